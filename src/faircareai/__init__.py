@@ -12,7 +12,9 @@ organizations interpret results based on their clinical context.
 __version__ = "0.2.0"
 
 # Core API - Primary entry points
+from faircareai.core.accumulator import AuditAccumulator
 from faircareai.core.audit import FairCareAudit
+from faircareai.core.cache import StageCache
 from faircareai.core.config import (
     FairnessConfig,
     FairnessMetric,
@@ -20,7 +22,10 @@ from faircareai.core.config import (
     SensitiveAttribute,
     UseCaseType,
 )
+from faircareai.core.monitoring import FairnessMonitor
 from faircareai.core.results import AuditResults
+from faircareai.core.sql import SQLAudit
+from faircareai.core.streaming import StreamingAudit
 
 # Fairness module
 from faircareai.fairness.decision_tree import (
@@ -32,6 +37,11 @@ from faircareai.fairness.decision_tree import (
 __all__ = [
     # Core API
     "FairCareAudit",
+    "StreamingAudit",
+    "SQLAudit",
+    "AuditAccumulator",
+    "FairnessMonitor",
+    "StageCache",
     "FairnessConfig",
     "AuditResults",
     # Enums
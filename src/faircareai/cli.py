@@ -171,6 +171,29 @@ def dashboard(port: int, host: str) -> None:
     show_default=True,
     help="Random seed for bootstrap resampling",
 )
+@click.option(
+    "--workers",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for the audit (-1 uses every core). Results do not depend on it.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("~/.cache/faircareai"),
+    envvar="FAIRCAREAI_CACHE_DIR",
+    show_default=True,
+    help="Directory of cached audit stages reused by reruns (env: FAIRCAREAI_CACHE_DIR).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    envvar="FAIRCAREAI_NO_CACHE",
+    help="Do not read or write cached stages, e.g. where derived data must stay off disk.",
+)
 @click.option(
     "--model-name",
     default="Unnamed Model",
@@ -190,6 +213,9 @@ def audit(
     output_format: str | None,
     threshold: float,
     seed: int | None,
+    workers: int,
+    cache_dir: Path,
+    no_cache: bool,
     model_name: str,
     attributes: tuple[str, ...],
     persona: str,
@@ -278,7 +304,8 @@ def audit(
     # Run audit
     console.print("\n[bold]Running fairness audit...[/bold]")
     try:
-        results = audit_obj.run(random_seed=seed)
+        cache = None if no_cache else cache_dir.expanduser()
+        results = audit_obj.run(random_seed=seed, workers=workers, cache=cache)
     except (DataValidationError, ConfigurationError, MetricComputationError) as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
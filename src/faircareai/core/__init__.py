@@ -5,7 +5,9 @@ Core components for healthcare AI fairness auditing.
 Methodology: Van Calster et al. (2025), CHAI RAIC Checkpoint 1.
 """
 
+from faircareai.core.accumulator import AuditAccumulator
 from faircareai.core.audit import AuditResult, FairCareAudit
+from faircareai.core.cache import StageCache
 from faircareai.core.config import (
     FairnessConfig,
     FairnessMetric,
@@ -14,8 +16,12 @@ from faircareai.core.config import (
     UseCaseType,
 )
 from faircareai.core.disparity import DisparityResult, compute_disparities
+from faircareai.core.histogram import ScoreHistogram
 from faircareai.core.metrics import GroupMetrics, compute_group_metrics
+from faircareai.core.monitoring import FairnessMonitor
+from faircareai.core.prepared import EncodedAttribute, PreparedAuditData
 from faircareai.core.results import AuditResults
+from faircareai.core.sql import SQLAudit
 from faircareai.core.statistics import (
     ci_newcombe_wilson as newcombe_wilson_ci,
 )
@@ -24,6 +30,8 @@ from faircareai.core.statistics import (
 from faircareai.core.statistics import (
     ci_wilson as wilson_score_ci,
 )
+from faircareai.core.streaming import StreamingAudit, scan_audit_source
+from faircareai.core.thresholds import GroupedThresholdIndex, ThresholdIndex
 
 # Legacy alias for backward compatibility
 FairAudit = FairCareAudit
@@ -31,6 +39,11 @@ FairAudit = FairCareAudit
 __all__ = [
     # Primary API
     "FairCareAudit",
+    "StreamingAudit",
+    "SQLAudit",
+    "AuditAccumulator",
+    "FairnessMonitor",
+    "StageCache",
     "FairnessConfig",
     "AuditResults",
     # Enums
@@ -43,6 +56,12 @@ __all__ = [
     "GroupMetrics",
     "compute_disparities",
     "DisparityResult",
+    "ThresholdIndex",
+    "GroupedThresholdIndex",
+    "PreparedAuditData",
+    "EncodedAttribute",
+    "ScoreHistogram",
+    "scan_audit_source",
     # Statistical
     "wilson_score_ci",
     "newcombe_wilson_ci",
@@ -0,0 +1,388 @@
+"""
+FairCareAI - Audit Accumulators
+
+Map-reduce audits across shards, time partitions or sites. An
+AuditAccumulator folds batches of rows into the per-group score histograms a
+StreamingAudit is computed from. Accumulators of disjoint batches merge by
+adding their histograms, serialize to compact Arrow tables (group-level
+counts, no rows, no pickle), and finalize into the same AuditResults as a
+single streaming pass over all of the rows.
+
+Usage:
+    >>> site = AuditAccumulator("risk", "readmit", attributes=["race", "sex"])
+    >>> for batch in batches:
+    ...     site.update(batch)
+    >>> payload = site.to_bytes()  # shipped to the coordinating site
+    >>> total = AuditAccumulator.from_bytes(payload_a).merge(
+    ...     AuditAccumulator.from_bytes(payload_b)
+    ... )
+    >>> results = total.finalize(config, references={"race": "White"})
+"""
+
+import io
+import json
+import zipfile
+from typing import Any, cast
+
+import numpy as np
+import polars as pl
+
+from faircareai.core.config import FairnessConfig
+from faircareai.core.constants import DEFAULT_BOOTSTRAP_SEED, STREAMING_SCORE_BINS
+from faircareai.core.exceptions import ConfigurationError, DataValidationError
+from faircareai.core.histogram import ScoreHistogram
+from faircareai.core.logging import get_logger
+from faircareai.core.results import AuditResults
+from faircareai.core.streaming import AuditSource, StreamingAudit, scan_histograms
+
+logger = get_logger(__name__)
+
+ACCUMULATOR_FORMAT_VERSION = 2
+"""Version of the to_bytes payload layout."""
+
+
+class AuditAccumulator:
+    """
+    Mergeable audit state for a fixed set of attributes and intersections.
+
+    Holds one ScoreHistogram per attribute column and per intersection
+    (keyed like StreamingAudit: the column, or the columns joined with
+    " x "). Every batch is validated as a StreamingAudit would validate it.
+    Counts, confusion metrics and fairness disparities of the finalized
+    audit are identical to a single pass over all rows; rank metrics are
+    computed from the merged histograms and carry ``auroc_max_error``.
+
+    Attributes:
+        pred_col: Column name for predicted probabilities.
+        target_col: Column name for true labels.
+        attributes: Sensitive attribute columns.
+        intersections: Column lists of the intersections.
+        threshold: Decision threshold.
+        n_bins: Score histogram bins.
+        histograms: Accumulated ScoreHistogram by key.
+    """
+
+    def __init__(
+        self,
+        pred_col: str,
+        target_col: str,
+        attributes: list[str],
+        intersections: list[list[str]] | None = None,
+        threshold: float = 0.5,
+        n_bins: int = STREAMING_SCORE_BINS,
+    ) -> None:
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            pred_col: Column name for predicted probabilities.
+            target_col: Column name for true labels (0/1).
+            attributes: Sensitive attribute columns to audit.
+            intersections: Lists of attribute columns to intersect.
+            threshold: Decision threshold. Default is 0.5.
+            n_bins: Score histogram bins. Default: STREAMING_SCORE_BINS.
+
+        Raises:
+            ConfigurationError: If no attributes are given or an intersection
+                names a column that is not an attribute.
+        """
+        if not attributes:
+            raise ConfigurationError("attributes", "At least one attribute column is required.")
+        intersections = intersections or []
+        for columns in intersections:
+            unknown = [c for c in columns if c not in attributes]
+            if unknown:
+                raise ConfigurationError(
+                    "intersections", f"Columns {unknown} are not accumulated attributes."
+                )
+
+        self.pred_col = pred_col
+        self.target_col = target_col
+        self.attributes = list(attributes)
+        self.intersections = [list(columns) for columns in intersections]
+        self.threshold = threshold
+        self.n_bins = n_bins
+        self.histograms: dict[str, ScoreHistogram] = {}
+        self._schema: pl.DataFrame | None = None
+
+    @property
+    def groupings(self) -> dict[str, list[str]]:
+        """Histogram key -> columns it groups by."""
+        groupings = {column: [column] for column in self.attributes}
+        for columns in self.intersections:
+            groupings[" x ".join(columns)] = columns
+        return groupings
+
+    @property
+    def n_rows(self) -> int:
+        """Rows accumulated so far."""
+        if not self.histograms:
+            return 0
+        return int(self.histograms[self.attributes[0]].sizes.sum())
+
+    def update(self, batch: AuditSource) -> "AuditAccumulator":
+        """
+        Add a batch of rows.
+
+        Args:
+            batch: Rows in any form StreamingAudit accepts (LazyFrame,
+                DataFrame, Parquet/CSV path, directory or list of paths).
+
+        Returns:
+            self: For method chaining.
+
+        Raises:
+            DataValidationError: If the batch fails validation or lacks an
+                attribute column.
+        """
+        audit = StreamingAudit(
+            batch, self.pred_col, self.target_col, threshold=self.threshold, n_bins=self.n_bins
+        )
+        missing = [c for c in self.attributes if c not in audit.scan.schema]
+        if missing:
+            raise DataValidationError(f"Batch is missing attribute columns: {missing}")
+
+        histograms = scan_histograms(
+            audit.scan, self.pred_col, self.target_col, self.groupings, self.threshold, self.n_bins
+        )
+        if self._schema is None:
+            self._schema = audit.df.select(self.pred_col, self.target_col, *self.attributes)
+        self._add(histograms)
+        logger.debug(f"Accumulated batch; {self.n_rows} rows in total")
+        return self
+
+    def merge(self, other: "AuditAccumulator") -> "AuditAccumulator":
+        """
+        Add the rows accumulated by another accumulator (disjoint batches).
+
+        Args:
+            other: Accumulator with the same columns, threshold and bins.
+
+        Returns:
+            self: For method chaining.
+
+        Raises:
+            ConfigurationError: If the accumulators were set up differently.
+        """
+        if self._settings() != other._settings():
+            raise ConfigurationError(
+                "accumulator",
+                f"Cannot merge accumulators with different settings: "
+                f"{self._settings()} vs {other._settings()}",
+            )
+        if self._schema is None:
+            self._schema = other._schema
+        self._add(other.histograms)
+        return self
+
+    def _settings(self) -> dict[str, Any]:
+        return {
+            "pred_col": self.pred_col,
+            "target_col": self.target_col,
+            "attributes": self.attributes,
+            "intersections": self.intersections,
+            "threshold": self.threshold,
+            "n_bins": self.n_bins,
+        }
+
+    def _add(self, histograms: dict[str, ScoreHistogram]) -> None:
+        for key, hist in histograms.items():
+            self.histograms[key] = (
+                self.histograms[key].merge(hist) if key in self.histograms else hist
+            )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the accumulated state.
+
+        The payload is a zip archive of a JSON manifest and Arrow IPC tables
+        (the column schema and each histogram's occupied cells); it holds
+        group-level counts only, never rows.
+
+        Returns:
+            Bytes for from_bytes.
+        """
+        meta = {
+            "format_version": ACCUMULATOR_FORMAT_VERSION,
+            **self._settings(),
+            "histograms": list(self.histograms),
+        }
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr("meta.json", json.dumps(meta))
+            if self._schema is not None:
+                zf.writestr("schema.arrow", _ipc_bytes(self._schema))
+            for i, hist in enumerate(self.histograms.values()):
+                zf.writestr(f"histogram-{i}.arrow", _ipc_bytes(hist.to_aggregates()))
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "AuditAccumulator":
+        """
+        Restore an accumulator serialized with to_bytes.
+
+        Args:
+            payload: Bytes from to_bytes.
+
+        Returns:
+            AuditAccumulator with the serialized state.
+
+        Raises:
+            ConfigurationError: If the payload format version is unknown.
+        """
+        with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+            meta = json.loads(zf.read("meta.json"))
+            if meta["format_version"] != ACCUMULATOR_FORMAT_VERSION:
+                raise ConfigurationError(
+                    "format_version",
+                    f"Unsupported accumulator format {meta['format_version']}.",
+                )
+            acc = cls(
+                meta["pred_col"],
+                meta["target_col"],
+                meta["attributes"],
+                meta["intersections"],
+                threshold=meta["threshold"],
+                n_bins=meta["n_bins"],
+            )
+            if "schema.arrow" in zf.namelist():
+                acc._schema = pl.read_ipc(zf.read("schema.arrow"))
+            for i, key in enumerate(meta["histograms"]):
+                frame = pl.read_ipc(zf.read(f"histogram-{i}.arrow"))
+                acc.histograms[key] = ScoreHistogram.from_aggregates(
+                    frame, key, acc.threshold, acc.n_bins
+                )
+        return acc
+
+    def audit(self, config: FairnessConfig | None = None) -> StreamingAudit:
+        """
+        Audit over the accumulated histograms, without attributes added.
+
+        Use this for full control over attribute names and references;
+        finalize() covers the common case.
+
+        Args:
+            config: FairnessConfig object with audit settings.
+
+        Returns:
+            StreamingAudit whose sections come from the accumulated state.
+
+        Raises:
+            DataValidationError: If no rows have been accumulated.
+        """
+        return _AccumulatedAudit(self, config)
+
+    def finalize(
+        self,
+        config: FairnessConfig,
+        references: dict[str, str] | None = None,
+        bootstrap_ci: bool = True,
+        n_bootstrap: int = 1000,
+        random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+        stratified_bootstrap: bool = False,
+    ) -> AuditResults:
+        """
+        Run the audit on everything accumulated.
+
+        Each attribute is added under its column name, and each intersection
+        is added as well.
+
+        Args:
+            config: FairnessConfig object with audit settings.
+            references: Reference group by attribute column (auto-detected
+                where not given).
+            bootstrap_ci: Calculate bootstrap confidence intervals.
+            n_bootstrap: Number of bootstrap iterations.
+            random_seed: Random seed for reproducibility.
+            stratified_bootstrap: Preserve each group's outcome counts when
+                resampling for the fairness disparity CIs.
+
+        Returns:
+            AuditResults as StreamingAudit.run() over all accumulated rows.
+        """
+        references = references or {}
+        audit = self.audit(config)
+        for column in self.attributes:
+            audit.add_sensitive_attribute(column, reference=references.get(column))
+        for columns in self.intersections:
+            audit.add_intersection(columns)
+        return audit.run(
+            bootstrap_ci=bootstrap_ci,
+            n_bootstrap=n_bootstrap,
+            random_seed=random_seed,
+            stratified_bootstrap=stratified_bootstrap,
+        )
+
+
+def _ipc_bytes(frame: pl.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    frame.write_ipc(buffer, compression="zstd")
+    return buffer.getvalue()
+
+
+class _AccumulatedAudit(StreamingAudit):
+    """StreamingAudit whose data profile, counts and histograms come from an accumulator."""
+
+    def __init__(self, accumulator: AuditAccumulator, config: FairnessConfig | None) -> None:
+        self.accumulator = accumulator
+        super().__init__(
+            accumulator,  # type: ignore[arg-type]
+            accumulator.pred_col,
+            accumulator.target_col,
+            config,
+            threshold=accumulator.threshold,
+            n_bins=accumulator.n_bins,
+        )
+
+    def _load_data(self, data: Any) -> pl.DataFrame:
+        """Zero-row frame with the accumulated columns' schema."""
+        schema = cast(AuditAccumulator, data)._schema
+        if schema is None:
+            raise DataValidationError("No rows have been accumulated.")
+        self.scan = schema.lazy()
+        return schema
+
+    def _data_profile(self) -> dict[str, Any]:
+        """Validation profile from the accumulated histogram of the first attribute."""
+        hist = self.accumulator.histograms[self.accumulator.attributes[0]]
+        per_class = hist.counts.sum(axis=(0, 2))
+        return {
+            "pred_nulls": 0,
+            "target_nulls": 0,
+            "pred_min": float(hist.prob_min.min()),
+            "pred_max": float(hist.prob_max.max()),
+            "target_values": [int(v) for v in np.flatnonzero(per_class)],
+            "n_rows": int(per_class.sum()),
+        }
+
+    def _attribute_counts(self, column: str) -> pl.DataFrame:
+        """Rows per value of an attribute column, from its accumulated histogram."""
+        hist = self.accumulator.histograms.get(column)
+        if hist is None:
+            return super()._attribute_counts(column)
+        return pl.DataFrame(
+            [
+                pl.Series(column, [None, *hist.groups], dtype=hist.dtype),
+                pl.Series("len", hist.sizes, dtype=pl.UInt32),
+            ]
+        ).filter(pl.col("len") > 0)
+
+    def _histograms(
+        self, groupings: dict[str, list[str]], n_bins: int | None
+    ) -> dict[str, ScoreHistogram]:
+        """The accumulated histograms for each grouping."""
+        missing = [key for key in groupings if key not in self.accumulator.histograms]
+        if missing:
+            raise ConfigurationError(
+                "sensitive_attributes", f"No accumulated histograms for {missing}."
+            )
+        if self.threshold != self.accumulator.threshold:
+            raise ConfigurationError(
+                "threshold",
+                f"Histograms were accumulated at threshold {self.accumulator.threshold}.",
+            )
+        if n_bins != self.accumulator.n_bins:
+            raise ConfigurationError(
+                "n_bins", f"Histograms were accumulated with {self.accumulator.n_bins} bins."
+            )
+        return {key: self.accumulator.histograms[key] for key in groupings}
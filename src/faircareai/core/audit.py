@@ -8,37 +8,352 @@ methodology. Healthcare organizations interpret results based on their clinical
 context, organizational values, and governance frameworks.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from concurrent.futures import Future
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
 import polars as pl
+import pyarrow as pa
 
+from faircareai.core.cache import StageCache, stage_key
 from faircareai.core.config import (
     FairnessConfig,
     SensitiveAttribute,
 )
-from faircareai.core.constants import DEFAULT_BOOTSTRAP_SEED
+from faircareai.core.constants import (
+    APPROXIMATE_SCORE_BINS,
+    AUROC_CI_METHODS,
+    DEDUPLICATED_MIN_CELLS,
+    DEFAULT_BOOTSTRAP_SEED,
+    IPC_FILE_SUFFIXES,
+    PARALLEL_BOOTSTRAP_BLOCK,
+)
 from faircareai.core.exceptions import (
     ConfigurationError,
     DataValidationError,
 )
+from faircareai.core.histogram import ScoreHistogram
 from faircareai.core.logging import get_logger
+from faircareai.core.parallel import resolve_workers, task_executor, unit_seed
+from faircareai.core.prepared import PreparedAuditData, group_key
 from faircareai.core.reproducibility import build_reproducibility_bundle
 from faircareai.core.results import AuditResults
-from faircareai.core.types import OverallPerformance
+from faircareai.core.shared import SharedArrays, publish_arrays
 from faircareai.data.sensitive_attrs import (
     display_suggestions,
-    get_reference_group,
-    suggest_sensitive_attributes,
-    validate_attribute,
+    match_sensitive_columns,
+    reference_from_counts,
+    suggest_from_counts,
+    validate_attribute_counts,
 )
 
 logger = get_logger(__name__)
 
 
+def scan_profile(
+    scan: pl.LazyFrame,
+    pred_col: str,
+    target_col: str,
+    attribute_columns: Sequence[str] = (),
+) -> dict[str, Any]:
+    """Validation and attribute profile of lazy audit data, from one query.
+
+    Score nulls and range, outcome nulls and values, the row count and the
+    rows per value of each attribute column are all computed by a single
+    select, so only those columns are read, once.
+
+    Args:
+        scan: Lazy audit data.
+        pred_col: Column name for predicted probabilities.
+        target_col: Column name for true labels.
+        attribute_columns: Columns to count rows per value for.
+
+    Returns:
+        Dict with the keys of FairCareAudit._data_profile(); its
+        "attribute_counts" maps each attribute column to its rows per value,
+        as returned by FairCareAudit._attribute_counts().
+    """
+    schema = scan.schema
+    pred = pl.col(pred_col)
+    target = pl.col(target_col)
+    counts = []
+    for i, column in enumerate(attribute_columns):
+        key = group_key(column, schema[column])
+        counts.append(key.value_counts().implode().alias(f"_counts_{i}"))
+    frame = scan.select(
+        pred.null_count().alias("pred_nulls"),
+        target.null_count().alias("target_nulls"),
+        pred.min().alias("pred_min"),
+        pred.max().alias("pred_max"),
+        pl.len().alias("n_rows"),
+        target.unique().implode().alias("target_values"),
+        *counts,
+    ).collect(streaming=True, comm_subplan_elim=False)
+    profile = frame.select(pl.exclude("^_counts_.*$")).row(0, named=True)
+    profile["attribute_counts"] = {
+        column: frame[f"_counts_{i}"]
+        .explode()
+        .struct.unnest()
+        .rename({"count": "len"})
+        .with_columns(pl.col("len").cast(pl.UInt32))
+        for i, column in enumerate(attribute_columns)
+    }
+    return profile
+
+
+@dataclass(frozen=True)
+class _AuditUnit:
+    """One independently schedulable unit of FairCareAudit.run().
+
+    ``stage`` is "overall", "overall_bootstrap" (one block of the overall
+    AUROC/AUPRC bootstrap), "subgroup", "fairness" or "intersectional"
+    ("descriptive" names the Table 1 stage for the stage cache);
+    ``target`` is the attribute name, the intersection's attribute names or
+    the block number. The unit's seed is derived from (stage, *target).
+    """
+
+    stage: str
+    target: tuple[str | int, ...] = ()
+    ranking_samples: dict[str, list[float]] | None = field(default=None, compare=False)
+
+
+@dataclass
+class _AuditContext:
+    """Picklable inputs shared by every audit unit.
+
+    Worker processes receive this once, through the pool initializer,
+    instead of the audit object and its DataFrame: the prepared data, a
+    zero-row frame carrying the schema, and the run settings. For a
+    process pool the prepared arrays are published to shared memory and
+    ``prepared`` travels as an empty skeleton that workers re-attach via
+    ``shared``.
+    """
+
+    prepared: PreparedAuditData
+    frame: pl.DataFrame
+    pred_col: str
+    target_col: str
+    threshold: float
+    attributes: dict[str, tuple[str, Any]]  # name -> (column, reference)
+    intersections: list[list[str]]
+    min_subgroup_n: int
+    bootstrap_ci: bool
+    n_bootstrap: int
+    random_seed: int
+    stratified_bootstrap: bool = False
+    bootstrap_tolerance: float | None = None
+    auroc_ci_method: str = "bootstrap"
+    shared: SharedArrays | None = None
+
+    def plan_units(self) -> list[_AuditUnit]:
+        """Per-attribute and per-intersection units."""
+        units = [_AuditUnit("subgroup", (name,)) for name in self.attributes]
+        units += [_AuditUnit("fairness", (name,)) for name in self.attributes]
+        units += [_AuditUnit("intersectional", tuple(i)) for i in self.intersections]
+        return units
+
+    def plan_bootstrap_blocks(self) -> list[_AuditUnit]:
+        """Fixed-size blocks of the overall AUROC/AUPRC bootstrap."""
+        if not self.bootstrap_ci or len(self.prepared) <= 10:
+            return []
+        n_blocks = -(-self.n_bootstrap // PARALLEL_BOOTSTRAP_BLOCK)
+        return [_AuditUnit("overall_bootstrap", (i,)) for i in range(n_blocks)]
+
+    def cache_key(self, unit: _AuditUnit) -> str:
+        """StageCache key of a unit: the data it reads and the settings it uses."""
+        settings: tuple[Any, ...]
+        if unit.stage == "descriptive":
+            names, settings = list(self.attributes), ()
+        elif unit.stage == "overall":
+            names, settings = [], (self.threshold, self.bootstrap_ci, self.n_bootstrap)
+        elif unit.stage == "intersectional":
+            names, settings = [str(n) for n in unit.target], (self.threshold, self.min_subgroup_n)
+        else:
+            names = [str(unit.target[0])]
+            settings = (self.threshold, self.bootstrap_ci, self.n_bootstrap)
+            if unit.stage == "subgroup":
+                settings += (self.bootstrap_tolerance, self.auroc_ci_method)
+            else:
+                settings += (self.stratified_bootstrap,)
+        columns = [
+            (name, *self.attributes[name], self.prepared.digest(self.attributes[name][0]))
+            for name in names
+        ]
+        return stage_key(
+            unit.stage, unit.target, self.random_seed, self.prepared.digest(), columns, settings
+        )
+
+    def compute(self, unit: _AuditUnit) -> Any:
+        """Compute one unit with its own derived seed."""
+        from faircareai.core.bootstrap import bootstrap_ranking_metrics
+        from faircareai.metrics.fairness import compute_fairness_metrics
+        from faircareai.metrics.performance import compute_overall_performance
+        from faircareai.metrics.subgroup import compute_intersectional, compute_subgroup_metrics
+
+        seed = unit_seed(self.random_seed, unit.stage, *unit.target)
+        prepared = self.prepared
+
+        if unit.stage == "overall":
+            return compute_overall_performance(
+                y_true=prepared.y_true,
+                y_prob=prepared.y_prob,
+                threshold=self.threshold,
+                bootstrap_ci=self.bootstrap_ci,
+                n_bootstrap=self.n_bootstrap,
+                random_seed=seed,
+                index=prepared.threshold_index,
+                ranking_samples=unit.ranking_samples,
+            )
+        if unit.stage == "overall_bootstrap":
+            start = int(unit.target[0]) * PARALLEL_BOOTSTRAP_BLOCK
+            samples, _ = bootstrap_ranking_metrics(
+                prepared.y_true,
+                prepared.y_prob,
+                n_bootstrap=min(PARALLEL_BOOTSTRAP_BLOCK, self.n_bootstrap - start),
+                seed=seed,
+                stratified=False,
+            )
+            return samples
+        if unit.stage == "intersectional":
+            return compute_intersectional(
+                df=self.frame,
+                y_prob_col=self.pred_col,
+                y_true_col=self.target_col,
+                group_cols=[self.attributes[str(name)][0] for name in unit.target],
+                threshold=self.threshold,
+                min_n=self.min_subgroup_n,
+                prepared=prepared,
+            )
+
+        column, reference = self.attributes[str(unit.target[0])]
+        kwargs: dict[str, Any] = {
+            "df": self.frame,
+            "y_prob_col": self.pred_col,
+            "y_true_col": self.target_col,
+            "group_col": column,
+            "threshold": self.threshold,
+            "reference": reference,
+            "bootstrap_ci": self.bootstrap_ci,
+            "n_bootstrap": self.n_bootstrap,
+            "random_seed": seed,
+            "prepared": prepared,
+        }
+        if unit.stage == "subgroup":
+            return compute_subgroup_metrics(
+                **kwargs,
+                bootstrap_tolerance=self.bootstrap_tolerance,
+                ci_method=self.auroc_ci_method,
+            )
+        return compute_fairness_metrics(**kwargs, stratified=self.stratified_bootstrap)
+
+
+# Per-process context installed by _init_audit_worker
+_AUDIT_WORKER_STATE: dict[str, _AuditContext] = {}
+
+
+def _init_audit_worker(context: _AuditContext) -> None:
+    """Install the shared audit context in the current process.
+
+    Prepared arrays published to shared memory are attached without copying.
+    """
+    if context.shared is not None:
+        prepared = context.prepared.with_arrays(context.shared.attach())
+        context = replace(context, prepared=prepared, shared=None)
+    _AUDIT_WORKER_STATE["context"] = context
+
+
+def _run_audit_unit(unit: _AuditUnit) -> Any:
+    """Compute one unit with the context installed by _init_audit_worker."""
+    return _AUDIT_WORKER_STATE["context"].compute(unit)
+
+
+def _run_audit_units(
+    context: _AuditContext, workers: int | None = 1, cache: StageCache | None = None
+) -> tuple[Any, dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Run every unit of an audit, serially or in a process pool.
+
+    Bootstrap blocks and attribute/intersection units are submitted first;
+    the overall unit follows with the merged block samples. With a cache,
+    units found in it are not run (nor the bootstrap blocks, when the
+    overall unit is cached) and each computed unit is stored as soon as it
+    finishes, so an interrupted run resumes where it stopped.
+
+    Returns:
+        Tuple of (overall performance, subgroup performance by attribute,
+        fairness metrics by attribute, intersectional results by key).
+    """
+    units = context.plan_units()
+    overall_unit = _AuditUnit("overall")
+    keys: dict[_AuditUnit, str] = {}
+    cached: dict[_AuditUnit, Any] = {}
+    if cache is not None:
+        for unit in [overall_unit, *units]:
+            keys[unit] = context.cache_key(unit)
+            value = cache.get(keys[unit])
+            if value is not None:
+                cached[unit] = value
+        logger.info(f"Loaded {len(cached)} of {len(units) + 1} audit stages from the cache")
+
+    def store(unit: _AuditUnit, future: Future) -> None:
+        if cache is not None and not future.cancelled() and future.exception() is None:
+            cache.put(keys[unit], future.result())
+
+    pending = [unit for unit in units if unit not in cached]
+    blocks = [] if overall_unit in cached else context.plan_bootstrap_blocks()
+    try:
+        with ExitStack() as stack:
+            if resolve_workers(workers) > 1:
+                # Publish the arrays once; workers attach instead of unpickling copies
+                arrays = context.prepared.arrays()
+                shared = stack.enter_context(publish_arrays(arrays))
+                skeleton = context.prepared.with_arrays({k: v[:0] for k, v in arrays.items()})
+                context = replace(context, prepared=skeleton, shared=shared)
+            executor = stack.enter_context(task_executor(workers, _init_audit_worker, (context,)))
+            block_futures = [executor.submit(_run_audit_unit, unit) for unit in blocks]
+            unit_futures = {}
+            for unit in pending:
+                unit_futures[unit] = executor.submit(_run_audit_unit, unit)
+                unit_futures[unit].add_done_callback(partial(store, unit))
+
+            overall = cached.get(overall_unit)
+            if overall is None:
+                ranking_samples: dict[str, list[float]] | None = None
+                if blocks:
+                    ranking_samples = {"auroc": [], "auprc": []}
+                    for future in block_futures:
+                        for name, values in future.result().items():
+                            ranking_samples[name].extend(values)
+                overall_future = executor.submit(
+                    _run_audit_unit, replace(overall_unit, ranking_samples=ranking_samples)
+                )
+                overall_future.add_done_callback(partial(store, overall_unit))
+                overall = overall_future.result()
+            outputs = [
+                cached[unit] if unit in cached else unit_futures[unit].result() for unit in units
+            ]
+    finally:
+        _AUDIT_WORKER_STATE.clear()
+
+    subgroup: dict[str, Any] = {}
+    fairness: dict[str, Any] = {}
+    intersectional: dict[str, Any] = {}
+    for unit, output in zip(units, outputs, strict=True):
+        if unit.stage == "subgroup":
+            subgroup[str(unit.target[0])] = output
+        elif unit.stage == "fairness":
+            fairness[str(unit.target[0])] = output
+        else:
+            intersectional[" x ".join(str(name) for name in unit.target)] = output
+    return overall, subgroup, fairness, intersectional
+
+
 class FairCareAudit:
     """
     Main class for conducting fairness audits on ML models.
@@ -129,6 +444,8 @@ class FairCareAudit:
         target_col: str,
         config: FairnessConfig | None = None,
         threshold: float = 0.5,
+        filter: pl.Expr | None = None,
+        extra_columns: Sequence[str] = (),
     ):
         """
         Initialize a fairness audit.
@@ -136,8 +453,11 @@ class FairCareAudit:
         Args:
             data: Model predictions data. Accepts:
                 - Polars DataFrame (preferred)
-                - pandas DataFrame (auto-converted to Polars)
-                - Path to .parquet or .csv file
+                - pyarrow Table, RecordBatch or RecordBatchReader
+                - pandas DataFrame (auto-converted to Polars via Arrow)
+                - Path to .parquet, .csv or Arrow IPC (.arrow, .feather,
+                  .ipc; memory-mapped) file
+                NumPy arrays can be audited with FairCareAudit.from_arrays().
 
             pred_col: Column name containing model predictions as probabilities.
                 Must be numeric values in the range [0.0, 1.0].
@@ -166,6 +486,15 @@ class FairCareAudit:
             threshold: Decision threshold for converting probabilities to binary
                 predictions. Default is 0.5. Adjust based on clinical context.
 
+            filter: Cohort filter, e.g. ``pl.col("admit_year") == 2025``. Only
+                matching rows are audited; for file inputs the filter is
+                pushed into the scan, so Parquet row groups whose statistics
+                rule it out are skipped.
+
+            extra_columns: Columns to load from file inputs besides the scores,
+                outcomes and sensitive attributes (file inputs are scanned
+                lazily and ``audit.df`` holds only the columns the audit uses).
+
         Example:
             >>> # From parquet file
             >>> audit = FairCareAudit(
@@ -174,6 +503,12 @@ class FairCareAudit:
             ...     target_col="readmit_30d"
             ... )
 
+            >>> # One cohort of a partitioned file, reading only the audited columns
+            >>> audit = FairCareAudit(
+            ...     "predictions.parquet", "risk_score", "readmit_30d",
+            ...     filter=pl.col("admit_year") == 2025,
+            ... )
+
             >>> # From pandas DataFrame
             >>> import pandas as pd
             >>> df = pd.DataFrame({
@@ -189,11 +524,22 @@ class FairCareAudit:
             sensitive attributes, then accept_suggested_attributes() or
             add_sensitive_attribute() to define which demographics to analyze.
         """
-        self.df = self._load_data(data)
         self.pred_col = pred_col
         self.target_col = target_col
         self.threshold = threshold
         self.config = config or FairnessConfig(model_name="Unnamed Model")
+        self.filter = filter
+        self.extra_columns = list(extra_columns)
+
+        # File inputs stay a lazy scan until the audit needs their rows (see df)
+        self._source: pl.LazyFrame | None = None
+        self._frame: pl.DataFrame | None = None
+        self.profile: dict[str, Any] = {}
+        loaded = self._load_data(data)
+        if isinstance(loaded, pl.LazyFrame):
+            self._source = loaded if filter is None else loaded.filter(filter)
+        else:
+            self.df = loaded if filter is None else loaded.filter(filter)
 
         # Store for visualization access
         self.y_true_col = target_col
@@ -205,7 +551,7 @@ class FairCareAudit:
         self._validate_data()
 
         # Auto-detect suggested attributes
-        self._suggestions = suggest_sensitive_attributes(self.df)
+        self._suggestions = self._detect_suggestions()
 
     def __getstate__(self) -> dict:
         """Return picklable state (exclude logger for Windows multiprocessing)."""
@@ -216,38 +562,57 @@ class FairCareAudit:
         """Restore state after unpickling."""
         self.__dict__.update(state)
 
-    def _load_data(self, data: pl.DataFrame | str | Path | Any) -> pl.DataFrame:
-        """Load data from DataFrame or file path.
+    def _load_data(self, data: pl.DataFrame | str | Path | Any) -> pl.DataFrame | pl.LazyFrame:
+        """Load data from DataFrame, Arrow data or file path.
 
         Supports:
             - Polars DataFrame (preferred, used internally)
-            - pandas DataFrame (auto-converted to Polars)
-            - Path to parquet or csv file
+            - pyarrow Table, RecordBatch or RecordBatchReader
+            - pandas DataFrame (converted through Arrow)
+            - Path to a parquet, csv or Arrow IPC (.arrow/.feather/.ipc) file
+
+        Numeric buffers are shared rather than copied wherever Arrow allows:
+        pyarrow and pandas inputs are wrapped without copying their numeric
+        columns (Arrow record batches stay separate chunks), and Arrow IPC
+        files are memory-mapped. pandas frames Arrow cannot convert (e.g.
+        object columns mixing strings and numbers) fall back to
+        ``pl.from_pandas``. Files are opened as
+        lazy scans and read later, one projection at a time (see df).
 
         Args:
-            data: Input data as DataFrame or file path.
+            data: Input data as DataFrame, Arrow data or file path.
 
         Returns:
-            Polars DataFrame ready for analysis.
+            Polars DataFrame ready for analysis, or a LazyFrame over a file.
 
         Raises:
             TypeError: If data type is not supported.
-            ValueError: If file format is not supported.
+            DataValidationError: If file format is not supported.
         """
         # Check for Polars DataFrame first (most common case)
         if isinstance(data, pl.DataFrame):
             return data
 
-        # Auto-convert pandas DataFrame to Polars
+        if isinstance(data, pa.RecordBatchReader):
+            data = data.read_all()
+        if isinstance(data, pa.Table | pa.RecordBatch):
+            return cast(pl.DataFrame, pl.from_arrow(data, rechunk=False))
+
+        # pandas goes through Arrow: pl.from_pandas copies numeric columns
         try:
             import pandas as pd
 
             if isinstance(data, pd.DataFrame):
                 logger.info(
-                    "Converting pandas DataFrame to Polars. "
+                    "Converting pandas DataFrame to Polars through Arrow. "
                     "FairCareAI uses Polars internally for performance."
                 )
-                return pl.from_pandas(data)
+                try:
+                    table = pa.Table.from_pandas(data, preserve_index=False)
+                except (pa.ArrowTypeError, pa.ArrowInvalid) as e:
+                    logger.debug(f"Arrow cannot convert the pandas DataFrame ({e}); copying it")
+                    return pl.from_pandas(data)
+                return cast(pl.DataFrame, pl.from_arrow(table, rechunk=False))
         except ImportError:
             pass  # pandas not installed, continue to other checks
 
@@ -255,21 +620,104 @@ class FairCareAudit:
         if isinstance(data, str | Path):
             path = Path(data)
             if path.suffix == ".parquet":
-                return pl.read_parquet(path)
+                return pl.scan_parquet(path)
             elif path.suffix == ".csv":
-                return pl.read_csv(path)
+                return pl.scan_csv(path)
+            elif path.suffix in IPC_FILE_SUFFIXES:
+                return pl.scan_ipc(path, memory_map=True)
             else:
                 raise DataValidationError(
-                    f"Unsupported file format: {path.suffix}. Supported formats: .parquet, .csv"
+                    f"Unsupported file format: {path.suffix}. "
+                    f"Supported formats: .parquet, .csv, {', '.join(IPC_FILE_SUFFIXES)}"
                 )
 
+        if isinstance(data, pl.LazyFrame):
+            raise TypeError(
+                "FairCareAudit needs the data in memory, got a LazyFrame. "
+                "Use StreamingAudit to audit lazy or larger-than-memory inputs."
+            )
+
         # Provide helpful error message
         type_name = type(data).__name__
         raise TypeError(
-            f"Expected Polars DataFrame, pandas DataFrame, or file path, got {type_name}. "
-            f"Ensure your model predictions are in a supported DataFrame format."
+            f"Expected Polars DataFrame, pandas DataFrame, Arrow table or file path, "
+            f"got {type_name}. Ensure your model predictions are in a supported DataFrame format."
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        y_prob: np.ndarray,
+        y_true: np.ndarray,
+        groups: dict[str, np.ndarray] | None = None,
+        config: FairnessConfig | None = None,
+        threshold: float = 0.5,
+    ) -> "FairCareAudit":
+        """Create an audit from NumPy arrays without building a DataFrame first.
+
+        Numeric arrays are wrapped as Polars columns without copying.
+
+        Args:
+            y_prob: Predicted probabilities.
+            y_true: Outcomes (0/1).
+            groups: Sensitive attribute arrays keyed by column name.
+            config: FairnessConfig object with audit settings.
+            threshold: Decision threshold. Default is 0.5.
+
+        Returns:
+            FairCareAudit over columns "y_prob", "y_true" and the group
+            columns.
+
+        Raises:
+            DataValidationError: If the arrays differ in length or fail validation.
+
+        Example:
+            >>> audit = FairCareAudit.from_arrays(y_prob, y_true, {"race": race})
+            >>> audit.add_sensitive_attribute("race", reference="White")
+        """
+        columns = {"y_prob": y_prob, "y_true": y_true, **(groups or {})}
+        lengths = {name: len(values) for name, values in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise DataValidationError(f"Arrays must have the same length, got {lengths}")
+        frame = pl.DataFrame([pl.Series(name, values) for name, values in columns.items()])
+        return cls(frame, "y_prob", "y_true", config, threshold)
+
+    @property
+    def df(self) -> pl.DataFrame:
+        """Audit data in memory.
+
+        For file inputs this is read on first use, and again after the
+        required columns change: only ``required_columns`` are scanned
+        (projection pushdown), with the cohort filter applied in the scan.
+        """
+        if self._source is not None:
+            columns = self.required_columns
+            if self._frame is None or self._frame.columns != columns:
+                logger.debug(f"Reading columns {columns} from the audit source")
+                self._frame = self._source.select(columns).collect()
+        return cast(pl.DataFrame, self._frame)
+
+    @df.setter
+    def df(self, frame: pl.DataFrame) -> None:
+        # New data invalidates the cached profile
+        self._source = None
+        self._frame = frame
+        self.profile = {}
+
+    @property
+    def required_columns(self) -> list[str]:
+        """Columns the audit reads: scores, outcomes, attributes and extra_columns."""
+        columns = [self.pred_col, self.target_col]
+        columns += [attr.column for attr in self.sensitive_attributes]
+        return list(dict.fromkeys(columns + self.extra_columns))
+
+    @property
+    def schema(self) -> dict[str, pl.DataType]:
+        """Column names and dtypes of the audit data, known without reading rows."""
+        if self._source is not None:
+            return dict(self._source.schema)
+        return dict(self.df.schema)
+
     def _validate_data(self) -> None:
         """Validate data for binary classification fairness analysis.
 
@@ -282,36 +730,39 @@ class FairCareAudit:
         from faircareai.core.exceptions import DataValidationError
 
         # 1. Check required columns exist
-        required = [self.pred_col, self.target_col]
-        missing = [c for c in required if c not in self.df.columns]
+        schema = self.schema
+        required = [self.pred_col, self.target_col, *self.extra_columns]
+        missing = [c for c in required if c not in schema]
         if missing:
             raise DataValidationError(f"Missing required columns: {missing}")
 
         # 2. Validate numeric types
-        if not self.df[self.pred_col].dtype.is_numeric():
+        if not schema[self.pred_col].is_numeric():
             raise DataValidationError(
                 f"Prediction column '{self.pred_col}' must be numeric, "
-                f"got {self.df[self.pred_col].dtype}. "
+                f"got {schema[self.pred_col]}. "
                 f"Ensure your model outputs probability scores.",
                 column=self.pred_col,
             )
-        if not self.df[self.target_col].dtype.is_numeric():
+        if not schema[self.target_col].is_numeric():
             raise DataValidationError(
                 f"Target column '{self.target_col}' must be numeric, "
-                f"got {self.df[self.target_col].dtype}. "
+                f"got {schema[self.target_col]}. "
                 f"Binary outcomes should be encoded as 0/1.",
                 column=self.target_col,
             )
 
+        profile = self.profile = self._data_profile()
+
         # 3. Check for null/NaN values
-        pred_nulls = self.df[self.pred_col].null_count()
+        pred_nulls = profile["pred_nulls"]
         if pred_nulls > 0:
             raise DataValidationError(
                 f"Predictions contain {pred_nulls} null/NaN values. "
                 f"Remove or impute missing predictions before analysis.",
                 column=self.pred_col,
             )
-        target_nulls = self.df[self.target_col].null_count()
+        target_nulls = profile["target_nulls"]
         if target_nulls > 0:
             raise DataValidationError(
                 f"Targets contain {target_nulls} null/NaN values. "
@@ -320,8 +771,8 @@ class FairCareAudit:
             )
 
         # 4. Validate predictions are probabilities [0, 1]
-        pred_min_value = self.df[self.pred_col].min()
-        pred_max_value = self.df[self.pred_col].max()
+        pred_min_value = profile["pred_min"]
+        pred_max_value = profile["pred_max"]
 
         if not isinstance(pred_min_value, int | float | Decimal) or not isinstance(
             pred_max_value, int | float | Decimal
@@ -342,7 +793,7 @@ class FairCareAudit:
             )
 
         # 5. Validate targets are binary (0/1 only)
-        target_values = self.df[self.target_col].unique().to_list()
+        target_values = profile["target_values"]
         valid_values = {0, 1}
         invalid = [v for v in target_values if v not in valid_values]
         if invalid:
@@ -353,13 +804,46 @@ class FairCareAudit:
             )
 
         # 6. Sample size warning (statistical reliability)
-        n = len(self.df)
+        n = profile["n_rows"]
         if n < 30:
             logger.warning(
                 f"Small dataset (n={n}). Fairness metrics may be unreliable. "
                 f"Consider collecting more data for robust analysis."
             )
 
+    def _data_profile(self) -> dict[str, Any]:
+        """Profile for _validate_data, kept on the audit as ``self.profile``.
+
+        Null counts, score range, outcome values and row count, plus the rows
+        per value of every column that matches a sensitive attribute pattern
+        ("attribute_counts"), all from one query over the data.
+        """
+        source = self._source if self._source is not None else self.df.lazy()
+        candidates = list(match_sensitive_columns(self.schema).values())
+        return scan_profile(source, self.pred_col, self.target_col, candidates)
+
+    def _attribute_counts(self, column: str) -> pl.DataFrame:
+        """Rows per value of an attribute column (nulls in their own row).
+
+        Counts are cached in ``self.profile``, which already holds the
+        columns matched for suggestions.
+        """
+        cached = self.profile.setdefault("attribute_counts", {})
+        if column not in cached:
+            if self._source is not None:
+                cached[column] = self._source.select(column).collect().group_by(column).len()
+            else:
+                cached[column] = self.df.group_by(column).len()
+        return cast(pl.DataFrame, cached[column])
+
+    def _detect_suggestions(self) -> list[dict]:
+        """Suggested sensitive attributes for suggest_attributes().
+
+        Columns are matched by name from the schema; their value counts come
+        from the validation profile.
+        """
+        return suggest_from_counts(list(self.schema), self._attribute_counts)
+
     def suggest_attributes(self, display: bool = True) -> list[dict]:
         """
         Show suggested sensitive attributes based on detected columns.
@@ -531,7 +1015,11 @@ class FairCareAudit:
         col = column or name
 
         # Validate
-        issues = validate_attribute(self.df, name, col, reference, categories)
+        if col in self.schema:
+            counts = self._attribute_counts(col)
+            issues = validate_attribute_counts(name, col, counts, reference, categories)
+        else:
+            issues = [f"Column '{col}' not found in data"]
         if any("not found" in issue for issue in issues):
             raise DataValidationError(f"Attribute validation failed: {issues}", column=col)
 
@@ -542,7 +1030,7 @@ class FairCareAudit:
 
         # Determine reference group if not specified
         if reference is None:
-            reference = get_reference_group(self.df, col, None)
+            reference = reference_from_counts(col, counts, None)
 
         attr = SensitiveAttribute(
             name=name,
@@ -623,7 +1111,7 @@ class FairCareAudit:
         for w in warnings:
             logger.warning(w)
 
-    def _compute_descriptive_statistics(self) -> dict:
+    def _compute_descriptive_statistics(self, prepared: PreparedAuditData | None = None) -> dict:
         """Compute descriptive statistics for the cohort."""
         from faircareai.metrics.descriptive import compute_cohort_summary
 
@@ -635,74 +1123,58 @@ class FairCareAudit:
                 a.name: {"column": a.column, "reference": a.reference}
                 for a in self.sensitive_attributes
             },
+            prepared=prepared,
         )
 
-    def _compute_overall_performance(
+    def _prepare(self) -> PreparedAuditData:
+        """Encode scores, labels and every sensitive attribute once for all stages."""
+        return PreparedAuditData.from_frame(
+            self.df,
+            self.pred_col,
+            self.target_col,
+            [attr.column for attr in self.sensitive_attributes],
+        )
+
+    def _context(
         self,
+        prepared: PreparedAuditData,
         bootstrap_ci: bool,
         n_bootstrap: int,
         random_seed: int | None,
-    ) -> OverallPerformance:
-        """Compute overall performance metrics."""
-        from faircareai.metrics.performance import compute_overall_performance
-
-        y_true = self.df[self.target_col].to_numpy()
-        y_prob = self.df[self.pred_col].to_numpy()
-
-        return compute_overall_performance(
-            y_true=y_true,
-            y_prob=y_prob,
+        stratified_bootstrap: bool = False,
+        bootstrap_tolerance: float | None = None,
+        auroc_ci_method: str = "bootstrap",
+    ) -> _AuditContext:
+        """Bundle the prepared data and run settings for the audit units."""
+        min_n_val = self.config.get_threshold("min_subgroup_n", 100)
+        return _AuditContext(
+            prepared=prepared,
+            frame=self.df.clear(),
+            pred_col=self.pred_col,
+            target_col=self.target_col,
             threshold=self.threshold,
+            attributes={a.name: (a.column, a.reference) for a in self.sensitive_attributes},
+            intersections=[list(i) for i in self.intersections],
+            min_subgroup_n=int(min_n_val) if min_n_val is not None else 100,
             bootstrap_ci=bootstrap_ci,
             n_bootstrap=n_bootstrap,
-            random_seed=random_seed,
+            random_seed=DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed,
+            stratified_bootstrap=stratified_bootstrap,
+            bootstrap_tolerance=bootstrap_tolerance,
+            auroc_ci_method=auroc_ci_method,
         )
 
-    def _compute_subgroup_performance(
-        self,
-        bootstrap_ci: bool,
-        n_bootstrap: int,
-        random_seed: int | None,
-    ) -> dict:
-        """Compute subgroup performance metrics."""
-        from faircareai.metrics.subgroup import compute_subgroup_metrics
-
-        results = {}
-        for attr in self.sensitive_attributes:
-            results[attr.name] = compute_subgroup_metrics(
-                df=self.df,
-                y_prob_col=self.pred_col,
-                y_true_col=self.target_col,
-                group_col=attr.column,
-                threshold=self.threshold,
-                reference=attr.reference,
-                bootstrap_ci=bootstrap_ci,
-                n_bootstrap=n_bootstrap,
-                random_seed=random_seed,
-            )
-        return results
-
-    def _compute_fairness_metrics(self) -> dict:
-        """Compute fairness metrics for each sensitive attribute."""
-        from faircareai.metrics.fairness import compute_fairness_metrics
-
-        results = {}
-        for attr in self.sensitive_attributes:
-            results[attr.name] = compute_fairness_metrics(
-                df=self.df,
-                y_prob_col=self.pred_col,
-                y_true_col=self.target_col,
-                group_col=attr.column,
-                threshold=self.threshold,
-                reference=attr.reference,
-            )
-        return results
-
     def run(
         self,
         bootstrap_ci: bool = True,
         n_bootstrap: int = 1000,
         random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+        stratified_bootstrap: bool = False,
+        workers: int = 1,
+        bootstrap_tolerance: float | None = None,
+        mode: str = "exact",
+        cache: StageCache | str | Path | None = None,
+        auroc_ci_method: str = "bootstrap",
     ) -> AuditResults:
         """
         Execute the fairness audit.
@@ -719,7 +1191,55 @@ class FairCareAudit:
                 intervals. Higher values increase precision but take longer.
                 Default: 1000.
             random_seed: Random seed for bootstrap and stochastic steps to
-                ensure reproducible results. Default: 42.
+                ensure reproducible results. Each unit of work (overall
+                performance, each block of its bootstrap, each attribute's
+                subgroup and fairness metrics, each intersection) draws from
+                its own numpy.random.SeedSequence child keyed by the unit.
+                Default: 42.
+            stratified_bootstrap: Preserve each group's outcome counts when
+                resampling for the fairness disparity CIs. Default: False.
+            workers: Number of processes for the independent units. Results
+                are identical for any worker count. -1 uses every core.
+                Default: 1 (serial).
+            bootstrap_tolerance: Opt-in sequential subgroup AUROC bootstrap:
+                each group stops resampling once the Monte Carlo standard
+                error of both CI endpoints is at most this value (AUROC
+                units, e.g. 0.005). Draws taken are recorded per group as
+                ``auroc_ci_draws``. Default: None (always n_bootstrap).
+            mode: "exact" (default) or "approximate". The approximate mode
+                computes every section in one pass from per-group score
+                histograms with APPROXIMATE_SCORE_BINS bins, as
+                StreamingAudit does: counts, confusion metrics, disparities
+                and curves on the bin grid stay exact, and
+                ``reproducibility["approximate"]`` reports the largest
+                possible error of AUROC, AUPRC and percentiles. The
+                "deduplicated" mode uses one bin per distinct score, which
+                compresses the rows losslessly into weighted (group,
+                outcome, score) tuples: every binned metric is exact and
+                the work scales with groups x distinct scores (e.g. scores
+                rounded to 3 decimals), while ICI/ECI/E_max come from the
+                binned calibration curve. When those histogram cells
+                outnumber the rows (e.g. continuous scores) and exceed
+                DEDUPLICATED_MIN_CELLS, deduplication cannot compress the
+                data and the run falls back to the exact mode, recorded in
+                ``reproducibility["deduplicated"]``. ``workers``,
+                ``bootstrap_tolerance`` and ``cache`` apply only to the
+                exact mode.
+            cache: StageCache, or a directory for one, to reuse stage
+                results across runs. Table 1 statistics, overall
+                performance, each attribute's subgroup and fairness metrics
+                and each intersection are cached separately, keyed by a
+                content hash of the encoded columns they read, their
+                settings and the library versions; unchanged stages are
+                loaded instead of recomputed, and an interrupted run resumes
+                from the stages it finished. Entries are aggregate results,
+                never rows. Default: None (no caching, nothing written).
+            auroc_ci_method: Subgroup AUROC CI method. "bootstrap" resamples
+                each group n_bootstrap times; "delong" uses the analytic
+                DeLong variance (one sort per group) and also reports each
+                group's AUROC standard error and the CI and p-value of its
+                AUROC difference from the reference. Exact mode only.
+                Default: "bootstrap".
 
         Returns:
             AuditResults object containing all computed metrics and methods for:
@@ -731,6 +1251,8 @@ class FairCareAudit:
             ConfigurationError: If required config fields are missing
                 (primary_fairness_metric, fairness_justification).
             ConfigurationError: If no sensitive attributes have been added.
+            ValueError: If workers is 0 or below -1, or mode or
+                auroc_ci_method is unknown.
 
         Example:
             >>> # Run audit with confidence intervals
@@ -747,6 +1269,12 @@ class FairCareAudit:
             >>> # Or equivalently:
             >>> results.to_pdf("governance.pdf", persona="governance")
         """
+        if mode not in ("exact", "approximate", "deduplicated"):
+            raise ValueError(f"mode must be 'exact', 'approximate' or 'deduplicated', got {mode!r}")
+        if auroc_ci_method not in AUROC_CI_METHODS:
+            raise ValueError(
+                f"auroc_ci_method must be one of {AUROC_CI_METHODS}, got {auroc_ci_method!r}"
+            )
         self._validate_audit_config()
 
         results = AuditResults(config=self.config, threshold=self.threshold)
@@ -756,35 +1284,73 @@ class FairCareAudit:
             bootstrap_ci=bootstrap_ci,
             n_bootstrap=n_bootstrap,
             random_seed=random_seed,
+            stratified_bootstrap=stratified_bootstrap,
+            workers=workers,
+            bootstrap_tolerance=bootstrap_tolerance,
+            auroc_ci_method=auroc_ci_method,
         )
 
-        # Section 1-4: Computation
-        results.descriptive_stats = self._compute_descriptive_statistics()
-        results.overall_performance = cast(
-            dict[str, Any],
-            self._compute_overall_performance(bootstrap_ci, n_bootstrap, random_seed),
+        if mode == "deduplicated":
+            n_cells, n_rows = self._deduplicated_cells()
+            if n_cells > max(n_rows, DEDUPLICATED_MIN_CELLS):
+                logger.warning(
+                    f"Deduplicated histograms would need {n_cells:,} cells for {n_rows:,} rows "
+                    f"(too many distinct scores); running the exact audit instead"
+                )
+                results.reproducibility["deduplicated"] = {
+                    "fallback": "exact",
+                    "histogram_cells": n_cells,
+                    "n_rows": n_rows,
+                }
+                mode = "exact"
+
+        if mode != "exact":
+            seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+            results.reproducibility[mode] = self._compute_histogram_sections(
+                results,
+                bootstrap_ci,
+                n_bootstrap,
+                seed,
+                stratified_bootstrap,
+                APPROXIMATE_SCORE_BINS if mode == "approximate" else None,
+            )
+            results.flags = self._generate_flags(results)
+            results.governance_recommendation = self._generate_recommendation(results)
+            results._audit = self
+            return results
+
+        stage_cache = StageCache(cache) if isinstance(cache, str | Path) else cache
+
+        # Section 1-5: Computation
+        # Encode once; every stage shares it
+        prepared = self._prepare()
+        context = self._context(
+            prepared,
+            bootstrap_ci,
+            n_bootstrap,
+            random_seed,
+            stratified_bootstrap,
+            bootstrap_tolerance,
+            auroc_ci_method,
         )
-        results.subgroup_performance = self._compute_subgroup_performance(
-            bootstrap_ci, n_bootstrap, random_seed
+        descriptive = None
+        if stage_cache is not None:
+            descriptive_key = context.cache_key(_AuditUnit("descriptive"))
+            descriptive = stage_cache.get(descriptive_key)
+        if descriptive is None:
+            descriptive = self._compute_descriptive_statistics(prepared)
+            if stage_cache is not None:
+                stage_cache.put(descriptive_key, descriptive)
+        results.descriptive_stats = descriptive
+        # Independent units, serially or in a process pool; workers get the
+        # prepared arrays once rather than the DataFrame
+        overall, subgroup, fairness, intersectional = _run_audit_units(
+            context, workers, stage_cache
         )
-        results.fairness_metrics = self._compute_fairness_metrics()
-
-        # Section 5: Intersectional Analysis
-        from faircareai.metrics.subgroup import compute_intersectional
-
-        results.intersectional = {}
-        for intersection in self.intersections:
-            key = " x ".join(intersection)
-            cols = [self._get_attr_column(a) for a in intersection]
-            min_n_val = self.config.get_threshold("min_subgroup_n", 100)
-            results.intersectional[key] = compute_intersectional(
-                df=self.df,
-                y_prob_col=self.pred_col,
-                y_true_col=self.target_col,
-                group_cols=cols,
-                threshold=self.threshold,
-                min_n=int(min_n_val) if min_n_val is not None else 100,
-            )
+        results.overall_performance = cast(dict[str, Any], overall)
+        results.subgroup_performance = subgroup
+        results.fairness_metrics = fairness
+        results.intersectional = intersectional
 
         # Section 6: Generate Flags
         results.flags = self._generate_flags(results)
@@ -797,6 +1363,146 @@ class FairCareAudit:
 
         return results
 
+    def _compute_histogram_sections(
+        self,
+        results: AuditResults,
+        bootstrap_ci: bool,
+        n_bootstrap: int,
+        random_seed: int,
+        stratified_bootstrap: bool,
+        n_bins: int | None,
+    ) -> dict[str, Any]:
+        """Build score histograms and derive every audit section from them.
+
+        Used by run(mode="approximate"/"deduplicated") and StreamingAudit.
+        Sets the descriptive, overall, subgroup, fairness and intersectional
+        sections of ``results``. ``n_bins`` None bins by distinct score.
+
+        Returns:
+            histogram_error_bounds of the computed metrics.
+        """
+        from faircareai.metrics.aggregated import (
+            histogram_cohort_summary,
+            histogram_error_bounds,
+            histogram_fairness_metrics,
+            histogram_intersectional,
+            histogram_overall_performance,
+            histogram_subgroup_metrics,
+        )
+
+        groupings = {a.column: [a.column] for a in self.sensitive_attributes}
+        for names in self.intersections:
+            columns = [self._get_attr_column(name) for name in names]
+            groupings[" x ".join(columns)] = columns
+        histograms = self._histograms(groupings, n_bins)
+
+        results.descriptive_stats = histogram_cohort_summary(
+            {a.column: histograms[a.column] for a in self.sensitive_attributes},
+            {
+                a.name: {"column": a.column, "reference": a.reference}
+                for a in self.sensitive_attributes
+            },
+        )
+        overall = histogram_overall_performance(
+            histograms[self.sensitive_attributes[0].column],
+            bootstrap_ci=bootstrap_ci,
+            n_bootstrap=n_bootstrap,
+            random_seed=unit_seed(random_seed, "overall"),
+        )
+
+        subgroup: dict[str, Any] = {}
+        fairness: dict[str, Any] = {}
+        for attr in self.sensitive_attributes:
+            hist = histograms[attr.column]
+            subgroup[attr.name] = histogram_subgroup_metrics(
+                hist,
+                attr.reference,
+                bootstrap_ci=bootstrap_ci,
+                n_bootstrap=n_bootstrap,
+                random_seed=unit_seed(random_seed, "subgroup", attr.name),
+            )
+            fairness[attr.name] = histogram_fairness_metrics(
+                hist,
+                self.pred_col,
+                self.target_col,
+                attr.reference,
+                bootstrap_ci=bootstrap_ci,
+                n_bootstrap=n_bootstrap,
+                random_seed=unit_seed(random_seed, "fairness", attr.name),
+                stratified=stratified_bootstrap,
+            )
+
+        min_n_val = self.config.get_threshold("min_subgroup_n", 100)
+        intersectional: dict[str, Any] = {}
+        for names in self.intersections:
+            columns = [self._get_attr_column(name) for name in names]
+            intersectional[" x ".join(names)] = histogram_intersectional(
+                histograms[" x ".join(columns)],
+                columns,
+                min_n=int(min_n_val) if min_n_val is not None else 100,
+            )
+
+        results.overall_performance = cast(dict[str, Any], overall)
+        results.subgroup_performance = subgroup
+        results.fairness_metrics = fairness
+        results.intersectional = intersectional
+        return histogram_error_bounds(overall, subgroup, n_bins)
+
+    def _deduplicated_cells(self) -> tuple[int, int]:
+        """Histogram cells mode="deduplicated" would allocate, and the row count.
+
+        Every grouping (attribute or intersection) holds a null slot and one
+        slot per group, times two outcomes, times the distinct scores.
+        Counted with polars ``n_unique`` before anything is encoded.
+        """
+        df = self.df
+        n_levels = df[self.pred_col].n_unique()
+        groupings = [[a.column] for a in self.sensitive_attributes]
+        groupings += [[self._get_attr_column(name) for name in i] for i in self.intersections]
+        slots = sum(
+            df.select(group_key(c, df.schema[c]) for c in columns).drop_nulls().n_unique() + 1
+            for columns in groupings
+        )
+        return slots * 2 * n_levels, len(df)
+
+    def _histograms(
+        self, groupings: dict[str, list[str]], n_bins: int | None
+    ) -> dict[str, ScoreHistogram]:
+        """Score histograms for each grouping, from the encoded columns.
+
+        Args:
+            groupings: Histogram key -> attribute columns it groups by.
+            n_bins: Number of score bins, or None for one bin per distinct
+                score.
+
+        Returns:
+            Dict of ScoreHistogram keyed like ``groupings``.
+        """
+        prepared = self._prepare()
+        levels: np.ndarray | None = None
+        if n_bins is None:
+            levels = np.unique(prepared.y_prob)
+            n_bins = len(levels)
+        histograms = {}
+        for key, columns in groupings.items():
+            attr = (
+                prepared.attribute(columns[0])
+                if len(columns) == 1
+                else prepared.intersection(columns)
+            )
+            histograms[key] = ScoreHistogram.from_arrays(
+                key,
+                attr.groups,
+                attr.codes,
+                prepared.y_true,
+                prepared.y_prob,
+                self.threshold,
+                n_bins,
+                dtype=attr.dtype,
+                levels=levels,
+            )
+        return histograms
+
     def _get_attr_column(self, name: str) -> str:
         """Get column name for attribute."""
         for attr in self.sensitive_attributes:
@@ -804,8 +1510,8 @@ class FairCareAudit:
                 return attr.column
         raise ConfigurationError("attribute_name", f"Attribute not found: {name}")
 
+    @staticmethod
     def _build_flag(
-        self,
         severity: str,
         category: str,
         message: str,
@@ -895,11 +1601,13 @@ class FairCareAudit:
 
         return flags
 
-    def _check_fairness_violations(self, results: AuditResults, thresholds: dict) -> list[dict]:
+    @classmethod
+    def _check_fairness_violations(cls, results: AuditResults, thresholds: dict) -> list[dict]:
         """Check fairness metrics against configured thresholds.
 
         Evaluates demographic parity ratios (EEOC 80% rule) and
-        equalized odds differences for each sensitive attribute.
+        equalized odds differences for each sensitive attribute. Only reads
+        ``results.fairness_metrics``, so FairnessMonitor applies it per window.
         """
         flags = []
         dp_range = thresholds.get("demographic_parity_ratio", (0.8, 1.25))
@@ -909,13 +1617,15 @@ class FairCareAudit:
             if not isinstance(fairness_data, dict):
                 continue
 
+            disparity_ci = fairness_data.get("disparity_ci", {})
+
             # Demographic parity (EEOC 80% rule)
             dp_ratios = fairness_data.get("demographic_parity_ratio", {})
             if isinstance(dp_ratios, dict):
                 for group, ratio in dp_ratios.items():
                     if ratio is not None and (ratio < dp_range[0] or ratio > dp_range[1]):
                         flags.append(
-                            self._build_flag(
+                            cls._build_flag(
                                 severity="warning",
                                 category="fairness",
                                 message=(
@@ -932,6 +1642,7 @@ class FairCareAudit:
                                 group=group,
                                 value=ratio,
                                 threshold=dp_range,
+                                ci_95=disparity_ci.get("demographic_parity_ratio", {}).get(group),
                             )
                         )
 
@@ -941,7 +1652,7 @@ class FairCareAudit:
                 for group, diff in eo_diffs.items():
                     if diff is not None and abs(diff) > eo_threshold:
                         flags.append(
-                            self._build_flag(
+                            cls._build_flag(
                                 severity="warning",
                                 category="fairness",
                                 message=f"Equalized odds difference {diff:.3f} > {eo_threshold}",
@@ -954,6 +1665,7 @@ class FairCareAudit:
                                 group=group,
                                 value=diff,
                                 threshold=eo_threshold,
+                                ci_95=disparity_ci.get("equalized_odds_diff", {}).get(group),
                             )
                         )
 
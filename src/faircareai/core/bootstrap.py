@@ -14,21 +14,36 @@ Usage:
         n_bootstrap=1000,
     )
     ci_lower, ci_upper = compute_percentile_ci(samples)
+
+For rank-based metrics (AUROC, AUPRC) the vectorized engine avoids refitting
+sklearn on every resample:
+
+    samples, n_failed = bootstrap_ranking_metrics(y_true, y_prob, n_bootstrap=1000)
+    ci_lower, ci_upper = compute_percentile_ci(samples["auroc"])
+
+Passing ``tolerance=`` makes a bootstrap sequential: it stops before
+``n_bootstrap`` once the Monte Carlo error of both CI endpoints is within the
+tolerance (see ``ci_converged``). The number of replicates returned (plus
+failures) is the number of draws taken.
 """
 
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
 
 from faircareai.core.constants import (
+    BOOTSTRAP_BLOCK_ELEMENTS,
     DEFAULT_ALPHA,
     DEFAULT_BOOTSTRAP_SEED,
     DEFAULT_N_BOOTSTRAP,
     MIN_BOOTSTRAP_SAMPLES,
+    SEQUENTIAL_CHECK_EVERY,
+    SEQUENTIAL_MIN_DRAWS,
 )
 from faircareai.core.logging import get_logger
+from faircareai.core.validation import safe_divide_array
 
 logger = get_logger(__name__)
 
@@ -43,6 +58,8 @@ def bootstrap_metric(
     seed: int = DEFAULT_BOOTSTRAP_SEED,
     min_classes: int = 2,
     stratified: bool = True,
+    tolerance: float | None = None,
+    alpha: float = DEFAULT_ALPHA,
 ) -> tuple[list[T], int]:
     """Compute bootstrap samples for a metric.
 
@@ -61,10 +78,14 @@ def bootstrap_metric(
             (default: 2 for binary classification).
         stratified: If True, preserve class proportions in each bootstrap sample.
             Recommended for imbalanced datasets (default: True).
+        tolerance: Opt-in sequential mode: stop early once ci_converged holds
+            for the samples so far (checked every SEQUENTIAL_CHECK_EVERY draws).
+        alpha: Significance level of the CI checked in sequential mode.
 
     Returns:
         Tuple of:
-            - list of metric samples (may be shorter than n_bootstrap if some failed)
+            - list of metric samples (may be shorter than n_bootstrap if some
+              failed or the run stopped early)
             - count of failed iterations
 
     Example:
@@ -106,6 +127,10 @@ def bootstrap_metric(
             }
 
     for i in range(n_bootstrap):
+        if i and i % SEQUENTIAL_CHECK_EVERY == 0 and ci_converged(samples, alpha, tolerance):
+            logger.debug("Sequential bootstrap stopped after %d draws", i)
+            break
+
         if stratified:
             # Stratified bootstrap: sample within each class separately
             idx_list: list[int] = []
@@ -153,6 +178,57 @@ def bootstrap_metric(
     return samples, n_failed
 
 
+def bootstrap_confusion_tables(
+    tables: NDArray[np.integer],
+    n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
+    seed: int = DEFAULT_BOOTSTRAP_SEED,
+    stratified: bool = True,
+) -> NDArray[np.int64]:
+    """Resample confusion tables directly from their cell counts.
+
+    A row-level bootstrap of one group only changes that group's 2x2 table, and
+    the resampled table is multinomial on the observed cell proportions. Drawing
+    the four cells directly therefore has the same distribution as resampling
+    rows, at O(n_bootstrap * groups) cost instead of O(n_bootstrap * n).
+    Group sizes are held fixed, i.e. the bootstrap is stratified by group.
+
+    Args:
+        tables: Confusion counts ordered (tp, fp, tn, fn). Shape (4,) for a
+            single table or (groups, 4) for one table per group.
+        n_bootstrap: Number of bootstrap iterations.
+        seed: Random seed for reproducibility.
+        stratified: If True, also preserve outcome counts: positives (tp, fn)
+            and negatives (fp, tn) are resampled separately within each group.
+
+    Returns:
+        Resampled tables of shape (n_bootstrap, *tables.shape).
+    """
+    rng = np.random.default_rng(seed)
+    tables = np.asarray(tables, dtype=np.int64)
+    single = tables.ndim == 1
+    tables = np.atleast_2d(tables)
+    n_groups = tables.shape[0]
+    tp, fp, tn, fn = tables.T
+
+    if stratified:
+        n_pos = tp + fn
+        n_neg = fp + tn
+        tp_boot = rng.binomial(n_pos, safe_divide_array(tp, n_pos), size=(n_bootstrap, n_groups))
+        fp_boot = rng.binomial(n_neg, safe_divide_array(fp, n_neg), size=(n_bootstrap, n_groups))
+        resampled = np.stack([tp_boot, fp_boot, n_neg - fp_boot, n_pos - tp_boot], axis=-1)
+    else:
+        n = tables.sum(axis=1)
+        pvals = safe_divide_array(tables, n[:, None])
+        # Groups with no rows get a placeholder distribution; their draws are all zero
+        pvals[n == 0] = 0.25
+        resampled = rng.multinomial(n, pvals, size=(n_bootstrap, n_groups))
+
+    out: NDArray[np.int64] = np.asarray(resampled, dtype=np.int64)
+    if single:
+        out = out[:, 0, :]
+    return out
+
+
 def bootstrap_confusion_metrics(
     y_true: NDArray[np.integer],
     y_prob: NDArray[np.floating],
@@ -164,7 +240,9 @@ def bootstrap_confusion_metrics(
     """Compute bootstrap samples for confusion matrix-derived metrics.
 
     Specialized bootstrap for metrics derived from the confusion matrix
-    (sensitivity, specificity, PPV, NPV) at a specific threshold.
+    (sensitivity, specificity, PPV, NPV) at a specific threshold. The
+    confusion table is built once and resampled at the count level with
+    ``bootstrap_confusion_tables``.
 
     Args:
         y_true: True binary labels.
@@ -182,73 +260,353 @@ def bootstrap_confusion_metrics(
             - ppv: Positive predictive value samples
             - npv: Negative predictive value samples
     """
-    from sklearn.metrics import confusion_matrix
+    y_true = np.asarray(y_true).ravel()
+    if len(y_true) == 0:
+        logger.warning("Bootstrap called with empty arrays")
+        return {"sensitivity": [], "specificity": [], "ppv": [], "npv": []}
+
+    y_pred = np.asarray(y_prob).ravel() >= threshold
+    positive = y_true == 1
+    table = np.array(
+        [
+            np.sum(positive & y_pred),
+            np.sum(~positive & y_pred),
+            np.sum(~positive & ~y_pred),
+            np.sum(positive & ~y_pred),
+        ]
+    )
+
+    boot = bootstrap_confusion_tables(
+        table, n_bootstrap=n_bootstrap, seed=seed, stratified=stratified
+    )
+    tp, fp, tn, fn = boot.T
 
-    results: dict[str, list[float]] = {
-        "sensitivity": [],
-        "specificity": [],
-        "ppv": [],
-        "npv": [],
+    return {
+        "sensitivity": safe_divide_array(tp, tp + fn).tolist(),
+        "specificity": safe_divide_array(tn, tn + fp).tolist(),
+        "ppv": safe_divide_array(tp, tp + fp).tolist(),
+        "npv": safe_divide_array(tn, tn + fn).tolist(),
     }
 
-    rng = np.random.default_rng(seed)
-    n = len(y_true)
-    n_failed = 0
 
-    # Pre-compute class stratification for stratified bootstrap
-    if stratified:
-        unique_classes = np.unique(y_true)
-        if len(unique_classes) < 2:
-            stratified = False
-        else:
-            class_indices_map = {
-                class_value: np.where(y_true == class_value)[0] for class_value in unique_classes
-            }
+def compute_percentile_ci_array(
+    samples: NDArray[np.floating],
+    alpha: float = DEFAULT_ALPHA,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """Compute percentile CIs column-wise for a matrix of bootstrap samples.
 
-    for i in range(n_bootstrap):
-        if stratified:
-            # Stratified bootstrap
-            idx_list: list[int] = []
-            for class_value in unique_classes:
-                class_indices = class_indices_map[class_value]
-                n_class = len(class_indices)
-                sampled = rng.choice(class_indices, size=n_class, replace=True)
-                idx_list.extend(sampled)
+    Vectorized counterpart of ``compute_percentile_ci`` for replicate arrays
+    of shape (n_bootstrap, ...). NaN replicates (undefined metric values) are
+    ignored; columns with fewer than MIN_BOOTSTRAP_SAMPLES valid values get
+    NaN bounds.
 
-            idx = np.array(idx_list)
-            rng.shuffle(idx)
-        else:
-            # Simple bootstrap
-            idx = rng.choice(n, size=n, replace=True)
-        y_true_boot = y_true[idx]
-        y_pred_boot = (y_prob[idx] >= threshold).astype(int)
+    Args:
+        samples: Bootstrap replicates with replicates along axis 0.
+        alpha: Significance level (default 0.05 for 95% CI).
 
-        try:
-            tn, fp, fn, tp = confusion_matrix(y_true_boot, y_pred_boot, labels=[0, 1]).ravel()
+    Returns:
+        Tuple of (lower, upper) arrays with shape ``samples.shape[1:]``.
+    """
+    samples = np.asarray(samples, dtype=float)
+    n_valid = np.sum(~np.isnan(samples), axis=0)
+    enough = n_valid >= MIN_BOOTSTRAP_SAMPLES
+
+    lower = np.full(samples.shape[1:], np.nan)
+    upper = np.full(samples.shape[1:], np.nan)
+    if np.any(enough):
+        ci = np.nanpercentile(
+            samples[:, enough], [(alpha / 2) * 100, (1 - alpha / 2) * 100], axis=0
+        )
+        lower[enough] = ci[0]
+        upper[enough] = ci[1]
+    return lower, upper
 
-            sens = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-            spec = tn / (tn + fp) if (tn + fp) > 0 else 0.0
-            ppv = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-            npv = tn / (tn + fn) if (tn + fn) > 0 else 0.0
 
-            results["sensitivity"].append(sens)
-            results["specificity"].append(spec)
-            results["ppv"].append(ppv)
-            results["npv"].append(npv)
+def percentile_mc_error(
+    samples: Sequence[Any] | NDArray[Any],
+    q: float,
+) -> float:
+    """Monte Carlo standard error of a bootstrap percentile.
 
-        except ValueError as e:
-            logger.debug("Bootstrap confusion matrix iteration %d failed: %s", i, str(e))
-            n_failed += 1
+    Distribution-free: the number of replicates below the true q-quantile is
+    Binomial(B, q), so the order statistics one binomial standard deviation
+    either side of rank ``B * q`` bracket the estimate; half their distance
+    approximates its standard error. Multi-column samples (replicates along
+    axis 0) return the largest error over columns; NaN replicates are ignored.
+
+    Args:
+        samples: Bootstrap replicates.
+        q: Quantile in [0, 1] (e.g. ``alpha / 2``).
+
+    Returns:
+        Estimated standard error, or inf with fewer than two valid replicates.
+    """
+    values = np.asarray(samples, dtype=float)
+    values = values.reshape(len(values), -1)
+    errors = []
+    for column in values.T:
+        column = np.sort(column[~np.isnan(column)])
+        b = len(column)
+        if b < 2:
+            return float("inf")
+        spread = np.sqrt(b * q * (1 - q))
+        lo = int(np.clip(np.floor(b * q - spread), 0, b - 1))
+        hi = int(np.clip(np.ceil(b * q + spread), 0, b - 1))
+        errors.append((column[hi] - column[lo]) / 2)
+    return float(max(errors)) if errors else float("inf")
+
+
+def ci_converged(
+    samples: Sequence[Any] | NDArray[Any],
+    alpha: float = DEFAULT_ALPHA,
+    tolerance: float | None = None,
+) -> bool:
+    """Whether a sequential bootstrap may stop.
+
+    True once at least SEQUENTIAL_MIN_DRAWS replicates exist and the Monte
+    Carlo standard error of both percentile CI endpoints is at most
+    ``tolerance`` (in the units of the statistic).
+
+    Args:
+        samples: Bootstrap replicates drawn so far.
+        alpha: Significance level of the CI.
+        tolerance: Maximum endpoint standard error; None never stops.
+
+    Returns:
+        True if the CI endpoints are stable within tolerance.
+    """
+    if tolerance is None or len(samples) < SEQUENTIAL_MIN_DRAWS:
+        return False
+    return (
+        max(percentile_mc_error(samples, alpha / 2), percentile_mc_error(samples, 1 - alpha / 2))
+        <= tolerance
+    )
+
+
+def draw_bootstrap_counts(
+    rng: np.random.Generator,
+    n: int,
+    n_draws: int,
+    strata: list[NDArray[np.intp]] | None = None,
+    scheme: str = "multinomial",
+    bins: NDArray[np.intp] | None = None,
+    n_bins: int | None = None,
+) -> NDArray[np.int64]:
+    """Draw resample counts for a block of bootstrap replicates.
+
+    Each row represents one resample as the number of times every observation
+    was drawn, so weighting row i of the data by ``counts[b, i]`` is equivalent
+    to indexing the data with a classical bootstrap index vector.
+
+    Args:
+        rng: NumPy random generator.
+        n: Number of observations.
+        n_draws: Number of replicates (rows) to draw.
+        strata: Optional index arrays partitioning ``range(n)``. Multinomial
+            counts are drawn within each stratum, preserving stratum sizes.
+        scheme: "multinomial" (exact bootstrap, each replicate has n draws) or
+            "poisson" (Poisson(1) weights; replicate sizes vary and strata
+            are ignored).
+        bins: Optional cell index for each observation. When given, counts
+            are summed per cell instead of returned per observation.
+        n_bins: Number of cells (default: ``bins.max() + 1``).
+
+    Returns:
+        Integer array of shape (n_draws, n), or (n_draws, n_bins) with bins.
+
+    Raises:
+        ValueError: If scheme is not recognized.
+    """
+    if scheme not in ("multinomial", "poisson"):
+        raise ValueError(f"Unknown bootstrap scheme: {scheme!r}. Use 'multinomial' or 'poisson'.")
+
+    if bins is None:
+        bins = np.arange(n)
+        n_bins = n
+    elif n_bins is None:
+        n_bins = int(bins.max()) + 1 if n > 0 else 0
+
+    offsets = (np.arange(n_draws) * n_bins)[:, None]
+
+    if scheme == "poisson":
+        weights = rng.poisson(1.0, size=(n_draws, n))
+        cells = np.broadcast_to(bins + offsets, (n_draws, n))
+        summed = np.bincount(cells.ravel(), weights=weights.ravel(), minlength=n_draws * n_bins)
+        return summed.astype(np.int64).reshape(n_draws, n_bins)
+
+    if strata is None:
+        strata = [np.arange(n)]
+
+    picks = np.concatenate(
+        [idx[rng.integers(0, len(idx), size=(n_draws, len(idx)))] for idx in strata if len(idx)],
+        axis=1,
+    )
+    cells = bins[picks] + offsets
+    return np.bincount(cells.ravel(), minlength=n_draws * n_bins).reshape(n_draws, n_bins)
+
+
+def auroc_from_counts(
+    pos_counts: NDArray[np.number],
+    neg_counts: NDArray[np.number],
+) -> NDArray[np.floating]:
+    """Compute AUROC from class weights at ascending score levels.
+
+    Ties within a level count as one half, matching ``roc_auc_score``.
+
+    Args:
+        pos_counts: Positive-class weights per distinct score level, sorted by
+            ascending score. Shape (levels,) or (replicates, levels).
+        neg_counts: Negative-class weights with the same shape.
+
+    Returns:
+        AUROC per replicate (NaN where a class has zero total weight).
+    """
+    pos = np.asarray(pos_counts, dtype=float)
+    neg = np.asarray(neg_counts, dtype=float)
+
+    neg_below = np.cumsum(neg, axis=-1) - neg
+    u_stat = np.sum(pos * (neg_below + 0.5 * neg), axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(u_stat / (pos.sum(axis=-1) * neg.sum(axis=-1)))
+
+
+def auprc_from_counts(
+    pos_counts: NDArray[np.number],
+    neg_counts: NDArray[np.number],
+) -> NDArray[np.floating]:
+    """Compute trapezoidal PR-curve area from class weights at ascending score levels.
+
+    Matches ``auc(recall, precision)`` on ``precision_recall_curve`` output,
+    including the (recall=0, precision=1) anchor point. Levels with zero
+    weight contribute nothing, as they are absent from a resampled array.
+
+    Args:
+        pos_counts: Positive-class weights per distinct score level, sorted by
+            ascending score. Shape (levels,) or (replicates, levels).
+        neg_counts: Negative-class weights with the same shape.
+
+    Returns:
+        AUPRC per replicate (NaN where there are no positives).
+    """
+    # Walk thresholds from the highest score down
+    pos = np.asarray(pos_counts, dtype=float)[..., ::-1]
+    tps = np.cumsum(pos, axis=-1)
+    n_flagged = tps + np.cumsum(np.asarray(neg_counts, dtype=float)[..., ::-1], axis=-1)
+
+    precision = np.ones_like(tps)
+    np.divide(tps, n_flagged, out=precision, where=n_flagged > 0)
+    prev_precision = np.ones_like(precision)
+    prev_precision[..., 1:] = precision[..., :-1]
+
+    # Recall steps by pos / n_pos at each level, so the trapezoid reduces to one sum
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(np.sum(pos * (precision + prev_precision), axis=-1) / (2 * tps[..., -1]))
+
+
+def bootstrap_ranking_metrics(
+    y_true: NDArray[np.integer] | NDArray[np.floating],
+    y_prob: NDArray[np.floating],
+    n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
+    seed: int = DEFAULT_BOOTSTRAP_SEED,
+    stratified: bool = True,
+    metrics: tuple[str, ...] = ("auroc", "auprc"),
+    scheme: str = "multinomial",
+    tolerance: float | None = None,
+    alpha: float = DEFAULT_ALPHA,
+) -> tuple[dict[str, list[float]], int]:
+    """Bootstrap AUROC and AUPRC for many resamples at once.
+
+    Vectorized counterpart of ``bootstrap_metric`` for rank-based metrics.
+    Scores are sorted once; each resample is represented as a vector of
+    counts over the sorted rows, and the metrics are evaluated for a whole
+    block of resamples from weighted cumulative sums. Each replicate equals
+    ``roc_auc_score`` / ``auc(recall, precision)`` on the corresponding
+    index-resampled arrays, so percentile CIs match the loop-based path up to
+    Monte Carlo error.
+
+    Args:
+        y_true: True binary labels (0/1).
+        y_prob: Predicted probabilities.
+        n_bootstrap: Number of bootstrap iterations.
+        seed: Random seed for reproducibility.
+        stratified: If True, preserve class counts in each resample.
+        metrics: Metrics to compute, any of "auroc" and "auprc".
+        scheme: Resample weight scheme, "multinomial" or "poisson".
+        tolerance: Opt-in sequential mode: blocks are capped at
+            SEQUENTIAL_CHECK_EVERY replicates and the run stops once
+            ci_converged holds for every requested metric.
+        alpha: Significance level of the CI checked in sequential mode.
+
+    Returns:
+        Tuple of:
+            - dict mapping metric name to list of bootstrap samples
+            - count of failed iterations (resamples with a single class)
+    """
+    unknown = set(metrics) - {"auroc", "auprc"}
+    if unknown:
+        raise ValueError(f"Unsupported ranking metrics: {sorted(unknown)}")
+
+    samples: dict[str, list[float]] = {name: [] for name in metrics}
+    y_true = np.asarray(y_true).ravel()
+    y_prob = np.asarray(y_prob, dtype=float).ravel()
+    n = len(y_true)
+
+    if n == 0:
+        logger.warning("Bootstrap called with empty arrays")
+        return samples, 0
+
+    rng = np.random.default_rng(seed)
+
+    # Sort once; every resample reuses the same ordering and tie levels
+    order = np.argsort(y_prob, kind="mergesort")
+    prob_sorted = y_prob[order]
+    y_sorted = y_true[order]
+    new_level = np.r_[True, prob_sorted[1:] != prob_sorted[:-1]]
+    n_levels = int(new_level.sum())
+    # Cell 2*level holds negatives at a score level, 2*level + 1 positives
+    cells = 2 * (np.cumsum(new_level) - 1) + (y_sorted == 1)
+
+    strata: list[NDArray[np.intp]] | None = None
+    if stratified:
+        unique_classes = np.unique(y_sorted)
+        # Fall back to simple bootstrap if only one class (stratification not possible)
+        if len(unique_classes) >= 2:
+            strata = [np.flatnonzero(y_sorted == c) for c in unique_classes]
+
+    n_failed = 0
+    block_size = max(1, BOOTSTRAP_BLOCK_ELEMENTS // n)
+    if tolerance is not None:
+        block_size = min(block_size, SEQUENTIAL_CHECK_EVERY)
+    for start in range(0, n_bootstrap, block_size):
+        if start and all(ci_converged(v, alpha, tolerance) for v in samples.values()):
+            logger.debug("Sequential bootstrap stopped after %d draws", start)
+            break
+
+        size = min(block_size, n_bootstrap - start)
+        counts = draw_bootstrap_counts(
+            rng, n, size, strata, scheme, bins=cells, n_bins=2 * n_levels
+        ).reshape(size, n_levels, 2)
+        neg, pos = counts[:, :, 0], counts[:, :, 1]
+
+        valid = (pos.sum(axis=1) > 0) & (neg.sum(axis=1) > 0)
+        n_failed += int(size - valid.sum())
+        if not valid.any():
             continue
 
+        pos, neg = pos[valid], neg[valid]
+        if "auroc" in samples:
+            samples["auroc"].extend(auroc_from_counts(pos, neg).tolist())
+        if "auprc" in samples:
+            samples["auprc"].extend(auprc_from_counts(pos, neg).tolist())
+
     if n_failed > 0:
         logger.debug(
-            "Bootstrap confusion metrics: %d/%d iterations failed",
+            "Vectorized bootstrap: %d/%d resamples contained a single class",
             n_failed,
             n_bootstrap,
         )
 
-    return results
+    return samples, n_failed
 
 
 def compute_percentile_ci(
@@ -332,11 +690,13 @@ def bootstrap_auroc(
     n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
     seed: int = DEFAULT_BOOTSTRAP_SEED,
     stratified: bool = True,
+    tolerance: float | None = None,
 ) -> tuple[list[float], float | None, float | None]:
     """Bootstrap AUROC with confidence interval.
 
     Convenience function specifically for AUROC bootstrapping,
-    the most common use case.
+    the most common use case. Uses the vectorized engine in
+    ``bootstrap_ranking_metrics``.
 
     Args:
         y_true: True binary labels.
@@ -345,6 +705,7 @@ def bootstrap_auroc(
         seed: Random seed for reproducibility.
         stratified: If True, preserve class proportions in each bootstrap sample
             (default: True).
+        tolerance: Opt-in sequential stopping (see bootstrap_ranking_metrics).
 
     Returns:
         Tuple of:
@@ -357,17 +718,16 @@ def bootstrap_auroc(
         >>> if ci_lower is not None:
         ...     print(f"AUROC 95% CI: ({ci_lower:.3f}, {ci_upper:.3f})")
     """
-    from sklearn.metrics import roc_auc_score
-
-    samples, _ = bootstrap_metric(
+    ranking_samples, _ = bootstrap_ranking_metrics(
         y_true,
         y_prob,
-        lambda yt, yp: roc_auc_score(yt, yp),
         n_bootstrap=n_bootstrap,
         seed=seed,
-        min_classes=2,
         stratified=stratified,
+        metrics=("auroc",),
+        tolerance=tolerance,
     )
+    samples = ranking_samples["auroc"]
 
     ci_lower, ci_upper = compute_percentile_ci(samples)
 
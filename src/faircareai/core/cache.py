@@ -0,0 +1,164 @@
+"""
+FairCareAI - Stage Result Cache
+
+Reuse audit stages across runs. ``FairCareAudit.run(cache=...)`` stores the
+result of every independent stage (Table 1 statistics, overall performance,
+and each attribute's subgroup and fairness metrics and each intersection) as
+its own entry, keyed by a content hash of the encoded columns the stage
+reads, the settings it depends on and the library versions. A rerun that
+only changes the output format, or adds a sensitive attribute, loads every
+unchanged stage; a run that was interrupted resumes from the stages it had
+finished.
+
+Entries are pickled aggregate results (group labels, counts and metrics),
+never rows. They still describe the cohort, so the cache is off by default
+in the Python API and can be turned off in the CLI (``--no-cache`` or
+FAIRCAREAI_NO_CACHE=1) where derived data must not be written to disk.
+Only open cache directories you created: entries are unpickled.
+
+Usage:
+    >>> results = audit.run(cache="~/.cache/faircareai")
+    >>> audit.add_sensitive_attribute("insurance")
+    >>> results = audit.run(cache="~/.cache/faircareai")  # only insurance is computed
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from faircareai.core.constants import STAGE_CACHE_MAX_BYTES
+from faircareai.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ENTRY_SUFFIX = ".pkl"
+_KEYED_PACKAGES = ("faircareai", "numpy", "polars", "scikit-learn", "scipy", "statsmodels")
+
+
+@cache
+def _library_versions() -> tuple[str | None, ...]:
+    """Versions of the packages whose code determines stage results."""
+    versions: list[str | None] = []
+    for name in _KEYED_PACKAGES:
+        try:
+            versions.append(metadata.version(name))
+        except metadata.PackageNotFoundError:
+            versions.append(None)
+    return tuple(versions)
+
+
+def stage_key(*parts: Any) -> str:
+    """Cache key over ``parts`` (by repr) and the library versions.
+
+    Args:
+        *parts: Stage name, content digests and settings of a stage.
+
+    Returns:
+        Hex digest naming the cache entry.
+    """
+    payload = repr((_library_versions(), parts)).encode()
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+class StageCache:
+    """
+    Directory of cached stage results with size-based LRU eviction.
+
+    Each entry is one file named by its key. Reading an entry marks it as
+    recently used; after every write the least recently used entries are
+    deleted until the directory holds at most ``max_bytes``.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = STAGE_CACHE_MAX_BYTES):
+        """
+        Open (and create) a stage cache directory.
+
+        Args:
+            directory: Cache directory; ``~`` is expanded.
+            max_bytes: Size limit of the cached entries. Default:
+                STAGE_CACHE_MAX_BYTES.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Cached value for ``key``, or None when there is none.
+
+        Unreadable entries (e.g. truncated by a crash) are deleted and
+        treated as missing.
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(FileNotFoundError):  # evicted concurrently; value is good
+            os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` and evict down to ``max_bytes``.
+
+        The entry is written to a temporary file and renamed into place, so
+        an interrupted write never leaves a partial entry.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def entries(self) -> list[Path]:
+        """Entry files, least recently used first."""
+        stats = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stats.append((path.stat().st_mtime_ns, path))
+            except FileNotFoundError:
+                continue
+        return [path for _, path in sorted(stats)]
+
+    def size_bytes(self) -> int:
+        """Total size of the cached entries."""
+        return sum(path.stat().st_size for path in self.entries() if path.exists())
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = self.entries()
+        sizes = {path: path.stat().st_size for path in entries if path.exists()}
+        total = sum(sizes.values())
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= sizes.get(path, 0)
+            logger.debug(f"Evicted cache entry {path.name}")
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for path in self.entries():
+            path.unlink(missing_ok=True)
@@ -6,6 +6,8 @@ Implements calibration assessment for healthcare ML models:
 2. Cluster bootstrap CIs for calibration metrics
 3. Group calibration parity analysis
 4. Calibration gap computation
+5. Grid-evaluated LOWESS calibration curve (ICI/ECI/E_max)
+6. Batched logistic recalibration (calibration intercept and slope)
 
 ACE is preferred over ECE for healthcare data because:
 - Quantile binning ensures high-risk tail contributes equally
@@ -16,12 +18,25 @@ Methodology: Van Calster et al. (2025), CHAI RAIC AC1.CR102 (calibration).
 
 from __future__ import annotations
 
+import warnings
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import numpy as np
 import polars as pl
-
+from scipy import special, stats
+
+from faircareai.core.bootstrap import ci_converged, draw_bootstrap_counts
+from faircareai.core.constants import (
+    BOOTSTRAP_BLOCK_ELEMENTS,
+    LOWESS_FRAC,
+    LOWESS_GRID_POINTS,
+    LOWESS_SCORE_BINS,
+    SEQUENTIAL_CHECK_EVERY,
+)
+from faircareai.core.histogram import logit_scores, score_bins
 from faircareai.core.logging import get_logger
+from faircareai.core.statistics import ClusterIndex
 
 logger = get_logger(__name__)
 
@@ -43,6 +58,8 @@ class CalibrationResult:
         n_samples: Total sample size.
         n_effective: Effective sample size (accounting for clustering).
         bins_used: Number of bins actually used.
+        n_bootstrap_draws: Bootstrap draws taken for the CI (fewer than
+            requested when a sequential run stopped early), None without CI.
     """
 
     group: str
@@ -53,6 +70,7 @@ class CalibrationResult:
     n_samples: int
     n_effective: int
     bins_used: int
+    n_bootstrap_draws: int | None = None
 
 
 @dataclass
@@ -157,6 +175,158 @@ def compute_ace(
     return (ace, bins_used)
 
 
+# ==============================================================================
+# Batched ACE Kernel
+# ==============================================================================
+
+
+def ace_from_counts(
+    y_true_sorted: np.ndarray,
+    y_prob_sorted: np.ndarray,
+    counts: np.ndarray,
+    n_bins: int = 10,
+    min_per_bin: int = 5,
+) -> np.ndarray:
+    """
+    Compute ACE for a block of resamples at once.
+
+    Each resample is a vector of counts over the rows, which must be sorted
+    by score. Quantile bin edges are interpolated from the weighted sorted
+    scores exactly as ``np.percentile`` would on the expanded resample, and
+    per-bin observed and predicted sums are taken over the row ranges between
+    the edges, so every value equals ``compute_ace`` on the index-resampled
+    arrays (up to floating-point summation order).
+
+    Args:
+        y_true_sorted: Binary outcomes (0/1), in ascending score order.
+        y_prob_sorted: Predicted probabilities in ascending order (no NaN).
+        counts: Integer array (n_resamples, n) of row multiplicities.
+        n_bins: Number of quantile bins.
+        min_per_bin: Minimum samples per bin (bins with fewer are excluded).
+
+    Returns:
+        ACE per resample; NaN for empty resamples or when no bin qualifies.
+    """
+    n_resamples, n = counts.shape
+    if n == 0:
+        return np.full(n_resamples, np.nan)
+
+    y_true_sorted = np.asarray(y_true_sorted, dtype=np.float64)
+    y_prob_sorted = np.asarray(y_prob_sorted, dtype=np.float64)
+
+    cum_w = np.cumsum(counts, axis=1)
+    m = cum_w[:, -1]
+
+    # Quantile edges: np.percentile's linear method on each expanded resample
+    quantiles = np.linspace(0, 100, n_bins + 1) / 100
+    virtual = np.maximum(m - 1, 0)[:, None] * quantiles
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+    expanded = np.stack([previous, np.minimum(previous + 1, np.maximum(m - 1, 0)[:, None])])
+    # Expanded position k is the row where the running count first exceeds k
+    base = np.concatenate(([0], np.cumsum(m)[:-1]))
+    flat = (cum_w + base[:, None]).ravel()
+    targets = expanded + base[:, None]
+    rows = np.searchsorted(flat, targets.ravel(), side="right").reshape(targets.shape)
+    rows = np.minimum(rows - (np.arange(n_resamples) * n)[:, None], n - 1)
+    lo, hi = y_prob_sorted[rows[0]], y_prob_sorted[rows[1]]
+    diff = hi - lo
+    edges = np.where(gamma >= 0.5, hi - diff * (1 - gamma), lo + diff * gamma)
+
+    # Bin boundaries as row positions; inner edges equal to the maximum merge
+    # into the last bin, as np.unique + np.digitize do in compute_ace
+    bounds = np.searchsorted(y_prob_sorted, edges.ravel(), side="left").reshape(edges.shape)
+    bounds[edges >= edges[:, -1:]] = n
+    bounds[:, 0] = 0
+
+    # Bins are contiguous row ranges: sum each with one reduceat over the
+    # flattened block (a trailing zero keeps end-of-block starts in range)
+    starts = (bounds[:, :-1] + (np.arange(n_resamples) * n)[:, None]).ravel()
+    empty = np.diff(bounds, axis=1) == 0
+
+    def bin_sums(weights: np.ndarray) -> np.ndarray:
+        sums = np.add.reduceat(np.append(weights.ravel(), 0.0), starts).reshape(empty.shape)
+        sums[empty] = 0.0
+        return sums
+
+    cum_at = np.take_along_axis(np.pad(cum_w, ((0, 0), (1, 0))), bounds, axis=1)
+    n_in_bin = np.diff(cum_at, axis=1).astype(np.float64)
+    observed = bin_sums(counts * y_true_sorted)
+    predicted = bin_sums(counts * y_prob_sorted)
+
+    used = n_in_bin >= max(min_per_bin, 1)
+    total_error = np.where(used, np.abs(observed - predicted), 0.0).sum(axis=1)
+    total_weight = np.where(used, n_in_bin, 0.0).sum(axis=1)
+    ace = np.divide(
+        total_error, total_weight, out=np.full(n_resamples, np.nan), where=total_weight > 0
+    )
+
+    # Constant resampled scores form a single bin regardless of its size
+    constant = (edges[:, 0] == edges[:, -1]) & (m > 0)
+    if constant.any():
+        ace[constant] = np.abs(observed[constant].sum(axis=1) - predicted[constant].sum(axis=1))
+        ace[constant] /= m[constant]
+    return ace
+
+
+def bootstrap_ace(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    n_bins: int = 10,
+    n_bootstrap: int = 1000,
+    rng: np.random.Generator | None = None,
+    cluster_ids: np.ndarray | None = None,
+    tolerance: float | None = None,
+    alpha: float = 0.05,
+) -> np.ndarray:
+    """
+    Bootstrap replicates of ACE, evaluated in blocks with ace_from_counts.
+
+    Rows with a NaN outcome or score are dropped before resampling.
+
+    Args:
+        y_true: Binary outcomes (0/1).
+        y_prob: Predicted probabilities.
+        n_bins: Number of quantile bins.
+        n_bootstrap: Number of bootstrap iterations.
+        rng: Random generator (default: unseeded).
+        cluster_ids: Optional cluster IDs; clusters are resampled instead of rows.
+        tolerance: Opt-in sequential mode: stop once the CI endpoints'
+            Monte Carlo error is within tolerance (see ci_converged).
+        alpha: Significance level of the CI checked in sequential mode.
+
+    Returns:
+        Array of ACE values (NaN where undefined), one per draw taken:
+        n_bootstrap unless a sequential run stopped early.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    valid = ~(np.isnan(y_true) | np.isnan(y_prob))
+    order = np.flatnonzero(valid)[np.argsort(y_prob[valid], kind="mergesort")]
+    n = len(order)
+    if n == 0:
+        return np.full(n_bootstrap, np.nan)
+
+    index = ClusterIndex.from_ids(cluster_ids[order]) if cluster_ids is not None else None
+    n_units = index.n_clusters if index is not None else n
+
+    aces = np.empty(n_bootstrap)
+    block_size = max(1, BOOTSTRAP_BLOCK_ELEMENTS // n)
+    if tolerance is not None:
+        block_size = min(block_size, SEQUENTIAL_CHECK_EVERY)
+    for start in range(0, n_bootstrap, block_size):
+        if start and ci_converged(aces[:start], alpha, tolerance):
+            return aces[:start]
+
+        size = min(block_size, n_bootstrap - start)
+        counts = draw_bootstrap_counts(rng, n_units, size)
+        if index is not None:
+            counts = counts[:, index.codes]
+        aces[start : start + size] = ace_from_counts(y_true[order], y_prob[order], counts, n_bins)
+    return aces
+
+
 # ==============================================================================
 # ACE with Bootstrap CI
 # ==============================================================================
@@ -170,12 +340,14 @@ def compute_ace_with_ci(
     n_bootstrap: int = 1000,
     alpha: float = 0.05,
     random_state: int | None = None,
+    tolerance: float | None = None,
 ) -> tuple[float, tuple[float, float], int]:
     """
     Compute ACE with bootstrap confidence interval.
 
     Supports cluster-aware bootstrap (resampling at patient level)
-    to account for within-patient correlation.
+    to account for within-patient correlation. Replicates are computed in
+    blocks by bootstrap_ace.
 
     Args:
         y_true: Binary outcomes (0/1).
@@ -185,6 +357,7 @@ def compute_ace_with_ci(
         n_bootstrap: Number of bootstrap iterations.
         alpha: Significance level.
         random_state: Random seed for reproducibility.
+        tolerance: Opt-in sequential stopping (see bootstrap_ace).
 
     Returns:
         Tuple of (ace, (ci_lower, ci_upper), bins_used).
@@ -201,41 +374,535 @@ def compute_ace_with_ci(
     if n == 0:
         return (np.nan, (np.nan, np.nan), 0)
 
-    bootstrap_aces = np.zeros(n_bootstrap)
+    bootstrap_aces = bootstrap_ace(
+        y_true, y_prob, n_bins, n_bootstrap, rng, cluster_ids, tolerance, alpha
+    )
+    return (ace, _percentile_ci(bootstrap_aces, alpha), bins_used)
+
 
-    if cluster_ids is not None:
-        # Cluster-aware bootstrap
-        unique_clusters = np.unique(cluster_ids)
-        n_clusters = len(unique_clusters)
+def _percentile_ci(samples: np.ndarray, alpha: float) -> tuple[float, float]:
+    """Percentile CI over the non-NaN bootstrap samples, NaN bounds if none."""
+    valid = samples[~np.isnan(samples)]
+    if len(valid) == 0:
+        return (np.nan, np.nan)
+    return (
+        float(np.percentile(valid, 100 * alpha / 2)),
+        float(np.percentile(valid, 100 * (1 - alpha / 2))),
+    )
 
-        for i in range(n_bootstrap):
-            sampled_clusters = rng.choice(unique_clusters, size=n_clusters, replace=True)
 
-            # Build resampled indices
-            indices_list: list[int] = []
-            for cluster in sampled_clusters:
-                cluster_mask = cluster_ids == cluster
-                indices_list.extend(np.where(cluster_mask)[0].tolist())
+# ==============================================================================
+# Smoothed Calibration Curve
+# ==============================================================================
 
-            indices = np.array(indices_list)
-            boot_ace, _ = compute_ace(y_true[indices], y_prob[indices], n_bins)
-            bootstrap_aces[i] = boot_ace
-    else:
-        # Standard bootstrap
-        for i in range(n_bootstrap):
-            indices = rng.integers(0, n, size=n)
-            boot_ace, _ = compute_ace(y_true[indices], y_prob[indices], n_bins)
-            bootstrap_aces[i] = boot_ace
-
-    # Filter valid values
-    valid_aces = bootstrap_aces[~np.isnan(bootstrap_aces)]
-    if len(valid_aces) == 0:
-        return (ace, (np.nan, np.nan), bins_used)
+# Grid points x score levels per block of the local fits
+_LOWESS_BLOCK_ELEMENTS = 2**20
+
+
+@dataclass(frozen=True)
+class SmoothedCalibration:
+    """LOWESS calibration curve on a grid, with the errors derived from it.
+
+    Attributes:
+        prob_pred: Ascending predicted risks the curve is evaluated at.
+        prob_true: Smoothed observed risk at each point, clipped to [0, 1].
+        ici: Integrated Calibration Index (mean absolute error over the rows).
+        eci: Estimated Calibration Index (mean squared error over the rows,
+            relative to that of predicting the prevalence).
+        e_max: Largest absolute error at any score.
+        frac: Share of the data in each local fit.
+        max_interpolation_error: Largest deviation of the linearly
+            interpolated curve from the local fit, checked halfway between
+            grid points; 0.0 when the grid is the distinct scores.
+    """
+
+    prob_pred: np.ndarray
+    prob_true: np.ndarray
+    ici: float
+    eci: float
+    e_max: float
+    frac: float
+    max_interpolation_error: float
+
+    def to_dict(self) -> dict[str, list[float] | str | float]:
+        """Curve in the ``calibration_curve_smoothed`` format of the metrics dicts."""
+        return {
+            "prob_true": self.prob_true.tolist(),
+            "prob_pred": self.prob_pred.tolist(),
+            "method": "lowess",
+            "frac": self.frac,
+            "grid_points": len(self.prob_pred),
+            "max_interpolation_error": self.max_interpolation_error,
+        }
+
+
+def _local_linear_fit(
+    points: np.ndarray,
+    levels: np.ndarray,
+    counts: np.ndarray,
+    positives: np.ndarray,
+    window: int,
+) -> np.ndarray:
+    """Tricube-weighted local linear fit at ``points`` over tied score levels.
+
+    Follows statsmodels ``lowess(it=0)``: the window of a point holds its
+    ``window`` nearest rows, the tricube weight falls to zero at the farthest
+    of them, and the fit is the weighted mean where the weighted spread of
+    the scores is below 0.001 of their range.
+    """
+    span = levels[-1] - levels[0]
+    fitted = np.empty(len(points))
+    block = max(1, _LOWESS_BLOCK_ELEMENTS // len(levels))
+    for start in range(0, len(points), block):
+        at = points[start : start + block]
+        distance = np.abs(at[:, None] - levels)
+        order = np.argsort(distance, axis=1, kind="stable")
+        reach = np.cumsum(counts[order], axis=1)
+        kth = np.argmax(reach >= window, axis=1)
+        radius = np.take_along_axis(distance, order[np.arange(len(at)), kth][:, None], axis=1)
+        # A zero radius keeps only the rows at the point itself
+        scaled = distance / np.maximum(radius, np.finfo(np.float64).tiny)
+        weights = (1 - np.minimum(scaled, 1.0) ** 3) ** 3
+
+        total = weights @ counts
+        x_mean = (weights @ (counts * levels)) / total
+        y_mean = (weights @ positives) / total
+        dx = levels - x_mean[:, None]
+        spread = (weights * counts * dx**2).sum(axis=1)
+        covariance = (weights * dx * (positives - counts * y_mean[:, None])).sum(axis=1)
+        linear = np.sqrt(spread / total) > 0.001 * span
+        slope = np.divide(covariance, spread, out=np.zeros_like(spread), where=linear)
+        fitted[start : start + block] = y_mean + slope * (at - x_mean)
+    return fitted
+
+
+def lowess_calibration_from_counts(
+    levels: np.ndarray,
+    counts: np.ndarray,
+    positives: np.ndarray,
+    frac: float = LOWESS_FRAC,
+    n_grid: int = LOWESS_GRID_POINTS,
+) -> SmoothedCalibration | None:
+    """
+    Smoothed calibration curve of rows tied at a few score levels.
+
+    The local regression is only evaluated on a grid of ``n_grid`` predicted
+    risks spanning the scores (or at every level when there are at most
+    ``n_grid``), so its cost is ``n_grid`` x levels and the curve has at most
+    ``n_grid`` points, whatever the number of rows. ICI, ECI and E_max
+    average the error of the linearly interpolated curve over the levels,
+    weighted by their counts.
+
+    Args:
+        levels: Ascending score of each level.
+        counts: Rows per level.
+        positives: Positive outcomes per level.
+        frac: Share of the rows in each local fit.
+        n_grid: Maximum number of points the curve is evaluated at.
+
+    Returns:
+        SmoothedCalibration, or None with fewer than three occupied levels.
+    """
+    occupied = np.asarray(counts) > 0
+    levels = np.asarray(levels, dtype=np.float64)[occupied]
+    counts = np.asarray(counts, dtype=np.float64)[occupied]
+    positives = np.asarray(positives, dtype=np.float64)[occupied]
+    if len(levels) < 3:
+        return None
+
+    n = counts.sum()
+    window = max(int(frac * n + 1e-10), 1)
+    exact = len(levels) <= n_grid
+    grid = levels if exact else np.linspace(levels[0], levels[-1], n_grid)
+    curve = np.clip(_local_linear_fit(grid, levels, counts, positives, window), 0.0, 1.0)
+
+    interpolation_error = 0.0
+    if not exact:
+        midpoints = (grid[:-1] + grid[1:]) / 2
+        at_midpoints = np.clip(
+            _local_linear_fit(midpoints, levels, counts, positives, window), 0.0, 1.0
+        )
+        interpolation_error = float(np.max(np.abs(at_midpoints - (curve[:-1] + curve[1:]) / 2)))
+
+    error = np.interp(levels, grid, curve) - levels
+    prevalence = positives.sum() / n
+    eci_denom = counts @ (prevalence - levels) ** 2 / n
+    eci_numer = counts @ error**2 / n
+    return SmoothedCalibration(
+        prob_pred=grid,
+        prob_true=curve,
+        ici=float(counts @ np.abs(error) / n),
+        eci=float(eci_numer / eci_denom) if eci_denom > 0 else 0.0,
+        e_max=float(np.max(np.abs(error))),
+        frac=frac,
+        max_interpolation_error=interpolation_error,
+    )
+
+
+def lowess_calibration(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    frac: float = LOWESS_FRAC,
+    n_grid: int = LOWESS_GRID_POINTS,
+    n_bins: int = LOWESS_SCORE_BINS,
+) -> SmoothedCalibration | None:
+    """
+    Smoothed (LOWESS) calibration curve evaluated on a fixed grid.
+
+    Replaces ``statsmodels`` ``lowess(frac, it=0)`` over all n rows, which
+    costs O(n^2 frac) and returns n points. The rows are pooled into
+    ``n_bins`` equal-width score bins in one O(n) pass, each bin standing at
+    the mean score of its rows, and the curve is fitted on the bins with
+    lowess_calibration_from_counts. Approximation error:
+
+    - Pooling moves each score by less than ``1 / n_bins``; scores with at
+      most one distinct value per bin (e.g. rounded to 0.001) are not moved.
+    - ICI and E_max interpolate the curve linearly between grid points and
+      deviate from the local fit at each score by about
+      ``max_interpolation_error`` (reported with the curve).
+
+    Args:
+        y_true: Binary outcomes (0/1).
+        y_prob: Predicted probabilities.
+        frac: Share of the rows in each local fit.
+        n_grid: Maximum number of points the curve is evaluated at.
+        n_bins: Score bins the rows are pooled into.
+
+    Returns:
+        SmoothedCalibration, or None with fewer than three occupied bins.
+    """
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    bins = score_bins(y_prob, n_bins)
+    counts = np.bincount(bins, minlength=n_bins)
+    score_sums = np.bincount(bins, weights=y_prob, minlength=n_bins)
+    positives = np.bincount(bins, weights=np.asarray(y_true, dtype=np.float64), minlength=n_bins)
+    levels = score_sums / np.maximum(counts, 1)
+    return lowess_calibration_from_counts(levels, counts, positives, frac, n_grid)
+
+
+# ==============================================================================
+# Logistic Recalibration
+# ==============================================================================
+
+_NEWTON_MAX_ITER = 100
+_NEWTON_TOLERANCE = 1e-10
+_NEWTON_HALVINGS = 30
+
+
+@dataclass(frozen=True)
+class RecalibrationFit:
+    """Calibration intercepts and slopes of a batch of recalibration fits.
+
+    All arrays share one shape (one entry per fit). Standard errors come
+    from the observed information at the estimate, as statsmodels ``Logit``.
+
+    Attributes:
+        intercept: Intercept of ``logit(Y) = a + offset(logit_p)``.
+        slope: Slope of ``logit(Y) = b0 + b1 * logit_p``.
+        intercept_se: Standard error of ``intercept``.
+        slope_se: Standard error of ``slope``.
+    """
+
+    intercept: np.ndarray
+    slope: np.ndarray
+    intercept_se: np.ndarray
+    slope_se: np.ndarray
+
+    def wald_ci(self, name: str, alpha: float = 0.05) -> tuple[np.ndarray, np.ndarray]:
+        """Wald CI bounds of ``"intercept"`` or ``"slope"``."""
+        z = stats.norm.ppf(1 - alpha / 2)
+        estimate, se = getattr(self, name), getattr(self, f"{name}_se")
+        return estimate - z * se, estimate + z * se
+
+
+def recalibration_from_counts(
+    logit_p: np.ndarray,
+    y_true: np.ndarray,
+    counts: np.ndarray,
+    segments: np.ndarray | None = None,
+) -> RecalibrationFit:
+    """
+    Calibration intercept and slope for many frequency-weight vectors at once.
+
+    Fits the Van Calster recalibration models by maximum likelihood:
+    the intercept from ``logit(Y) = a + offset(logit_p)`` and the slope from
+    ``logit(Y) = b0 + b1 * logit_p``. Every row of ``counts`` weights the
+    cells (e.g. one bootstrap resample each), and ``segments`` splits the
+    cells into independent fits (e.g. one per group). All fits take their
+    Newton steps together, each step reducing weighted sums over the cells,
+    so the cost per step is one pass over ``counts``.
+
+    Each Newton step is halved until it does not decrease the
+    log-likelihood, so fits started at perfect calibration also converge
+    for badly overfit models (slopes far below 1). Fits that still do not
+    converge are refitted one at a time with ``statsmodels`` ``GLM``.
+    Results equal ``statsmodels`` ``Logit`` on the expanded rows up to the
+    convergence tolerance.
+
+    Args:
+        logit_p: Logit of the predicted probability of each cell.
+        y_true: Outcome (0/1) of each cell.
+        counts: Frequency weights, shape (n_fits, n_cells) or (n_cells,).
+        segments: Ascending start index of each fitted segment of cells;
+            None fits all cells together.
+
+    Returns:
+        RecalibrationFit with arrays of shape (n_fits,) without segments or
+        (n_fits, n_segments) with them (scalars for 1-d ``counts``); NaN
+        where a fit has no events or no non-events, a constant score (slope
+        only), or has no finite estimate (e.g. perfect separation).
+    """
+    logit_p = np.asarray(logit_p, dtype=np.float64)
+    y_true = np.asarray(y_true, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    single = counts.ndim == 1
+    counts = np.atleast_2d(counts)
+    n_fits, n_cells = counts.shape
+    starts = np.zeros(1, dtype=np.int64) if segments is None else np.asarray(segments, np.int64)
+    sizes = np.diff(np.append(starts, n_cells))
+    occupied = sizes > 0
+
+    fitted = np.full((4, n_fits, len(starts)), np.nan)
+    if n_cells > 0 and occupied.any():
+        # reduceat needs non-empty segments; empty ones stay NaN
+        starts = starts[occupied]
+        cell_segment = np.repeat(np.arange(len(starts)), sizes[occupied])
+        block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // n_cells)
+        segment_ids = np.flatnonzero(occupied)
+        for start in range(0, n_fits, block):
+            fits = slice(start, start + block)
+            estimates, retry = _newton_recalibration(
+                logit_p, y_true, counts[fits], starts, cell_segment
+            )
+            fitted[:, fits, occupied] = estimates
+            for model, fit, segment in np.argwhere(retry):
+                cells = slice(starts[segment], starts[segment] + sizes[occupied][segment])
+                fitted[2 * np.arange(2) + model, start + fit, segment_ids[segment]] = (
+                    _glm_recalibration(
+                        logit_p[cells], y_true[cells], counts[start + fit, cells], model
+                    )
+                )
+    if segments is None:
+        fitted = fitted[:, :, 0]
+    if single:
+        fitted = fitted[:, 0]
+    return RecalibrationFit(*fitted)
+
+
+def _log_likelihood(
+    eta: np.ndarray, y: np.ndarray, counts: np.ndarray, total: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """Weighted Bernoulli log-likelihood of linear predictors ``eta`` per fit."""
+    return total(counts * (y * eta - np.logaddexp(0.0, eta)))
+
+
+def _newton_recalibration(
+    x: np.ndarray,
+    y: np.ndarray,
+    counts: np.ndarray,
+    starts: np.ndarray,
+    cell_segment: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Damped Newton iterations of both recalibration models for one block of fits.
+
+    Returns:
+        Stacked intercept, slope and their standard errors, and a mask
+        (intercept model, slope model) of defined fits that did not
+        converge.
+    """
+
+    def total(values: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(values, starts, axis=1)
+
+    def halve(
+        eta: np.ndarray, delta: np.ndarray, current: np.ndarray, active: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Largest fraction 2**-k of the step ``delta`` (in linear-predictor units)
+        that does not lower the log-likelihood ``current`` of ``eta``."""
+        scale = np.ones_like(current)
+        for _ in range(_NEWTON_HALVINGS):
+            proposed = _log_likelihood(eta + scale[:, cell_segment] * delta, y, counts, total)
+            worse = active & ~(proposed >= current - 1e-12 * (1 + np.abs(current)))
+            if not worse.any():
+                break
+            scale = np.where(worse, scale / 2, scale)
+        return scale, proposed
+
+    n = total(counts)
+    events = total(counts * y)
+    defined = (events > 0) & (events < n)
+
+    # Intercept with logit_p as offset: one-parameter Newton from 0
+    a = np.zeros_like(n)
+    likelihood = _log_likelihood(np.broadcast_to(x, counts.shape), y, counts, total)
+    for _ in range(_NEWTON_MAX_ITER):
+        p = special.expit(a[:, cell_segment] + x)
+        weighted = counts * p
+        gradient = events - total(weighted)
+        information = total(weighted * (1 - p))
+        step = np.divide(
+            gradient, information, out=np.zeros_like(a), where=defined & (information > 0)
+        )
+        converged = np.abs(step) < _NEWTON_TOLERANCE
+        if converged[defined].all():
+            break
+        scale, likelihood = halve(
+            a[:, cell_segment] + x, step[:, cell_segment], likelihood, defined & ~converged
+        )
+        a += scale * step
+    valid = defined & converged & np.isfinite(a) & (information > 0)
+    intercept = np.where(valid, a, np.nan)
+    intercept_se = np.where(valid, 1 / np.sqrt(np.where(valid, information, 1.0)), np.nan)
+    retry_intercept = defined & ~valid
+
+    # Intercept and slope: two-parameter Newton from perfect calibration (0, 1)
+    b0 = np.zeros_like(n)
+    b1 = np.ones_like(n)
+    solvable = defined.copy()
+    likelihood = _log_likelihood(np.broadcast_to(x, counts.shape), y, counts, total)
+    for _ in range(_NEWTON_MAX_ITER):
+        p = special.expit(b0[:, cell_segment] + b1[:, cell_segment] * x)
+        residual = counts * (y - p)
+        variance = counts * p * (1 - p)
+        g0, g1 = total(residual), total(residual * x)
+        h00, h01, h11 = total(variance), total(variance * x), total(variance * x * x)
+        det = h00 * h11 - h01 * h01
+        # A singular information matrix means one distinct score
+        solvable &= det > 1e-12 * np.maximum(h00 * h11, np.finfo(np.float64).tiny)
+        d0 = np.divide(h11 * g0 - h01 * g1, det, out=np.zeros_like(det), where=solvable)
+        d1 = np.divide(h00 * g1 - h01 * g0, det, out=np.zeros_like(det), where=solvable)
+        converged = np.maximum(np.abs(d0), np.abs(d1)) < _NEWTON_TOLERANCE
+        if converged[solvable].all():
+            break
+        scale, likelihood = halve(
+            b0[:, cell_segment] + b1[:, cell_segment] * x,
+            d0[:, cell_segment] + d1[:, cell_segment] * x,
+            likelihood,
+            solvable & ~converged,
+        )
+        b0 += scale * d0
+        b1 += scale * d1
+    valid = solvable & converged & np.isfinite(b1)
+    slope = np.where(valid, b1, np.nan)
+    slope_se = np.where(
+        valid, np.sqrt(np.divide(h00, det, out=np.ones_like(det), where=valid)), np.nan
+    )
+    retry_slope = solvable & ~valid
+    return np.stack([intercept, slope, intercept_se, slope_se]), np.stack(
+        [retry_intercept, retry_slope]
+    )
+
+
+def _glm_recalibration(
+    x: np.ndarray, y: np.ndarray, counts: np.ndarray, model: int
+) -> tuple[float, float]:
+    """Refit one recalibration model with statsmodels ``GLM``.
+
+    Fallback for the fits the batched Newton solver did not converge on.
+
+    Args:
+        x: Logit of the predicted probability of each cell.
+        y: Outcome (0/1) of each cell.
+        counts: Frequency weight of each cell.
+        model: 0 for the offset intercept, 1 for the slope model.
+
+    Returns:
+        Tuple of (estimate, standard_error); NaN when statsmodels warns of
+        separation or non-convergence, or fails.
+    """
+    import statsmodels.api as sm
+    from statsmodels.tools.sm_exceptions import (
+        ConvergenceWarning,
+        PerfectSeparationError,
+        PerfectSeparationWarning,
+    )
+
+    kept = counts > 0
+    x, y, counts = x[kept], y[kept], counts[kept]
+    ones = np.ones((len(x), 1))
+    exog = ones if model == 0 else np.column_stack([ones, x])
+    offset = x if model == 0 else None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ConvergenceWarning)
+            warnings.simplefilter("error", PerfectSeparationWarning)
+            result = sm.GLM(
+                y, exog, family=sm.families.Binomial(), offset=offset, freq_weights=counts
+            ).fit()
+    except (
+        ConvergenceWarning,
+        PerfectSeparationError,
+        PerfectSeparationWarning,
+        np.linalg.LinAlgError,
+        ValueError,
+    ) as e:
+        logger.debug(f"Recalibration fallback fit failed ({type(e).__name__}): {e}")
+        return np.nan, np.nan
+    estimate, se = float(result.params[model]), float(result.bse[model])
+    if not (np.isfinite(estimate) and np.isfinite(se)):
+        return np.nan, np.nan
+    logger.debug("Recalibration fit refitted with statsmodels GLM after Newton did not converge")
+    return estimate, se
+
+
+def group_recalibration(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    group_rows: list[np.ndarray],
+    n_bootstrap: int = 0,
+    rng: np.random.Generator | None = None,
+) -> RecalibrationFit:
+    """
+    Calibration intercept and slope of every group, with bootstrap replicates.
 
-    ci_lower = np.percentile(valid_aces, 100 * alpha / 2)
-    ci_upper = np.percentile(valid_aces, 100 * (1 - alpha / 2))
+    Rows are pooled into cells of equal (group, score, outcome), so tied
+    scores are fitted once, and the bootstrap draws cell counts within each
+    group (draw_bootstrap_counts with the groups as strata). All groups and
+    replicates are fitted together by recalibration_from_counts.
 
-    return (ace, (ci_lower, ci_upper), bins_used)
+    Args:
+        y_true: Binary outcomes (0/1).
+        y_prob: Predicted probabilities.
+        group_rows: Row indices of each group.
+        n_bootstrap: Number of bootstrap replicates (0 for none).
+        rng: Random generator for the replicates (default: unseeded).
+
+    Returns:
+        RecalibrationFit with arrays of shape (1 + n_bootstrap, n_groups):
+        row 0 is the fit on the data, the rest one replicate each. NaN where
+        a fit is undefined (see recalibration_from_counts).
+    """
+    rows = np.concatenate([np.asarray(r, dtype=np.int64) for r in group_rows])
+    sizes = np.array([len(r) for r in group_rows], dtype=np.int64)
+    group_ids = np.repeat(np.arange(len(group_rows)), sizes)
+    x = logit_scores(np.asarray(y_prob)[rows])
+    y = np.asarray(y_true, dtype=np.float64)[rows]
+
+    # Unique sorts by group first, so each group's cells are contiguous
+    cells, cell_of_row = np.unique(np.column_stack([group_ids, x, y]), axis=0, return_inverse=True)
+    cell_of_row = cell_of_row.ravel()
+    n_cells = len(cells)
+    segments = np.searchsorted(cells[:, 0], np.arange(len(group_rows)))
+    counts = np.bincount(cell_of_row, minlength=n_cells)[None, :]
+
+    if n_bootstrap > 0:
+        rng = rng if rng is not None else np.random.default_rng()
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        strata = [np.arange(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)]
+        block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(len(rows), 1))
+        draws = [
+            draw_bootstrap_counts(
+                rng,
+                len(rows),
+                min(block, n_bootstrap - start),
+                strata=strata,
+                bins=cell_of_row,
+                n_bins=n_cells,
+            )
+            for start in range(0, n_bootstrap, block)
+        ]
+        counts = np.vstack([counts, *draws])
+    return recalibration_from_counts(cells[:, 1], cells[:, 2], counts, segments)
 
 
 # ==============================================================================
@@ -252,6 +919,7 @@ def compute_group_calibration(
     n_bootstrap: int = 1000,
     alpha: float = 0.05,
     random_state: int | None = None,
+    tolerance: float | None = None,
 ) -> GroupCalibrationResult:
     """
     Compute calibration metrics separately for each group.
@@ -265,20 +933,28 @@ def compute_group_calibration(
         n_bootstrap: Number of bootstrap iterations.
         alpha: Significance level.
         random_state: Random seed.
+        tolerance: Opt-in sequential stopping per group (see bootstrap_ace);
+            the gap CI uses the draws common to every group.
 
     Returns:
         GroupCalibrationResult with per-group results and gap.
     """
     rng = np.random.default_rng(random_state)
-    unique_groups = np.unique(groups)
+    unique_groups, group_codes = np.unique(groups, return_inverse=True)
+
+    # Partition rows by group once; each group's bootstrap replicates serve
+    # both its own CI and the calibration-gap CI
+    order = np.argsort(group_codes.reshape(-1), kind="stable")
+    bounds = np.cumsum(np.bincount(group_codes.reshape(-1), minlength=len(unique_groups)))
+    partitions = np.split(order, bounds[:-1])
 
     group_results = {}
+    group_boot_aces = []
 
-    for group in unique_groups:
-        group_mask = groups == group
-        group_y_true = y_true[group_mask]
-        group_y_prob = y_prob[group_mask]
-        group_clusters = cluster_ids[group_mask] if cluster_ids is not None else None
+    for group, rows in zip(unique_groups, partitions, strict=True):
+        group_y_true = y_true[rows]
+        group_y_prob = y_prob[rows]
+        group_clusters = cluster_ids[rows] if cluster_ids is not None else None
 
         # Compute effective sample size
         if group_clusters is not None:
@@ -286,14 +962,23 @@ def compute_group_calibration(
         else:
             n_effective = len(group_y_true)
 
-        ace, (ci_lower, ci_upper), bins_used = compute_ace_with_ci(
+        ace, bins_used = compute_ace(group_y_true, group_y_prob, n_bins)
+        group_rng = np.random.default_rng(
+            rng.integers(0, 2**31) if random_state is not None else None
+        )
+        boot_aces = bootstrap_ace(
             group_y_true,
             group_y_prob,
-            cluster_ids=group_clusters,
-            n_bins=n_bins,
-            n_bootstrap=n_bootstrap,
-            alpha=alpha,
-            random_state=rng.integers(0, 2**31) if random_state is not None else None,
+            n_bins,
+            n_bootstrap,
+            group_rng,
+            group_clusters,
+            tolerance,
+            alpha,
+        )
+        group_boot_aces.append(boot_aces)
+        ci_lower, ci_upper = (
+            _percentile_ci(boot_aces, alpha) if n_bootstrap > 0 else (np.nan, np.nan)
         )
 
         group_results[str(group)] = CalibrationResult(
@@ -305,6 +990,7 @@ def compute_group_calibration(
             n_samples=len(group_y_true),
             n_effective=n_effective,
             bins_used=bins_used,
+            n_bootstrap_draws=len(boot_aces) if n_bootstrap > 0 else None,
         )
 
     # Compute calibration gap
@@ -321,35 +1007,15 @@ def compute_group_calibration(
     # Bootstrap CI for calibration gap if requested
     gap_ci = None
     if n_bootstrap > 0 and len(unique_groups) >= 2:
-        gap_bootstraps = np.zeros(n_bootstrap)
-
-        for i in range(n_bootstrap):
-            group_aces = []
-            for group in unique_groups:
-                group_mask = groups == group
-                group_y_true = y_true[group_mask]
-                group_y_prob = y_prob[group_mask]
-
-                n = len(group_y_true)
-                if n == 0:
-                    continue
-
-                indices = rng.integers(0, n, size=n)
-                boot_ace, _ = compute_ace(group_y_true[indices], group_y_prob[indices], n_bins)
-                if not np.isnan(boot_ace):
-                    group_aces.append(boot_ace)
-
-            if len(group_aces) >= 2:
-                gap_bootstraps[i] = max(group_aces) - min(group_aces)
-            else:
-                gap_bootstraps[i] = np.nan
-
-        valid_gaps = gap_bootstraps[~np.isnan(gap_bootstraps)]
-        if len(valid_gaps) > 0:
-            gap_ci = (
-                np.percentile(valid_gaps, 100 * alpha / 2),
-                np.percentile(valid_gaps, 100 * (1 - alpha / 2)),
-            )
+        n_common = min(len(b) for b in group_boot_aces)
+        boot = np.stack([b[:n_common] for b in group_boot_aces])
+        gap_bootstraps = np.full(n_common, np.nan)
+        enough = (~np.isnan(boot)).sum(axis=0) >= 2
+        gap_bootstraps[enough] = np.nanmax(boot[:, enough], axis=0) - np.nanmin(
+            boot[:, enough], axis=0
+        )
+        if not np.isnan(gap_bootstraps).all():
+            gap_ci = _percentile_ci(gap_bootstraps, alpha)
 
     return GroupCalibrationResult(
         group_results=group_results,
@@ -374,6 +1040,7 @@ def compute_calibration_from_df(
     n_bootstrap: int = 1000,
     alpha: float = 0.05,
     random_state: int | None = None,
+    tolerance: float | None = None,
 ) -> CalibrationResult | GroupCalibrationResult:
     """
     Compute calibration metrics from a Polars DataFrame.
@@ -388,6 +1055,7 @@ def compute_calibration_from_df(
         n_bootstrap: Number of bootstrap iterations.
         alpha: Significance level.
         random_state: Random seed.
+        tolerance: Opt-in sequential bootstrap stopping (see bootstrap_ace).
 
     Returns:
         CalibrationResult if no group_col, else GroupCalibrationResult.
@@ -403,9 +1071,22 @@ def compute_calibration_from_df(
         else:
             n_effective = len(df)
 
-        ace, (ci_lower, ci_upper), bins_used = compute_ace_with_ci(
-            y_true, y_prob, cluster_ids, n_bins, n_bootstrap, alpha, random_state
-        )
+        ace, bins_used = compute_ace(y_true, y_prob, n_bins)
+        ci_lower, ci_upper = (np.nan, np.nan)
+        n_draws = None
+        if n_bootstrap > 0 and len(df) > 0:
+            boot_aces = bootstrap_ace(
+                y_true,
+                y_prob,
+                n_bins,
+                n_bootstrap,
+                np.random.default_rng(random_state),
+                cluster_ids,
+                tolerance,
+                alpha,
+            )
+            ci_lower, ci_upper = _percentile_ci(boot_aces, alpha)
+            n_draws = len(boot_aces)
 
         return CalibrationResult(
             group="all",
@@ -416,10 +1097,11 @@ def compute_calibration_from_df(
             n_samples=len(df),
             n_effective=n_effective,
             bins_used=bins_used,
+            n_bootstrap_draws=n_draws,
         )
     else:
         # Group-level calibration
         groups = df[group_col].to_numpy()
         return compute_group_calibration(
-            y_true, y_prob, groups, cluster_ids, n_bins, n_bootstrap, alpha, random_state
+            y_true, y_prob, groups, cluster_ids, n_bins, n_bootstrap, alpha, random_state, tolerance
         )
@@ -55,6 +55,68 @@ DEFAULT_CONFIDENCE_LEVEL: Final[float] = 0.95
 DEFAULT_ALPHA: Final[float] = 0.05
 """Default significance level (1 - confidence_level)."""
 
+BOOTSTRAP_BLOCK_ELEMENTS: Final[int] = 2**24
+"""Maximum resample-count cells (replicates x rows) held in memory per vectorized block."""
+
+PARALLEL_BOOTSTRAP_BLOCK: Final[int] = 250
+"""Replicates per scheduled overall-bootstrap block in FairCareAudit.run (fixed, so the
+block seeds and results do not depend on the worker count)."""
+
+SEQUENTIAL_MIN_DRAWS: Final[int] = 200
+"""Draws taken before a sequential (``tolerance=``) bootstrap may stop early."""
+
+SEQUENTIAL_CHECK_EVERY: Final[int] = 100
+"""Draws between stopping checks in sequential bootstrap and permutation runs."""
+
+AUROC_CI_METHODS: Final[tuple[str, ...]] = ("bootstrap", "delong")
+"""AUROC confidence interval methods: percentile bootstrap, or the analytic DeLong variance."""
+
+BESAG_CLIFFORD_EXCEEDANCES: Final[int] = 10
+"""Null statistics at least as extreme as observed after which a sequential permutation
+test stops (Besag & Clifford 1991), reporting p = h / draws."""
+
+STREAMING_SCORE_BINS: Final[int] = 1000
+"""Equal-width score bins of the histograms behind streaming audits. Confusion counts
+are exact on the grid of multiples of 1 / bins and at the decision threshold."""
+
+APPROXIMATE_SCORE_BINS: Final[int] = 10_000
+"""Score bins of ``FairCareAudit.run(mode="approximate")``; AUROC/AUPRC error bounds and
+percentile errors shrink with the bin width."""
+
+DEDUPLICATED_MIN_CELLS: Final[int] = 2**20
+"""Histogram cells (slots x outcomes x distinct scores, over all groupings) that
+``mode="deduplicated"`` may always allocate; above this it runs only when the cells are
+fewer than the rows, else it falls back to the exact mode."""
+
+LOWESS_FRAC: Final[float] = 0.75
+"""Share of the data in each local fit of the smoothed (LOWESS) calibration curve."""
+
+LOWESS_GRID_POINTS: Final[int] = 200
+"""Predicted-risk points the smoothed calibration curve is evaluated at; ICI/ECI/E_max
+interpolate between them."""
+
+LOWESS_SCORE_BINS: Final[int] = 10_000
+"""Equal-width score bins whose centroids stand in for the rows in the smoothed
+calibration curve; each score moves by at most 1 / bins."""
+
+SQL_SCHEMA_SAMPLE_ROWS: Final[int] = 1000
+"""Rows a SQLAudit reads to infer the column dtypes of its table or query."""
+
+IPC_FILE_SUFFIXES: Final[tuple[str, ...]] = (".arrow", ".feather", ".ipc")
+"""File suffixes read as Arrow IPC (Feather v2), memory-mapped."""
+
+STAGE_CACHE_MAX_BYTES: Final[int] = 1024**3
+"""Default size limit of a StageCache directory (1 GiB); least recently used entries go first."""
+
+MONITORING_PERIOD: Final[str] = "1d"
+"""Default period (polars duration) that FairnessMonitor buckets timestamps into."""
+
+MONITORING_WINDOW: Final[int] = 7
+"""Default rolling-window length of FairnessMonitor, in periods."""
+
+MONITORING_HALF_LIFE: Final[float] = 7.0
+"""Default half-life of FairnessMonitor's exponentially decayed metrics, in periods."""
+
 
 # =============================================================================
 # FAIRNESS THRESHOLDS
@@ -96,6 +158,12 @@ MAX_MISSING_RATE: Final[float] = 0.10
 DEFAULT_DECISION_THRESHOLD: Final[float] = 0.5
 """Default decision/classification threshold."""
 
+THRESHOLD_GRID_SIZE: Final[int] = 1000
+"""Number of grid steps on (0, 1) for threshold sweeps and threshold search."""
+
+THRESHOLD_GAP_TOLERANCE: Final[float] = 0.01
+"""Fairness gaps within this margin of the minimum are treated as tied in threshold search."""
+
 
 # =============================================================================
 # CALIBRATION PARAMETERS
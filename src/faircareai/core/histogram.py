@@ -0,0 +1,583 @@
+"""
+Score Histograms
+
+Additive sufficient statistics for the count-based audit metrics. A
+ScoreHistogram holds, for each group of one grouping (a sensitive attribute
+or an intersection of several), the number of cases per (outcome, score
+bin), the number flagged at the decision threshold, and sums of the scores
+and of their logits.
+Histograms of disjoint sets of rows add up (ScoreHistogram.merge), so they
+can be built by a streaming query, chunk by chunk, or per site and combined
+without holding or moving the rows.
+
+Scores fall into ``n_bins`` equal-width bins with lower edges ``k / n_bins``:
+bin ``k`` holds ``edge[k] <= y_prob < edge[k + 1]`` (the last bin also holds
+1.0). Confusion counts are therefore exact at the decision threshold and at
+every threshold on the grid. Rank metrics treat each bin as one tied score
+level, so AUROC comes with the largest possible deviation from its exact
+value.
+
+With ``levels`` (the sorted distinct scores) instead of ``n_bins``, each bin
+is one score value and the histogram is a lossless weighted deduplication of
+the (group, outcome, score) tuples: threshold curves, rank metrics and
+percentiles are then exact. The arrays stay dense, so time and memory scale
+with groups x distinct scores rather than the rows; that only pays off when
+scores repeat (FairCareAudit.run(mode="deduplicated") falls back to the
+exact mode otherwise).
+
+Usage:
+    >>> hist = ScoreHistogram.from_arrays("race", groups, codes, y_true, y_prob, 0.5)
+    >>> hist.aggregates()  # per-group confusion counts at 0.5
+    >>> hist.auroc(hist.slot("Black"))
+    (0.781, 0.0004)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from faircareai.core.bootstrap import auprc_from_counts, auroc_from_counts
+from faircareai.core.constants import PROB_CLIP_MAX, PROB_CLIP_MIN, STREAMING_SCORE_BINS
+from faircareai.core.thresholds import ThresholdIndex
+from faircareai.core.validation import safe_divide_array
+
+AGGREGATE_COLUMNS = (
+    "_outcome",
+    "_bin",
+    "n",
+    "flagged",
+    "prob_sum",
+    "logit_sum",
+    "prob_sq_sum",
+    "prob_min",
+    "prob_max",
+)
+"""Columns of an aggregate frame (besides the group key), see ScoreHistogram.from_aggregates."""
+
+
+def score_bins(y_prob: np.ndarray, n_bins: int = STREAMING_SCORE_BINS) -> np.ndarray:
+    """Histogram bin of each score.
+
+    ``floor(y_prob * n_bins)`` corrected by one where rounding disagrees with
+    the edge comparison, so that bin ``k`` is exactly ``k / n_bins <= y_prob
+    < (k + 1) / n_bins``. Same rule as score_bin_expr.
+
+    Args:
+        y_prob: Predicted probabilities in [0, 1].
+        n_bins: Number of equal-width bins.
+
+    Returns:
+        int64 bin indices in [0, n_bins).
+    """
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    raw = np.floor(y_prob * n_bins)
+    raw -= y_prob < raw / n_bins
+    raw += y_prob >= (raw + 1) / n_bins
+    return np.asarray(np.clip(raw, 0, n_bins - 1), dtype=np.int64)
+
+
+def logit_scores(y_prob: np.ndarray) -> np.ndarray:
+    """Logit of predicted probabilities clipped to [PROB_CLIP_MIN, PROB_CLIP_MAX]."""
+    clipped = np.clip(np.asarray(y_prob, dtype=np.float64), PROB_CLIP_MIN, PROB_CLIP_MAX)
+    return np.log(clipped / (1 - clipped))
+
+
+def score_bin_expr(column: str, n_bins: int = STREAMING_SCORE_BINS) -> pl.Expr:
+    """Polars expression for score_bins over ``column``."""
+    score = pl.col(column).cast(pl.Float64)
+    # Polars rewrites division by a literal as multiplication by its
+    # reciprocal, which moves edges like 9 / 1000 by an ulp; dividing by an
+    # expression keeps true division and stays in the streaming engine
+    width = score * 0 + n_bins
+    raw = (score * n_bins).floor()
+    lower = raw - (score < raw / width).cast(pl.Float64)
+    upper = lower + (score >= (lower + 1) / width).cast(pl.Float64)
+    return upper.clip(0, n_bins - 1).cast(pl.Int32)
+
+
+def logit_score_expr(column: str) -> pl.Expr:
+    """Polars expression for logit_scores over ``column``."""
+    clipped = pl.col(column).cast(pl.Float64).clip(PROB_CLIP_MIN, PROB_CLIP_MAX)
+    return (clipped / (1 - clipped)).log()
+
+
+def _same_levels(a: np.ndarray | None, b: np.ndarray | None) -> bool:
+    """Whether two histograms bin scores the same way (both equal-width or equal levels)."""
+    if a is None or b is None:
+        return a is b
+    return bool(np.array_equal(a, b))
+
+
+@dataclass
+class ScoreHistogram:
+    """Per-group score histograms for one grouping.
+
+    Slot 0 holds the rows where the grouping is null; slot ``i + 1`` holds
+    ``groups[i]``. Outcome index 0 is the negative class, 1 the positive.
+
+    Attributes:
+        column: Grouping column (intersections join their columns with " x ").
+        dtype: Polars dtype of the group values.
+        groups: Non-null group values in sorted order.
+        threshold: Decision threshold of ``flagged``.
+        counts: Cases per (slot, outcome, bin), int64 of shape (slots, 2, n_bins).
+        flagged: Cases with ``y_prob >= threshold`` per (slot, outcome).
+        prob_sum: Score sums per (slot, outcome, bin).
+        logit_sum: Sums of the score logits (logit_scores) per (slot,
+            outcome, bin); the calibration fits use their cell means.
+        prob_sq_sum: Squared-score sums per (slot, outcome).
+        prob_min: Smallest score per slot (inf where empty).
+        prob_max: Largest score per slot (-inf where empty).
+        levels: Ascending score of each bin when bins are the distinct
+            scores, or None for equal-width bins.
+    """
+
+    column: str
+    dtype: pl.DataType
+    groups: list[Any]
+    threshold: float
+    counts: np.ndarray
+    flagged: np.ndarray
+    prob_sum: np.ndarray
+    logit_sum: np.ndarray
+    prob_sq_sum: np.ndarray
+    prob_min: np.ndarray
+    prob_max: np.ndarray
+    levels: np.ndarray | None = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        column: str,
+        groups: list[Any],
+        codes: np.ndarray,
+        y_true: np.ndarray,
+        y_prob: np.ndarray,
+        threshold: float,
+        n_bins: int = STREAMING_SCORE_BINS,
+        dtype: pl.DataType | None = None,
+        levels: np.ndarray | None = None,
+    ) -> ScoreHistogram:
+        """Build from row arrays with group codes (as EncodedAttribute.codes).
+
+        Args:
+            column: Grouping column name.
+            groups: Group values; code ``i`` is ``groups[i]``, -1 is null.
+            codes: Per-row group code.
+            y_true: Outcomes (0/1).
+            y_prob: Predicted probabilities.
+            threshold: Decision threshold for ``flagged``.
+            n_bins: Number of score bins (ignored when ``levels`` is given).
+            dtype: Polars dtype of the group values (inferred when None).
+            levels: Strictly ascending scores containing every ``y_prob``
+                (e.g. ``np.unique(y_prob)``); each becomes its own bin.
+
+        Returns:
+            ScoreHistogram of the rows.
+        """
+        n_slots = len(groups) + 1
+        y_prob = np.asarray(y_prob, dtype=np.float64)
+        pairs = (np.asarray(codes, dtype=np.int64) + 1) * 2 + (np.asarray(y_true) == 1)
+        if levels is None:
+            bins = score_bins(y_prob, n_bins)
+        else:
+            levels = np.asarray(levels, dtype=np.float64)
+            n_bins = len(levels)
+            bins = np.searchsorted(levels, y_prob)
+        cells = pairs * n_bins + bins
+
+        size = n_slots * 2 * n_bins
+        shape = (n_slots, 2, n_bins)
+        slots = pairs // 2
+        prob_min = np.full(n_slots, np.inf)
+        prob_max = np.full(n_slots, -np.inf)
+        np.minimum.at(prob_min, slots, y_prob)
+        np.maximum.at(prob_max, slots, y_prob)
+        return cls(
+            column=column,
+            dtype=pl.Series(groups).dtype if dtype is None else dtype,
+            groups=list(groups),
+            threshold=threshold,
+            counts=np.bincount(cells, minlength=size).reshape(shape),
+            flagged=np.bincount(pairs[y_prob >= threshold], minlength=n_slots * 2).reshape(
+                n_slots, 2
+            ),
+            prob_sum=np.bincount(cells, weights=y_prob, minlength=size).reshape(shape),
+            logit_sum=np.bincount(cells, weights=logit_scores(y_prob), minlength=size).reshape(
+                shape
+            ),
+            prob_sq_sum=np.bincount(pairs, weights=y_prob * y_prob, minlength=n_slots * 2).reshape(
+                n_slots, 2
+            ),
+            prob_min=prob_min,
+            prob_max=prob_max,
+            levels=levels,
+        )
+
+    @classmethod
+    def from_aggregates(
+        cls,
+        frame: pl.DataFrame,
+        column: str,
+        threshold: float,
+        n_bins: int = STREAMING_SCORE_BINS,
+    ) -> ScoreHistogram:
+        """Build from a grouped aggregate frame.
+
+        ``frame`` has one row per observed (group, outcome, bin) with the
+        group key in ``column`` and the AGGREGATE_COLUMNS: ``_outcome`` (0/1),
+        ``_bin`` (score_bins), and the case count, flagged count, score sum,
+        score-logit sum, squared-score sum, min and max of the cell. This is what a streaming
+        or database group-by returns.
+
+        Args:
+            frame: Aggregate frame.
+            column: Group key column.
+            threshold: Decision threshold the flagged counts were taken at.
+            n_bins: Number of score bins.
+
+        Returns:
+            ScoreHistogram of the aggregated rows.
+        """
+        keys = frame[column]
+        groups = keys.drop_nulls().unique().sort().to_list()
+        n_slots = len(groups) + 1
+        # Dense ranks are 1..G in sorted order and stay null for null keys
+        slots = keys.rank("dense").fill_null(0).to_numpy().astype(np.int64)
+        pairs = slots * 2 + frame["_outcome"].to_numpy().astype(np.int64)
+        cells = pairs * n_bins + frame["_bin"].to_numpy().astype(np.int64)
+
+        def cell_sum(name: str) -> np.ndarray:
+            values = frame[name].cast(pl.Float64).to_numpy()
+            return np.bincount(cells, weights=values, minlength=n_slots * 2 * n_bins)
+
+        def pair_sum(name: str) -> np.ndarray:
+            values = frame[name].cast(pl.Float64).to_numpy()
+            return np.bincount(pairs, weights=values, minlength=n_slots * 2)
+
+        shape = (n_slots, 2, n_bins)
+        prob_min = np.full(n_slots, np.inf)
+        prob_max = np.full(n_slots, -np.inf)
+        np.minimum.at(prob_min, slots, frame["prob_min"].cast(pl.Float64).to_numpy())
+        np.maximum.at(prob_max, slots, frame["prob_max"].cast(pl.Float64).to_numpy())
+        return cls(
+            column=column,
+            dtype=keys.dtype,
+            groups=groups,
+            threshold=threshold,
+            counts=cell_sum("n").round().astype(np.int64).reshape(shape),
+            flagged=pair_sum("flagged").round().astype(np.int64).reshape(n_slots, 2),
+            prob_sum=cell_sum("prob_sum").reshape(shape),
+            logit_sum=cell_sum("logit_sum").reshape(shape),
+            prob_sq_sum=pair_sum("prob_sq_sum").reshape(n_slots, 2),
+            prob_min=prob_min,
+            prob_max=prob_max,
+        )
+
+    def to_aggregates(self) -> pl.DataFrame:
+        """Aggregate frame of the occupied cells; from_aggregates restores the histogram.
+
+        Per-(group, outcome) statistics sit on the group's first occupied
+        bin and the per-group min/max on every row, so the frame is a
+        compact, dtype-preserving serialization.
+        """
+        slot, outcome, bins = np.nonzero(self.counts)
+        pair = slot * 2 + outcome
+        first = np.ones(len(pair), dtype=bool)
+        first[1:] = pair[1:] != pair[:-1]
+        keys = pl.Series(self.column, [None, *self.groups], dtype=self.dtype)
+        return pl.DataFrame(
+            [
+                keys.gather(slot),
+                pl.Series("_outcome", outcome, dtype=pl.Int8),
+                pl.Series("_bin", bins, dtype=pl.Int32),
+                pl.Series("n", self.counts[slot, outcome, bins], dtype=pl.Int64),
+                pl.Series("flagged", np.where(first, self.flagged[slot, outcome], 0)),
+                pl.Series("prob_sum", self.prob_sum[slot, outcome, bins]),
+                pl.Series("logit_sum", self.logit_sum[slot, outcome, bins]),
+                pl.Series("prob_sq_sum", np.where(first, self.prob_sq_sum[slot, outcome], 0.0)),
+                pl.Series("prob_min", self.prob_min[slot]),
+                pl.Series("prob_max", self.prob_max[slot]),
+            ]
+        )
+
+    def merge(self, other: ScoreHistogram) -> ScoreHistogram:
+        """Histogram of the rows of both histograms (disjoint row sets).
+
+        Groups are the union of both group lists, in sorted order.
+
+        Raises:
+            ValueError: If the grouping, threshold, bin count or score levels differ.
+        """
+        if (self.column, self.threshold, self.n_bins) != (
+            other.column,
+            other.threshold,
+            other.n_bins,
+        ) or not _same_levels(self.levels, other.levels):
+            raise ValueError(
+                f"Cannot merge histograms of {self.column!r} at threshold {self.threshold} "
+                f"({self.n_bins} bins) and {other.column!r} at threshold {other.threshold} "
+                f"({other.n_bins} bins)"
+            )
+
+        dtype = self.dtype if self.groups else other.dtype
+        groups = pl.Series([*self.groups, *other.groups], dtype=dtype).unique().sort().to_list()
+        position = {group: i + 1 for i, group in enumerate(groups)}
+        shape = (len(groups) + 1, 2, self.n_bins)
+        merged = ScoreHistogram(
+            column=self.column,
+            dtype=dtype,
+            groups=groups,
+            threshold=self.threshold,
+            counts=np.zeros(shape, dtype=np.int64),
+            flagged=np.zeros(shape[:2], dtype=np.int64),
+            prob_sum=np.zeros(shape),
+            logit_sum=np.zeros(shape),
+            prob_sq_sum=np.zeros(shape[:2]),
+            prob_min=np.full(shape[0], np.inf),
+            prob_max=np.full(shape[0], -np.inf),
+            levels=self.levels,
+        )
+        for hist in (self, other):
+            slots = np.array([0, *(position[g] for g in hist.groups)], dtype=np.int64)
+            merged.counts[slots] += hist.counts
+            merged.flagged[slots] += hist.flagged
+            merged.prob_sum[slots] += hist.prob_sum
+            merged.logit_sum[slots] += hist.logit_sum
+            merged.prob_sq_sum[slots] += hist.prob_sq_sum
+            merged.prob_min[slots] = np.minimum(merged.prob_min[slots], hist.prob_min)
+            merged.prob_max[slots] = np.maximum(merged.prob_max[slots], hist.prob_max)
+        return merged
+
+    @property
+    def n_bins(self) -> int:
+        """Number of score bins."""
+        return int(self.counts.shape[-1])
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Lower bin edges, ``k / n_bins``, or the score levels."""
+        if self.levels is not None:
+            return self.levels
+        return np.arange(self.n_bins) / self.n_bins
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Cases per slot (slot 0 is the null group)."""
+        return np.asarray(self.counts.sum(axis=(1, 2)))
+
+    def slot(self, group: Any) -> int:
+        """Slot of ``group``.
+
+        Raises:
+            ValueError: If the group is not in the histogram.
+        """
+        return self.groups.index(group) + 1
+
+    def class_counts(self, slot: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Positive and negative cases per bin, for one slot or for all rows."""
+        counts = self.counts.sum(axis=0) if slot is None else self.counts[slot]
+        return counts[1], counts[0]
+
+    def moments(self, slot: int | None = None) -> tuple[int, float, float]:
+        """Case count, score sum and squared-score sum, for one slot or all rows."""
+        if slot is None:
+            return int(self.counts.sum()), float(self.prob_sum.sum()), float(self.prob_sq_sum.sum())
+        return (
+            int(self.counts[slot].sum()),
+            float(self.prob_sum[slot].sum()),
+            float(self.prob_sq_sum[slot].sum()),
+        )
+
+    def confusion(self, slot: int | None = None) -> tuple[int, int, int, int]:
+        """Exact (tp, fp, tn, fn) at ``threshold``, for one slot or all rows."""
+        flagged = self.flagged.sum(axis=0) if slot is None else self.flagged[slot]
+        pos, neg = self.class_counts(slot)
+        tp, fp = int(flagged[1]), int(flagged[0])
+        return tp, fp, int(neg.sum()) - fp, int(pos.sum()) - tp
+
+    def threshold_index(self, slot: int | None = None) -> ThresholdIndex:
+        """Threshold index over the bins (each bin one level at its lower edge).
+
+        Exact at thresholds on the bin grid, and at every threshold with
+        score levels; elsewhere a bin straddling the threshold is counted
+        entirely below it.
+        """
+        pos, neg = self.class_counts(slot)
+        keep = (pos + neg) > 0
+        return ThresholdIndex.from_counts(self.edges[keep], pos[keep], neg[keep])
+
+    def auroc(self, slot: int | None = None) -> tuple[float, float]:
+        """AUROC with each bin as one tied level, and its largest possible error.
+
+        A positive and a negative case in the same bin count one half; their
+        true order moves the exact AUROC by at most that half, so the exact
+        value lies within ``max_error`` of the estimate. With score levels
+        the ties are real and ``max_error`` is 0. Both are NaN without cases
+        of both classes.
+
+        Returns:
+            Tuple of (auroc, max_error).
+        """
+        pos, neg = self.class_counts(slot)
+        n_pairs = float(pos.sum()) * float(neg.sum())
+        if n_pairs == 0:
+            return float("nan"), float("nan")
+        auroc = float(auroc_from_counts(pos, neg))
+        if self.levels is not None:
+            return auroc, 0.0
+        tied = float(np.dot(pos.astype(np.float64), neg.astype(np.float64)))
+        return auroc, 0.5 * tied / n_pairs
+
+    def auprc(self, slot: int | None = None) -> tuple[float, float]:
+        """AUPRC with each bin as one tied level, and its largest possible error.
+
+        Bins are strictly ordered, so the exact precision-recall curve passes
+        through every bin boundary, and within a bin each recall step is
+        weighted by precisions reached inside it: between ``T / (T + F + n)``
+        (the bin's negatives first) and ``(T + p) / (T + p + F)`` (its
+        positives first), with ``T``, ``F`` the cases above the bin and
+        ``p``, ``n`` its own. Summing each bin's recall times those extremes
+        brackets the exact AUPRC whatever the order within bins; ``max_error``
+        is the larger distance from the estimate to either end (0 with score
+        levels). Both are NaN without positive cases.
+
+        Returns:
+            Tuple of (auprc, max_error).
+        """
+        pos, neg = self.class_counts(slot)
+        if pos.sum() == 0:
+            return float("nan"), float("nan")
+        estimate = float(auprc_from_counts(pos, neg))
+        if self.levels is not None:
+            return estimate, 0.0
+        # Descending score order, with the cases ranked above each bin
+        p, n = pos[::-1].astype(np.float64), neg[::-1].astype(np.float64)
+        above_pos, above_neg = np.cumsum(p) - p, np.cumsum(n) - n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Precision is 1 before any case is flagged
+            high = np.where(
+                above_pos + above_neg == 0, 1.0, (above_pos + p) / (above_pos + p + above_neg)
+            )
+            low = np.where(
+                above_pos + above_neg + n == 0, 1.0, above_pos / (above_pos + above_neg + n)
+            )
+        recall = p / p.sum()
+        upper, lower = float(np.dot(recall, high)), float(np.dot(recall, low))
+        return estimate, max(upper - estimate, estimate - lower)
+
+    def bootstrap_counts(
+        self,
+        n_bootstrap: int,
+        seed: int,
+        slot: int | None = None,
+        stratified: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resampled positive and negative counts per occupied bin.
+
+        A row-level bootstrap only changes how many cases fall in each
+        (outcome, bin) cell, and those counts are multinomial on the observed
+        cell proportions, so drawing the cells directly has the same
+        distribution as resampling rows (as bootstrap_confusion_tables).
+
+        Args:
+            n_bootstrap: Number of bootstrap iterations.
+            seed: Random seed for reproducibility.
+            slot: Slot, or None for all rows.
+            stratified: If True, preserve class counts (positives and
+                negatives are resampled separately).
+
+        Returns:
+            Tuple of (pos, neg) arrays of shape (n_bootstrap, occupied bins),
+            bins in ascending score order.
+        """
+        pos, neg = self.class_counts(slot)
+        keep = (pos + neg) > 0
+        rng = np.random.default_rng(seed)
+
+        def draw(cells: np.ndarray) -> np.ndarray:
+            n = int(cells.sum())
+            return rng.multinomial(n, cells / max(n, 1), size=n_bootstrap)
+
+        if stratified:
+            return draw(pos[keep]), draw(neg[keep])
+        draws = draw(np.concatenate([pos[keep], neg[keep]]))
+        n_levels = int(keep.sum())
+        return draws[:, :n_levels], draws[:, n_levels:]
+
+    def quantiles(self, q: Sequence[float] | np.ndarray, slot: int | None = None) -> np.ndarray:
+        """Score quantiles, interpolating linearly within bins.
+
+        The outermost occupied bins are narrowed to the observed minimum and
+        maximum, so q=0 and q=1 are exact; others are within one bin width.
+        With score levels the quantiles are exact (as ``np.quantile``).
+
+        Args:
+            q: Quantiles in [0, 1].
+            slot: Slot, or None for all rows.
+
+        Returns:
+            Array of quantile values (NaN when the slot is empty).
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        pos, neg = self.class_counts(slot)
+        counts = (pos + neg).astype(np.float64)
+        total = counts.sum()
+        if total == 0:
+            return np.full(len(q), np.nan)
+        if self.levels is not None:
+            # Linear interpolation between the order statistics around q * (n - 1)
+            cum = np.cumsum(counts)
+            position = q * (total - 1)
+            below = np.floor(position)
+            lower = self.levels[np.searchsorted(cum, below, side="right")]
+            upper = self.levels[
+                np.searchsorted(cum, np.minimum(below + 1, total - 1), side="right")
+            ]
+            return np.asarray(lower + (position - below) * (upper - lower))
+
+        low = float(self.prob_min.min() if slot is None else self.prob_min[slot])
+        high = float(self.prob_max.max() if slot is None else self.prob_max[slot])
+        lower = np.clip(self.edges, low, high)
+        upper = np.clip(self.edges + 1 / self.n_bins, low, high)
+
+        cum = np.concatenate(([0.0], np.cumsum(counts)))
+        target = q * total
+        k = np.clip(np.searchsorted(cum, target, side="left") - 1, 0, self.n_bins - 1)
+        frac = np.clip(safe_divide_array(target - cum[k], counts[k]), 0.0, 1.0)
+        return np.asarray(lower[k] + frac * (upper[k] - lower[k]))
+
+    def aggregates(self) -> pl.DataFrame:
+        """Per-group confusion counts at ``threshold``.
+
+        Same columns and group order as aggregate_encoded (null group
+        skipped), so the grouped fairness and subgroup stages accept it as
+        ``group_aggregates``.
+        """
+        counts = self.counts[1:]
+        n = counts.sum(axis=(1, 2))
+        n_positive = counts[:, 1].sum(axis=1)
+        tp = self.flagged[1:, 1]
+        fp = self.flagged[1:, 0]
+        return pl.DataFrame(
+            [
+                pl.Series(self.column, self.groups, dtype=self.dtype),
+                pl.Series("n", n, dtype=pl.Int64),
+                pl.Series("n_positive", n_positive, dtype=pl.Int64),
+                pl.Series("tp", tp, dtype=pl.Int64),
+                pl.Series("fp", fp, dtype=pl.Int64),
+                pl.Series("tn", n - n_positive - fp, dtype=pl.Int64),
+                pl.Series("fn", n_positive - tp, dtype=pl.Int64),
+                pl.Series("prevalence", safe_divide_array(n_positive, n, default=np.nan)),
+                pl.Series("selection_rate", safe_divide_array(tp + fp, n, default=np.nan)),
+                pl.Series(
+                    "mean_predicted_prob",
+                    safe_divide_array(self.prob_sum[1:].sum(axis=(1, 2)), n, default=np.nan),
+                ),
+            ]
+        )
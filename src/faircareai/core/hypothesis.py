@@ -7,6 +7,7 @@ Implements rigorous hypothesis tests for fairness analysis:
 3. Patient-level (cluster) permutation preserving correlation
 4. Confounder stratification for Simpson's Paradox control
 5. +1 p-value correction to avoid p=0
+6. Batched evaluation of count-based statistics over many permutations
 
 CRITICAL: For conditional metrics (TPR, FPR), permutation must occur
 only within the relevant outcome stratum AND at the patient level.
@@ -19,11 +20,19 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Literal
 
 import numpy as np
 import polars as pl
 
+from faircareai.core.constants import (
+    BESAG_CLIFFORD_EXCEEDANCES,
+    BOOTSTRAP_BLOCK_ELEMENTS,
+    SEQUENTIAL_CHECK_EVERY,
+)
+from faircareai.core.statistics import dense_codes
+
 # ==============================================================================
 # Metric Type Mapping
 # ==============================================================================
@@ -56,6 +65,190 @@ def compute_metric_by_type(metric_name: str) -> str:
         return "Independence"
 
 
+# ==============================================================================
+# Permutation Index
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class PermutationIndex:
+    """Permutation structure of a test stratum, built once per test.
+
+    Group labels are exchanged between units (clusters, or single rows
+    without clustering) within each confounder stratum. A unit takes the
+    group and confounder stratum of its first row.
+
+    Attributes:
+        group_codes: Per-row group code in ``unique().sort()`` order of the
+            group column (nulls form one group).
+        n_groups: Number of groups.
+        row_unit: Per-row unit code.
+        unit_rows: First row of each unit.
+        strata: Unit codes of each confounder stratum.
+    """
+
+    group_codes: np.ndarray
+    n_groups: int
+    row_unit: np.ndarray
+    unit_rows: np.ndarray
+    strata: list[np.ndarray]
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pl.DataFrame,
+        group_col: str,
+        cluster_col: str | None = None,
+        confound_cols: list[str] | None = None,
+    ) -> PermutationIndex:
+        """Encode the group, cluster and confounder columns of ``df``."""
+        n = len(df)
+        group_codes = dense_codes(df[group_col])
+        n_groups = int(group_codes.max()) + 1 if n else 0
+
+        if cluster_col is not None:
+            row_unit = dense_codes(df[cluster_col])
+        else:
+            row_unit = np.arange(n, dtype=np.int64)
+        n_units = int(row_unit.max()) + 1 if n else 0
+        # First occurrence of each unit: reverse assignment keeps the smallest row
+        unit_rows = np.empty(n_units, dtype=np.int64)
+        unit_rows[row_unit[::-1]] = np.arange(n - 1, -1, -1)
+
+        stratum = np.zeros(n_units, dtype=np.int64)
+        for col in confound_cols or []:
+            codes = dense_codes(df[col])[unit_rows]
+            radix = int(codes.max()) + 1 if n_units else 1
+            _, stratum = np.unique(stratum * radix + codes, return_inverse=True)
+            stratum = stratum.reshape(-1)
+        order = np.argsort(stratum, kind="stable")
+        bounds = np.cumsum(np.bincount(stratum))[:-1]
+        return cls(group_codes, n_groups, row_unit, unit_rows, np.split(order, bounds))
+
+    @property
+    def n_units(self) -> int:
+        """Number of exchangeable units."""
+        return len(self.unit_rows)
+
+    def permute(self, rng: np.random.Generator, n_perms: int) -> np.ndarray:
+        """Draw permutations of the units within each stratum.
+
+        Args:
+            rng: NumPy random generator.
+            n_perms: Number of permutations.
+
+        Returns:
+            Array (n_perms, n_units): unit ``u`` takes the group of unit
+            ``result[b, u]`` in permutation ``b``.
+        """
+        sources = np.empty((n_perms, self.n_units), dtype=np.int64)
+        for units in self.strata:
+            sources[:, units] = rng.permuted(np.broadcast_to(units, (n_perms, len(units))), axis=1)
+        return sources
+
+    def row_sources(self, sources: np.ndarray) -> np.ndarray:
+        """Row whose group each row takes, per permutation (n_perms, n_rows)."""
+        rows: np.ndarray = self.unit_rows[sources][:, self.row_unit]
+        return rows
+
+    def group_counts(
+        self, values: np.ndarray, sources: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Per-group row counts and value sums for a block of permutations.
+
+        Rows of a unit always share a group, so rows are first reduced to
+        per-unit counts and sums and each permutation only moves units.
+
+        Args:
+            values: Per-row values to sum (e.g. ``y_pred``).
+            sources: Permutations from :meth:`permute`; None for the observed
+                grouping.
+
+        Returns:
+            Tuple of (n, sums), each of shape (n_perms, n_groups); a single
+            row for the observed grouping.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if sources is None:
+            codes = self.group_codes[None, :]
+            unit_n = np.ones(len(self.row_unit))
+            unit_sums = values
+        else:
+            codes = self.group_codes[self.unit_rows][sources]
+            unit_n = np.bincount(self.row_unit, minlength=self.n_units).astype(np.float64)
+            unit_sums = np.bincount(self.row_unit, weights=values, minlength=self.n_units)
+
+        n_perms = len(codes)
+        cells = (codes + (np.arange(n_perms) * self.n_groups)[:, None]).ravel()
+        shape = (n_perms, self.n_groups)
+        n = np.bincount(
+            cells,
+            weights=np.broadcast_to(unit_n, codes.shape).ravel(),
+            minlength=n_perms * self.n_groups,
+        )
+        sums = np.bincount(
+            cells,
+            weights=np.broadcast_to(unit_sums, codes.shape).ravel(),
+            minlength=n_perms * self.n_groups,
+        )
+        return n.reshape(shape), sums.reshape(shape)
+
+    def permuted_counts(
+        self, rng: np.random.Generator, values: np.ndarray, n_perms: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Per-group counts and sums for a block of fresh permutations.
+
+        When every unit is a single row and ``values`` is 0/1, permuting
+        labels within a stratum deals its ones to groups of fixed size, so
+        the per-group sums are drawn directly from the multivariate
+        hypergeometric distribution instead of shuffling every row.
+
+        Args:
+            rng: NumPy random generator.
+            values: Per-row values to sum.
+            n_perms: Number of permutations.
+
+        Returns:
+            Tuple of (n, sums) as in :meth:`group_counts`.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if self.n_units < len(self.row_unit) or not np.isin(values, (0.0, 1.0)).all():
+            return self.group_counts(values, self.permute(rng, n_perms))
+
+        sizes = np.zeros(self.n_groups, dtype=np.int64)
+        sums = np.zeros((n_perms, self.n_groups), dtype=np.int64)
+        for units in self.strata:
+            rows = self.unit_rows[units]
+            colors = np.bincount(self.group_codes[rows], minlength=self.n_groups)
+            sizes += colors
+            sums += rng.multivariate_hypergeometric(colors, int(values[rows].sum()), size=n_perms)
+        return np.broadcast_to(sizes, sums.shape).astype(np.float64), sums.astype(np.float64)
+
+
+def group_rate_gap(n: np.ndarray, successes: np.ndarray) -> np.ndarray:
+    """
+    Largest difference in group rates, per permutation.
+
+    Count statistic for stratified_cluster_permutation_test: with
+    ``value_col`` set to the prediction column, this is the TPR gap in the
+    TPR stratum, the FPR gap in the FPR stratum and the selection-rate gap
+    under Independence.
+
+    Args:
+        n: Group sizes, shape (n_perms, n_groups).
+        successes: Group sums of the value column, same shape.
+
+    Returns:
+        Max minus min rate over non-empty groups; NaN with fewer than two.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(n > 0, successes / n, np.nan)
+    gap = np.full(len(n), np.nan)
+    enough = (n > 0).sum(axis=1) >= 2
+    gap[enough] = np.nanmax(rates[enough], axis=1) - np.nanmin(rates[enough], axis=1)
+    return gap
+
+
 # ==============================================================================
 # Stratified Cluster Permutation Test
 # ==============================================================================
@@ -63,7 +256,7 @@ def compute_metric_by_type(metric_name: str) -> str:
 
 def stratified_cluster_permutation_test(
     df: pl.DataFrame,
-    statistic_fn: Callable[[pl.DataFrame], float],
+    statistic_fn: Callable[[pl.DataFrame], float] | None,
     metric_type: Literal["TPR", "FPR", "TNR", "Independence"],
     group_col: str,
     y_true_col: str,
@@ -72,6 +265,9 @@ def stratified_cluster_permutation_test(
     n_perms: int = 1000,
     alpha: float = 0.05,
     random_state: int | None = None,
+    count_statistic: Callable[[np.ndarray, np.ndarray], np.ndarray] | None = None,
+    value_col: str | None = None,
+    sequential: bool = False,
 ) -> dict:
     """
     Perform stratified cluster permutation test.
@@ -81,9 +277,16 @@ def stratified_cluster_permutation_test(
     y_true==0 for FPR). This is essential when base rates differ
     between groups.
 
+    The stratum, cluster and confounder partitions are encoded once
+    (see PermutationIndex). With ``count_statistic`` the statistic is
+    evaluated from per-group counts for whole blocks of permutations at
+    once; ``statistic_fn`` is the DataFrame fallback, called once per
+    permutation on a frame with the permuted group column.
+
     Args:
         df: DataFrame with data.
-        statistic_fn: Function computing the test statistic from df.
+        statistic_fn: Function computing the test statistic from df. Unused
+            (may be None) when count_statistic is given.
         metric_type: Type of metric determining stratum.
         group_col: Column for group membership.
         y_true_col: Column for true labels.
@@ -92,10 +295,31 @@ def stratified_cluster_permutation_test(
         n_perms: Number of permutations.
         alpha: Significance level.
         random_state: Random seed.
+        count_statistic: Optional vectorized statistic ``f(n, sums)`` taking
+            per-group row counts and sums of ``value_col``, each of shape
+            (n_perms, n_groups) with groups in sorted order, and returning
+            one value per permutation (e.g. group_rate_gap).
+        value_col: Column summed per group for count_statistic.
+        sequential: Opt-in Besag-Clifford stopping: permutations run in
+            blocks of SEQUENTIAL_CHECK_EVERY and stop at the
+            BESAG_CLIFFORD_EXCEEDANCES-th null statistic at least as extreme
+            as observed, with p = h / draws. Clearly non-significant tests
+            stop after a few dozen permutations; significant ones run to
+            n_perms with the usual p-value.
 
     Returns:
-        Dict with 'observed_stat', 'p_value', 'null_distribution', 'ci_lower', 'ci_upper'.
+        Dict with 'observed_stat', 'p_value', 'null_distribution', 'ci_lower',
+        'ci_upper' and 'n_perms' (permutations actually drawn).
+
+    Raises:
+        ValueError: If neither statistic is given, or count_statistic is
+            given without value_col.
     """
+    if count_statistic is None and statistic_fn is None:
+        raise ValueError("Provide statistic_fn or count_statistic")
+    if count_statistic is not None and value_col is None:
+        raise ValueError("count_statistic requires value_col")
+
     rng = np.random.default_rng(random_state)
 
     # Determine stratum filter
@@ -120,90 +344,63 @@ def stratified_cluster_permutation_test(
             "null_distribution": np.array([]),
             "ci_lower": np.nan,
             "ci_upper": np.nan,
+            "n_perms": 0,
         }
 
-    # Compute observed statistic
-    observed_stat = statistic_fn(stratum_df)
-
-    # Build permutation structure
-    if cluster_col is not None and cluster_col in stratum_df.columns:
-        # Get unique cluster-group mappings - sort for reproducibility
-        cluster_groups = stratum_df.select([cluster_col, group_col]).unique().sort(cluster_col)
-        clusters = cluster_groups[cluster_col].to_numpy()
-        groups = cluster_groups[group_col].to_numpy()
-        use_clusters = True
-    else:
-        # Row-level permutation
-        clusters = None
-        groups = stratum_df[group_col].to_numpy()
-        use_clusters = False
-
-    # Handle confounder stratification
-    if confound_cols:
-        # Build strata from confounders using Polars unique
-        confound_df = stratum_df.select(confound_cols)
-        unique_strata_df = confound_df.unique()
-        unique_strata_rows = unique_strata_df.to_dicts()
-    else:
-        confound_df = None
-        unique_strata_rows = None
+    # Build permutation structure once
+    index = PermutationIndex.from_frame(
+        stratum_df,
+        group_col,
+        cluster_col if cluster_col is not None and cluster_col in stratum_df.columns else None,
+        confound_cols,
+    )
+    if count_statistic is not None and value_col is not None:
+        values = stratum_df[value_col].cast(pl.Float64).to_numpy()
+        observed_stat = float(count_statistic(*index.group_counts(values))[0])
+
+        def draw_block(size: int) -> np.ndarray:
+            return count_statistic(*index.permuted_counts(rng, values, size))
+
+    elif statistic_fn is not None:
+        # Compute observed statistic
+        observed_stat = statistic_fn(stratum_df)
+        groups = stratum_df[group_col]
+
+        def draw_block(size: int) -> np.ndarray:
+            sources = index.permute(rng, size)
+            stats = np.empty(size)
+            for k in range(size):
+                rows = index.row_sources(sources[k : k + 1])[0]
+                stats[k] = statistic_fn(stratum_df.with_columns(groups.gather(rows)))
+            return stats
+
+    # Permutations are drawn in blocks so both paths consume the same stream
+    block_size = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(index.n_units, 1))
+    if sequential:
+        block_size = min(block_size, SEQUENTIAL_CHECK_EVERY)
 
-    # Permutation loop
     null_distribution = np.zeros(n_perms)
+    drawn = 0
+    stopped_at = None
+    while drawn < n_perms:
+        size = min(block_size, n_perms - drawn)
+        null_distribution[drawn : drawn + size] = draw_block(size)
+        drawn += size
+        if sequential and not np.isnan(observed_stat):
+            extreme = np.cumsum(np.abs(null_distribution[:drawn]) >= np.abs(observed_stat))
+            if extreme[-1] >= BESAG_CLIFFORD_EXCEEDANCES:
+                stopped_at = int(np.argmax(extreme >= BESAG_CLIFFORD_EXCEEDANCES)) + 1
+                break
 
-    for i in range(n_perms):
-        if confound_df is not None and unique_strata_rows is not None:
-            # Stratified permutation
-            permuted_groups = groups.copy()
-            for stratum_dict in unique_strata_rows:
-                # Build filter for this stratum using the main stratum_df
-                stratum_filter = pl.lit(True)
-                for col, val in stratum_dict.items():
-                    stratum_filter = stratum_filter & (pl.col(col) == val)
-
-                if use_clusters and cluster_col is not None and clusters is not None:
-                    # Get clusters in this stratum from the main stratum_df
-                    stratum_clusters = (
-                        stratum_df.filter(stratum_filter)[cluster_col].unique().to_numpy()
-                    )
-                    stratum_cluster_mask = np.isin(clusters, stratum_clusters)
-                    stratum_indices = np.where(stratum_cluster_mask)[0]
-                else:
-                    # Use index matching for row-level permutation
-                    confound_dicts = confound_df.to_dicts()
-                    stratum_indices = np.array(
-                        [j for j, row in enumerate(confound_dicts) if row == stratum_dict]
-                    )
-
-                # Permute within stratum
-                if len(stratum_indices) > 0:
-                    rng.shuffle(permuted_groups[stratum_indices])
-        else:
-            # Global permutation
-            permuted_groups = groups.copy()
-            rng.shuffle(permuted_groups)
-
-        # Apply permuted groups
-        if use_clusters and cluster_col is not None and clusters is not None:
-            # Build cluster-to-group mapping
-            # Create a mapping dict for deterministic replacement
-            cluster_to_group_map = dict(zip(clusters, permuted_groups))
-
-            # Map clusters to permuted groups using a list comprehension
-            cluster_values = stratum_df[cluster_col].to_list()
-            new_groups = [cluster_to_group_map[c] for c in cluster_values]
-            permuted_df = stratum_df.with_columns(pl.Series(group_col, new_groups))
-        else:
-            permuted_df = stratum_df.with_columns(pl.Series(group_col, permuted_groups))
-
-        # Compute statistic on permuted data
-        null_distribution[i] = statistic_fn(permuted_df)
-
-    # Compute p-value with +1 correction (ensures p > 0)
-    # p = (1 + count(|null| >= |observed|)) / (1 + n_perms)
     if np.isnan(observed_stat):
         p_value = np.nan
+    elif stopped_at is not None:
+        # Besag-Clifford: stop at the h-th exceedance, p = h / draws
+        null_distribution = null_distribution[:stopped_at]
+        p_value = BESAG_CLIFFORD_EXCEEDANCES / stopped_at
     else:
+        # Compute p-value with +1 correction (ensures p > 0)
+        # p = (1 + count(|null| >= |observed|)) / (1 + n_perms)
         count_extreme = np.sum(np.abs(null_distribution) >= np.abs(observed_stat))
         p_value = (1 + count_extreme) / (1 + n_perms)
 
@@ -221,6 +418,7 @@ def stratified_cluster_permutation_test(
         "null_distribution": null_distribution,
         "ci_lower": ci_lower,
         "ci_upper": ci_upper,
+        "n_perms": len(null_distribution),
     }
 
 
@@ -15,6 +15,7 @@ import polars as pl
 if TYPE_CHECKING:
     import numpy as np
 
+from faircareai.core.prepared import EncodedAttribute, aggregate_encoded
 from faircareai.core.statistical import (
     clopper_pearson_ci,
     get_sample_status,
@@ -118,34 +119,70 @@ def compute_confusion_metrics(
     return result
 
 
-def compute_metrics_for_group(
+def compute_group_aggregates(
     df: pl.DataFrame,
-    group_name: str,
+    group_cols: str | list[str],
     y_true_col: str = "y_true",
-    y_pred_col: str = "y_pred",
-    confidence: float = 0.95,
-) -> GroupMetrics:
-    """
-    Compute all fairness metrics for a single group.
+    y_prob_col: str | None = None,
+    threshold: float = 0.5,
+    y_pred_col: str | None = None,
+) -> dict[str, pl.DataFrame]:
+    """Compute per-group confusion counts for one or more grouping columns.
+
+    The label/prediction indicators are derived once and every attribute is
+    aggregated from them by bincount over dense group codes, so the cost is
+    O(N) per attribute instead of one full filter scan per group.
 
     Args:
-        df: DataFrame containing predictions for this group.
-        group_name: Name of the group.
-        y_true_col: Column name for ground truth.
-        y_pred_col: Column name for predictions.
-        confidence: Confidence level for CIs.
+        df: DataFrame with predictions and demographics.
+        group_cols: Grouping column name or list of names.
+        y_true_col: Column name for ground truth (0/1).
+        y_prob_col: Column name for predicted probabilities. Used to derive
+            predictions at ``threshold`` and for ``mean_predicted_prob``.
+        threshold: Decision threshold applied to ``y_prob_col``.
+        y_pred_col: Column name for binary predictions. Takes precedence
+            over thresholding ``y_prob_col``.
 
     Returns:
-        GroupMetrics dataclass with all metrics and CIs.
+        Dict mapping each grouping column to a DataFrame sorted by group
+        (null groups dropped) with columns: the group column, n, n_positive,
+        tp, fp, tn, fn, prevalence, selection_rate and, when ``y_prob_col``
+        is given, mean_predicted_prob.
+
+    Raises:
+        ValueError: If neither y_prob_col nor y_pred_col is given.
     """
-    y_true = df[y_true_col]
-    y_pred = df[y_pred_col]
+    if isinstance(group_cols, str):
+        group_cols = [group_cols]
 
-    n = len(df)
-    n_positive = int(y_true.sum())
-    n_negative = n - n_positive
+    if y_pred_col is not None:
+        predicted = df[y_pred_col].to_numpy() == 1
+    elif y_prob_col is not None:
+        predicted = df[y_prob_col].to_numpy() >= threshold
+    else:
+        raise ValueError("Either y_prob_col or y_pred_col must be provided")
 
-    tp, fp, tn, fn = _compute_confusion_matrix(y_true, y_pred)
+    positive = df[y_true_col].to_numpy() == 1
+    y_prob = df[y_prob_col].cast(pl.Float64).to_numpy() if y_prob_col is not None else None
+
+    # Dense codes + bincount rather than a polars group_by (see core.prepared.group_key)
+    return {
+        col: aggregate_encoded(EncodedAttribute.from_series(df[col]), positive, predicted, y_prob)
+        for col in dict.fromkeys(group_cols)
+    }
+
+
+def _metrics_from_counts(
+    group_name: str,
+    n: int,
+    n_positive: int,
+    tp: int,
+    fp: int,
+    tn: int,
+    fn: int,
+) -> GroupMetrics:
+    """Build GroupMetrics from confusion counts."""
+    n_negative = n - n_positive
 
     # Compute rates
     tpr = safe_divide(tp, tp + fn)  # Sensitivity
@@ -187,6 +224,37 @@ def compute_metrics_for_group(
     )
 
 
+def compute_metrics_for_group(
+    df: pl.DataFrame,
+    group_name: str,
+    y_true_col: str = "y_true",
+    y_pred_col: str = "y_pred",
+    confidence: float = 0.95,
+) -> GroupMetrics:
+    """
+    Compute all fairness metrics for a single group.
+
+    Args:
+        df: DataFrame containing predictions for this group.
+        group_name: Name of the group.
+        y_true_col: Column name for ground truth.
+        y_pred_col: Column name for predictions.
+        confidence: Confidence level for CIs.
+
+    Returns:
+        GroupMetrics dataclass with all metrics and CIs.
+    """
+    y_true = df[y_true_col]
+    y_pred = df[y_pred_col]
+
+    n = len(df)
+    n_positive = int(y_true.sum())
+
+    tp, fp, tn, fn = _compute_confusion_matrix(y_true, y_pred)
+
+    return _metrics_from_counts(group_name, n, n_positive, tp, fp, tn, fn)
+
+
 def compute_metric_ci(
     metric: str,
     group_metrics: GroupMetrics,
@@ -263,20 +331,22 @@ def compute_group_metrics(
     if metrics is None:
         metrics = ["tpr", "fpr", "ppv"]
 
-    # Get unique groups
-    groups = df[group_col].unique().sort().to_list()
+    aggregates = compute_group_aggregates(
+        df, group_col, y_true_col=y_true_col, y_pred_col=y_pred_col
+    )[group_col]
 
-    # Compute metrics for each group
+    # Compute metrics for each group from the single grouped pass
     rows = []
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        gm = compute_metrics_for_group(
-            group_df,
-            str(group),
-            y_true_col,
-            y_pred_col,
-            confidence,
+    for agg in aggregates.iter_rows(named=True):
+        gm = _metrics_from_counts(
+            str(agg[group_col]),
+            agg["n"],
+            agg["n_positive"],
+            agg["tp"],
+            agg["fp"],
+            agg["tn"],
+            agg["fn"],
         )
 
         row = {
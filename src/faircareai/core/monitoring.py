@@ -0,0 +1,423 @@
+"""
+FairCareAI - Fairness Monitoring
+
+Track fairness drift of a deployed model as its predictions arrive. A
+FairnessMonitor keeps additive confusion counts per time period (day, week,
+...), sensitive attribute and group. New rows only add to the counts of
+their periods, so an update reads only the new data: a batch, new Parquet
+files, or the appended tail of a CSV file. Rolling-window and exponentially
+decayed disparities are derived from the counts and flagged with the same
+thresholds as FairCareAudit.
+
+Usage:
+    >>> monitor = FairnessMonitor("risk", "sepsis", "scored_at", {"race": "White"}, config)
+    >>> monitor.refresh("predictions/")  # only files and rows not read before
+    >>> monitor.rolling(7)  # disparities over the 7 days ending at each day
+    >>> monitor.decayed(half_life=14)
+"""
+
+import io
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import polars as pl
+
+from faircareai.core.audit import FairCareAudit
+from faircareai.core.config import FairnessConfig
+from faircareai.core.constants import (
+    MIN_SAMPLE_SIZE_FLAG,
+    MONITORING_HALF_LIFE,
+    MONITORING_PERIOD,
+    MONITORING_WINDOW,
+)
+from faircareai.core.exceptions import ConfigurationError, DataValidationError
+from faircareai.core.logging import get_logger
+from faircareai.core.results import AuditResults
+from faircareai.core.streaming import AuditSource, StreamingAudit, _group_key
+from faircareai.core.validation import safe_divide_array
+
+logger = get_logger(__name__)
+
+COUNT_COLUMNS = ("n", "tp", "fp", "tn", "fn", "prob_sum")
+"""Additive per-(period, attribute, group) statistics kept by FairnessMonitor."""
+
+
+class FairnessMonitor:
+    """
+    Incremental fairness monitoring over a timestamp column.
+
+    Rows are bucketed into periods of length ``every`` (a polars duration
+    such as "1d", "1w" or "1mo") by their timestamp. For each period,
+    attribute and group the monitor keeps n, TP, FP, TN, FN and the score
+    sum at the decision threshold, so state grows with periods x groups, not
+    rows. Window metrics are sums of period counts: rolling() sums a fixed
+    number of periods, decayed() weights period counts by
+    ``0.5 ** (age / half_life)``. Rolling-window metrics equal those of
+    compute_fairness_metrics over the window's rows.
+
+    Attributes:
+        pred_col: Column name for predicted probabilities.
+        target_col: Column name for true labels.
+        time_col: Date or datetime column the rows are bucketed by.
+        references: Reference group by attribute column (None: largest group).
+        config: FairnessConfig whose thresholds flag the windows.
+        every: Period length.
+        threshold: Decision threshold.
+        counts: Accumulated counts, one row per (period, attribute, group).
+    """
+
+    def __init__(
+        self,
+        pred_col: str,
+        target_col: str,
+        time_col: str,
+        attributes: list[str] | dict[str, str | None],
+        config: FairnessConfig | None = None,
+        every: str = MONITORING_PERIOD,
+        threshold: float = 0.5,
+    ) -> None:
+        """
+        Initialize an empty monitor.
+
+        Args:
+            pred_col: Column name for predicted probabilities.
+            target_col: Column name for true labels (0/1).
+            time_col: Date or datetime column of each prediction.
+            attributes: Attribute columns, or a dict of column -> reference
+                group (None picks the largest group seen so far).
+            config: FairnessConfig whose ``thresholds`` flag disparities.
+                Defaults to the FairnessConfig defaults.
+            every: Period length as a polars duration. Default: "1d".
+            threshold: Decision threshold. Default is 0.5.
+
+        Raises:
+            ConfigurationError: If no attributes are given.
+        """
+        if not attributes:
+            raise ConfigurationError("attributes", "At least one attribute column is required.")
+        self.pred_col = pred_col
+        self.target_col = target_col
+        self.time_col = time_col
+        self.references: dict[str, str | None] = (
+            dict(attributes) if isinstance(attributes, dict) else dict.fromkeys(attributes)
+        )
+        self.config = config or FairnessConfig(model_name="Fairness Monitor")
+        self.every = every
+        self.threshold = threshold
+        self.counts = pl.DataFrame(
+            schema={
+                "period": pl.Datetime("us"),
+                "attribute": pl.Utf8,
+                "group": pl.Utf8,
+                **{c: pl.Float64 if c == "prob_sum" else pl.Int64 for c in COUNT_COLUMNS},
+            }
+        )
+        self._offsets: dict[str, int] = {}
+
+    def update(self, data: AuditSource) -> int:
+        """
+        Add new rows.
+
+        Args:
+            data: Rows in any form StreamingAudit accepts.
+
+        Returns:
+            Number of rows added.
+
+        Raises:
+            DataValidationError: If the rows fail validation or lack the
+                time or attribute columns.
+        """
+        scan = StreamingAudit(data, self.pred_col, self.target_col, threshold=self.threshold).scan
+        schema = scan.schema
+        missing = [c for c in (self.time_col, *self.references) if c not in schema]
+        if missing:
+            raise DataValidationError(f"Missing monitoring columns: {missing}")
+        if not schema[self.time_col].is_temporal():
+            raise DataValidationError(
+                f"Time column must be a date or datetime, got {schema[self.time_col]}",
+                column=self.time_col,
+            )
+
+        score = pl.col(self.pred_col).cast(pl.Float64)
+        positive = pl.col(self.target_col) == 1
+        flagged = score >= self.threshold
+        period = pl.col(self.time_col).cast(pl.Datetime("us")).dt.truncate(self.every)
+        queries = [
+            scan.group_by(period.alias("period"), _group_key(schema, [column]).alias("group"))
+            .agg(
+                pl.len().cast(pl.Int64).alias("n"),
+                (positive & flagged).sum().cast(pl.Int64).alias("tp"),
+                (~positive & flagged).sum().cast(pl.Int64).alias("fp"),
+                (~positive & ~flagged).sum().cast(pl.Int64).alias("tn"),
+                (positive & ~flagged).sum().cast(pl.Int64).alias("fn"),
+                score.sum().alias("prob_sum"),
+            )
+            .select(
+                "period",
+                pl.lit(column).alias("attribute"),
+                pl.col("group").cast(pl.Utf8),
+                *COUNT_COLUMNS,
+            )
+            for column in self.references
+        ]
+        frames = pl.collect_all(queries, streaming=True, comm_subplan_elim=False)
+        # Rows with a null attribute count toward n_rows but no group
+        n_rows = int(frames[0]["n"].sum())
+        batch = pl.concat(frames).drop_nulls("group")
+
+        self.counts = (
+            pl.concat([self.counts, batch])
+            .group_by("period", "attribute", "group")
+            .agg(pl.col(c).sum() for c in COUNT_COLUMNS)
+            .sort("period", "attribute", "group")
+        )
+        logger.debug(f"Monitor added {n_rows} rows; {len(self.counts)} period-group cells")
+        return n_rows
+
+    def refresh(self, source: str | Path) -> int:
+        """
+        Add rows from files that have not been read yet.
+
+        Parquet files are read from the first unseen row (new files whole);
+        CSV files from the byte after the last complete line read, so an
+        appended log only has its new tail parsed.
+
+        Args:
+            source: A .parquet or .csv file, a glob, or a directory of them.
+
+        Returns:
+            Number of rows added.
+        """
+        path = Path(source)
+        if path.is_dir():
+            files = sorted([*path.glob("*.parquet"), *path.glob("*.csv")])
+        elif any(c in str(path) for c in "*?["):
+            files = sorted(path.parent.glob(path.name))
+        else:
+            files = [path]
+
+        added = 0
+        batch: pl.DataFrame | pl.LazyFrame | None
+        for file in files:
+            key = str(file.resolve())
+            offset = self._offsets.get(key, 0)
+            if file.suffix == ".csv":
+                batch, offset = _read_csv_tail(file, offset)
+            else:
+                scan = pl.scan_parquet(file)
+                total = int(scan.select(pl.len()).collect().item())
+                batch = scan.slice(offset) if total > offset else None
+                offset = total
+            if batch is not None:
+                added += self.update(batch)
+            self._offsets[key] = offset
+        return added
+
+    def rolling(self, periods: int = MONITORING_WINDOW) -> pl.DataFrame:
+        """
+        Disparities over the ``periods`` periods ending at each period.
+
+        Args:
+            periods: Window length in periods (calendar periods; periods
+                without rows count toward the window).
+
+        Returns:
+            Time series frame, see _series.
+        """
+        return self._series(lambda counts: _rolling_sum(counts, periods))
+
+    def decayed(self, half_life: float = MONITORING_HALF_LIFE) -> pl.DataFrame:
+        """
+        Exponentially decayed disparities at each period.
+
+        Counts of a period ``k`` periods back are weighted by
+        ``0.5 ** (k / half_life)``; group sizes are the weighted counts.
+
+        Args:
+            half_life: Half-life in periods.
+
+        Returns:
+            Time series frame, see _series.
+        """
+        return self._series(lambda counts: _decayed_sum(counts, 0.5 ** (1 / half_life)))
+
+    def _series(self, window: Callable[[np.ndarray], np.ndarray]) -> pl.DataFrame:
+        """Window metrics per (period, attribute, group) with fairness flags.
+
+        Args:
+            window: Maps period counts of shape (periods, cells, stats) to
+                window counts of the same shape.
+
+        Returns:
+            Frame with period, attribute, group, reference, n, selection_rate,
+            tpr, fpr, ppv, mean_predicted_prob, demographic_parity_ratio,
+            equalized_odds_diff and flagged (a fairness flag of
+            _check_fairness_violations is raised for the group). Disparities
+            are null for the reference group and for groups (or references)
+            with fewer than MIN_SAMPLE_SIZE_FLAG cases.
+        """
+        if self.counts.is_empty():
+            return pl.DataFrame()
+
+        periods = self.counts["period"]
+        first, last = cast(datetime, periods.min()), cast(datetime, periods.max())
+        grid = pl.datetime_range(first, last, self.every, time_unit="us", eager=True)
+        cells = self.counts.select("attribute", "group").unique().sort("attribute", "group")
+        period_index = {p: i for i, p in enumerate(grid.to_list())}
+        cell_index = {key: i for i, key in enumerate(cells.iter_rows())}
+
+        counts = np.zeros((len(grid), len(cells), len(COUNT_COLUMNS)))
+        rows = np.array([period_index[p] for p in self.counts["period"].to_list()], dtype=np.int64)
+        cols = np.array(
+            [cell_index[key] for key in self.counts.select("attribute", "group").iter_rows()],
+            dtype=np.int64,
+        )
+        counts[rows, cols] = self.counts.select(COUNT_COLUMNS).to_numpy()
+        n, tp, fp, tn, fn, prob_sum = np.moveaxis(window(counts), -1, 0)
+
+        selection = safe_divide_array(tp + fp, n)
+        tpr = safe_divide_array(tp, tp + fn)
+        fpr = safe_divide_array(fp, fp + tn)
+        ppv = safe_divide_array(tp, tp + fp)
+
+        attributes = cells["attribute"].to_list()
+        groups = cells["group"].to_list()
+        reference = np.array([self._reference(a) for a in attributes])
+        ref = np.array(
+            [cell_index.get((a, r), -1) for a, r in zip(attributes, reference, strict=True)]
+        )
+        valid = (n >= MIN_SAMPLE_SIZE_FLAG) & (ref >= 0)
+        valid &= np.where(ref >= 0, n[:, ref] >= MIN_SAMPLE_SIZE_FLAG, False)
+        is_reference = np.array(groups) == reference
+        ref_selection = selection[:, ref]
+        dp_ratio = np.where(
+            valid & ~is_reference & (ref_selection > 0),
+            safe_divide_array(selection, ref_selection),
+            np.nan,
+        )
+        eo_diff = np.where(
+            valid & ~is_reference,
+            np.maximum(np.abs(tpr - tpr[:, ref]), np.abs(fpr - fpr[:, ref])),
+            np.nan,
+        )
+
+        n_periods, n_cells = n.shape
+        frame = pl.DataFrame(
+            {
+                "period": np.repeat(grid.to_numpy(), n_cells),
+                "attribute": attributes * n_periods,
+                "group": groups * n_periods,
+                "reference": np.tile(is_reference, n_periods),
+                "n": n.ravel(),
+                "selection_rate": selection.ravel(),
+                "tpr": tpr.ravel(),
+                "fpr": fpr.ravel(),
+                "ppv": ppv.ravel(),
+                "mean_predicted_prob": safe_divide_array(prob_sum, n).ravel(),
+                "demographic_parity_ratio": dp_ratio.ravel(),
+                "equalized_odds_diff": eo_diff.ravel(),
+            }
+        ).with_columns(pl.col("demographic_parity_ratio", "equalized_odds_diff").fill_nan(None))
+
+        flagged = {
+            (flag["period"], flag["attribute"], flag["group"])
+            for flag in self._flags(frame, reference=dict(zip(attributes, reference, strict=True)))
+        }
+        return frame.with_columns(
+            pl.Series(
+                "flagged",
+                [
+                    key in flagged
+                    for key in frame.select("period", "attribute", "group").iter_rows()
+                ],
+            )
+        )
+
+    def _reference(self, attribute: str) -> str:
+        """Reference group: the configured one, else the largest group overall."""
+        sizes = (
+            self.counts.filter(pl.col("attribute") == attribute)
+            .group_by("group")
+            .agg(pl.col("n").sum().alias("len"))
+            .sort("group")
+        )
+        suggested = self.references[attribute]
+        if suggested is not None and suggested in sizes["group"].to_list():
+            return suggested
+        return str(sizes.sort("len", descending=True, maintain_order=True)["group"][0])
+
+    def _flags(self, series: pl.DataFrame, reference: dict[str, str]) -> list[dict]:
+        """Fairness flags of every window, each tagged with its period."""
+        flags: list[dict] = []
+        for window in series.partition_by("period", maintain_order=True):
+            results = AuditResults(config=self.config, threshold=self.threshold)
+            results.fairness_metrics = {
+                rows["attribute"][0]: {
+                    "reference": reference[rows["attribute"][0]],
+                    "demographic_parity_ratio": dict(
+                        rows.select("group", "demographic_parity_ratio").drop_nulls().iter_rows()
+                    ),
+                    "equalized_odds_diff": dict(
+                        rows.select("group", "equalized_odds_diff").drop_nulls().iter_rows()
+                    ),
+                }
+                for rows in window.partition_by("attribute", maintain_order=True)
+            }
+            for flag in FairCareAudit._check_fairness_violations(results, self.config.thresholds):
+                flags.append({**flag, "period": window["period"][0]})
+        return flags
+
+    def flags(self, series: pl.DataFrame) -> list[dict]:
+        """
+        Fairness flags of a rolling() or decayed() series.
+
+        Args:
+            series: Frame from rolling() or decayed().
+
+        Returns:
+            Flags as FairCareAudit builds them, each with its ``period``.
+        """
+        if series.is_empty():
+            return []
+        reference = dict(series.filter("reference").select("attribute", "group").iter_rows())
+        return self._flags(series, reference)
+
+
+def _rolling_sum(counts: np.ndarray, periods: int) -> np.ndarray:
+    """Sums over the ``periods`` periods ending at each period."""
+    cumulative = np.cumsum(counts, axis=0)
+    lagged = np.zeros_like(cumulative)
+    lagged[periods:] = cumulative[:-periods]
+    return np.asarray(cumulative - lagged)
+
+
+def _decayed_sum(counts: np.ndarray, decay: float) -> np.ndarray:
+    """Exponentially weighted sums: ``S[t] = decay * S[t - 1] + counts[t]``."""
+    decayed = np.empty_like(counts)
+    running = np.zeros(counts.shape[1:])
+    for t in range(len(counts)):
+        running = running * decay + counts[t]
+        decayed[t] = running
+    return decayed
+
+
+def _read_csv_tail(path: Path, offset: int) -> tuple[pl.DataFrame | None, int]:
+    """Complete CSV lines from byte ``offset`` (0: after the header) on.
+
+    Returns:
+        Tuple of (rows or None, byte offset after the last complete line).
+    """
+    with path.open("rb") as fh:
+        header = fh.readline()
+        start = max(offset, len(header))
+        fh.seek(start)
+        tail = fh.read()
+    end = tail.rfind(b"\n") + 1
+    if end == 0:
+        return None, start
+    frame = pl.read_csv(io.BytesIO(header + tail[:end]), try_parse_dates=True)
+    return frame, start + end
@@ -0,0 +1,151 @@
+"""
+Parallel Execution Helpers
+
+Runs independent units of work (per-attribute audit stages, intersections,
+bootstrap blocks, Van Calster subgroups) serially or in a process pool.
+
+Each unit draws its random stream from its own ``numpy.random.SeedSequence``
+child, addressed by the unit's identity (e.g. ``("fairness", "race")``)
+rather than by its position in a task list. A unit's result therefore
+depends only on the root seed and on what the unit is, never on which
+worker ran it, how many workers there are, or which other units exist.
+
+Worker processes are started with the ``spawn`` method: forking a process
+that already holds Polars/BLAS thread pools can deadlock.
+
+Usage:
+    >>> seed = unit_seed(42, "subgroup", "race")
+    >>> results = run_tasks(compute_unit, units, workers=4)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import zlib
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, ParamSpec, TypeVar
+
+import numpy as np
+
+from faircareai.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def unit_seed(random_seed: int, *key: str | int) -> int:
+    """Derive the seed of the unit identified by ``key`` from a root seed.
+
+    The seed is the first state word of ``SeedSequence(random_seed,
+    spawn_key=key)``, the child that ``SeedSequence.spawn`` addressing
+    uses, with string key parts mapped to integers by CRC-32.
+
+    Args:
+        random_seed: Root seed.
+        *key: Unit identity, e.g. ``("fairness", "race")`` or
+            ``("overall_bootstrap", 3)``.
+
+    Returns:
+        Unsigned 32-bit seed, stable for a given root seed and key.
+    """
+    spawn_key = tuple(zlib.crc32(k.encode()) if isinstance(k, str) else int(k) for k in key)
+    return int(np.random.SeedSequence(random_seed, spawn_key=spawn_key).generate_state(1)[0])
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Normalize a worker count.
+
+    Args:
+        workers: Number of processes. ``None`` or 1 runs serially; -1 uses
+            every available core.
+
+    Returns:
+        Positive worker count.
+
+    Raises:
+        ValueError: If workers is 0 or below -1.
+    """
+    if workers is None:
+        return 1
+    if workers == -1:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer or -1, got {workers}")
+    return workers
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each task in the calling process on submit."""
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+@contextmanager
+def task_executor(
+    workers: int | None = 1,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[Executor]:
+    """Executor for independent tasks: inline when serial, else a process pool.
+
+    Args:
+        workers: Number of processes (see resolve_workers).
+        initializer: Called once per worker process before any task, e.g.
+            to install shared read-only state. Called in this process when
+            running serially.
+        initargs: Arguments for ``initializer``; pickled once per worker.
+
+    Yields:
+        Executor whose ``submit``/``map`` run the tasks.
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield _InlineExecutor()
+        return
+
+    logger.debug("Starting %d worker processes", workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        yield executor
+
+
+def run_tasks(
+    fn: Callable[[T], R],
+    tasks: Sequence[T],
+    workers: int | None = 1,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[R]:
+    """Apply ``fn`` to every task, in a process pool when ``workers > 1``.
+
+    Args:
+        fn: Picklable module-level function taking one task.
+        tasks: Task arguments.
+        workers: Number of processes (see resolve_workers).
+        initializer: See task_executor.
+        initargs: See task_executor.
+
+    Returns:
+        Results in task order.
+    """
+    workers = min(resolve_workers(workers), max(len(tasks), 1))
+    with task_executor(workers, initializer, initargs) as executor:
+        return list(executor.map(fn, tasks))
@@ -0,0 +1,368 @@
+"""
+Prepared Audit Data
+
+Compact, encoded view of the audit frame built once per run and shared by
+every pipeline stage:
+
+- scores as a contiguous float64 array with a cached stable argsort
+- labels as uint8
+- each sensitive attribute dictionary-encoded as int32 codes in sorted
+  group order, with rows grouped by code and per-group offsets
+
+Stages read arrays, group rows, group sizes and per-threshold confusion
+counts from here instead of re-scanning the DataFrame.
+
+Usage:
+    >>> prepared = PreparedAuditData.from_frame(df, "risk_score", "outcome", ["race", "sex"])
+    >>> prepared.attribute("race").rows("Black")
+    array([  3,  17,  42, ...])
+    >>> prepared.group_aggregates(0.3)["race"]
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from faircareai.core.thresholds import ThresholdIndex
+from faircareai.core.validation import safe_divide_array
+
+_ATTRIBUTE_ARRAYS = ("codes", "order", "offsets")
+
+
+def group_key(column: str, dtype: pl.DataType) -> pl.Expr:
+    """Polars key expression for grouping or counting by an attribute column.
+
+    Categorical columns become strings: a group_by, value_counts or
+    n_unique keyed on a Categorical column corrupts memory on polars 0.20.
+    Eager code avoids polars grouping altogether and groups the codes of
+    EncodedAttribute instead.
+    """
+    key = pl.col(column)
+    return key.cast(pl.Utf8) if dtype == pl.Categorical else key
+
+
+@dataclass
+class EncodedAttribute:
+    """Dictionary-encoded sensitive attribute.
+
+    Attributes:
+        column: Source column name.
+        dtype: Polars dtype of the source column.
+        groups: Non-null group values in sorted order; code ``i`` is ``groups[i]``.
+        codes: Per-row int32 code, -1 for null.
+        order: Row positions sorted by code (stable, so rows keep their
+            original order within a group); null rows come first.
+        offsets: Group ``i`` occupies ``order[offsets[i]:offsets[i + 1]]``.
+    """
+
+    column: str
+    dtype: pl.DataType
+    groups: list[Any]
+    codes: np.ndarray
+    order: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_series(cls, series: pl.Series) -> EncodedAttribute:
+        """Encode a column; codes follow the same order as ``unique().sort()``."""
+        ranks = series.rank("dense")
+        codes = (ranks.fill_null(0).to_numpy().astype(np.int32)) - 1
+        groups = series.drop_nulls().unique().sort().to_list()
+        return cls.from_codes(series.name, series.dtype, groups, codes)
+
+    @classmethod
+    def from_codes(
+        cls, column: str, dtype: pl.DataType, groups: list[Any], codes: np.ndarray
+    ) -> EncodedAttribute:
+        """Build from per-row codes into ``groups`` (-1 for null)."""
+        order = np.argsort(codes, kind="stable")
+        sizes = np.bincount(codes[codes >= 0], minlength=len(groups))
+        n_null = len(codes) - int(sizes.sum())
+        offsets = np.concatenate(([n_null], n_null + np.cumsum(sizes))).astype(np.int64)
+        return cls(column, dtype, groups, codes, order, offsets)
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of rows per group, in group order."""
+        return np.diff(self.offsets)
+
+    def rows(self, group: Any) -> np.ndarray:
+        """Row positions belonging to ``group``."""
+        i = self.groups.index(group)
+        return self.order[self.offsets[i] : self.offsets[i + 1]]
+
+    def group_rows(self) -> dict[Any, np.ndarray]:
+        """Mapping of every group to its row positions (as group_row_indices)."""
+        return {
+            group: self.order[self.offsets[i] : self.offsets[i + 1]]
+            for i, group in enumerate(self.groups)
+        }
+
+    def group_sizes(self) -> dict[Any, int]:
+        """Mapping of every group to its size."""
+        return dict(zip(self.groups, self.sizes.tolist(), strict=True))
+
+
+def aggregate_encoded(
+    attr: EncodedAttribute,
+    positive: np.ndarray,
+    predicted: np.ndarray,
+    y_prob: np.ndarray | None = None,
+) -> pl.DataFrame:
+    """Per-group confusion counts for one encoded attribute.
+
+    One bincount per count over the group codes; null rows are skipped.
+
+    Args:
+        attr: Encoded attribute.
+        positive: Boolean array, True where the outcome is positive.
+        predicted: Boolean array, True where the prediction is positive.
+        y_prob: Optional scores for ``mean_predicted_prob``.
+
+    Returns:
+        DataFrame with the group column, n, n_positive, tp, fp, tn, fn,
+        prevalence, selection_rate and, when ``y_prob`` is given,
+        mean_predicted_prob, in group order.
+    """
+    valid = attr.codes >= 0
+    codes = attr.codes[valid]
+    n_groups = len(attr.groups)
+    n = attr.sizes
+
+    cells = {
+        "tp": positive & predicted,
+        "fp": ~positive & predicted,
+        "tn": ~positive & ~predicted,
+        "fn": positive & ~predicted,
+    }
+    counts = {
+        name: np.bincount(codes[mask[valid]], minlength=n_groups).astype(np.int64)
+        for name, mask in cells.items()
+    }
+    n_positive = counts["tp"] + counts["fn"]
+    columns = [
+        pl.Series(attr.column, attr.groups, dtype=attr.dtype),
+        pl.Series("n", n, dtype=pl.Int64),
+        pl.Series("n_positive", n_positive, dtype=pl.Int64),
+        *[pl.Series(name, values, dtype=pl.Int64) for name, values in counts.items()],
+        pl.Series("prevalence", safe_divide_array(n_positive, n, default=np.nan)),
+        pl.Series(
+            "selection_rate", safe_divide_array(counts["tp"] + counts["fp"], n, default=np.nan)
+        ),
+    ]
+    if y_prob is not None:
+        prob_sum = np.bincount(codes, weights=y_prob[valid], minlength=n_groups)
+        columns.append(
+            pl.Series("mean_predicted_prob", safe_divide_array(prob_sum, n, default=np.nan))
+        )
+    return pl.DataFrame(columns)
+
+
+@dataclass
+class PreparedAuditData:
+    """Prepared arrays for one audit run.
+
+    Build with :meth:`from_frame`. Derived structures (score argsort,
+    threshold index, per-threshold group aggregates) are computed on first
+    use and cached.
+
+    Attributes:
+        y_prob: Predicted probabilities (contiguous float64).
+        y_true: Outcomes (uint8).
+        attributes: Encoded sensitive attributes keyed by column name.
+    """
+
+    y_prob: np.ndarray
+    y_true: np.ndarray
+    attributes: dict[str, EncodedAttribute] = field(default_factory=dict)
+    _aggregates: dict[float, dict[str, pl.DataFrame]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _digests: dict[str | None, str] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pl.DataFrame,
+        y_prob_col: str,
+        y_true_col: str,
+        group_cols: list[str] | None = None,
+    ) -> PreparedAuditData:
+        """Encode the columns an audit needs.
+
+        Args:
+            df: Audit DataFrame (validated: no null scores or labels).
+            y_prob_col: Column name for predicted probabilities.
+            y_true_col: Column name for true labels (0/1).
+            group_cols: Sensitive attribute columns to encode.
+
+        Returns:
+            PreparedAuditData for the frame.
+        """
+        y_prob = np.ascontiguousarray(df[y_prob_col].to_numpy(), dtype=np.float64)
+        y_true = np.ascontiguousarray(df[y_true_col].to_numpy(), dtype=np.uint8)
+        attributes = {
+            col: EncodedAttribute.from_series(df[col]) for col in dict.fromkeys(group_cols or [])
+        }
+        return cls(y_prob=y_prob, y_true=y_true, attributes=attributes)
+
+    def __len__(self) -> int:
+        return len(self.y_true)
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """Every array of the prepared data, keyed as with_arrays expects.
+
+        Keys are ``y_prob``, ``y_true`` and ``<column>/codes``,
+        ``<column>/order``, ``<column>/offsets`` per attribute.
+        """
+        arrays = {"y_prob": self.y_prob, "y_true": self.y_true}
+        for col, attr in self.attributes.items():
+            for part in _ATTRIBUTE_ARRAYS:
+                arrays[f"{col}/{part}"] = getattr(attr, part)
+        return arrays
+
+    def with_arrays(self, arrays: dict[str, np.ndarray]) -> PreparedAuditData:
+        """Same structure backed by ``arrays`` (e.g. shared-memory views).
+
+        Args:
+            arrays: Mapping with the keys produced by :meth:`arrays`.
+
+        Returns:
+            New PreparedAuditData; caches start empty.
+        """
+        attributes = {
+            col: replace(
+                attr,
+                codes=arrays[f"{col}/codes"],
+                order=arrays[f"{col}/order"],
+                offsets=arrays[f"{col}/offsets"],
+            )
+            for col, attr in self.attributes.items()
+        }
+        return PreparedAuditData(
+            y_prob=arrays["y_prob"], y_true=arrays["y_true"], attributes=attributes
+        )
+
+    def digest(self, column: str | None = None) -> str:
+        """Content hash of the scores and outcomes, or of one encoded attribute.
+
+        Hashes the array buffers (BLAKE2b) plus an attribute's dtype and
+        group labels; memoized. Used to key cached stage results.
+
+        Args:
+            column: Prepared attribute column, or None for scores and outcomes.
+
+        Returns:
+            Hex digest.
+        """
+        if column not in self._digests:
+            digest = hashlib.blake2b(digest_size=20)
+            if column is None:
+                arrays = [self.y_prob, self.y_true]
+            else:
+                attr = self.attribute(column)
+                digest.update(repr((str(attr.dtype), attr.groups)).encode())
+                arrays = [attr.codes]
+            for array in arrays:
+                digest.update(f"{array.dtype.str}{array.shape}".encode())
+                digest.update(np.ascontiguousarray(array).data)
+            self._digests[column] = digest.hexdigest()
+        return self._digests[column]
+
+    @cached_property
+    def score_order(self) -> np.ndarray:
+        """Stable ascending argsort of the scores."""
+        return np.argsort(self.y_prob, kind="mergesort")
+
+    @cached_property
+    def threshold_index(self) -> ThresholdIndex:
+        """Threshold sweep index over the whole cohort."""
+        return ThresholdIndex(self.y_true, self.y_prob, order=self.score_order)
+
+    @cached_property
+    def class_indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Row positions of the negative and the positive outcomes."""
+        return np.flatnonzero(self.y_true == 0), np.flatnonzero(self.y_true == 1)
+
+    def attribute(self, column: str) -> EncodedAttribute:
+        """Encoded attribute for ``column``.
+
+        Raises:
+            KeyError: If the column was not encoded by from_frame.
+        """
+        if column not in self.attributes:
+            raise KeyError(f"Attribute column '{column}' was not prepared")
+        return self.attributes[column]
+
+    def intersection(self, columns: list[str]) -> EncodedAttribute:
+        """Encoded cross product of several prepared attributes.
+
+        Group labels join the string form of each value with ``" x "`` (as
+        compute_intersectional names them); a row that is null in any
+        attribute is null in the intersection. Only combinations that occur
+        are kept.
+
+        Args:
+            columns: Prepared attribute columns to intersect.
+
+        Returns:
+            EncodedAttribute over the intersection labels.
+        """
+        attrs = [self.attribute(col) for col in columns]
+        combined = np.zeros(len(self), dtype=np.int64)
+        valid = np.ones(len(self), dtype=bool)
+        for attr in attrs:
+            combined = combined * len(attr.groups) + attr.codes
+            valid &= attr.codes >= 0
+
+        present, inverse = np.unique(combined[valid], return_inverse=True)
+        labels = [
+            pl.Series(attr.groups, dtype=attr.dtype).cast(pl.Utf8).to_list() for attr in attrs
+        ]
+        names = []
+        for value in present.tolist():
+            parts = []
+            for attr, attr_labels in zip(reversed(attrs), reversed(labels), strict=True):
+                value, code = divmod(value, len(attr.groups))
+                parts.append(attr_labels[code])
+            names.append(" x ".join(reversed(parts)))
+
+        # Re-code so that groups are in sorted label order
+        by_name = sorted(range(len(names)), key=names.__getitem__)
+        rank = np.empty(len(names), dtype=np.int32)
+        rank[by_name] = np.arange(len(names), dtype=np.int32)
+        codes = np.full(len(self), -1, dtype=np.int32)
+        codes[valid] = rank[inverse]
+        return EncodedAttribute.from_codes(
+            " x ".join(columns), pl.Utf8(), [names[i] for i in by_name], codes
+        )
+
+    def group_aggregates(self, threshold: float) -> dict[str, pl.DataFrame]:
+        """Per-group confusion counts for every attribute at ``threshold``.
+
+        Same columns and group order as compute_group_aggregates, computed
+        with one bincount per count over the encoded groups.
+
+        Args:
+            threshold: Decision threshold (``y_prob >= threshold`` is positive).
+
+        Returns:
+            Dict mapping attribute column to aggregate DataFrame.
+        """
+        if threshold in self._aggregates:
+            return self._aggregates[threshold]
+
+        pred = self.y_prob >= threshold
+        result = {
+            col: aggregate_encoded(attr, self.y_true == 1, pred, self.y_prob)
+            for col, attr in self.attributes.items()
+        }
+
+        self._aggregates[threshold] = result
+        return result
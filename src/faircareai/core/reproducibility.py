@@ -63,11 +63,24 @@ def build_reproducibility_bundle(
     bootstrap_ci: bool,
     n_bootstrap: int,
     random_seed: int | None,
+    stratified_bootstrap: bool = False,
+    workers: int = 1,
+    bootstrap_tolerance: float | None = None,
+    auroc_ci_method: str = "bootstrap",
 ) -> dict:
-    """Build a reproducibility bundle with environment + audit settings."""
+    """Build a reproducibility bundle with environment + audit settings.
+
+    Results do not depend on ``workers``: each audit unit draws from its own
+    ``SeedSequence`` child keyed by the unit, recorded as ``seed_strategy``.
+    """
     return {
         "environment": capture_environment(),
         "bootstrap_ci": bootstrap_ci,
         "n_bootstrap": n_bootstrap,
         "random_seed": random_seed,
+        "stratified_bootstrap": stratified_bootstrap,
+        "seed_strategy": "numpy.random.SeedSequence child per audit unit, keyed by unit",
+        "workers": workers,
+        "bootstrap_tolerance": bootstrap_tolerance,
+        "auroc_ci_method": auroc_ci_method,
     }
@@ -0,0 +1,109 @@
+"""
+Shared-Memory Array Transport
+
+Publishes the NumPy arrays that parallel workers need (scores, labels,
+group codes, cluster ids, ...) into a single ``multiprocessing.shared_memory``
+block, once. Workers receive a small picklable :class:`SharedArrays` handle
+and attach to the block with zero copies instead of unpickling their own
+copy of every array.
+
+Usage:
+    >>> with publish_arrays({"y_prob": y_prob, "y_true": y_true}) as handle:
+    ...     run_tasks(fn, tasks, workers=8, initializer=init, initargs=(handle,))
+    >>> # in the worker
+    >>> arrays = handle.attach()
+    >>> arrays["y_prob"]  # read-only view of the shared block
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from faircareai.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ALIGNMENT = 64
+
+# Blocks attached in this process, kept open for the lifetime of the views
+_ATTACHED: dict[str, SharedMemory] = {}
+
+
+@dataclass(frozen=True)
+class SharedArrays:
+    """Picklable handle to arrays published in one shared-memory block.
+
+    Attributes:
+        name: Shared-memory block name.
+        layout: Array key -> (dtype string, shape, byte offset in the block).
+    """
+
+    name: str
+    layout: dict[str, tuple[str, tuple[int, ...], int]]
+
+    def attach(self) -> dict[str, np.ndarray]:
+        """Read-only views of the published arrays (no copy).
+
+        The block stays open in this process for as long as the process
+        lives; attaching twice reuses it.
+
+        Returns:
+            Dict mapping each published key to its array view.
+        """
+        shm = _ATTACHED.get(self.name)
+        if shm is None:
+            shm = SharedMemory(name=self.name)
+            _ATTACHED[self.name] = shm
+
+        arrays: dict[str, np.ndarray] = {}
+        for key, (dtype, shape, offset) in self.layout.items():
+            view: np.ndarray = np.ndarray(
+                shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+            )
+            view.flags.writeable = False
+            arrays[key] = view
+        return arrays
+
+
+@contextmanager
+def publish_arrays(arrays: Mapping[str, np.ndarray]) -> Iterator[SharedArrays]:
+    """Copy arrays into a new shared-memory block for the duration of the block.
+
+    Args:
+        arrays: Arrays to publish, keyed by name. Object arrays are not
+            supported.
+
+    Yields:
+        Handle that workers attach to.
+
+    Raises:
+        TypeError: If an array has object dtype.
+    """
+    layout: dict[str, tuple[str, tuple[int, ...], int]] = {}
+    size = 0
+    for key, array in arrays.items():
+        if array.dtype.hasobject:
+            raise TypeError(f"Cannot publish object array '{key}' to shared memory")
+        size = -(-size // _ALIGNMENT) * _ALIGNMENT
+        layout[key] = (array.dtype.str, array.shape, size)
+        size += array.nbytes
+
+    shm = SharedMemory(create=True, size=max(size, 1))
+    try:
+        for key, array in arrays.items():
+            dtype, shape, offset = layout[key]
+            target: np.ndarray = np.ndarray(
+                shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+            )
+            target[...] = array
+            del target
+        logger.debug("Published %d arrays (%d bytes) to %s", len(layout), size, shm.name)
+        yield SharedArrays(shm.name, layout)
+    finally:
+        shm.close()
+        shm.unlink()
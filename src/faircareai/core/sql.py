@@ -0,0 +1,273 @@
+"""
+FairCareAI - SQL Pushdown Audits
+
+Audit predictions where they live, in a database. A SQLAudit sends the
+group-by aggregations an audit needs to the database as SQL and only reads
+back small aggregate tables: the validation profile, the rows per attribute
+value, and one score histogram per sensitive attribute and intersection
+(cases, flagged cases and score sums per group, outcome and score bin).
+Per-group confusion counts at every threshold, calibration sums and the
+Table 1 counts are all derived from those histograms, as in StreamingAudit.
+
+The queries use portable SQL (CAST, CASE, ``||``, GROUP BY) and run on any
+DB-API 2.0 connection, e.g. ``sqlite3`` or ``duckdb``.
+
+Usage:
+    >>> import duckdb
+    >>> con = duckdb.connect("warehouse.duckdb")
+    >>> audit = SQLAudit(con, "predictions", pred_col="risk", target_col="readmit")
+    >>> audit.add_sensitive_attribute("race", reference="White")
+    >>> results = audit.run()
+"""
+
+from typing import Any
+
+import polars as pl
+
+from faircareai.core.config import FairnessConfig
+from faircareai.core.constants import (
+    PROB_CLIP_MAX,
+    PROB_CLIP_MIN,
+    SQL_SCHEMA_SAMPLE_ROWS,
+    STREAMING_SCORE_BINS,
+)
+from faircareai.core.exceptions import DataValidationError
+from faircareai.core.histogram import ScoreHistogram
+from faircareai.core.logging import get_logger
+from faircareai.core.streaming import StreamingAudit
+
+logger = get_logger(__name__)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column name for SQL (double quotes, embedded quotes doubled)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _relation_sql(relation: str) -> str:
+    """FROM clause target: a query becomes a subquery, a table name is used as given."""
+    if relation.lstrip().lower().startswith(("select", "with")):
+        return f"({relation}) AS _audit_data"
+    return relation
+
+
+def fetch_frame(connection: Any, sql: str) -> pl.DataFrame:
+    """Run a query on a DB-API 2.0 connection and return its rows as a DataFrame.
+
+    Args:
+        connection: Database connection with a ``cursor()`` method.
+        sql: Query to execute.
+
+    Returns:
+        DataFrame with the query's columns. Dtypes are inferred from all
+        returned values, not a prefix: databases may return NULL group keys
+        first.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql)
+        names = [column[0] for column in cursor.description]
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    return pl.DataFrame(rows, schema=names, orient="row", infer_schema_length=None)
+
+
+def _group_key_sql(columns: list[str]) -> str:
+    """SQL group key for one attribute column or an intersection of several.
+
+    Intersections join the text of each value with " x ", as
+    compute_intersectional; ``||`` makes the key null when any value is.
+    """
+    if len(columns) == 1:
+        return quote_identifier(columns[0])
+    return " || ' x ' || ".join(f"CAST({quote_identifier(c)} AS VARCHAR)" for c in columns)
+
+
+def score_bin_sql(score: str, n_bins: int = STREAMING_SCORE_BINS) -> str:
+    """SQL expression for score_bins over a DOUBLE expression ``score``.
+
+    ``CAST(... AS INTEGER)`` truncates in some databases and rounds in
+    others; either way it is within one of the floor, and the same two edge
+    comparisons as score_bins move it to the bin with
+    ``k / n_bins <= score < (k + 1) / n_bins``.
+    """
+    width = f"CAST({n_bins} AS DOUBLE)"
+    raw = f"CAST({score} * {n_bins} AS INTEGER)"
+    lower = f"({raw} - CASE WHEN {score} < {raw} / {width} THEN 1 ELSE 0 END)"
+    upper = f"({lower} + CASE WHEN {score} >= ({lower} + 1) / {width} THEN 1 ELSE 0 END)"
+    last = n_bins - 1
+    return f"CASE WHEN {upper} > {last} THEN {last} WHEN {upper} < 0 THEN 0 ELSE {upper} END"
+
+
+def logit_score_sql(score: str) -> str:
+    """SQL expression for logit_scores over a DOUBLE expression ``score``."""
+    clipped = (
+        f"(CASE WHEN {score} < {PROB_CLIP_MIN!r} THEN {PROB_CLIP_MIN!r} "
+        f"WHEN {score} > {PROB_CLIP_MAX!r} THEN {PROB_CLIP_MAX!r} ELSE {score} END)"
+    )
+    return f"LN({clipped} / (1 - {clipped}))"
+
+
+def sql_histograms(
+    connection: Any,
+    relation: str,
+    pred_col: str,
+    target_col: str,
+    groupings: dict[str, list[str]],
+    threshold: float,
+    n_bins: int = STREAMING_SCORE_BINS,
+) -> dict[str, ScoreHistogram]:
+    """Score histograms of a SQL relation, one aggregate query per grouping.
+
+    Args:
+        connection: DB-API 2.0 connection.
+        relation: Table name, or a SELECT query over the audit rows.
+        pred_col: Column name for predicted probabilities.
+        target_col: Column name for true labels.
+        groupings: Histogram key -> attribute columns it groups by.
+        threshold: Decision threshold for the flagged counts.
+        n_bins: Number of score bins.
+
+    Returns:
+        Dict of ScoreHistogram keyed like ``groupings``.
+    """
+    source = _relation_sql(relation)
+    score = f"CAST({quote_identifier(pred_col)} AS DOUBLE)"
+    histograms = {}
+    for key, columns in groupings.items():
+        # The inner query names the score once, so the bin expression stays short
+        sql = (
+            f"SELECT _key, _outcome, {score_bin_sql('_score', n_bins)} AS _bin, "
+            f"COUNT(*) AS n, "
+            f"SUM(CASE WHEN _score >= {float(threshold)!r} THEN 1 ELSE 0 END) AS flagged, "
+            f"SUM(_score) AS prob_sum, SUM({logit_score_sql('_score')}) AS logit_sum, "
+            f"SUM(_score * _score) AS prob_sq_sum, "
+            f"MIN(_score) AS prob_min, MAX(_score) AS prob_max "
+            f"FROM (SELECT {_group_key_sql(columns)} AS _key, "
+            f"CASE WHEN {quote_identifier(target_col)} = 1 THEN 1 ELSE 0 END AS _outcome, "
+            f"{score} AS _score FROM {source}) AS _scored "
+            f"GROUP BY _key, _outcome, _bin"
+        )
+        frame = fetch_frame(connection, sql).rename({"_key": key})
+        histograms[key] = ScoreHistogram.from_aggregates(frame, key, threshold, n_bins)
+    return histograms
+
+
+class SQLAudit(StreamingAudit):
+    """
+    Fairness audit computed inside a database.
+
+    Same workflow, sections and accuracy as StreamingAudit (every section
+    comes from per-group score histograms with ``n_bins`` bins), but the
+    histograms, validation profile and attribute counts are SQL group-by
+    queries: the rows never leave the database.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        relation: str,
+        pred_col: str,
+        target_col: str,
+        config: FairnessConfig | None = None,
+        threshold: float = 0.5,
+        n_bins: int = STREAMING_SCORE_BINS,
+    ):
+        """
+        Initialize a SQL pushdown fairness audit.
+
+        Args:
+            connection: DB-API 2.0 connection (e.g. ``sqlite3.connect(...)``
+                or ``duckdb.connect(...)``).
+            relation: Table name (inserted into the SQL as given), or a
+                SELECT query over the audit rows.
+            pred_col: Column name containing model predictions as probabilities.
+            target_col: Column name containing actual outcomes (0/1).
+            config: FairnessConfig object with audit settings.
+            threshold: Decision threshold. Default is 0.5.
+            n_bins: Score histogram bins; rank metrics are resolved to
+                ``1 / n_bins``. Default: STREAMING_SCORE_BINS.
+
+        Raises:
+            DataValidationError: If the data fails validation.
+        """
+        self.connection = connection
+        super().__init__(relation, pred_col, target_col, config, threshold, n_bins)
+
+    def _load_data(self, data: Any) -> pl.DataFrame:
+        """Zero-row frame with the relation's columns, dtypes inferred from a sample.
+
+        Columns that are NULL throughout the sample take their dtype from a
+        sample of their non-NULL values.
+        """
+        self.relation = str(data)
+        self.source = _relation_sql(self.relation)
+        sample = fetch_frame(
+            self.connection, f"SELECT * FROM {self.source} LIMIT {SQL_SCHEMA_SAMPLE_ROWS}"
+        )
+        if sample.is_empty():
+            raise DataValidationError(f"SQL relation {self.relation!r} has no rows.")
+        schema = dict(sample.schema)
+        for column in [name for name, dtype in schema.items() if dtype == pl.Null]:
+            quoted = quote_identifier(column)
+            values = fetch_frame(
+                self.connection,
+                f"SELECT {quoted} FROM {self.source} WHERE {quoted} IS NOT NULL "
+                f"LIMIT {SQL_SCHEMA_SAMPLE_ROWS}",
+            )
+            if not values.is_empty():
+                schema[column] = values.schema[column]
+        empty = pl.DataFrame(schema=schema)
+        self.scan = empty.lazy()
+        return empty
+
+    def _data_profile(self) -> dict[str, Any]:
+        """Validation profile from two aggregate queries."""
+        pred = quote_identifier(self.pred_col)
+        target = quote_identifier(self.target_col)
+        stats = fetch_frame(
+            self.connection,
+            f"SELECT SUM(CASE WHEN {pred} IS NULL THEN 1 ELSE 0 END) AS pred_nulls, "
+            f"SUM(CASE WHEN {target} IS NULL THEN 1 ELSE 0 END) AS target_nulls, "
+            f"MIN({pred}) AS pred_min, MAX({pred}) AS pred_max, COUNT(*) AS n_rows "
+            f"FROM {self.source}",
+        )
+        targets = fetch_frame(
+            self.connection, f"SELECT {target} FROM {self.source} GROUP BY {target}"
+        )
+        profile = stats.row(0, named=True)
+        profile["target_values"] = targets[self.target_col].to_list()
+        return profile
+
+    def _attribute_counts(self, column: str) -> pl.DataFrame:
+        """Rows per value of an attribute column, from a GROUP BY query."""
+        if column not in self._value_counts:
+            quoted = quote_identifier(column)
+            counts = fetch_frame(
+                self.connection,
+                f"SELECT {quoted}, COUNT(*) AS len FROM {self.source} GROUP BY {quoted}",
+            )
+            self._value_counts[column] = counts.with_columns(pl.col("len").cast(pl.UInt32))
+        return self._value_counts[column]
+
+    def _histograms(
+        self, groupings: dict[str, list[str]], n_bins: int | None
+    ) -> dict[str, ScoreHistogram]:
+        """Score histograms for each grouping, one aggregate query each.
+
+        Raises:
+            ValueError: If ``n_bins`` is None (the database bins the scores).
+        """
+        if n_bins is None:
+            raise ValueError("SQL histograms need a fixed number of score bins")
+        logger.debug(f"Pushing {len(groupings)} histogram queries down to SQL")
+        return sql_histograms(
+            self.connection,
+            self.relation,
+            self.pred_col,
+            self.target_col,
+            groupings,
+            self.threshold,
+            n_bins,
+        )
@@ -9,6 +9,7 @@ Implements rigorous statistical methods for fairness analysis:
 5. Sample size adequacy (stratum-specific Rule of 5)
 6. Multiplicity control (Holm-Bonferroni, BH-FDR)
 7. Disparate impact decision logic
+8. DeLong AUROC variance and AUROC difference tests (DeLong et al. 1988)
 
 Methodology: Van Calster et al. (2025).
 """
@@ -24,6 +25,9 @@ import numpy as np
 import polars as pl
 from scipy import stats
 
+from faircareai.core.bootstrap import ci_converged
+from faircareai.core.constants import SEQUENTIAL_CHECK_EVERY
+
 # ==============================================================================
 # Configuration Dataclass
 # ==============================================================================
@@ -386,6 +390,102 @@ def bootstrap_ci_simple(
     return (point_estimate, (float(ci_lower), float(ci_upper)))
 
 
+def dense_codes(series: pl.Series) -> np.ndarray:
+    """Per-row int64 codes ``0..k - 1`` in ``unique().sort()`` order; nulls share code 0."""
+    codes = series.rank("dense").fill_null(0).to_numpy().astype(np.int64)
+    if series.null_count() == 0:
+        codes -= 1
+    return codes
+
+
+@dataclass(frozen=True)
+class ClusterIndex:
+    """Rows grouped by cluster (e.g. patient) in CSR layout.
+
+    Built once per bootstrap so that a cluster resample is a vectorized
+    gather instead of one scan of the data per sampled cluster.
+
+    Attributes:
+        codes: Per-row cluster code in ``0..n_clusters - 1``, in sorted
+            cluster-id order.
+        order: Row positions sorted by cluster (stable, so rows keep their
+            original order within a cluster).
+        offsets: Cluster ``i`` occupies ``order[offsets[i]:offsets[i + 1]]``.
+    """
+
+    codes: np.ndarray
+    order: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> ClusterIndex:
+        """Build from dense per-row cluster codes."""
+        codes = np.asarray(codes, dtype=np.int64)
+        sizes = np.bincount(codes) if len(codes) else np.zeros(0, dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+        return cls(codes, np.argsort(codes, kind="stable"), offsets)
+
+    @classmethod
+    def from_ids(cls, cluster_ids: np.ndarray) -> ClusterIndex:
+        """Build from an array of cluster ids."""
+        _, codes = np.unique(cluster_ids, return_inverse=True)
+        return cls.from_codes(codes.reshape(-1))
+
+    @classmethod
+    def from_series(cls, series: pl.Series) -> ClusterIndex:
+        """Build from a cluster id column; null ids form one cluster."""
+        return cls.from_codes(dense_codes(series))
+
+    @property
+    def n_clusters(self) -> int:
+        """Number of clusters."""
+        return len(self.offsets) - 1
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Number of rows per cluster."""
+        return np.diff(self.offsets)
+
+    def sample(self, rng: np.random.Generator) -> np.ndarray:
+        """Draw ``n_clusters`` cluster codes with replacement."""
+        return rng.integers(0, self.n_clusters, size=self.n_clusters)
+
+    def rows(self, clusters: np.ndarray) -> np.ndarray:
+        """Row positions of the given clusters, concatenated in order.
+
+        Args:
+            clusters: Cluster codes, repeats allowed (e.g. from :meth:`sample`).
+
+        Returns:
+            Row positions, each cluster's rows once per occurrence.
+        """
+        starts = self.offsets[clusters]
+        lengths = self.offsets[clusters + 1] - starts
+        # Position k of the output belongs to draw j: start_j + (k - first_k_of_j)
+        shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        rows: np.ndarray = self.order[np.arange(int(lengths.sum())) + shift]
+        return rows
+
+    def counts(self, clusters: np.ndarray) -> np.ndarray:
+        """How many times each cluster occurs in a resample."""
+        return np.bincount(clusters, minlength=self.n_clusters)
+
+    def row_weights(self, clusters: np.ndarray) -> np.ndarray:
+        """Per-row resample weight (the row's cluster multiplicity)."""
+        weights: np.ndarray = self.counts(clusters)[self.codes]
+        return weights
+
+    def sums(self, values: np.ndarray) -> np.ndarray:
+        """Per-cluster sums of ``values``, a sufficient statistic for resamples.
+
+        For any resample, ``counts(clusters) @ sums(values)`` equals
+        ``values[rows(clusters)].sum()``.
+        """
+        return np.bincount(
+            self.codes, weights=np.asarray(values, dtype=np.float64), minlength=self.n_clusters
+        )
+
+
 def cluster_bootstrap_ci(
     df: pl.DataFrame,
     cluster_col: str,
@@ -393,12 +493,15 @@ def cluster_bootstrap_ci(
     n_bootstrap: int = 2000,
     alpha: float = 0.05,
     random_state: int | None = None,
+    tolerance: float | None = None,
 ) -> tuple[float, tuple[float, float]]:
     """
     Compute cluster-aware bootstrap CI.
 
     Resamples at the cluster level (e.g., patient) rather than
     observation level to account for within-cluster correlation.
+    Rows are indexed by cluster once (see :class:`ClusterIndex`); each
+    iteration gathers the sampled clusters' rows in a single take.
 
     Args:
         df: Polars DataFrame with data.
@@ -407,37 +510,31 @@ def cluster_bootstrap_ci(
         n_bootstrap: Number of bootstrap iterations.
         alpha: Significance level.
         random_state: Random seed for reproducibility.
+        tolerance: Opt-in sequential mode: stop once the CI endpoints'
+            Monte Carlo error is within tolerance (see ci_converged).
 
     Returns:
         Tuple of (point_estimate, (ci_lower, ci_upper)).
     """
     rng = np.random.default_rng(random_state)
 
-    # Get unique clusters
-    clusters = df[cluster_col].unique().to_numpy()
-    n_clusters = len(clusters)
-
-    if n_clusters == 0:
+    index = ClusterIndex.from_series(df[cluster_col])
+    if index.n_clusters == 0:
         return (np.nan, (np.nan, np.nan))
 
     point_estimate = statistic_fn(df)
     bootstrap_stats = np.zeros(n_bootstrap)
 
     for i in range(n_bootstrap):
-        # Resample clusters with replacement
-        sampled_clusters = rng.choice(clusters, size=n_clusters, replace=True)
+        if i and i % SEQUENTIAL_CHECK_EVERY == 0:
+            drawn = bootstrap_stats[:i]
+            if ci_converged(drawn[~np.isnan(drawn)], alpha, tolerance):
+                bootstrap_stats = drawn
+                break
 
-        # Build resampled DataFrame
-        resampled_dfs = []
-        for cluster_id in sampled_clusters:
-            cluster_data = df.filter(pl.col(cluster_col) == cluster_id)
-            resampled_dfs.append(cluster_data)
-
-        if resampled_dfs:
-            resampled_df = pl.concat(resampled_dfs)
-            bootstrap_stats[i] = statistic_fn(resampled_df)
-        else:
-            bootstrap_stats[i] = np.nan
+        # Resample clusters with replacement
+        rows = index.rows(index.sample(rng))
+        bootstrap_stats[i] = statistic_fn(df[rows])
 
     # Remove NaN values for percentile calculation
     valid_stats = bootstrap_stats[~np.isnan(bootstrap_stats)]
@@ -674,6 +771,184 @@ def get_effective_sample_size(
     return df[cluster_col].n_unique()
 
 
+# ==============================================================================
+# DeLong AUROC Variance
+# ==============================================================================
+
+
+def _sample_covariance(components: np.ndarray) -> np.ndarray:
+    """Covariance (ddof=1) between the rows of ``components``; NaN for one column."""
+    centered = components - components.mean(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray((centered @ centered.T) / (components.shape[1] - 1))
+
+
+def delong_auroc_covariance(
+    y_true: np.ndarray,
+    y_scores: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    AUROCs of one or more score columns and their DeLong covariance matrix.
+
+    Uses the fast DeLong algorithm (Sun & Xu 2014). The placement value of
+    each case (share of controls scored below it) and of each control
+    (share of cases scored above it) is a difference of midranks: pooled
+    rank minus rank within its own class. That makes the cost one sort per
+    score column, O(n log n), instead of O(cases x controls) comparisons.
+    Ties count as one half, matching ``roc_auc_score``.
+
+    Args:
+        y_true: True binary labels, shape (n,).
+        y_scores: Scores on the same patients, shape (n,) or (k, n).
+
+    Returns:
+        Tuple of (aurocs, covariance) with shapes (k,) and (k, k). The
+        variances are NaN when a class has a single member.
+
+    Raises:
+        ValueError: If y_true does not contain both classes.
+
+    Reference:
+        DeLong, DeLong, Clarke-Pearson (1988). Comparing the areas under two
+        or more correlated ROC curves. Biometrics 44(3).
+        Sun, Xu (2014). Fast implementation of DeLong's algorithm for
+        comparing the areas under correlated ROC curves. IEEE SPL 21(11).
+    """
+    is_case = np.asarray(y_true) == 1
+    scores = np.atleast_2d(np.asarray(y_scores, dtype=float))
+    m = int(is_case.sum())
+    n = is_case.size - m
+    if m == 0 or n == 0:
+        raise ValueError("DeLong AUROC variance requires both outcome classes")
+
+    cases, controls = scores[:, is_case], scores[:, ~is_case]
+    pooled = stats.rankdata(np.concatenate([cases, controls], axis=1), axis=1)
+    case_placements = (pooled[:, :m] - stats.rankdata(cases, axis=1)) / n
+    control_placements = 1.0 - (pooled[:, m:] - stats.rankdata(controls, axis=1)) / m
+
+    aurocs = case_placements.mean(axis=1)
+    covariance = (
+        _sample_covariance(case_placements) / m + _sample_covariance(control_placements) / n
+    )
+    return aurocs, covariance
+
+
+def ci_delong_auroc(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    alpha: float = 0.05,
+) -> tuple[float, float, float, float]:
+    """
+    Compute AUROC with a DeLong normal-approximation confidence interval.
+
+    The interval is clipped to [0, 1], as in pROC's ``ci.auc``.
+
+    Args:
+        y_true: True binary labels.
+        y_prob: Predicted probabilities.
+        alpha: Significance level (default 0.05 for 95% CI).
+
+    Returns:
+        Tuple of (auroc, standard_error, lower_bound, upper_bound).
+
+    Raises:
+        ValueError: If y_true does not contain both classes.
+    """
+    aurocs, covariance = delong_auroc_covariance(y_true, y_prob)
+    auroc = float(aurocs[0])
+    se = math.sqrt(max(float(covariance[0, 0]), 0.0))
+    z = stats.norm.ppf(1 - alpha / 2)
+    return auroc, se, max(0.0, auroc - z * se), min(1.0, auroc + z * se)
+
+
+@dataclass(frozen=True)
+class AurocDifference:
+    """Difference between two AUROCs with a normal-approximation CI and test.
+
+    Attributes:
+        difference: AUROC of the first scores/group minus the second.
+        se: Standard error of the difference.
+        ci_lower: Lower bound of CI (clipped to -1).
+        ci_upper: Upper bound of CI (clipped to 1).
+        p_value: Two-sided p-value for a zero difference.
+    """
+
+    difference: float
+    se: float
+    ci_lower: float
+    ci_upper: float
+    p_value: float
+
+    @classmethod
+    def from_variance(
+        cls,
+        difference: float,
+        variance: float,
+        alpha: float = 0.05,
+    ) -> AurocDifference:
+        """
+        Build the CI and z-test of an AUROC difference from its variance.
+
+        For independent groups the variance is the sum of the two DeLong
+        variances; for two scores on the same patients it also subtracts
+        twice their covariance (see delong_paired_difference).
+
+        Args:
+            difference: AUROC difference.
+            variance: Variance of the difference.
+            alpha: Significance level (default 0.05 for 95% CI).
+
+        Returns:
+            AurocDifference (NaN fields when the variance is NaN).
+        """
+        se = math.sqrt(max(variance, 0.0)) if not math.isnan(variance) else math.nan
+        z = stats.norm.ppf(1 - alpha / 2)
+        if se > 0:
+            p_value = float(2 * stats.norm.sf(abs(difference) / se))
+        elif se == 0:
+            # Degenerate placements (e.g. both AUROCs are 1): no sampling spread
+            p_value = 1.0 if difference == 0 else 0.0
+        else:
+            p_value = math.nan
+        return cls(
+            difference=float(difference),
+            se=se,
+            ci_lower=max(-1.0, difference - z * se),
+            ci_upper=min(1.0, difference + z * se),
+            p_value=p_value,
+        )
+
+
+def delong_paired_difference(
+    y_true: np.ndarray,
+    y_prob_a: np.ndarray,
+    y_prob_b: np.ndarray,
+    alpha: float = 0.05,
+) -> AurocDifference:
+    """
+    Compare the AUROCs of two scores evaluated on the same patients.
+
+    The paired DeLong test accounts for the correlation between the two
+    AUROCs, which is what makes it more powerful than comparing their
+    separate CIs.
+
+    Args:
+        y_true: True binary labels.
+        y_prob_a: First scores.
+        y_prob_b: Second scores on the same patients.
+        alpha: Significance level (default 0.05 for 95% CI).
+
+    Returns:
+        AurocDifference of AUROC(a) - AUROC(b).
+
+    Raises:
+        ValueError: If y_true does not contain both classes.
+    """
+    aurocs, covariance = delong_auroc_covariance(y_true, np.vstack([y_prob_a, y_prob_b]))
+    variance = covariance[0, 0] + covariance[1, 1] - 2 * covariance[0, 1]
+    return AurocDifference.from_variance(float(aurocs[0] - aurocs[1]), float(variance), alpha)
+
+
 # ==============================================================================
 # Multiplicity Control
 # ==============================================================================
@@ -0,0 +1,316 @@
+"""
+FairCareAI - Streaming Audits
+
+Audit data that does not fit in memory. A StreamingAudit reads a lazy
+Parquet/CSV scan (or any polars LazyFrame) and never materializes the rows:
+validation, attribute counts and one score histogram per sensitive attribute
+and intersection are computed by streaming group-by queries, and every audit
+section is derived from those histograms (see faircareai.metrics.aggregated
+for which metrics are exact and which are binned).
+
+Usage:
+    >>> audit = StreamingAudit("predictions/", pred_col="risk", target_col="readmit")
+    >>> audit.add_sensitive_attribute("race", reference="White")
+    >>> results = audit.run()
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from faircareai.core.audit import FairCareAudit, scan_profile
+from faircareai.core.cache import StageCache
+from faircareai.core.config import FairnessConfig
+from faircareai.core.constants import (
+    DEFAULT_BOOTSTRAP_SEED,
+    IPC_FILE_SUFFIXES,
+    STREAMING_SCORE_BINS,
+)
+from faircareai.core.exceptions import DataValidationError
+from faircareai.core.histogram import ScoreHistogram, logit_score_expr, score_bin_expr
+from faircareai.core.logging import get_logger
+from faircareai.core.prepared import group_key
+from faircareai.core.reproducibility import build_reproducibility_bundle
+from faircareai.core.results import AuditResults
+
+logger = get_logger(__name__)
+
+AuditSource = pl.LazyFrame | pl.DataFrame | str | Path | Sequence[str | Path]
+
+
+def scan_audit_source(source: AuditSource) -> pl.LazyFrame:
+    """Open audit data as a lazy scan.
+
+    Args:
+        source: A LazyFrame, a DataFrame, a .parquet, .csv or Arrow IPC
+            path (globs allowed; IPC files are memory-mapped), a directory
+            of .parquet files, or a list of paths whose scans are
+            concatenated.
+
+    Returns:
+        LazyFrame over the data.
+
+    Raises:
+        TypeError: If the source type is not supported.
+        DataValidationError: If a file format is not supported.
+    """
+    if isinstance(source, pl.LazyFrame):
+        return source
+    if isinstance(source, pl.DataFrame):
+        return source.lazy()
+    if isinstance(source, str | Path):
+        return _scan_path(Path(source))
+    if isinstance(source, Sequence) and source:
+        return pl.concat([_scan_path(Path(path)) for path in source], how="vertical")
+
+    type_name = type(source).__name__
+    raise TypeError(
+        f"Expected a LazyFrame, DataFrame, file path or list of file paths, got {type_name}."
+    )
+
+
+def _scan_path(path: Path) -> pl.LazyFrame:
+    """Lazy scan of one path, glob or directory of .parquet files."""
+    if path.is_dir():
+        return pl.scan_parquet(str(path / "*.parquet"))
+    if path.suffix == ".parquet":
+        return pl.scan_parquet(str(path))
+    if path.suffix == ".csv":
+        return pl.scan_csv(str(path))
+    if path.suffix in IPC_FILE_SUFFIXES:
+        return pl.scan_ipc(str(path), memory_map=True)
+    raise DataValidationError(
+        f"Unsupported file format: {path.suffix}. "
+        f"Supported formats: .parquet, .csv, {', '.join(IPC_FILE_SUFFIXES)}"
+    )
+
+
+def _group_key(schema: dict[str, Any], columns: list[str]) -> pl.Expr:
+    """Group-by key for one attribute column or an intersection of several.
+
+    Single columns are keyed by group_key. Intersections join their values
+    with " x ", as compute_intersectional; a null in any column makes the
+    key null.
+    """
+    if len(columns) == 1:
+        return group_key(columns[0], schema[columns[0]])
+    return pl.concat_str([pl.col(c).cast(pl.Utf8) for c in columns], separator=" x ")
+
+
+def scan_histograms(
+    scan: pl.LazyFrame,
+    pred_col: str,
+    target_col: str,
+    groupings: dict[str, list[str]],
+    threshold: float,
+    n_bins: int = STREAMING_SCORE_BINS,
+) -> dict[str, ScoreHistogram]:
+    """Score histograms of a lazy scan, one per grouping, in one streaming pass.
+
+    Args:
+        scan: Lazy audit data.
+        pred_col: Column name for predicted probabilities.
+        target_col: Column name for true labels.
+        groupings: Histogram key -> attribute columns it groups by (one
+            column, or several for an intersection).
+        threshold: Decision threshold for the flagged counts.
+        n_bins: Number of score bins.
+
+    Returns:
+        Dict of ScoreHistogram keyed like ``groupings``.
+    """
+    schema = scan.schema
+    score = pl.col(pred_col).cast(pl.Float64)
+    queries = [
+        scan.group_by(
+            _group_key(schema, columns).alias(key),
+            (pl.col(target_col) == 1).cast(pl.Int8).alias("_outcome"),
+            score_bin_expr(pred_col, n_bins).alias("_bin"),
+        ).agg(
+            pl.len().alias("n"),
+            (score >= threshold).sum().alias("flagged"),
+            score.sum().alias("prob_sum"),
+            logit_score_expr(pred_col).sum().alias("logit_sum"),
+            (score * score).sum().alias("prob_sq_sum"),
+            score.min().alias("prob_min"),
+            score.max().alias("prob_max"),
+        )
+        for key, columns in groupings.items()
+    ]
+    frames = pl.collect_all(queries, streaming=True, comm_subplan_elim=False)
+    return {
+        key: ScoreHistogram.from_aggregates(frame, key, threshold, n_bins)
+        for key, frame in zip(groupings, frames, strict=True)
+    }
+
+
+class StreamingAudit(FairCareAudit):
+    """
+    Fairness audit over a lazy scan, for data larger than memory.
+
+    Same workflow and AuditResults as FairCareAudit, with sensitive
+    attributes added explicitly (no column-name suggestions are made, as
+    that would need a pass over every candidate column). Each run makes one
+    streaming pass that builds score histograms with ``n_bins`` equal-width
+    bins per attribute and intersection; all sections are computed from them:
+
+    - Counts, rates, confusion metrics and fairness disparities (with their
+      CIs) are exact, as are threshold and decision curves at multiples of
+      ``1 / n_bins``.
+    - AUROC/AUPRC treat each bin as a tied score level; each AUROC carries
+      ``auroc_max_error``, the largest possible deviation from its exact
+      value, which shrinks with the bin width.
+    - Calibration slope and intercept are fitted on the binned data.
+
+    Stratified plots need the rows and are not available on the results.
+    """
+
+    def __init__(
+        self,
+        data: AuditSource,
+        pred_col: str,
+        target_col: str,
+        config: FairnessConfig | None = None,
+        threshold: float = 0.5,
+        n_bins: int = STREAMING_SCORE_BINS,
+        filter: pl.Expr | None = None,
+    ):
+        """
+        Initialize a streaming fairness audit.
+
+        Args:
+            data: Model predictions data. Accepts a polars LazyFrame (or
+                DataFrame), a .parquet, .csv or Arrow IPC path or glob, a
+                directory of .parquet files, or a list of such paths.
+            pred_col: Column name containing model predictions as probabilities.
+            target_col: Column name containing actual outcomes (0/1).
+            config: FairnessConfig object with audit settings.
+            threshold: Decision threshold. Default is 0.5.
+            n_bins: Score histogram bins; rank metrics are resolved to
+                ``1 / n_bins``. Default: STREAMING_SCORE_BINS.
+            filter: Cohort filter, e.g. ``pl.col("admit_year") == 2025``,
+                pushed into the scan (Parquet row groups whose statistics
+                rule it out are skipped).
+
+        Raises:
+            DataValidationError: If the data fails validation (one streaming pass).
+        """
+        self.n_bins = n_bins
+        self._value_counts: dict[str, pl.DataFrame] = {}
+        super().__init__(data, pred_col, target_col, config, threshold, filter)  # type: ignore[arg-type]
+
+    def _load_data(self, data: Any) -> pl.DataFrame:
+        """Open the lazy scan; ``self.df`` is a zero-row frame carrying its schema."""
+        self.scan = scan_audit_source(data)
+        if self.filter is not None:
+            self.scan = self.scan.filter(self.filter)
+        return pl.DataFrame(schema=self.scan.schema)
+
+    def _data_profile(self) -> dict[str, Any]:
+        """Validation profile from one streaming query."""
+        return scan_profile(self.scan, self.pred_col, self.target_col)
+
+    def _attribute_counts(self, column: str) -> pl.DataFrame:
+        """Rows per value of an attribute column, from a streaming query."""
+        if column not in self._value_counts:
+            key = _group_key(self.scan.schema, [column]).alias(column)
+            self._value_counts[column] = self.scan.group_by(key).len().collect(streaming=True)
+        return self._value_counts[column]
+
+    def _detect_suggestions(self) -> list[dict]:
+        """No suggestions: detection would scan every candidate column."""
+        return []
+
+    def _histograms(
+        self, groupings: dict[str, list[str]], n_bins: int | None
+    ) -> dict[str, ScoreHistogram]:
+        """Score histograms for each grouping, from one streaming pass.
+
+        Raises:
+            ValueError: If ``n_bins`` is None; the distinct scores of a scan
+                are not known before it is read.
+        """
+        if n_bins is None:
+            raise ValueError("Streaming histograms need a fixed number of score bins")
+        return scan_histograms(
+            self.scan, self.pred_col, self.target_col, groupings, self.threshold, n_bins
+        )
+
+    def run(
+        self,
+        bootstrap_ci: bool = True,
+        n_bootstrap: int = 1000,
+        random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+        stratified_bootstrap: bool = False,
+        workers: int = 1,
+        bootstrap_tolerance: float | None = None,
+        mode: str = "approximate",
+        cache: StageCache | str | Path | None = None,  # noqa: ARG002
+        auroc_ci_method: str = "bootstrap",  # noqa: ARG002
+    ) -> AuditResults:
+        """
+        Execute the fairness audit in one streaming pass over the data.
+
+        Args:
+            bootstrap_ci: Calculate bootstrap confidence intervals. Rank
+                metrics resample the histogram cells; disparities use the
+                same count-level bootstrap as FairCareAudit. Default: True.
+            n_bootstrap: Number of bootstrap iterations. Default: 1000.
+            random_seed: Random seed; each section draws from the seed of
+                its audit unit, as in FairCareAudit. Default: 42.
+            stratified_bootstrap: Preserve each group's outcome counts when
+                resampling for the fairness disparity CIs. Default: False.
+            workers: Accepted for compatibility; the histogram sections are
+                computed serially.
+            bootstrap_tolerance: Accepted for compatibility; histogram
+                bootstraps always take n_bootstrap draws.
+            mode: Only "approximate": the rows are never materialized.
+            cache: Accepted for compatibility; the single streaming pass is
+                not cached.
+            auroc_ci_method: Accepted for compatibility; histogram AUROC
+                CIs always resample the histogram cells.
+
+        Returns:
+            AuditResults with the same sections as FairCareAudit.run().
+            ``reproducibility["streaming"]`` records the bin count and the
+            largest possible error of the binned metrics
+            (histogram_error_bounds).
+
+        Raises:
+            ConfigurationError: If required config fields are missing or no
+                sensitive attributes have been added.
+            ValueError: If mode is not "approximate".
+        """
+        if mode != "approximate":
+            raise ValueError(
+                f"StreamingAudit only supports mode='approximate', got {mode!r}; "
+                f"use FairCareAudit for an exact audit"
+            )
+        self._validate_audit_config()
+        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+
+        results = AuditResults(config=self.config, threshold=self.threshold)
+        results.run_timestamp = datetime.now().astimezone().isoformat(timespec="seconds")
+        results.random_seed = random_seed
+        results.reproducibility = build_reproducibility_bundle(
+            bootstrap_ci=bootstrap_ci,
+            n_bootstrap=n_bootstrap,
+            random_seed=random_seed,
+            stratified_bootstrap=stratified_bootstrap,
+            workers=workers,
+            bootstrap_tolerance=bootstrap_tolerance,
+        )
+        results.reproducibility["streaming"] = self._compute_histogram_sections(
+            results, bootstrap_ci, n_bootstrap, seed, stratified_bootstrap, self.n_bins
+        )
+
+        results.flags = self._generate_flags(results)
+        results.governance_recommendation = self._generate_recommendation(results)
+
+        # No rows to plot from; stratified plots report that they need FairCareAudit
+        results._audit = None
+
+        return results
@@ -0,0 +1,352 @@
+"""
+Threshold Sweep Index
+
+Sorts predicted probabilities once and answers confusion-matrix counts at
+any number of decision thresholds with cumulative counts and binary search.
+The index can also be built from class counts at sorted score levels
+(``ThresholdIndex.from_counts``), e.g. from a score histogram.
+Threshold tables, decision curves and net benefit are all derived from the
+same index. GroupedThresholdIndex holds one index per group and returns
+(groups x thresholds) count and rate matrices for fairness sweeps.
+
+Usage:
+    >>> from faircareai.core.thresholds import ThresholdIndex
+    >>> index = ThresholdIndex(y_true, y_prob)
+    >>> index.confusion(0.3)
+    (412, 1033, 7985, 570)
+    >>> index.metrics([0.1, 0.2, 0.3])["sensitivity"]
+    array([0.95, 0.71, 0.42])
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from faircareai.core.validation import safe_divide_array
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+class ThresholdIndex:
+    """Sorted-score index for confusion counts at arbitrary thresholds.
+
+    A case is flagged positive when ``y_prob >= threshold`` (NaN scores are
+    never flagged), matching the rule used throughout the package. Building
+    the index costs one O(n log n) sort; each threshold query is O(log n).
+
+    Args:
+        y_true: True binary labels (0/1).
+        y_prob: Predicted probabilities.
+        order: Precomputed ascending argsort of ``y_prob`` (e.g. cached on
+            PreparedAuditData); skips the sort when given.
+
+    Attributes:
+        n: Number of cases.
+        n_positive: Number of cases with y_true == 1.
+        n_negative: Number of cases with y_true == 0.
+        prevalence: Observed outcome rate (0.0 when empty).
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_prob: np.ndarray,
+        order: np.ndarray | None = None,
+    ) -> None:
+        y_true = np.asarray(y_true).ravel()
+        y_prob = np.asarray(y_prob, dtype=np.float64).ravel()
+        if len(y_true) != len(y_prob):
+            raise ValueError(
+                f"y_true and y_prob must have the same length ({len(y_true)} != {len(y_prob)})"
+            )
+
+        is_pos = y_true == 1
+        finite = ~np.isnan(y_prob)
+        if order is None:
+            order = np.argsort(y_prob, kind="mergesort")
+        # NaN scores sort last; drop them from the searchable prefix
+        order = order[finite[order]]
+
+        nan_pos = int(np.sum(is_pos & ~finite))
+        self._set_levels(
+            y_prob[order],
+            np.concatenate(([0], np.cumsum(is_pos[order], dtype=np.int64))),
+            None,
+            nan_pos,
+            int(np.sum(~finite)) - nan_pos,
+        )
+
+    @classmethod
+    def from_counts(
+        cls,
+        scores: np.ndarray,
+        n_positive: np.ndarray,
+        n_negative: np.ndarray,
+    ) -> ThresholdIndex:
+        """Build the index from class counts at ascending score levels.
+
+        Answers exactly as an index over rows repeating each level
+        ``n_positive[i] + n_negative[i]`` times, without materializing them
+        (e.g. score histograms or deduplicated scores).
+
+        Args:
+            scores: Strictly ascending score levels.
+            n_positive: Positive cases at each level.
+            n_negative: Negative cases at each level.
+
+        Returns:
+            ThresholdIndex over the expanded rows.
+        """
+        n_positive = np.asarray(n_positive, dtype=np.int64)
+        n_total = n_positive + np.asarray(n_negative, dtype=np.int64)
+        index = cls.__new__(cls)
+        index._set_levels(
+            np.asarray(scores, dtype=np.float64),
+            np.concatenate(([0], np.cumsum(n_positive))),
+            np.concatenate(([0], np.cumsum(n_total))),
+            0,
+            0,
+        )
+        return index
+
+    def _set_levels(
+        self,
+        scores: np.ndarray,
+        cum_pos: np.ndarray,
+        cum_n: np.ndarray | None,
+        nan_pos: int,
+        nan_neg: int,
+    ) -> None:
+        """Install the sorted levels and their cumulative counts.
+
+        ``cum_pos[k]`` and ``cum_n[k]`` are the positives and cases among the
+        k lowest levels; ``cum_n`` is None when every level is one row.
+        """
+        self._scores = scores
+        self._cum_pos = cum_pos
+        self._cum_n = cum_n
+        self._nan_pos = nan_pos
+        self._nan_neg = nan_neg
+
+        n_finite = len(scores) if cum_n is None else int(cum_n[-1])
+        self.n = n_finite + nan_pos + nan_neg
+        self.n_positive = int(cum_pos[-1]) + nan_pos
+        self.n_negative = self.n - self.n_positive
+        self.prevalence = self.n_positive / self.n if self.n > 0 else 0.0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return (
+            f"ThresholdIndex(n={self.n}, n_positive={self.n_positive}, "
+            f"prevalence={self.prevalence:.4f})"
+        )
+
+    def counts(
+        self, thresholds: float | Sequence[float] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Confusion counts at each threshold.
+
+        Args:
+            thresholds: Scalar or array of decision thresholds.
+
+        Returns:
+            Tuple of int64 arrays (tp, fp, tn, fn), one entry per threshold.
+        """
+        t = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        # Number of finite score levels strictly below each threshold
+        levels_below = np.searchsorted(self._scores, t, side="left")
+        if self._cum_n is None:
+            below, n_finite = levels_below, len(self._scores)
+        else:
+            below, n_finite = self._cum_n[levels_below], int(self._cum_n[-1])
+
+        fn_finite = self._cum_pos[levels_below]
+        tp = self._cum_pos[-1] - fn_finite
+        fp = (n_finite - below) - tp
+        fn = fn_finite + self._nan_pos
+        tn = (below - fn_finite) + self._nan_neg
+        return tp, fp, tn, fn
+
+    def confusion(self, threshold: float) -> tuple[int, int, int, int]:
+        """Confusion counts (tp, fp, tn, fn) at a single threshold."""
+        tp, fp, tn, fn = self.counts(threshold)
+        return int(tp[0]), int(fp[0]), int(tn[0]), int(fn[0])
+
+    def metrics(self, thresholds: float | Sequence[float] | np.ndarray) -> dict[str, np.ndarray]:
+        """Classification metrics at each threshold.
+
+        Zero denominators give 0.0, consistent with safe_divide.
+
+        Args:
+            thresholds: Scalar or array of decision thresholds.
+
+        Returns:
+            Dict of arrays: threshold, tp, fp, tn, fn, sensitivity,
+            specificity, ppv, npv, f1_score, accuracy, pct_flagged.
+        """
+        t = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        tp, fp, tn, fn = self.counts(t)
+        n = np.asarray(self.n)
+        return {
+            "threshold": t,
+            "tp": tp,
+            "fp": fp,
+            "tn": tn,
+            "fn": fn,
+            "sensitivity": safe_divide_array(tp, tp + fn),
+            "specificity": safe_divide_array(tn, tn + fp),
+            "ppv": safe_divide_array(tp, tp + fp),
+            "npv": safe_divide_array(tn, tn + fn),
+            "f1_score": safe_divide_array(2 * tp, 2 * tp + fp + fn),
+            "accuracy": safe_divide_array(tp + tn, n),
+            "pct_flagged": safe_divide_array(tp + fp, n) * 100,
+        }
+
+    def net_benefit(self, thresholds: float | Sequence[float] | np.ndarray) -> np.ndarray:
+        """Model net benefit, NB = TP/n - FP/n * t/(1-t); 0.0 where t >= 1.
+
+        Args:
+            thresholds: Scalar or array of threshold probabilities.
+
+        Returns:
+            Array of net benefit values.
+        """
+        t = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        if self.n == 0:
+            return np.zeros_like(t)
+        tp, fp, _, _ = self.counts(t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nb = tp / self.n - fp / self.n * (t / (1 - t))
+        return np.where(t < 1, nb, 0.0)
+
+    def net_benefit_treat_all(self, thresholds: float | Sequence[float] | np.ndarray) -> np.ndarray:
+        """Treat-all net benefit, prevalence - (1 - prevalence) * t/(1-t); 0.0 where t >= 1.
+
+        Args:
+            thresholds: Scalar or array of threshold probabilities.
+
+        Returns:
+            Array of net benefit values.
+        """
+        t = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        prevalence = self.prevalence
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nb = prevalence - (1 - prevalence) * (t / (1 - t))
+        return np.where(t < 1, nb, 0.0)
+
+
+class GroupedThresholdIndex:
+    """One ThresholdIndex per group, queried for all groups at once.
+
+    Each group's scores are sorted once; ``counts`` and ``rates`` return
+    (n_groups, n_thresholds) matrices, so per-group TPR/FPR/selection-rate
+    curves on a fine grid cost O(G * T * log n) rather than a pass over the
+    data per threshold.
+
+    Args:
+        y_true: True binary labels (0/1) for the whole cohort.
+        y_prob: Predicted probabilities for the whole cohort.
+        group_rows: Mapping of group value to the row positions of that
+            group (e.g. from faircareai.metrics.group_utils.group_row_indices).
+
+    Attributes:
+        groups: Group values, in the order of matrix rows.
+        n: Group sizes, shape (n_groups,).
+        n_positive: Positive cases per group, shape (n_groups,).
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_prob: np.ndarray,
+        group_rows: Mapping[Any, np.ndarray],
+    ) -> None:
+        y_true = np.asarray(y_true).ravel()
+        y_prob = np.asarray(y_prob, dtype=np.float64).ravel()
+        self.groups: list[Any] = list(group_rows)
+        self._indexes = [ThresholdIndex(y_true[rows], y_prob[rows]) for rows in group_rows.values()]
+        self.n = np.array([idx.n for idx in self._indexes], dtype=np.int64)
+        self.n_positive = np.array([idx.n_positive for idx in self._indexes], dtype=np.int64)
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pl.DataFrame,
+        y_prob_col: str,
+        y_true_col: str,
+        group_col: str,
+    ) -> GroupedThresholdIndex:
+        """Build the index from a DataFrame (null groups are dropped).
+
+        Args:
+            df: DataFrame with predictions and the grouping column.
+            y_prob_col: Column name for predicted probabilities.
+            y_true_col: Column name for true labels.
+            group_col: Column name for grouping variable.
+
+        Returns:
+            GroupedThresholdIndex with groups in sorted order.
+        """
+        from faircareai.metrics.group_utils import group_row_indices
+
+        return cls(
+            df[y_true_col].to_numpy(),
+            df[y_prob_col].to_numpy(),
+            group_row_indices(df, group_col),
+        )
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __getitem__(self, group: Any) -> ThresholdIndex:
+        return self._indexes[self.groups.index(group)]
+
+    def __repr__(self) -> str:
+        return f"GroupedThresholdIndex(groups={self.groups!r}, n={int(self.n.sum())})"
+
+    def counts(
+        self, thresholds: float | Sequence[float] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Confusion counts for every group at each threshold.
+
+        Args:
+            thresholds: Scalar or array of decision thresholds.
+
+        Returns:
+            Tuple of int64 arrays (tp, fp, tn, fn), each (n_groups, n_thresholds).
+        """
+        t = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        per_group = [idx.counts(t) for idx in self._indexes]
+        if not per_group:
+            empty = np.zeros((0, len(t)), dtype=np.int64)
+            return empty, empty, empty, empty
+        tp, fp, tn, fn = (np.stack(cells) for cells in zip(*per_group, strict=True))
+        return tp, fp, tn, fn
+
+    def rates(self, thresholds: float | Sequence[float] | np.ndarray) -> dict[str, np.ndarray]:
+        """Per-group rates at each threshold; zero denominators give 0.0.
+
+        Args:
+            thresholds: Scalar or array of decision thresholds.
+
+        Returns:
+            Dict of (n_groups, n_thresholds) arrays: tp, fp, tn, fn, tpr,
+            fpr, ppv, selection_rate.
+        """
+        tp, fp, tn, fn = self.counts(thresholds)
+        return {
+            "tp": tp,
+            "fp": fp,
+            "tn": tn,
+            "fn": fn,
+            "tpr": safe_divide_array(tp, tp + fn),
+            "fpr": safe_divide_array(fp, fp + tn),
+            "ppv": safe_divide_array(tp, tp + fp),
+            "selection_rate": safe_divide_array(tp + fp, self.n[:, None]),
+        }
@@ -131,6 +131,11 @@ class GroupMetricsWithError(TypedDict, total=False):
     npv: float
     auroc: float
     auroc_ci_95: list[float | None]
+    auroc_se: float
+    calibration_intercept: float | None
+    calibration_intercept_ci_95: list[float]
+    calibration_slope: float | None
+    calibration_slope_ci_95: list[float]
     mean_predicted_prob: float
     mean_calibration_error: float
     tp: int
@@ -182,6 +187,9 @@ class FairnessResult(TypedDict):
     calibration_diff: dict[str, float]
     """Calibration error differences vs reference."""
 
+    disparity_ci: NotRequired[dict[str, dict[str, list[float] | None]]]
+    """Bootstrap 95% CIs per disparity metric and group (when bootstrap_ci=True)."""
+
     summary: dict[str, dict]
     """Summary statistics with worst disparities."""
 
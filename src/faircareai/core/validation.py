@@ -45,6 +45,33 @@ def safe_divide(
     return numerator / denominator if denominator > 0 else default
 
 
+def safe_divide_array(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    default: float = 0.0,
+) -> np.ndarray:
+    """Elementwise safe_divide for NumPy arrays.
+
+    Args:
+        numerator: Array of dividends.
+        denominator: Array of divisors (broadcastable with numerator).
+        default: Value used wherever the denominator is zero or negative.
+
+    Returns:
+        Float array of numerator / denominator, with default where undefined.
+
+    Examples:
+        >>> safe_divide_array(np.array([1, 2]), np.array([2, 0]))
+        array([0.5, 0. ])
+    """
+    numerator, denominator = np.broadcast_arrays(
+        np.asarray(numerator, dtype=float), np.asarray(denominator, dtype=float)
+    )
+    out = np.full(numerator.shape, default, dtype=float)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
 def validate_probability_array(y_prob: np.ndarray) -> None:
     """Validate that probabilities are in the valid [0, 1] range.
 
@@ -8,6 +8,7 @@ Methodology: CHAI RAIC Checkpoint 1 (protected attribute documentation).
 Note: Suggestions require explicit user acceptance.
 """
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import polars as pl
@@ -127,43 +128,83 @@ def suggest_sensitive_attributes(df: pl.DataFrame) -> list[dict]:
         - clinical_justification: Why this attribute matters
         - accepted: Always False (user must explicitly accept)
     """
+    return suggest_from_counts(df.columns, lambda column: df.group_by(column).len())
+
+
+def suggest_from_counts(
+    columns: list[str],
+    value_counts: Callable[[str], pl.DataFrame],
+) -> list[dict]:
+    """
+    Suggest sensitive attributes from column names and per-column value counts.
+
+    Columns are matched by name alone; value counts are only requested for
+    the matched columns, so callers with lazy data read nothing else.
+
+    Args:
+        columns: Column names of the data.
+        value_counts: Returns the rows per value of a column, with the
+            values in the column's name and counts in "len" (nulls in
+            their own row), as ``df.group_by(column).len()``.
+
+    Returns:
+        Suggestions as returned by suggest_sensitive_attributes().
+    """
     suggestions = []
-    columns_lower = {c.lower(): c for c in df.columns}
+    for attr_name, actual_col in match_sensitive_columns(columns).items():
+        config = SUGGESTED_PATTERNS[attr_name]
+        counts = value_counts(actual_col)
+        values = counts[actual_col]
+
+        # Get unique values
+        unique_vals = values.drop_nulls().sort().to_list()
+
+        # Calculate missing rate
+        n_rows = int(counts["len"].sum())
+        n_missing = int(counts.filter(values.is_null())["len"].sum())
+        missing_rate = n_missing / n_rows if n_rows else 0.0
+
+        suggested_reference = _resolve_suggested_reference(
+            unique_vals,
+            config["suggested_reference"],
+        )
+        if config["suggested_reference"] is not None and suggested_reference is None:
+            suggested_reference = reference_from_counts(actual_col, counts)
+
+        suggestions.append(
+            {
+                "suggested_name": attr_name,
+                "detected_column": actual_col,
+                "unique_values": unique_vals[:10],  # First 10 for preview
+                "n_unique": len(unique_vals),
+                "missing_rate": float(missing_rate),
+                "suggested_reference": suggested_reference,
+                "clinical_justification": config["clinical_justification"],
+                "accepted": False,  # User must explicitly accept
+            }
+        )
+
+    return suggestions
+
 
+def match_sensitive_columns(columns: Iterable[str]) -> dict[str, str]:
+    """Match column names against SUGGESTED_PATTERNS.
+
+    Args:
+        columns: Column names of the data.
+
+    Returns:
+        Suggested attribute name -> detected column, for each attribute
+        with a matching column (the first matching pattern wins).
+    """
+    columns_lower = {c.lower(): c for c in columns}
+    matches = {}
     for attr_name, config in SUGGESTED_PATTERNS.items():
         for pattern in config["patterns"]:
             if pattern in columns_lower:
-                actual_col = columns_lower[pattern]
-                col_data = df[actual_col]
-
-                # Get unique values
-                unique_vals = col_data.drop_nulls().unique().sort().to_list()
-
-                # Calculate missing rate
-                missing_rate = col_data.null_count() / len(df)
-
-                suggested_reference = _resolve_suggested_reference(
-                    unique_vals,
-                    config["suggested_reference"],
-                )
-                if config["suggested_reference"] is not None and suggested_reference is None:
-                    suggested_reference = get_reference_group(df, actual_col)
-
-                suggestions.append(
-                    {
-                        "suggested_name": attr_name,
-                        "detected_column": actual_col,
-                        "unique_values": unique_vals[:10],  # First 10 for preview
-                        "n_unique": len(unique_vals),
-                        "missing_rate": float(missing_rate),
-                        "suggested_reference": suggested_reference,
-                        "clinical_justification": config["clinical_justification"],
-                        "accepted": False,  # User must explicitly accept
-                    }
-                )
+                matches[attr_name] = columns_lower[pattern]
                 break  # Only match first pattern per attribute
-
-    return suggestions
+    return matches
 
 
 def display_suggestions(suggestions: list[dict]) -> str:
@@ -260,8 +301,35 @@ def validate_attribute(
         issues.append(f"Column '{column}' not found in data")
         return issues
 
-    col_data = df[column]
-    actual_values = col_data.drop_nulls().unique().to_list()
+    return validate_attribute_counts(name, column, df.group_by(column).len(), reference, categories)
+
+
+def validate_attribute_counts(
+    name: str,
+    column: str,
+    value_counts: pl.DataFrame,
+    reference: str | None = None,
+    categories: list[str] | None = None,
+) -> list[str]:
+    """Validate a sensitive attribute against its value counts.
+
+    Same checks as validate_attribute, from a ``group_by(column).len()``
+    frame (null values counted in their own row), so the counts can come
+    from a lazy or streaming query.
+
+    Args:
+        name: Display name for the attribute.
+        column: Column name in data.
+        value_counts: Frame with the values in ``column`` and counts in "len".
+        reference: Reference group for comparisons.
+        categories: Expected category values.
+
+    Returns:
+        List of validation issues (empty if valid).
+    """
+    issues = []
+
+    actual_values = value_counts[column].drop_nulls().to_list()
 
     if reference and reference not in actual_values:
         issues.append(f"Reference group '{reference}' not in data values: {actual_values[:10]}")
@@ -272,7 +340,8 @@ def validate_attribute(
             issues.append(f"Expected categories not found: {missing}")
 
     # Warn about high missing rate
-    missing_rate = col_data.null_count() / len(df)
+    n_missing = value_counts.filter(pl.col(column).is_null())["len"].sum()
+    missing_rate = n_missing / value_counts["len"].sum()
     if missing_rate > 0.1:
         issues.append(
             f"High missing rate ({missing_rate:.1%}) for {name}. "
@@ -280,7 +349,6 @@ def validate_attribute(
         )
 
     # Warn about small groups
-    value_counts = df.group_by(column).len()
     min_count_val = value_counts["len"].min()
     min_count: int | None = None
     if min_count_val is not None and isinstance(min_count_val, int | float):
@@ -310,15 +378,32 @@ def get_reference_group(
     Returns:
         Reference group to use (suggested if valid, else largest group).
     """
-    col_data = df[column]
-    actual_values = col_data.drop_nulls().unique().to_list()
+    return reference_from_counts(column, df.group_by(column).len(), suggested_reference)
+
+
+def reference_from_counts(
+    column: str,
+    value_counts: pl.DataFrame,
+    suggested_reference: str | None = None,
+) -> str:
+    """Determine the reference group from an attribute's value counts.
+
+    Args:
+        column: Column name for the attribute.
+        value_counts: Frame with the values in ``column`` and counts in "len".
+        suggested_reference: User-suggested reference group.
+
+    Returns:
+        Reference group to use (suggested if valid, else largest group).
+    """
+    actual_values = value_counts[column].drop_nulls().to_list()
 
     # Use suggested if valid
     if suggested_reference and suggested_reference in actual_values:
         return suggested_reference
 
     # Otherwise use largest group
-    value_counts = df.group_by(column).len().sort("len", descending=True)
+    value_counts = value_counts.sort("len", descending=True)
     if len(value_counts) == 0:
         raise ValueError(f"Column '{column}' has no data")
     return str(value_counts[column][0])
@@ -5,6 +5,14 @@ Compute descriptive statistics, overall performance, fairness metrics,
 subgroup analysis, and Van Calster recommended performance measures.
 """
 
+from faircareai.metrics.aggregated import (
+    histogram_cohort_summary,
+    histogram_error_bounds,
+    histogram_fairness_metrics,
+    histogram_intersectional,
+    histogram_overall_performance,
+    histogram_subgroup_metrics,
+)
 from faircareai.metrics.descriptive import (
     compute_cohort_summary,
     format_table1_text,
@@ -36,6 +44,13 @@ __all__ = [
     # Subgroup analysis
     "compute_subgroup_metrics",
     "compute_intersectional",
+    # Metrics from score histograms (streaming audits)
+    "histogram_cohort_summary",
+    "histogram_overall_performance",
+    "histogram_subgroup_metrics",
+    "histogram_fairness_metrics",
+    "histogram_intersectional",
+    "histogram_error_bounds",
     # Van Calster (2025) recommended metrics
     "compute_vancalster_metrics",
     "compute_auroc_by_subgroup",
@@ -0,0 +1,723 @@
+"""
+FairCareAI Metrics from Score Histograms
+
+Compute the audit sections from ScoreHistogram sufficient statistics instead
+of row arrays, for audits whose data never fits in memory (StreamingAudit).
+Results have the same structure as their row-level counterparts:
+
+- Counts, rates and confusion metrics at the decision threshold are exact,
+  as are the fairness disparities and their count-level bootstrap CIs.
+- Threshold and decision curves are exact on the bin grid.
+- Score means, SDs, the Brier score and O:E ratio are exact; percentiles
+  are within one bin width.
+- AUROC and AUPRC treat each bin as one tied score level; AUROC is reported
+  with ``auroc_max_error``, the largest possible deviation from its exact
+  value. Bootstrap CIs resample the (outcome, bin) cells.
+- Calibration slope and intercept (overall and per group, with Wald CIs)
+  come from a logistic recalibration fit on the binned data. The smoothed (LOWESS) curve and ICI/ECI/E_max are fitted
+  on the score bins, each standing at the mean score of its cases.
+
+Histograms with one bin per distinct score (``ScoreHistogram.levels``) make
+every binned quantity above exact: rank metrics, percentiles, threshold
+curves, the calibration curve, the recalibration fit and the LOWESS curve.
+
+Methodology: Van Calster et al. (2025), CHAI RAIC Checkpoint 1.
+"""
+
+from typing import Any, cast
+
+import numpy as np
+import polars as pl
+
+from faircareai.core.bootstrap import (
+    auprc_from_counts,
+    auroc_from_counts,
+    bootstrap_confusion_tables,
+    compute_percentile_ci,
+)
+from faircareai.core.calibration import (
+    lowess_calibration_from_counts,
+    recalibration_from_counts,
+)
+from faircareai.core.constants import (
+    DEFAULT_BOOTSTRAP_SEED,
+    LOWESS_FRAC,
+)
+from faircareai.core.histogram import ScoreHistogram
+from faircareai.core.logging import get_logger
+from faircareai.core.types import (
+    CalibrationMetrics,
+    ClassificationMetrics,
+    DiscriminationMetrics,
+    FairnessResult,
+    OverallPerformance,
+)
+from faircareai.core.validation import safe_divide, safe_divide_array
+from faircareai.metrics.descriptive import _summarize_attribute
+from faircareai.metrics.fairness import compute_fairness_metrics
+from faircareai.metrics.group_utils import determine_reference_group
+from faircareai.metrics.performance import (
+    _classification_metrics_from_counts,
+    _interpret_calibration,
+    compute_decision_curve_analysis,
+    compute_threshold_analysis,
+)
+from faircareai.metrics.subgroup import (
+    _compute_subgroup_disparities,
+    _interpret_auroc_range,
+    _recalibration_metrics,
+)
+
+logger = get_logger(__name__)
+
+
+def histogram_cohort_summary(
+    histograms: dict[str, ScoreHistogram],
+    sensitive_attrs: dict[str, dict],
+) -> dict[str, Any]:
+    """Compute the Table 1 cohort summary from score histograms.
+
+    Args:
+        histograms: Score histograms keyed by attribute column. Every
+            histogram covers all rows, so any of them gives the overview.
+        sensitive_attrs: Dict of sensitive attribute configurations.
+
+    Returns:
+        Dict with the same sections as compute_cohort_summary.
+    """
+    results: dict[str, Any] = {}
+
+    overall = next(iter(histograms.values()))
+    n_total, prob_sum, prob_sq_sum = overall.moments()
+    pos, _ = overall.class_counts()
+    n_positive = int(pos.sum())
+    prevalence = n_positive / n_total if n_total > 0 else 0.0
+
+    results["cohort_overview"] = {
+        "n_total": int(n_total),
+        "n_positive": n_positive,
+        "n_negative": int(n_total - n_positive),
+        "prevalence": float(prevalence),
+        "prevalence_pct": f"{prevalence * 100:.1f}%",
+    }
+
+    if n_total > 0:
+        mean = prob_sum / n_total
+        median, p25, p75, p90, p95 = overall.quantiles([0.5, 0.25, 0.75, 0.9, 0.95])
+        results["prediction_distribution"] = {
+            "mean": float(mean),
+            "std": float(np.sqrt(max(prob_sq_sum / n_total - mean * mean, 0.0))),
+            "median": float(median),
+            "min": float(overall.prob_min.min()),
+            "max": float(overall.prob_max.max()),
+            "percentile_25": float(p25),
+            "percentile_75": float(p75),
+            "percentile_90": float(p90),
+            "percentile_95": float(p95),
+        }
+    else:
+        results["prediction_distribution"] = {}
+
+    attr_distributions: dict[str, dict] = {}
+    outcome_by_attr: dict[str, dict] = {}
+    prediction_by_attr: dict[str, dict] = {}
+
+    for attr_name, attr_config in sensitive_attrs.items():
+        col = attr_config.get("column", attr_name)
+        if col not in histograms:
+            continue
+
+        hist = histograms[col]
+        summary = _summarize_attribute(
+            _histogram_group_counts(hist),
+            col,
+            attr_config.get("reference"),
+            int(hist.sizes[0]),
+            n_total,
+        )
+        attr_distributions[attr_name] = summary["distribution"]
+        if summary["outcome"]["groups"]:
+            outcome_by_attr[attr_name] = summary["outcome"]
+            prediction_by_attr[attr_name] = summary["prediction"]
+
+    results["attribute_distributions"] = attr_distributions
+    results["outcome_by_attribute"] = outcome_by_attr
+    results["prediction_by_attribute"] = prediction_by_attr
+
+    return results
+
+
+def _histogram_group_counts(hist: ScoreHistogram) -> pl.DataFrame:
+    """Per-group n, n_positive, mean_prob and std_prob (as _encoded_group_counts)."""
+    n = hist.counts.sum(axis=(1, 2))
+    n_positive = hist.counts[:, 1].sum(axis=1)
+    sums = hist.prob_sum.sum(axis=(1, 2))
+    mean = safe_divide_array(sums, n, default=np.nan)
+    variance = safe_divide_array(
+        hist.prob_sq_sum.sum(axis=1) - n * mean * mean, n - 1, default=np.nan
+    )
+    std = np.where(n > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+    keys = pl.Series(hist.column, [None, *hist.groups], dtype=hist.dtype)
+    return pl.DataFrame(
+        [
+            keys,
+            pl.Series("n", n, dtype=pl.Int64),
+            pl.Series("n_positive", n_positive, dtype=pl.Int64),
+            pl.Series("mean_prob", mean).fill_nan(None),
+            pl.Series("std_prob", std).fill_nan(None),
+        ]
+    ).filter(pl.Series(n > 0))
+
+
+def histogram_overall_performance(
+    hist: ScoreHistogram,
+    thresholds_to_evaluate: list[float] | None = None,
+    bootstrap_ci: bool = True,
+    n_bootstrap: int = 1000,
+    random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+) -> OverallPerformance:
+    """Compute overall model performance from a score histogram.
+
+    Args:
+        hist: Score histogram of the cohort (any grouping; all slots are pooled).
+        thresholds_to_evaluate: List of thresholds for sensitivity analysis.
+        bootstrap_ci: Whether to compute bootstrap confidence intervals.
+        n_bootstrap: Number of bootstrap iterations.
+        random_seed: Random seed for bootstrap resampling.
+
+    Returns:
+        Dict with the same sections as compute_overall_performance, at the
+        histogram's decision threshold.
+    """
+    seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+    threshold = hist.threshold
+    tp, fp, tn, fn = hist.confusion()
+
+    classification = _classification_metrics_from_counts(threshold, tp, fp, tn, fn)
+    if bootstrap_ci and tp + fp + tn + fn > 10:
+        boot = bootstrap_confusion_tables(
+            np.array([tp, fp, tn, fn]), n_bootstrap=n_bootstrap, seed=seed, stratified=False
+        )
+        b_tp, b_fp, b_tn, b_fn = boot.T
+        for key, samples in (
+            ("sensitivity_ci_95", safe_divide_array(b_tp, b_tp + b_fn)),
+            ("specificity_ci_95", safe_divide_array(b_tn, b_tn + b_fp)),
+            ("ppv_ci_95", safe_divide_array(b_tp, b_tp + b_fp)),
+        ):
+            lower, upper = compute_percentile_ci(samples.tolist())
+            if lower is not None:
+                classification[key] = [lower, upper]
+
+    if thresholds_to_evaluate is None:
+        thresholds_to_evaluate = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+
+    # Each occupied bin is one score level; exact on the bin grid
+    index = hist.threshold_index()
+    empty = np.empty(0)
+
+    return cast(
+        OverallPerformance,
+        {
+            "primary_threshold": threshold,
+            "discrimination": histogram_discrimination_metrics(
+                hist, bootstrap_ci, n_bootstrap, seed
+            ),
+            "calibration": histogram_calibration_metrics(hist),
+            "classification_at_threshold": cast(ClassificationMetrics, classification),
+            "threshold_analysis": compute_threshold_analysis(
+                empty, empty, thresholds_to_evaluate, index=index
+            ),
+            "decision_curve": compute_decision_curve_analysis(empty, empty, index=index),
+            "confusion_matrix": {
+                "threshold": threshold,
+                "matrix": [[tn, fp], [fn, tp]],
+                "labels": ["Negative", "Positive"],
+                "tp": tp,
+                "fp": fp,
+                "tn": tn,
+                "fn": fn,
+            },
+        },
+    )
+
+
+def histogram_discrimination_metrics(
+    hist: ScoreHistogram,
+    bootstrap_ci: bool = True,
+    n_bootstrap: int = 1000,
+    random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+) -> DiscriminationMetrics:
+    """Compute AUROC, AUPRC and curve data from a score histogram.
+
+    Args:
+        hist: Score histogram (all slots are pooled).
+        bootstrap_ci: Whether to compute bootstrap CIs (cell resampling).
+        n_bootstrap: Number of bootstrap iterations.
+        random_seed: Random seed for bootstrap resampling.
+
+    Returns:
+        Dict with the keys of compute_discrimination_metrics, plus
+        ``auroc_max_error``, ``auprc_max_error`` and ``n_score_bins``.
+    """
+    pos_all, neg_all = hist.class_counts()
+    keep = (pos_all + neg_all) > 0
+    levels = hist.edges[keep]
+    pos = pos_all[keep].astype(np.float64)
+    neg = neg_all[keep].astype(np.float64)
+    n_pos, n_neg = pos.sum(), neg.sum()
+    n, _, prob_sq_sum = hist.moments()
+
+    auroc, max_error = hist.auroc()
+    auprc, auprc_max_error = hist.auprc()
+
+    # Flagged cases at each level's lower edge, highest level first
+    tps = np.cumsum(pos[::-1])
+    fps = np.cumsum(neg[::-1])
+    precision = safe_divide_array(tps, tps + fps)
+    average_precision = float(safe_divide(np.sum(pos[::-1] * precision), n_pos))
+
+    # Precision-recall points in ascending threshold order, up to full recall
+    start = max(int(np.sum(tps[::-1] == n_pos)) - 1, 0)
+    pr_precision = np.append(precision[::-1][start:], 1.0)
+    pr_recall = np.append(safe_divide_array(tps[::-1], n_pos)[start:], 0.0)
+
+    # Brier = mean(p^2) - 2 mean(p * y) + mean(y); positives' scores are in prob_sum[:, 1]
+    brier = safe_divide(prob_sq_sum - 2 * float(hist.prob_sum[:, 1].sum()) + n_pos, n)
+
+    result: dict[str, Any] = {
+        "auroc": float(auroc),
+        "auroc_max_error": float(max_error),
+        "n_score_bins": hist.n_bins,
+        "auprc": auprc,
+        "auprc_max_error": auprc_max_error,
+        "average_precision": average_precision,
+        "brier_score": float(brier),
+        "roc_curve": {
+            "fpr": np.concatenate(([0.0], safe_divide_array(fps, n_neg))).tolist(),
+            "tpr": np.concatenate(([0.0], safe_divide_array(tps, n_pos))).tolist(),
+            "thresholds": np.concatenate(([np.inf], levels[::-1])).tolist(),
+        },
+        "pr_curve": {
+            "precision": pr_precision.tolist(),
+            "recall": pr_recall.tolist(),
+            "thresholds": levels[start:].tolist(),
+        },
+        "prevalence": float(safe_divide(n_pos, n)),
+    }
+
+    if bootstrap_ci and n > 10:
+        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+        boot_pos, boot_neg = hist.bootstrap_counts(n_bootstrap, seed)
+        for name, values in (
+            ("auroc", auroc_from_counts(boot_pos, boot_neg)),
+            ("auprc", auprc_from_counts(boot_pos, boot_neg)),
+        ):
+            samples = values[~np.isnan(values)].tolist()
+            if len(samples) > 10:
+                lower, upper = compute_percentile_ci(samples)
+                if lower is not None and upper is not None:
+                    result[f"{name}_ci_95"] = [lower, upper]
+                    result[f"{name}_ci_fmt"] = f"(95% CI: {lower:.3f}-{upper:.3f})"
+
+    return cast(DiscriminationMetrics, result)
+
+
+def histogram_calibration_metrics(hist: ScoreHistogram, n_bins: int = 10) -> CalibrationMetrics:
+    """Compute calibration metrics from a score histogram.
+
+    Brier score, scaled Brier and O:E ratio are exact. The calibration curve
+    pools the score bins into ``n_bins`` uniform bins; slope and intercept
+    are fitted on the binned data (method "binned"). The LOWESS curve and
+    ICI/ECI/E_max come from lowess_calibration_from_counts over the score
+    bins, falling back to the binned curve with fewer than three occupied bins.
+
+    Args:
+        hist: Score histogram (all slots are pooled).
+        n_bins: Number of bins for calibration curve.
+
+    Returns:
+        Dict with the keys of compute_calibration_metrics.
+    """
+    n, prob_sum, prob_sq_sum = hist.moments()
+    pos_all, neg_all = hist.class_counts()
+    observed = float(pos_all.sum())
+    prevalence = safe_divide(observed, n)
+
+    brier = safe_divide(prob_sq_sum - 2 * float(hist.prob_sum[:, 1].sum()) + observed, n)
+    brier_null = prevalence * (1 - prevalence)
+    brier_scaled = 1 - (brier / brier_null) if brier_null > 0 else 0.0
+
+    # Pool the score bins into the uniform calibration bins
+    counts = (pos_all + neg_all).astype(np.float64)
+    bin_sums = hist.prob_sum.sum(axis=(0, 1))
+    if hist.levels is None:
+        coarse = np.arange(hist.n_bins) * n_bins // hist.n_bins
+    else:
+        # Same edges and side as calibration_curve(strategy="uniform")
+        coarse = np.searchsorted(np.linspace(0.0, 1.0, n_bins + 1)[1:-1], hist.levels)
+    coarse_n = np.bincount(coarse, weights=counts, minlength=n_bins)
+    occupied = coarse_n > 0
+    prob_true = (np.bincount(coarse, weights=pos_all, minlength=n_bins) / np.maximum(coarse_n, 1))[
+        occupied
+    ]
+    prob_pred = (np.bincount(coarse, weights=bin_sums, minlength=n_bins) / np.maximum(coarse_n, 1))[
+        occupied
+    ]
+
+    slope, intercept = _binned_recalibration(pos_all, neg_all, hist.logit_sum.sum(axis=0))
+
+    oe_ratio = float(observed / prob_sum) if prob_sum > 0 else None
+    # Deprecated legacy E/O ratio (Expected / Observed). Use oe_ratio; remove in next major version.
+    eo_ratio = prob_sum / observed if observed > 0 else float("inf")
+
+    smoothed = lowess_calibration_from_counts(
+        bin_sums / np.maximum(counts, 1), counts, pos_all.astype(np.float64)
+    )
+    ici = 0.0
+    eci = 0.0
+    e_max = 0.0
+    if smoothed is not None:
+        ici, eci, e_max = smoothed.ici, smoothed.eci, smoothed.e_max
+    elif len(prob_true) > 0:
+        ici = float(np.mean(np.abs(prob_true - prob_pred)))
+        eci_denom = np.mean((prevalence - prob_pred) ** 2)
+        eci = float(np.mean((prob_true - prob_pred) ** 2) / eci_denom) if eci_denom > 0 else 0.0
+        e_max = float(np.max(np.abs(prob_true - prob_pred)))
+
+    return cast(
+        CalibrationMetrics,
+        {
+            "brier_score": float(brier),
+            "brier_scaled": float(brier_scaled),
+            "calibration_slope": slope,
+            "calibration_intercept": intercept,
+            "calibration_method": "binned",
+            "oe_ratio": oe_ratio,
+            "eo_ratio": float(eo_ratio),
+            "ici": ici,
+            "eci": eci,
+            "e_max": e_max,
+            "calibration_curve": {
+                "prob_true": prob_true.tolist(),
+                "prob_pred": prob_pred.tolist(),
+                "n_bins": n_bins,
+            },
+            "calibration_curve_smoothed": (
+                smoothed.to_dict()
+                if smoothed is not None
+                else {"prob_true": [], "prob_pred": [], "method": "lowess", "frac": LOWESS_FRAC}
+            ),
+            "interpretation": _interpret_calibration(slope, brier),
+        },
+    )
+
+
+def _recalibration_cells(
+    pos: np.ndarray, neg: np.ndarray, logit_sums: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Logit, outcome and count of each (outcome, occupied bin) cell.
+
+    Each cell enters the logistic recalibration models at the mean logit of
+    its scores (``logit_sums`` per (outcome, bin), as ScoreHistogram.logit_sum),
+    which unlike the logit of the mean score is not pulled towards the bin
+    centre where the logit is steep. Cells are ordered as the ``(pos, neg)``
+    draws of ScoreHistogram.bootstrap_counts, positives first.
+    """
+    keep = (pos + neg) > 0
+    # Empty cells of occupied bins have weight 0 in every fit and resample
+    x = np.concatenate(
+        [
+            safe_divide_array(logit_sums[1][keep], pos[keep]),
+            safe_divide_array(logit_sums[0][keep], neg[keep]),
+        ]
+    )
+    y = np.concatenate([np.ones(int(keep.sum())), np.zeros(int(keep.sum()))])
+    return x, y, np.concatenate([pos[keep], neg[keep]]).astype(np.float64)
+
+
+def _binned_recalibration(
+    pos: np.ndarray, neg: np.ndarray, logit_sums: np.ndarray
+) -> tuple[float, float]:
+    """Calibration slope and intercept fitted on (outcome, score bin) counts.
+
+    The bin counts are frequency weights of recalibration_from_counts.
+    """
+    fit = recalibration_from_counts(*_recalibration_cells(pos, neg, logit_sums))
+    if np.isnan(fit.intercept) or np.isnan(fit.slope):
+        logger.warning("Binned calibration slope computation failed. Using default slope=1.0")
+    return (
+        1.0 if np.isnan(fit.slope) else float(fit.slope),
+        0.0 if np.isnan(fit.intercept) else float(fit.intercept),
+    )
+
+
+def histogram_subgroup_metrics(
+    hist: ScoreHistogram,
+    reference: str | None = None,
+    bootstrap_ci: bool = True,
+    n_bootstrap: int = 500,
+    random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+) -> dict[str, Any]:
+    """Compute per-subgroup metrics from a score histogram.
+
+    Args:
+        hist: Score histogram of the attribute.
+        reference: Reference group for comparisons.
+        bootstrap_ci: Whether to compute bootstrap CI (cell resampling).
+        n_bootstrap: Number of bootstrap iterations.
+        random_seed: Random seed for bootstrap resampling.
+
+    Returns:
+        Dict with the structure of compute_subgroup_metrics; each AUROC also
+        carries its ``auroc_max_error``.
+    """
+    results: dict[str, Any] = {
+        "attribute": hist.column,
+        "threshold": hist.threshold,
+        "groups": {},
+    }
+
+    sizes = hist.sizes
+    reference = determine_reference_group(
+        hist.groups,
+        pl.DataFrame(),
+        hist.column,
+        reference,
+        group_sizes={g: int(sizes[hist.slot(g)]) for g in hist.groups},
+    )
+    results["reference"] = reference
+
+    # Calibration intercept and slope of every group in one batched fit
+    fitted = [group for group in hist.groups if sizes[hist.slot(group)] >= 10]
+    recalibration: dict[Any, dict[str, Any]] = {}
+    if fitted:
+        cells = [
+            _recalibration_cells(*hist.class_counts(slot), hist.logit_sum[slot])
+            for slot in map(hist.slot, fitted)
+        ]
+        x, y, weights = (np.concatenate(parts) for parts in zip(*cells, strict=True))
+        segments = np.cumsum([0] + [len(cell[0]) for cell in cells[:-1]])
+        fit = recalibration_from_counts(x, y, weights, segments)
+        recalibration = {group: _recalibration_metrics(fit, (i,)) for i, group in enumerate(fitted)}
+
+    seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+    for group in hist.groups:
+        slot = hist.slot(group)
+        n = int(sizes[slot])
+
+        group_result: dict[str, Any] = {
+            "n": n,
+            "is_reference": str(group) == str(reference),
+            "small_sample_warning": n < 100,
+        }
+
+        if n < 10:
+            group_result["error"] = "Insufficient sample size (n < 10)"
+            results["groups"][str(group)] = group_result
+            continue
+
+        tp, fp, tn, fn = hist.confusion(slot)
+        group_result["prevalence"] = float(safe_divide(tp + fn, n))
+        group_result.update(
+            {
+                "tpr": float(safe_divide(tp, tp + fn)),
+                "fpr": float(safe_divide(fp, fp + tn)),
+                "ppv": float(safe_divide(tp, tp + fp)),
+                "npv": float(safe_divide(tn, tn + fn)),
+                "selection_rate": float(safe_divide(tp + fp, n)),
+                "tp": tp,
+                "fp": fp,
+                "tn": tn,
+                "fn": fn,
+            }
+        )
+
+        if tp + fn > 0 and fp + tn > 0:
+            auroc, max_error = hist.auroc(slot)
+            group_result["auroc"] = float(auroc)
+            group_result["auroc_max_error"] = float(max_error)
+
+            if bootstrap_ci and n >= 20:
+                boot_pos, boot_neg = hist.bootstrap_counts(
+                    n_bootstrap, seed, slot=slot, stratified=True
+                )
+                samples = auroc_from_counts(boot_pos, boot_neg)
+                samples = samples[~np.isnan(samples)]
+                if len(samples) > 10:
+                    auroc_ci = np.percentile(samples, [2.5, 97.5])
+                    group_result["auroc_ci_95"] = [float(auroc_ci[0]), float(auroc_ci[1])]
+
+        group_result.update(recalibration[group])
+
+        _, prob_sum, _ = hist.moments(slot)
+        group_result["mean_predicted_prob"] = float(prob_sum / n)
+
+        results["groups"][str(group)] = group_result
+
+    results["disparities"] = _compute_subgroup_disparities(results, reference)
+
+    return results
+
+
+def histogram_fairness_metrics(
+    hist: ScoreHistogram,
+    y_prob_col: str,
+    y_true_col: str,
+    reference: str | None = None,
+    bootstrap_ci: bool = False,
+    n_bootstrap: int = 1000,
+    random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+    stratified: bool = False,
+) -> FairnessResult:
+    """Compute fairness metrics from a score histogram.
+
+    The fairness stage only needs per-group confusion counts, so this is
+    compute_fairness_metrics on the histogram's aggregates; results,
+    including the count-level bootstrap CIs, match the row-level path.
+
+    Args:
+        hist: Score histogram of the attribute.
+        y_prob_col: Column name for predicted probabilities.
+        y_true_col: Column name for true labels.
+        reference: Reference group for ratio calculations.
+        bootstrap_ci: Whether to compute bootstrap CIs for every disparity.
+        n_bootstrap: Number of bootstrap iterations.
+        random_seed: Random seed for bootstrap resampling.
+        stratified: Preserve each group's outcome counts when resampling.
+
+    Returns:
+        Dict with the structure of compute_fairness_metrics.
+    """
+    frame = pl.DataFrame(
+        schema={hist.column: hist.dtype, y_prob_col: pl.Float64, y_true_col: pl.Int64}
+    )
+    return compute_fairness_metrics(
+        df=frame,
+        y_prob_col=y_prob_col,
+        y_true_col=y_true_col,
+        group_col=hist.column,
+        threshold=hist.threshold,
+        reference=reference,
+        bootstrap_ci=bootstrap_ci,
+        n_bootstrap=n_bootstrap,
+        random_seed=random_seed,
+        group_aggregates=hist.aggregates(),
+        stratified=stratified,
+    )
+
+
+def histogram_intersectional(
+    hist: ScoreHistogram,
+    group_cols: list[str],
+    min_n: int = 30,
+) -> dict[str, Any]:
+    """Compute intersectional subgroup metrics from a score histogram.
+
+    Args:
+        hist: Score histogram keyed by the intersection (values joined with " x ").
+        group_cols: Columns of the intersection.
+        min_n: Minimum sample size for reporting.
+
+    Returns:
+        Dict with the structure of compute_intersectional.
+    """
+    results: dict[str, Any] = {
+        "attributes": group_cols,
+        "threshold": hist.threshold,
+        "min_n": min_n,
+        "intersections": {},
+    }
+
+    sizes = hist.sizes
+    intersections = sorted(
+        (g for g in hist.groups if sizes[hist.slot(g)] >= min_n),
+        key=lambda g: -sizes[hist.slot(g)],
+    )
+
+    best_auroc: dict[str, str | float | None] = {"group": None, "value": 0.0}
+    worst_auroc: dict[str, str | float | None] = {"group": None, "value": 1.0}
+
+    for intersection_name in intersections:
+        slot = hist.slot(intersection_name)
+        tp, fp, tn, fn = hist.confusion(slot)
+        n = tp + fp + tn + fn
+
+        group_result: dict[str, Any] = {
+            "n": n,
+            "prevalence": float((tp + fn) / n),
+            "small_sample_warning": n < 100,
+            "tpr": float(safe_divide(tp, tp + fn)),
+            "fpr": float(safe_divide(fp, fp + tn)),
+            "ppv": float(safe_divide(tp, tp + fp)),
+            "selection_rate": float(safe_divide(tp + fp, n)),
+        }
+
+        if tp + fn > 0 and fp + tn > 0:
+            auroc, max_error = hist.auroc(slot)
+            group_result["auroc"] = float(auroc)
+            group_result["auroc_max_error"] = float(max_error)
+
+            if auroc > float(best_auroc["value"] or 0.0):
+                best_auroc = {"group": intersection_name, "value": float(auroc)}
+            if auroc < float(worst_auroc["value"] or 0.0):
+                worst_auroc = {"group": intersection_name, "value": float(auroc)}
+
+        results["intersections"][intersection_name] = group_result
+
+    if best_auroc["group"] and worst_auroc["group"]:
+        auroc_disparity = float(best_auroc["value"] or 0.0) - float(worst_auroc["value"] or 0.0)
+        results["summary"] = {
+            "n_intersections": len(results["intersections"]),
+            "n_excluded_small": len(intersections) - len(results["intersections"]),
+            "best_performing": best_auroc,
+            "worst_performing": worst_auroc,
+            "auroc_range": float(auroc_disparity),
+            "concern_level": _interpret_auroc_range(auroc_disparity),
+        }
+    else:
+        results["summary"] = {
+            "n_intersections": len(results["intersections"]),
+            "n_excluded_small": 0,
+            "note": "Insufficient data for summary",
+        }
+
+    return results
+
+
+def histogram_error_bounds(
+    overall: OverallPerformance | dict[str, Any],
+    subgroup: dict[str, Any],
+    n_bins: int | None,
+) -> dict[str, Any]:
+    """Largest possible deviation of histogram-based metrics from their exact values.
+
+    Counts, rates, fairness disparities, the Brier score and score moments
+    are exact, and threshold and decision curves are exact on the bin grid,
+    so only the rank metrics and percentiles have a binning error.
+
+    Args:
+        overall: Result of histogram_overall_performance.
+        subgroup: Results of histogram_subgroup_metrics by attribute.
+        n_bins: Number of equal-width score bins of the histograms, or None
+            when they have one bin per distinct score (no binning error).
+
+    Returns:
+        Dict with n_bins (the number of bins or score levels),
+        auroc_max_error and auprc_max_error (overall),
+        subgroup_auroc_max_error (largest over all groups) and
+        percentile_max_error (one bin width).
+    """
+    discrimination = cast(dict[str, Any], overall["discrimination"])
+    group_errors = [
+        metrics["auroc_max_error"]
+        for attribute in subgroup.values()
+        for metrics in attribute.get("groups", {}).values()
+        if isinstance(metrics, dict) and not np.isnan(metrics.get("auroc_max_error", np.nan))
+    ]
+    return {
+        "n_bins": discrimination["n_score_bins"],
+        "auroc_max_error": discrimination["auroc_max_error"],
+        "auprc_max_error": discrimination["auprc_max_error"],
+        "subgroup_auroc_max_error": float(max(group_errors, default=0.0)),
+        "percentile_max_error": 0.0 if n_bins is None else 1 / n_bins,
+    }
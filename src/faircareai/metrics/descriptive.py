@@ -13,6 +13,9 @@ import numpy as np
 import polars as pl
 from scipy import stats
 
+from faircareai.core.prepared import EncodedAttribute, PreparedAuditData
+from faircareai.core.validation import safe_divide_array
+
 
 def _pivot_compat(
     df: pl.DataFrame,
@@ -34,6 +37,7 @@ def compute_cohort_summary(
     y_true_col: str,
     y_prob_col: str,
     sensitive_attrs: dict[str, dict],
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute comprehensive cohort summary for Table 1.
 
@@ -42,6 +46,9 @@ def compute_cohort_summary(
         y_true_col: Column name for true labels.
         y_prob_col: Column name for predicted probabilities.
         sensitive_attrs: Dict of sensitive attribute configurations.
+        prepared: Encoded audit data. When given, outcome counts come from
+            its cached class indices and per-group counts from its encoded
+            attributes instead of re-encoding each attribute column.
 
     Returns:
         Dict containing:
@@ -55,7 +62,10 @@ def compute_cohort_summary(
 
     # === Cohort Overview ===
     n_total = len(df)
-    n_positive = df[y_true_col].sum()
+    if prepared is not None:
+        n_positive = len(prepared.class_indices[1])
+    else:
+        n_positive = int(df[y_true_col].sum())
     prevalence = n_positive / n_total if n_total > 0 else 0.0
 
     results["cohort_overview"] = {
@@ -96,86 +106,25 @@ def compute_cohort_summary(
         if col not in df.columns:
             continue
 
-        # Group counts and percentages
-        group_counts = (
-            df.group_by(col)
-            .agg(
-                pl.len().alias("n"),
-                pl.col(y_true_col).sum().alias("n_positive"),
-                pl.col(y_prob_col).mean().alias("mean_prob"),
-                pl.col(y_prob_col).std().alias("std_prob"),
+        # Group counts and percentages from encoded codes (see core.prepared.group_key)
+        if prepared is not None and col in prepared.attributes:
+            group_counts = _encoded_group_counts(
+                prepared.attribute(col), prepared.y_true, prepared.y_prob
+            )
+        else:
+            group_counts = _encoded_group_counts(
+                EncodedAttribute.from_series(df[col]),
+                df[y_true_col].to_numpy(),
+                df[y_prob_col].to_numpy(),
             )
-            .sort(col)
-        )
-
-        # Calculate missing
-        n_missing = df[col].null_count()
-        missing_rate = n_missing / n_total if n_total > 0 else 0.0
-
-        # Build distribution dict
-        attr_dist: dict[str, Any] = {
-            "n_missing": int(n_missing),
-            "missing_rate": float(missing_rate),
-            "groups": {},
-        }
 
-        # Get reference group outcome rate for ratio calculation
-        ref_rate = None
-        if reference:
-            ref_row = group_counts.filter(pl.col(col) == reference)
-            if len(ref_row) > 0:
-                ref_n = ref_row["n"][0]
-                ref_pos = ref_row["n_positive"][0]
-                ref_rate = ref_pos / ref_n if ref_n > 0 else None
-
-        for row in group_counts.iter_rows(named=True):
-            group_name = str(row[col]) if row[col] is not None else "Unknown"
-            n_group = row["n"]
-            n_pos = row["n_positive"]
-            pct = n_group / n_total if n_total > 0 else 0.0
-            outcome_rate = n_pos / n_group if n_group > 0 else 0.0
-
-            # Calculate rate ratio vs reference
-            rate_ratio = None
-            if ref_rate is not None and ref_rate > 0:
-                rate_ratio = outcome_rate / ref_rate
-
-            # Calculate 95% CI for outcome rate using Wilson score
-            ci_low, ci_high = _wilson_ci(n_pos, n_group)
-
-            attr_dist["groups"][group_name] = {
-                "n": int(n_group),
-                "pct": float(pct),
-                "pct_fmt": f"{pct * 100:.1f}%",
-            }
-
-            # Outcome by attribute
-            if attr_name not in outcome_by_attr:
-                outcome_by_attr[attr_name] = {"reference": reference, "groups": {}}
-
-            outcome_by_attr[attr_name]["groups"][group_name] = {
-                "n": int(n_group),
-                "n_positive": int(n_pos),
-                "outcome_rate": float(outcome_rate),
-                "outcome_rate_pct": f"{outcome_rate * 100:.1f}%",
-                "ci_95_low": float(ci_low),
-                "ci_95_high": float(ci_high),
-                "ci_95_fmt": f"({ci_low * 100:.1f}%, {ci_high * 100:.1f}%)",
-                "rate_ratio": float(rate_ratio) if rate_ratio is not None else None,
-                "is_reference": group_name == reference,
-            }
-
-            # Prediction by attribute
-            if attr_name not in prediction_by_attr:
-                prediction_by_attr[attr_name] = {"groups": {}}
-
-            prediction_by_attr[attr_name]["groups"][group_name] = {
-                "n": int(n_group),
-                "mean_prob": float(row["mean_prob"]) if row["mean_prob"] is not None else None,
-                "std_prob": float(row["std_prob"]) if row["std_prob"] is not None else None,
-            }
-
-        attr_distributions[attr_name] = attr_dist
+        summary = _summarize_attribute(
+            group_counts, col, reference, int(df[col].null_count()), n_total
+        )
+        attr_distributions[attr_name] = summary["distribution"]
+        if summary["outcome"]["groups"]:
+            outcome_by_attr[attr_name] = summary["outcome"]
+            prediction_by_attr[attr_name] = summary["prediction"]
 
     results["attribute_distributions"] = attr_distributions
     results["outcome_by_attribute"] = outcome_by_attr
@@ -184,6 +133,127 @@ def compute_cohort_summary(
     return results
 
 
+def _encoded_group_counts(
+    attr: EncodedAttribute, y_true: np.ndarray, y_prob: np.ndarray
+) -> pl.DataFrame:
+    """Per-group n, n_positive, mean_prob and std_prob from encoded codes.
+
+    Matches a ``group_by(col)`` aggregation sorted by group: the null group
+    comes first when present, missing scores are skipped and std_prob is
+    the sample SD (null for fewer than two scores).
+    """
+    slots = attr.codes.astype(np.int64) + 1  # slot 0 holds the null rows
+    n_slots = len(attr.groups) + 1
+    y_true = np.nan_to_num(np.asarray(y_true, dtype=np.float64))
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    scored = ~np.isnan(y_prob)
+
+    n = np.bincount(slots, minlength=n_slots)
+    n_positive = np.bincount(slots, weights=y_true, minlength=n_slots)
+    n_scored = np.bincount(slots[scored], minlength=n_slots)
+    mean = safe_divide_array(
+        np.bincount(slots[scored], weights=y_prob[scored], minlength=n_slots),
+        n_scored,
+        default=np.nan,
+    )
+    deviation = y_prob[scored] - mean[slots[scored]]
+    variance = safe_divide_array(
+        np.bincount(slots[scored], weights=deviation * deviation, minlength=n_slots),
+        n_scored - 1,
+        default=np.nan,
+    )
+
+    frame = pl.DataFrame(
+        [
+            pl.Series(attr.column, [None, *attr.groups], dtype=attr.dtype),
+            pl.Series("n", n, dtype=pl.Int64),
+            pl.Series("n_positive", n_positive, dtype=pl.Int64),
+            pl.Series("mean_prob", mean).fill_nan(None),
+            pl.Series("std_prob", np.sqrt(variance)).fill_nan(None),
+        ]
+    )
+    return frame.filter(pl.Series(n > 0))
+
+
+def _summarize_attribute(
+    group_counts: pl.DataFrame,
+    col: str,
+    reference: Any,
+    n_missing: int,
+    n_total: int,
+) -> dict[str, Any]:
+    """Table 1 entries for one attribute from its per-group counts.
+
+    Args:
+        group_counts: Frame as returned by _encoded_group_counts.
+        col: Attribute column (group values are in this column).
+        reference: Reference group for rate ratios.
+        n_missing: Rows with a null attribute value.
+        n_total: Cohort size.
+
+    Returns:
+        Dict with "distribution", "outcome" and "prediction" entries.
+    """
+    missing_rate = n_missing / n_total if n_total > 0 else 0.0
+    distribution: dict[str, Any] = {
+        "n_missing": int(n_missing),
+        "missing_rate": float(missing_rate),
+        "groups": {},
+    }
+    outcome: dict[str, Any] = {"reference": reference, "groups": {}}
+    prediction: dict[str, Any] = {"groups": {}}
+
+    # Get reference group outcome rate for ratio calculation
+    ref_rate = None
+    if reference:
+        ref_row = group_counts.filter(pl.col(col) == reference)
+        if len(ref_row) > 0:
+            ref_n = ref_row["n"][0]
+            ref_pos = ref_row["n_positive"][0]
+            ref_rate = ref_pos / ref_n if ref_n > 0 else None
+
+    for row in group_counts.iter_rows(named=True):
+        group_name = str(row[col]) if row[col] is not None else "Unknown"
+        n_group = row["n"]
+        n_pos = row["n_positive"]
+        pct = n_group / n_total if n_total > 0 else 0.0
+        outcome_rate = n_pos / n_group if n_group > 0 else 0.0
+
+        # Calculate rate ratio vs reference
+        rate_ratio = None
+        if ref_rate is not None and ref_rate > 0:
+            rate_ratio = outcome_rate / ref_rate
+
+        # Calculate 95% CI for outcome rate using Wilson score
+        ci_low, ci_high = _wilson_ci(n_pos, n_group)
+
+        distribution["groups"][group_name] = {
+            "n": int(n_group),
+            "pct": float(pct),
+            "pct_fmt": f"{pct * 100:.1f}%",
+        }
+
+        outcome["groups"][group_name] = {
+            "n": int(n_group),
+            "n_positive": int(n_pos),
+            "outcome_rate": float(outcome_rate),
+            "outcome_rate_pct": f"{outcome_rate * 100:.1f}%",
+            "ci_95_low": float(ci_low),
+            "ci_95_high": float(ci_high),
+            "ci_95_fmt": f"({ci_low * 100:.1f}%, {ci_high * 100:.1f}%)",
+            "rate_ratio": float(rate_ratio) if rate_ratio is not None else None,
+            "is_reference": group_name == reference,
+        }
+
+        prediction["groups"][group_name] = {
+            "n": int(n_group),
+            "mean_prob": float(row["mean_prob"]) if row["mean_prob"] is not None else None,
+            "std_prob": float(row["std_prob"]) if row["std_prob"] is not None else None,
+        }
+
+    return {"distribution": distribution, "outcome": outcome, "prediction": prediction}
+
+
 def _wilson_ci(successes: int, n: int, alpha: float = 0.05) -> tuple[float, float]:
     """Calculate Wilson score confidence interval for a proportion.
 
@@ -13,14 +13,21 @@ from typing import Any
 import numpy as np
 import polars as pl
 from sklearn.calibration import calibration_curve
-from sklearn.metrics import confusion_matrix, roc_auc_score
+from sklearn.metrics import roc_auc_score
 
-from faircareai.core.bootstrap import bootstrap_auroc
+from faircareai.core.bootstrap import (
+    bootstrap_auroc,
+    bootstrap_confusion_tables,
+    compute_percentile_ci_array,
+)
 from faircareai.core.constants import (
+    AUROC_CI_METHODS,
     AUROC_DIFF_MODERATE,
     AUROC_DIFF_NEGLIGIBLE,
     AUROC_DIFF_SMALL,
+    DEFAULT_ALPHA,
     DEFAULT_BOOTSTRAP_SEED,
+    DEFAULT_N_BOOTSTRAP,
     DEFAULT_N_BOOTSTRAP_SUBGROUP,
     DEMOGRAPHIC_PARITY_LOWER,
     DEMOGRAPHIC_PARITY_UPPER,
@@ -34,14 +41,23 @@ from faircareai.core.constants import (
     EQUALIZED_ODDS_THRESHOLD,
     MIN_SAMPLE_SIZE_CALIBRATION,
     MIN_SAMPLE_SIZE_FLAG,
+    THRESHOLD_GAP_TOLERANCE,
+    THRESHOLD_GRID_SIZE,
 )
 from faircareai.core.logging import get_logger
+from faircareai.core.metrics import compute_group_aggregates
+from faircareai.core.prepared import PreparedAuditData
+from faircareai.core.statistics import (
+    AurocDifference,
+    ci_delong_auroc,
+    delong_paired_difference,
+)
+from faircareai.core.thresholds import GroupedThresholdIndex
 from faircareai.core.types import DisparityIndexResult, FairnessResult
-from faircareai.core.validation import safe_divide
+from faircareai.core.validation import safe_divide, safe_divide_array
 from faircareai.metrics.group_utils import (
     determine_reference_group,
-    filter_to_group,
-    get_unique_groups,
+    group_row_indices,
 )
 
 logger = get_logger(__name__)
@@ -54,6 +70,12 @@ def compute_fairness_metrics(
     group_col: str,
     threshold: float = 0.5,
     reference: str | None = None,
+    bootstrap_ci: bool = False,
+    n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
+    random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+    group_aggregates: pl.DataFrame | None = None,
+    prepared: PreparedAuditData | None = None,
+    stratified: bool = False,
 ) -> FairnessResult:
     """Compute comprehensive fairness metrics for a sensitive attribute.
 
@@ -64,6 +86,19 @@ def compute_fairness_metrics(
         group_col: Column name for sensitive attribute.
         threshold: Decision threshold for classification.
         reference: Reference group for ratio calculations.
+        bootstrap_ci: Whether to compute bootstrap CIs for every disparity.
+            Uses a count-level bootstrap of the per-group 2x2 tables, so the
+            cost does not grow with the number of rows.
+        n_bootstrap: Number of bootstrap iterations.
+        random_seed: Random seed for bootstrap resampling.
+        group_aggregates: Precomputed per-group counts for ``group_col`` from
+            compute_group_aggregates at the same threshold. Computed here
+            when not supplied.
+        prepared: Encoded audit data shared across stages. When given (and
+            ``group_aggregates`` is not), group counts are read from it.
+        stratified: If True, the disparity bootstrap also preserves each
+            group's outcome counts (positives and negatives are resampled
+            separately).
 
     Returns:
         Dict containing:
@@ -74,6 +109,7 @@ def compute_fairness_metrics(
         - ppv_ratio: Predictive parity ratios
         - calibration_diff: Calibration differences
         - group_metrics: Per-group raw metrics
+        - disparity_ci: Per-disparity, per-group 95% CIs (if bootstrap_ci)
     """
     results: FairnessResult = {
         "group_col": group_col,
@@ -91,21 +127,30 @@ def compute_fairness_metrics(
         "summary": {},
     }
 
-    groups = get_unique_groups(df, group_col)
+    if group_aggregates is None and prepared is not None and group_col in prepared.attributes:
+        group_aggregates = prepared.group_aggregates(threshold)[group_col]
+    if group_aggregates is None:
+        group_aggregates = compute_group_aggregates(
+            df, group_col, y_true_col=y_true_col, y_prob_col=y_prob_col, threshold=threshold
+        )[group_col]
+
+    aggregates = {row[group_col]: row for row in group_aggregates.iter_rows(named=True)}
+    groups = list(aggregates)
 
     # Determine reference group
-    reference = determine_reference_group(groups, df, group_col, reference)
+    reference = determine_reference_group(
+        groups,
+        df,
+        group_col,
+        reference,
+        group_sizes={g: row["n"] for g, row in aggregates.items()},
+    )
 
     results["reference"] = str(reference)
 
-    # Compute per-group metrics
-    for group in groups:
-        group_df = filter_to_group(df, group_col, group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
-        y_pred = (y_prob >= threshold).astype(int)
-
-        n = len(y_true)
+    # Compute per-group metrics from the grouped confusion counts
+    for group, agg in aggregates.items():
+        n = agg["n"]
         if n < MIN_SAMPLE_SIZE_FLAG:
             results["group_metrics"][str(group)] = {
                 "n": n,
@@ -113,16 +158,7 @@ def compute_fairness_metrics(
             }
             continue
 
-        # Confusion matrix components
-        try:
-            tn, fp, fn, tp = confusion_matrix(y_true, y_pred, labels=[0, 1]).ravel()
-        except ValueError as e:
-            logger.debug("Confusion matrix computation failed for group %s: %s", group, str(e))
-            results["group_metrics"][str(group)] = {
-                "n": n,
-                "error": "Could not compute confusion matrix",
-            }
-            continue
+        tp, fp, tn, fn = agg["tp"], agg["fp"], agg["tn"], agg["fn"]
 
         # Basic rates using centralized safe_divide
         selection_rate = safe_divide(tp + fp, n)
@@ -133,10 +169,10 @@ def compute_fairness_metrics(
         prevalence = safe_divide(tp + fn, n)
 
         # Mean predicted probability
-        mean_prob = float(np.mean(y_prob))
+        mean_prob = float(agg["mean_predicted_prob"])
 
         # Calibration (difference between mean predicted and observed rate)
-        observed_rate = safe_divide(tp + fn, n)
+        observed_rate = prevalence
         predicted_rate = mean_prob
         mean_calibration_error = predicted_rate - observed_rate
 
@@ -211,12 +247,88 @@ def compute_fairness_metrics(
         cal = group_data.get("mean_calibration_error", 0)
         results["calibration_diff"][str(group)] = float(cal - ref_cal)
 
+    if bootstrap_ci:
+        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+        results["disparity_ci"] = _bootstrap_disparity_cis(
+            results["group_metrics"], str(reference), n_bootstrap, seed, stratified=stratified
+        )
+
     # Summary statistics
     results["summary"] = _compute_fairness_summary(results)
 
     return results
 
 
+def _bootstrap_disparity_cis(
+    group_metrics: dict[str, Any],
+    reference: str,
+    n_bootstrap: int,
+    seed: int,
+    alpha: float = DEFAULT_ALPHA,
+    stratified: bool = False,
+) -> dict[str, dict[str, list[float] | None]]:
+    """Compute percentile CIs for every disparity from resampled 2x2 tables.
+
+    Each group's confusion table is resampled with multinomial draws on its
+    cell counts (equivalent to a row-level bootstrap within each group), and
+    all disparities vs the reference are recomputed per replicate.
+
+    Args:
+        group_metrics: Per-group metrics with tp/fp/tn/fn counts.
+        reference: Reference group name.
+        n_bootstrap: Number of bootstrap iterations.
+        seed: Random seed for reproducibility.
+        alpha: Significance level (default 0.05 for 95% CI).
+        stratified: If True, resample positives and negatives separately
+            within each group.
+
+    Returns:
+        Dict mapping disparity name to {group: [lower, upper] or None}.
+    """
+    groups = [g for g, m in group_metrics.items() if "error" not in m]
+    if reference not in groups:
+        return {}
+
+    tables = np.array(
+        [[group_metrics[g][cell] for cell in ("tp", "fp", "tn", "fn")] for g in groups]
+    )
+    boot = bootstrap_confusion_tables(
+        tables, n_bootstrap=n_bootstrap, seed=seed, stratified=stratified
+    )
+    tp, fp, tn, fn = np.moveaxis(boot, -1, 0)
+
+    selection = safe_divide_array(tp + fp, tp + fp + tn + fn)
+    tpr = safe_divide_array(tp, tp + fn)
+    fpr = safe_divide_array(fp, fp + tn)
+    ppv = safe_divide_array(tp, tp + fp)
+
+    ref = groups.index(reference)
+    tpr_diff = tpr - tpr[:, [ref]]
+    fpr_diff = fpr - fpr[:, [ref]]
+    replicates = {
+        "demographic_parity_ratio": safe_divide_array(
+            selection, selection[:, [ref]], default=np.nan
+        ),
+        "demographic_parity_diff": selection - selection[:, [ref]],
+        "tpr_diff": tpr_diff,
+        "fpr_diff": fpr_diff,
+        "equalized_odds_diff": np.maximum(np.abs(tpr_diff), np.abs(fpr_diff)),
+        "ppv_ratio": safe_divide_array(ppv, ppv[:, [ref]], default=np.nan),
+        "ppv_diff": ppv - ppv[:, [ref]],
+    }
+
+    cis: dict[str, dict[str, list[float] | None]] = {}
+    for metric, values in replicates.items():
+        lower, upper = compute_percentile_ci_array(values, alpha)
+        cis[metric] = {
+            str(group): None if np.isnan(lower[j]) else [float(lower[j]), float(upper[j])]
+            for j, group in enumerate(groups)
+            if j != ref
+        }
+
+    return cis
+
+
 def _compute_fairness_summary(metrics: dict[str, Any] | FairnessResult) -> dict[str, Any]:
     """Compute summary statistics for fairness metrics.
 
@@ -431,12 +543,13 @@ def compute_calibration_by_group(
     """
     results: dict[str, Any] = {"groups": {}}
 
-    groups = get_unique_groups(df, group_col)
+    group_rows = group_row_indices(df, group_col)
+    y_true_all = df[y_true_col].to_numpy()
+    y_prob_all = df[y_prob_col].to_numpy()
 
-    for group in groups:
-        group_df = filter_to_group(df, group_col, group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         if len(y_true) < MIN_SAMPLE_SIZE_CALIBRATION:
             results["groups"][str(group)] = {
@@ -478,9 +591,14 @@ def compute_threshold_fairness(
     group_col: str,
     thresholds: list[float] | None = None,
     reference: str | None = None,
+    min_sensitivity: float = 0.0,
+    n_grid: int = THRESHOLD_GRID_SIZE,
 ) -> dict[str, Any]:
     """Analyze how fairness metrics change across thresholds.
 
+    Scores are sorted once per group; the requested thresholds and the fine
+    search grid are both answered from cumulative counts.
+
     Args:
         df: Polars DataFrame with patient data.
         y_prob_col: Column name for predicted probabilities.
@@ -488,9 +606,14 @@ def compute_threshold_fairness(
         group_col: Column name for sensitive attribute.
         thresholds: List of thresholds to evaluate.
         reference: Reference group.
+        min_sensitivity: Sensitivity floor every group must meet at the
+            recommended threshold.
+        n_grid: Number of grid steps on (0, 1) searched for the recommended
+            threshold.
 
     Returns:
-        Dict with fairness metrics at each threshold.
+        Dict with fairness metrics at each threshold and the recommended
+        (equalized-odds minimizing) threshold from the fine grid.
     """
     if thresholds is None:
         thresholds = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
@@ -500,8 +623,29 @@ def compute_threshold_fairness(
         "metrics_by_threshold": [],
     }
 
-    for thresh in thresholds:
-        metrics = compute_fairness_metrics(df, y_prob_col, y_true_col, group_col, thresh, reference)
+    index = GroupedThresholdIndex.from_frame(df, y_prob_col, y_true_col, group_col)
+    base = compute_group_aggregates(df, group_col, y_true_col=y_true_col, y_prob_col=y_prob_col)[
+        group_col
+    ]
+    tp, fp, tn, fn = index.counts(thresholds)
+
+    for i, thresh in enumerate(thresholds):
+        group_aggregates = base.with_columns(
+            pl.Series("tp", tp[:, i]),
+            pl.Series("fp", fp[:, i]),
+            pl.Series("tn", tn[:, i]),
+            pl.Series("fn", fn[:, i]),
+            pl.Series("selection_rate", safe_divide_array(tp[:, i] + fp[:, i], index.n)),
+        )
+        metrics = compute_fairness_metrics(
+            df,
+            y_prob_col,
+            y_true_col,
+            group_col,
+            thresh,
+            reference,
+            group_aggregates=group_aggregates,
+        )
         summary = metrics.get("summary", {})
 
         results["metrics_by_threshold"].append(
@@ -514,25 +658,200 @@ def compute_threshold_fairness(
             }
         )
 
-    # Find threshold with best fairness
-    best_threshold = None
-    best_eo = float("inf")
-
-    for item in results["metrics_by_threshold"]:
-        eo = item.get("equalized_odds_worst")
-        if eo is not None and eo < best_eo:
-            best_eo = eo
-            best_threshold = item["threshold"]
+    # Find threshold with best fairness on the fine grid
+    best = optimize_fairness_thresholds(
+        df,
+        y_prob_col,
+        y_true_col,
+        group_col,
+        criterion="equalized_odds",
+        min_sensitivity=min_sensitivity,
+        reference=reference,
+        n_grid=n_grid,
+        index=index,
+    )
 
     results["recommended_threshold"] = {
-        "threshold": best_threshold,
-        "equalized_odds_diff": best_eo if best_eo != float("inf") else None,
+        "threshold": best["threshold"],
+        "equalized_odds_diff": best["gap"],
+        "min_sensitivity": min_sensitivity,
         "note": "Threshold that minimizes equalized odds disparity",
     }
 
     return results
 
 
+def optimize_fairness_thresholds(
+    df: pl.DataFrame,
+    y_prob_col: str,
+    y_true_col: str,
+    group_col: str,
+    criterion: str = "equalized_odds",
+    min_sensitivity: float = 0.0,
+    min_specificity: float = 0.0,
+    group_specific: bool = False,
+    reference: str | None = None,
+    n_grid: int = THRESHOLD_GRID_SIZE,
+    tolerance: float = THRESHOLD_GAP_TOLERANCE,
+    index: GroupedThresholdIndex | None = None,
+) -> dict[str, Any]:
+    """Search thresholds that minimize a fairness gap under a sensitivity floor.
+
+    The gap is measured against the reference group, as in
+    compute_fairness_metrics: equalized odds uses max(|TPR diff|, |FPR diff|),
+    demographic parity uses |selection rate diff|; the worst group defines
+    the gap. Thresholds are taken from a regular grid on (0, 1). Every group
+    must reach ``min_sensitivity``, overall specificity must reach
+    ``min_specificity``, and thresholds that flag everyone or no one are
+    excluded. Among thresholds whose gap is within ``tolerance`` of the
+    smallest feasible gap, the one with the highest overall Youden index is
+    chosen.
+
+    With ``group_specific=True`` each group gets its own threshold: for each
+    reference threshold, every other group takes the grid threshold that
+    best matches the reference rates.
+
+    Args:
+        df: Polars DataFrame with patient data.
+        y_prob_col: Column name for predicted probabilities.
+        y_true_col: Column name for true labels.
+        group_col: Column name for sensitive attribute.
+        criterion: "equalized_odds" or "demographic_parity".
+        min_sensitivity: Minimum TPR required in every group.
+        min_specificity: Minimum overall specificity.
+        group_specific: Search one threshold per group instead of a global one.
+        reference: Reference group (default: largest group).
+        n_grid: Number of grid steps on (0, 1).
+        tolerance: Gap margin treated as a tie before comparing Youden index.
+        index: Prebuilt GroupedThresholdIndex for ``group_col``.
+
+    Returns:
+        Dict with the chosen ``thresholds`` per group (and ``threshold`` for
+        the reference group), the resulting ``gap`` and ``group_gaps``,
+        per-group sensitivity/FPR/selection rate, overall sensitivity and
+        specificity, and ``feasible`` (False when no grid threshold meets the
+        sensitivity floor).
+
+    Raises:
+        ValueError: If criterion is not recognized.
+    """
+    if criterion not in ("equalized_odds", "demographic_parity"):
+        raise ValueError(
+            f"Unknown criterion: {criterion}. Use 'equalized_odds' or 'demographic_parity'."
+        )
+
+    if index is None:
+        index = GroupedThresholdIndex.from_frame(df, y_prob_col, y_true_col, group_col)
+
+    # Same eligibility rule as compute_fairness_metrics
+    keep = [i for i, n in enumerate(index.n) if n >= MIN_SAMPLE_SIZE_FLAG]
+    groups = [index.groups[i] for i in keep]
+    sizes = {index.groups[i]: int(index.n[i]) for i in keep}
+    reference = determine_reference_group(groups, df, group_col, reference, group_sizes=sizes)
+
+    results: dict[str, Any] = {
+        "criterion": criterion,
+        "group_specific": group_specific,
+        "min_sensitivity": min_sensitivity,
+        "min_specificity": min_specificity,
+        "reference": str(reference) if reference is not None else None,
+        "n_grid": n_grid,
+        "excluded_groups": [str(g) for g in index.groups if g not in sizes],
+        "feasible": False,
+        "threshold": None,
+        "thresholds": {},
+        "gap": None,
+        "group_gaps": {},
+    }
+    if reference not in sizes:
+        results["note"] = "No group has enough data for threshold search"
+        return results
+
+    grid = np.linspace(0.0, 1.0, n_grid + 1)[1:-1]
+    rates = index.rates(grid)
+    rates = {key: value[keep] for key, value in rates.items()}
+    ref = groups.index(reference)
+    others = [j for j in range(len(groups)) if j != ref]
+    meets_floor = rates["tpr"] >= min_sensitivity
+
+    def _gap(j: int, ref_cols: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        # Gap between group j at grid columns ``cols`` and reference at ``ref_cols``
+        gap: np.ndarray
+        if criterion == "equalized_odds":
+            gap = np.maximum(
+                np.abs(rates["tpr"][j][cols] - rates["tpr"][ref][ref_cols]),
+                np.abs(rates["fpr"][j][cols] - rates["fpr"][ref][ref_cols]),
+            )
+        else:
+            gap = np.abs(rates["selection_rate"][j][cols] - rates["selection_rate"][ref][ref_cols])
+        return gap
+
+    n_cols = len(grid)
+    columns = np.arange(n_cols)
+    # choice[j, c]: grid column used by group j when the reference uses column c
+    choice = np.tile(columns, (len(groups), 1))
+    gaps = np.zeros((len(groups), n_cols))
+    feasible = meets_floor[ref].copy()
+
+    for j in others:
+        if group_specific:
+            # (reference column, group column) matrix of gaps
+            pair_gap = _gap(j, columns[:, None], columns[None, :])
+            pair_gap = np.where(meets_floor[j][None, :], pair_gap, np.inf)
+            choice[j] = np.argmin(pair_gap, axis=1)
+            gaps[j] = pair_gap[columns, choice[j]]
+            feasible &= np.isfinite(gaps[j])
+        else:
+            gaps[j] = _gap(j, columns, columns)
+            feasible &= meets_floor[j]
+
+    worst_gap = gaps.max(axis=0)
+    rows = np.arange(len(groups))[:, None]
+    tp, fp, tn, fn = (rates[cell][rows, choice].sum(axis=0) for cell in ("tp", "fp", "tn", "fn"))
+    sensitivity = safe_divide_array(tp, tp + fn)
+    specificity = safe_divide_array(tn, tn + fp)
+    youden = sensitivity + specificity - 1
+
+    # Flagging everyone (or no one) trivially equalizes rates; it is not a decision rule
+    n_flagged = tp + fp
+    feasible &= (n_flagged > 0) & (n_flagged < tp + fp + tn + fn)
+    feasible &= specificity >= min_specificity
+
+    if not feasible.any():
+        results["note"] = (
+            f"No threshold keeps every group's sensitivity >= {min_sensitivity} "
+            f"with overall specificity >= {min_specificity}"
+        )
+        return results
+
+    best_gap = worst_gap[feasible].min()
+    candidates = feasible & (worst_gap <= best_gap + tolerance)
+    best = int(np.flatnonzero(candidates)[np.argmax(youden[candidates])])
+    chosen = choice[:, best]
+
+    results.update(
+        {
+            "feasible": True,
+            "threshold": float(grid[chosen[ref]]),
+            "thresholds": {str(g): float(grid[chosen[j]]) for j, g in enumerate(groups)},
+            "gap": float(worst_gap[best]),
+            "group_gaps": {str(groups[j]): float(gaps[j, best]) for j in others},
+            "group_sensitivity": {
+                str(g): float(rates["tpr"][j, chosen[j]]) for j, g in enumerate(groups)
+            },
+            "group_fpr": {str(g): float(rates["fpr"][j, chosen[j]]) for j, g in enumerate(groups)},
+            "group_selection_rate": {
+                str(g): float(rates["selection_rate"][j, chosen[j]]) for j, g in enumerate(groups)
+            },
+            "overall_sensitivity": float(sensitivity[best]),
+            "overall_specificity": float(specificity[best]),
+            "note": ("Group-specific thresholds" if group_specific else "Single global threshold")
+            + f" minimizing {criterion.replace('_', ' ')} gap vs '{reference}'",
+        }
+    )
+    return results
+
+
 def compute_group_auroc_comparison(
     df: pl.DataFrame,
     y_prob_col: str,
@@ -540,6 +859,7 @@ def compute_group_auroc_comparison(
     group_col: str,
     reference: str | None = None,
     n_bootstrap: int = DEFAULT_N_BOOTSTRAP_SUBGROUP,
+    ci_method: str = "bootstrap",
 ) -> dict[str, Any]:
     """Compare AUROC across groups with statistical testing.
 
@@ -550,19 +870,31 @@ def compute_group_auroc_comparison(
         group_col: Column name for sensitive attribute.
         reference: Reference group.
         n_bootstrap: Number of bootstrap iterations.
+        ci_method: "bootstrap" (percentile CI over n_bootstrap resamples)
+            or "delong" (analytic DeLong variance, one sort per group).
+            DeLong also adds ``auroc_se`` per group and, per comparison,
+            the CI and two-sided p-value of the difference from the
+            reference (independent groups, so their variances add).
 
     Returns:
         Dict with per-group AUROC and pairwise comparisons.
+
+    Raises:
+        ValueError: If ci_method is not one of AUROC_CI_METHODS.
     """
-    results: dict[str, Any] = {"groups": {}, "comparisons": {}}
+    if ci_method not in AUROC_CI_METHODS:
+        raise ValueError(f"ci_method must be one of {AUROC_CI_METHODS}, got {ci_method!r}")
+    results: dict[str, Any] = {"groups": {}, "comparisons": {}, "ci_method": ci_method}
 
-    groups = get_unique_groups(df, group_col)
+    group_rows = group_row_indices(df, group_col)
+    groups = list(group_rows)
+    y_true_all = df[y_true_col].to_numpy()
+    y_prob_all = df[y_prob_col].to_numpy()
 
     # Compute per-group AUROC
-    for group in groups:
-        group_df = filter_to_group(df, group_col, group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         if len(y_true) < MIN_SAMPLE_SIZE_CALIBRATION or len(np.unique(y_true)) < 2:
             results["groups"][str(group)] = {
@@ -573,20 +905,24 @@ def compute_group_auroc_comparison(
 
         auroc = roc_auc_score(y_true, y_prob)
 
-        # Bootstrap CI using centralized bootstrap module
-        _, auroc_ci_lower, auroc_ci_upper = bootstrap_auroc(
-            y_true,
-            y_prob,
-            n_bootstrap=n_bootstrap,
-            seed=DEFAULT_BOOTSTRAP_SEED,
-            stratified=False,  # Backward compatibility
-        )
+        group_result: dict[str, Any] = {"n": len(y_true), "auroc": float(auroc)}
+        auroc_ci_lower: float | None
+        auroc_ci_upper: float | None
+        if ci_method == "delong":
+            _, auroc_se, auroc_ci_lower, auroc_ci_upper = ci_delong_auroc(y_true, y_prob)
+            group_result["auroc_se"] = auroc_se
+        else:
+            # Bootstrap CI using centralized bootstrap module
+            _, auroc_ci_lower, auroc_ci_upper = bootstrap_auroc(
+                y_true,
+                y_prob,
+                n_bootstrap=n_bootstrap,
+                seed=DEFAULT_BOOTSTRAP_SEED,
+                stratified=False,  # Backward compatibility
+            )
+        group_result["auroc_ci_95"] = [auroc_ci_lower, auroc_ci_upper]
 
-        results["groups"][str(group)] = {
-            "n": len(y_true),
-            "auroc": float(auroc),
-            "auroc_ci_95": [auroc_ci_lower, auroc_ci_upper],
-        }
+        results["groups"][str(group)] = group_result
 
     # Determine reference
     if reference is None:
@@ -611,13 +947,83 @@ def compute_group_auroc_comparison(
             group_auroc = group_data.get("auroc", 0)
             diff = group_auroc - ref_auroc
 
-            results["comparisons"][str(group)] = {
+            comparison: dict[str, Any] = {
                 "auroc_diff": float(diff),
                 "group_auroc": float(group_auroc),
                 "reference_auroc": float(ref_auroc),
                 "interpretation": _interpret_auroc_diff(diff),
             }
+            if ci_method == "delong":
+                test = AurocDifference.from_variance(
+                    diff, group_data["auroc_se"] ** 2 + ref_data["auroc_se"] ** 2
+                )
+                comparison["auroc_diff_ci_95"] = [test.ci_lower, test.ci_upper]
+                comparison["p_value"] = test.p_value
+            results["comparisons"][str(group)] = comparison
+
+    return results
+
 
+def compute_paired_auroc_comparison(
+    df: pl.DataFrame,
+    y_prob_col: str,
+    other_prob_col: str,
+    y_true_col: str,
+    group_col: str | None = None,
+    alpha: float = DEFAULT_ALPHA,
+) -> dict[str, Any]:
+    """Compare the AUROCs of two score columns on the same patients (paired DeLong).
+
+    Use this to compare two models, or a model and its recalibrated or
+    retrained version, overall and within each group.
+
+    Args:
+        df: Polars DataFrame with patient data.
+        y_prob_col: Column name for the first predicted probabilities.
+        other_prob_col: Column name for the second predicted probabilities.
+        y_true_col: Column name for true labels.
+        group_col: Optional sensitive attribute; adds one comparison per group.
+        alpha: Significance level (default 0.05 for 95% CI).
+
+    Returns:
+        Dict with the "overall" comparison and, with group_col, per-group
+        comparisons under "groups". Each holds n, both AUROCs, their
+        difference (y_prob_col minus other_prob_col) with SE, CI and
+        two-sided p-value, or an error for groups with too little data.
+    """
+    y_true_all = df[y_true_col].to_numpy()
+    scores_all = df[y_prob_col].to_numpy()
+    other_all = df[other_prob_col].to_numpy()
+
+    def compare(rows: np.ndarray | slice) -> dict[str, Any]:
+        y_true = y_true_all[rows]
+        if len(y_true) < MIN_SAMPLE_SIZE_CALIBRATION or len(np.unique(y_true)) < 2:
+            return {
+                "n": len(y_true),
+                "error": f"Insufficient data for AUROC (n < {MIN_SAMPLE_SIZE_CALIBRATION} or single class)",
+            }
+        scores, other = scores_all[rows], other_all[rows]
+        test = delong_paired_difference(y_true, scores, other, alpha)
+        return {
+            "n": len(y_true),
+            "auroc": float(roc_auc_score(y_true, scores)),
+            "other_auroc": float(roc_auc_score(y_true, other)),
+            "auroc_diff": test.difference,
+            "auroc_diff_se": test.se,
+            "auroc_diff_ci_95": [test.ci_lower, test.ci_upper],
+            "p_value": test.p_value,
+            "interpretation": _interpret_auroc_diff(test.difference),
+        }
+
+    results: dict[str, Any] = {
+        "y_prob_col": y_prob_col,
+        "other_prob_col": other_prob_col,
+        "overall": compare(slice(None)),
+    }
+    if group_col is not None:
+        results["groups"] = {
+            str(group): compare(rows) for group, rows in group_row_indices(df, group_col).items()
+        }
     return results
 
 
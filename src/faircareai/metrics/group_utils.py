@@ -8,8 +8,11 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import polars as pl
 
+from faircareai.core.prepared import EncodedAttribute, PreparedAuditData
+
 
 def get_unique_groups(df: pl.DataFrame, group_col: str) -> list[Any]:
     """Get sorted list of unique groups from a column.
@@ -38,11 +41,60 @@ def filter_to_group(df: pl.DataFrame, group_col: str, group: Any) -> pl.DataFram
     return df.filter(pl.col(group_col) == group)
 
 
+def group_row_indices(df: pl.DataFrame, group_col: str) -> dict[Any, np.ndarray]:
+    """Map each non-null group to the row positions it occupies.
+
+    A single grouped pass replaces one ``filter`` scan per group; callers
+    take their column arrays once and index them per group. Rows keep their
+    original order within each group.
+
+    Args:
+        df: DataFrame containing the group column
+        group_col: Column name for grouping variable
+
+    Returns:
+        Dict mapping group value to an int64 array of row positions,
+        ordered by sorted group value
+    """
+    # Dense codes + stable argsort rather than a polars group_by (see core.prepared.group_key)
+    return EncodedAttribute.from_series(df[group_col]).group_rows()
+
+
+def group_arrays(
+    df: pl.DataFrame,
+    y_true_col: str,
+    y_prob_col: str,
+    group_col: str,
+    prepared: PreparedAuditData | None = None,
+) -> tuple[np.ndarray, np.ndarray, dict[Any, np.ndarray]]:
+    """Label and score arrays with the row positions of each group.
+
+    Args:
+        df: DataFrame with predictions and demographics
+        y_true_col: Column name for ground truth
+        y_prob_col: Column name for predicted probabilities
+        group_col: Column name for grouping variable
+        prepared: Encoded audit data; used instead of ``df`` when it
+            encodes ``group_col``
+
+    Returns:
+        Tuple of (y_true, y_prob, group rows as from group_row_indices)
+    """
+    if prepared is not None and group_col in prepared.attributes:
+        return prepared.y_true, prepared.y_prob, prepared.attribute(group_col).group_rows()
+    return (
+        df[y_true_col].to_numpy(),
+        df[y_prob_col].to_numpy(),
+        group_row_indices(df, group_col),
+    )
+
+
 def determine_reference_group(
     groups: list[Any],
     df: pl.DataFrame,
     group_col: str,
     reference: str | None = None,
+    group_sizes: dict[Any, int] | None = None,
 ) -> Any:
     """Determine the reference group for comparisons.
 
@@ -51,6 +103,8 @@ def determine_reference_group(
         df: DataFrame containing the group column
         group_col: Column name for grouping variable
         reference: User-specified reference group (if any)
+        group_sizes: Precomputed group counts (e.g. from
+            compute_group_aggregates); avoids another pass over df
 
     Returns:
         Reference group value (specified, or largest group by count)
@@ -58,6 +112,9 @@ def determine_reference_group(
     if reference is not None and reference in groups:
         return reference
 
+    if group_sizes:
+        return max(group_sizes, key=lambda g: group_sizes[g])
+
     # Default to largest group
     group_counts = df.group_by(group_col).len().sort("len", descending=True)
     return group_counts[group_col][0]
@@ -30,39 +30,41 @@ USE_WITH_CAUTION (improper measures - use with explicit caveats only):
 See constants.py for VANCALSTER_* classification constants.
 """
 
-import warnings
 from typing import Any, cast
 
 import numpy as np
 import polars as pl
 from sklearn.calibration import calibration_curve
-from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import (
     auc,
     average_precision_score,
     brier_score_loss,
     confusion_matrix,
-    f1_score,
     precision_recall_curve,
     roc_auc_score,
     roc_curve,
 )
-from statsmodels.api import Logit
 
 from faircareai.core.bootstrap import (
     bootstrap_confusion_metrics,
-    bootstrap_metric,
+    bootstrap_ranking_metrics,
     compute_percentile_ci,
 )
+from faircareai.core.calibration import (
+    logit_scores,
+    lowess_calibration,
+    recalibration_from_counts,
+)
 from faircareai.core.constants import (
     BRIER_POOR_THRESHOLD,
     CALIBRATION_SLOPE_OVERFITTING,
     CALIBRATION_SLOPE_UNDERFITTING,
     DEFAULT_BOOTSTRAP_SEED,
-    PROB_CLIP_MAX,
-    PROB_CLIP_MIN,
+    LOWESS_FRAC,
 )
 from faircareai.core.logging import get_logger
+from faircareai.core.metrics import compute_group_aggregates
+from faircareai.core.thresholds import ThresholdIndex
 from faircareai.core.types import (
     CalibrationMetrics,
     ClassificationMetrics,
@@ -70,6 +72,7 @@ from faircareai.core.types import (
     OverallPerformance,
 )
 from faircareai.core.validation import safe_divide
+from faircareai.metrics.group_utils import group_row_indices
 
 logger = get_logger(__name__)
 
@@ -82,6 +85,8 @@ def compute_overall_performance(
     bootstrap_ci: bool = True,
     n_bootstrap: int = 1000,
     random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+    index: ThresholdIndex | None = None,
+    ranking_samples: dict[str, list[float]] | None = None,
 ) -> OverallPerformance:
     """Compute comprehensive model performance metrics.
 
@@ -93,6 +98,10 @@ def compute_overall_performance(
         bootstrap_ci: Whether to compute bootstrap confidence intervals.
         n_bootstrap: Number of bootstrap iterations.
         random_seed: Random seed for bootstrap resampling.
+        index: Prebuilt ThresholdIndex over ``y_true``/``y_prob`` (e.g.
+            PreparedAuditData.threshold_index). Built here when not supplied.
+        ranking_samples: Precomputed AUROC/AUPRC bootstrap samples (see
+            compute_discrimination_metrics).
 
     Returns:
         Dict containing:
@@ -108,7 +117,7 @@ def compute_overall_performance(
     y_prob = np.asarray(y_prob).ravel()
 
     discrimination = compute_discrimination_metrics(
-        y_true, y_prob, bootstrap_ci, n_bootstrap, random_seed
+        y_true, y_prob, bootstrap_ci, n_bootstrap, random_seed, ranking_samples
     )
     calibration = compute_calibration_metrics(y_true, y_prob)
     classification = compute_classification_at_threshold(
@@ -117,8 +126,14 @@ def compute_overall_performance(
 
     if thresholds_to_evaluate is None:
         thresholds_to_evaluate = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
-    threshold_analysis = compute_threshold_analysis(y_true, y_prob, thresholds_to_evaluate)
-    decision_curve = compute_decision_curve_analysis(y_true, y_prob)
+
+    # Sort once; the threshold table and decision curve both query this index
+    if index is None:
+        index = ThresholdIndex(y_true, y_prob)
+    threshold_analysis = compute_threshold_analysis(
+        y_true, y_prob, thresholds_to_evaluate, index=index
+    )
+    decision_curve = compute_decision_curve_analysis(y_true, y_prob, index=index)
     confusion_matrix_data = compute_confusion_matrix(y_true, y_prob, threshold)
 
     return cast(
@@ -141,6 +156,7 @@ def compute_discrimination_metrics(
     bootstrap_ci: bool = True,
     n_bootstrap: int = 1000,
     random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+    ranking_samples: dict[str, list[float]] | None = None,
 ) -> DiscriminationMetrics:
     """Compute discrimination metrics with confidence intervals.
 
@@ -150,6 +166,10 @@ def compute_discrimination_metrics(
         bootstrap_ci: Whether to compute bootstrap CI.
         n_bootstrap: Number of bootstrap iterations.
         random_seed: Random seed for bootstrap resampling.
+        ranking_samples: Precomputed "auroc"/"auprc" bootstrap samples, e.g.
+            merged from blocks resampled in parallel. Used for the CIs
+            instead of resampling here; ``n_bootstrap`` and ``random_seed``
+            are then ignored.
 
     Returns:
         Dict with AUROC, AUPRC, AP, and curve data.
@@ -186,30 +206,18 @@ def compute_discrimination_metrics(
 
     # Bootstrap confidence intervals using centralized bootstrap module
     if bootstrap_ci and len(y_true) > 10:
-        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
-        # AUROC bootstrap (stratified=False for backward compatibility)
-        auroc_samples, _ = bootstrap_metric(
-            y_true,
-            y_prob,
-            lambda yt, yp: roc_auc_score(yt, yp),
-            n_bootstrap=n_bootstrap,
-            seed=seed,
-            stratified=False,
-        )
-
-        # AUPRC bootstrap
-        def _auprc_metric(yt: np.ndarray, yp: np.ndarray) -> float:
-            prec, rec, _ = precision_recall_curve(yt, yp)
-            return float(auc(rec, prec))
-
-        auprc_samples, _ = bootstrap_metric(
-            y_true,
-            y_prob,
-            _auprc_metric,
-            n_bootstrap=n_bootstrap,
-            seed=seed,
-            stratified=False,
-        )
+        if ranking_samples is None:
+            seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+            # AUROC/AUPRC bootstrap (stratified=False for backward compatibility)
+            ranking_samples, _ = bootstrap_ranking_metrics(
+                y_true,
+                y_prob,
+                n_bootstrap=n_bootstrap,
+                seed=seed,
+                stratified=False,
+            )
+        auroc_samples = ranking_samples["auroc"]
+        auprc_samples = ranking_samples["auprc"]
 
         if len(auroc_samples) > 10:
             auroc_ci_lower, auroc_ci_upper = compute_percentile_ci(auroc_samples)
@@ -256,31 +264,11 @@ def compute_calibration_metrics(
     except ValueError:
         prob_true, prob_pred = np.array([]), np.array([])
 
-    # Smoothed calibration curve using LOWESS (Van Calster reference)
-    smoothed_pred = np.array([])
-    smoothed_true = np.array([])
+    # Smoothed calibration curve using LOWESS (Van Calster reference),
+    # evaluated on a fixed grid of predicted risks
+    smoothed = None
     try:
-        if np.unique(y_prob).size >= 3:
-            from statsmodels.nonparametric.smoothers_lowess import lowess
-
-            order = np.argsort(y_prob)
-            prob_sorted = y_prob[order]
-            y_sorted = y_true[order]
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    message=".*invalid value encountered in divide.*",
-                    category=RuntimeWarning,
-                )
-                lowess_result = lowess(
-                    y_sorted,
-                    prob_sorted,
-                    frac=0.75,
-                    it=0,
-                    return_sorted=True,
-                )
-            smoothed_pred = lowess_result[:, 0]
-            smoothed_true = np.clip(lowess_result[:, 1], 0.0, 1.0)
+        smoothed = lowess_calibration(y_true, y_prob)
     except Exception as e:
         logger.warning("LOWESS calibration smoothing failed (%s): %s", type(e).__name__, str(e))
 
@@ -288,38 +276,22 @@ def compute_calibration_metrics(
     # Intercept: fit logistic model with logit(p) as OFFSET (coefficient fixed at 1)
     # Slope: fit logistic regression with logit(p) as predictor
     # Slope = 1 means perfect calibration, <1 = overfitting, >1 = underfitting
+    # Both are fitted by Newton's method on the unpenalized likelihood
+    # (no regularization shrinkage), see recalibration_from_counts
     slope = 1.0
     intercept = 0.0
-    try:
-        # Clip probabilities to avoid log(0)
-        y_prob_clipped = np.clip(y_prob, PROB_CLIP_MIN, PROB_CLIP_MAX)
-        logit_p = np.log(y_prob_clipped / (1 - y_prob_clipped))
-
-        # Calibration INTERCEPT using statsmodels Logit with offset
-        # This is the Van Calster method: logit(Y) = α + offset(logit_p)
-        try:
-            int_model = Logit(y_true, np.ones_like(y_true), offset=logit_p).fit(disp=0)
-            intercept = float(int_model.params[0])
-        except (ValueError, np.linalg.LinAlgError) as e:
-            # Fallback to sklearn method if statsmodels fails
-            logger.warning(
-                "Statsmodels calibration intercept failed (%s): %s. Falling back to sklearn.",
-                type(e).__name__,
-                str(e),
-            )
-            lr_int = LogisticRegression(solver="lbfgs", C=1e12, max_iter=1000)
-            lr_int.fit(logit_p.reshape(-1, 1), y_true)
-            intercept = float(lr_int.intercept_[0])
-
-        # Calibration SLOPE via logistic recalibration model (free intercept + slope)
-        # This avoids regularization shrinkage in sklearn defaults.
-        slope_model = Logit(y_true, np.column_stack([np.ones_like(logit_p), logit_p])).fit(disp=0)
-        slope = float(slope_model.params[1])
-    except (ValueError, np.linalg.LinAlgError) as e:
+    fit = recalibration_from_counts(logit_scores(y_prob), y_true, np.ones(len(y_true)))
+    if np.isnan(fit.intercept):
+        logger.warning("Calibration intercept is undefined. Using default intercept=0.0")
+    else:
+        intercept = float(fit.intercept)
+    if np.isnan(fit.slope):
         logger.warning(
-            "Calibration slope computation failed: %s. Using default slope=1.0",
-            str(e),
+            "Calibration slope computation failed (one class, one score or separation). "
+            "Using default slope=1.0"
         )
+    else:
+        slope = float(fit.slope)
 
     # Calibration-in-the-large ratio
     # O:E ratio (Observed / Expected) per Van Calster et al.
@@ -330,18 +302,17 @@ def compute_calibration_metrics(
     eo_ratio = expected / observed if observed > 0 else float("inf")
 
     # ICI/ECI/E_max using smoothed curve when available (Van Calster)
-    error_pred = smoothed_pred if len(smoothed_pred) > 0 else prob_pred
-    error_true = smoothed_true if len(smoothed_true) > 0 else prob_true
-
     ici = 0.0
     eci = 0.0
     e_max = 0.0
-    if len(error_true) > 0:
-        ici = float(np.mean(np.abs(error_true - error_pred)))
-        eci_numer = np.mean((error_true - error_pred) ** 2)
-        eci_denom = np.mean((prevalence - error_pred) ** 2)
+    if smoothed is not None:
+        ici, eci, e_max = smoothed.ici, smoothed.eci, smoothed.e_max
+    elif len(prob_true) > 0:
+        ici = float(np.mean(np.abs(prob_true - prob_pred)))
+        eci_numer = np.mean((prob_true - prob_pred) ** 2)
+        eci_denom = np.mean((prevalence - prob_pred) ** 2)
         eci = float(eci_numer / eci_denom) if eci_denom > 0 else 0.0
-        e_max = float(np.max(np.abs(error_true - error_pred)))
+        e_max = float(np.max(np.abs(prob_true - prob_pred)))
 
     return cast(
         CalibrationMetrics,
@@ -360,12 +331,11 @@ def compute_calibration_metrics(
                 "prob_pred": prob_pred.tolist() if len(prob_pred) > 0 else [],
                 "n_bins": n_bins,
             },
-            "calibration_curve_smoothed": {
-                "prob_true": smoothed_true.tolist() if len(smoothed_true) > 0 else [],
-                "prob_pred": smoothed_pred.tolist() if len(smoothed_pred) > 0 else [],
-                "method": "lowess",
-                "frac": 0.75,
-            },
+            "calibration_curve_smoothed": (
+                smoothed.to_dict()
+                if smoothed is not None
+                else {"prob_true": [], "prob_pred": [], "method": "lowess", "frac": LOWESS_FRAC}
+            ),
             "interpretation": _interpret_calibration(slope, brier),
         },
     )
@@ -415,12 +385,63 @@ def compute_classification_at_threshold(
     # Confusion matrix
     tn, fp, fn, tp = confusion_matrix(y_true, y_pred, labels=[0, 1]).ravel()
 
+    result = _classification_metrics_from_counts(threshold, tp, fp, tn, fn)
+
+    # Bootstrap CI for key metrics using centralized bootstrap module
+    if bootstrap_ci and len(y_true) > 10:
+        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
+        # Use bootstrap_confusion_metrics for sens/spec/ppv CIs
+        ci_results = bootstrap_confusion_metrics(
+            y_true,
+            y_prob,
+            threshold=threshold,
+            n_bootstrap=n_bootstrap,
+            seed=seed,
+            stratified=False,  # Backward compatibility
+        )
+
+        if len(ci_results["sensitivity"]) > 10:
+            sens_ci_lower, sens_ci_upper = compute_percentile_ci(ci_results["sensitivity"])
+            spec_ci_lower, spec_ci_upper = compute_percentile_ci(ci_results["specificity"])
+            ppv_ci_lower, ppv_ci_upper = compute_percentile_ci(ci_results["ppv"])
+
+            if sens_ci_lower is not None:
+                result["sensitivity_ci_95"] = [sens_ci_lower, sens_ci_upper]
+            if spec_ci_lower is not None:
+                result["specificity_ci_95"] = [spec_ci_lower, spec_ci_upper]
+            if ppv_ci_lower is not None:
+                result["ppv_ci_95"] = [ppv_ci_lower, ppv_ci_upper]
+
+    return cast(ClassificationMetrics, result)
+
+
+def _classification_metrics_from_counts(
+    threshold: float,
+    tp: int,
+    fp: int,
+    tn: int,
+    fn: int,
+) -> dict[str, Any]:
+    """Derive threshold classification metrics from confusion counts.
+
+    Args:
+        threshold: Decision threshold the counts were taken at.
+        tp: True positives.
+        fp: False positives.
+        tn: True negatives.
+        fn: False negatives.
+
+    Returns:
+        Dict with sensitivity, specificity, PPV, NPV, F1, accuracy,
+        balanced_accuracy, youden_index, mcc, dor, kappa, pct_flagged, NNE
+        and the counts themselves.
+    """
     # Core metrics using safe_divide for consistency
     sensitivity = safe_divide(tp, tp + fn)
     specificity = safe_divide(tn, tn + fp)
     ppv = safe_divide(tp, tp + fp)
     npv = safe_divide(tn, tn + fn)
-    f1 = f1_score(y_true, y_pred, zero_division=0)
+    f1 = safe_divide(2 * tp, 2 * tp + fp + fn)
 
     # Additional Van Calster classification metrics
     n_total = tp + tn + fp + fn
@@ -430,7 +451,8 @@ def compute_classification_at_threshold(
 
     # Matthews Correlation Coefficient (MCC)
     # MCC = (TP*TN - FP*FN) / sqrt((TP+FP)(TP+FN)(TN+FP)(TN+FN))
-    mcc_denom = np.sqrt(float((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn)))
+    # Products taken in float to avoid int64 overflow on large cohorts
+    mcc_denom = np.sqrt(float(tp + fp) * float(tp + fn) * float(tn + fp) * float(tn + fn))
     mcc = (tp * tn - fp * fn) / mcc_denom if mcc_denom > 0 else 0.0
 
     # DOR (Diagnostic Odds Ratio) per Van Calster
@@ -442,7 +464,7 @@ def compute_classification_at_threshold(
 
     # Kappa (Cohen's Kappa) per Van Calster
     # Kappa = (Accuracy - Accuracy_expected) / (1 - Accuracy_expected)
-    prevalence = np.mean(y_true)
+    prevalence = safe_divide(tp + fn, n_total)
     acc_expected = (
         prevalence * ((tp + fp) / n_total) + (1 - prevalence) * ((fn + tn) / n_total)
         if n_total > 0
@@ -451,12 +473,12 @@ def compute_classification_at_threshold(
     kappa = (accuracy - acc_expected) / (1 - acc_expected) if acc_expected < 1 else 0.0
 
     # Percentage flagged
-    pct_flagged = (tp + fp) / len(y_true) * 100 if len(y_true) > 0 else 0.0
+    pct_flagged = (tp + fp) / n_total * 100 if n_total > 0 else 0.0
 
     # Number Needed to Evaluate (NNE)
     nne = 1 / ppv if ppv > 0 else float("inf")
 
-    result: dict[str, Any] = {
+    return {
         "threshold": threshold,
         "sensitivity": float(sensitivity),
         "specificity": float(specificity),
@@ -478,38 +500,12 @@ def compute_classification_at_threshold(
         "fn": int(fn),
     }
 
-    # Bootstrap CI for key metrics using centralized bootstrap module
-    if bootstrap_ci and len(y_true) > 10:
-        seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
-        # Use bootstrap_confusion_metrics for sens/spec/ppv CIs
-        ci_results = bootstrap_confusion_metrics(
-            y_true,
-            y_prob,
-            threshold=threshold,
-            n_bootstrap=n_bootstrap,
-            seed=seed,
-            stratified=False,  # Backward compatibility
-        )
-
-        if len(ci_results["sensitivity"]) > 10:
-            sens_ci_lower, sens_ci_upper = compute_percentile_ci(ci_results["sensitivity"])
-            spec_ci_lower, spec_ci_upper = compute_percentile_ci(ci_results["specificity"])
-            ppv_ci_lower, ppv_ci_upper = compute_percentile_ci(ci_results["ppv"])
-
-            if sens_ci_lower is not None:
-                result["sensitivity_ci_95"] = [sens_ci_lower, sens_ci_upper]
-            if spec_ci_lower is not None:
-                result["specificity_ci_95"] = [spec_ci_lower, spec_ci_upper]
-            if ppv_ci_lower is not None:
-                result["ppv_ci_95"] = [ppv_ci_lower, ppv_ci_upper]
-
-    return cast(ClassificationMetrics, result)
-
 
 def compute_threshold_analysis(
     y_true: np.ndarray,
     y_prob: np.ndarray,
     thresholds: list[float],
+    index: ThresholdIndex | None = None,
 ) -> dict[str, Any]:
     """Compute metrics across multiple thresholds.
 
@@ -517,14 +513,20 @@ def compute_threshold_analysis(
         y_true: True binary labels.
         y_prob: Predicted probabilities.
         thresholds: List of thresholds to evaluate.
+        index: Prebuilt ThresholdIndex for (y_true, y_prob); built here
+            when not supplied.
 
     Returns:
         Dict with metrics at each threshold.
     """
+    if index is None:
+        index = ThresholdIndex(y_true, y_prob)
+
     results: dict[str, Any] = {"thresholds": [], "metrics": []}
 
-    for thresh in thresholds:
-        metrics = compute_classification_at_threshold(y_true, y_prob, thresh, bootstrap_ci=False)
+    tp, fp, tn, fn = index.counts(thresholds)
+    for i, thresh in enumerate(thresholds):
+        metrics = _classification_metrics_from_counts(thresh, tp[i], fp[i], tn[i], fn[i])
         results["thresholds"].append(thresh)
         results["metrics"].append(metrics)
 
@@ -550,6 +552,7 @@ def compute_decision_curve_analysis(
     y_true: np.ndarray,
     y_prob: np.ndarray,
     thresholds: np.ndarray | None = None,
+    index: ThresholdIndex | None = None,
 ) -> dict[str, Any]:
     """Compute Decision Curve Analysis for clinical utility.
 
@@ -560,53 +563,40 @@ def compute_decision_curve_analysis(
         y_true: True binary labels.
         y_prob: Predicted probabilities.
         thresholds: Array of threshold probabilities to evaluate.
+        index: Prebuilt ThresholdIndex for (y_true, y_prob); built here
+            when not supplied.
 
     Returns:
         Dict with DCA net benefit curves.
     """
     if thresholds is None:
         thresholds = np.linspace(0.01, 0.99, 99)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
 
-    n = len(y_true)
-    prevalence = np.mean(y_true)
-
-    # Net benefit for model
-    net_benefit_model = []
-    for t in thresholds:
-        y_pred = (y_prob >= t).astype(int)
-        tp = np.sum((y_pred == 1) & (y_true == 1))
-        fp = np.sum((y_pred == 1) & (y_true == 0))
+    if index is None:
+        index = ThresholdIndex(y_true, y_prob)
 
-        # Net benefit = TP/n - FP/n * (threshold / (1 - threshold))
-        nb = tp / n - fp / n * (t / (1 - t)) if t < 1 else 0
-        net_benefit_model.append(nb)
-
-    # Net benefit for treat all
-    net_benefit_all = []
-    for t in thresholds:
-        nb = prevalence - (1 - prevalence) * (t / (1 - t)) if t < 1 else 0
-        net_benefit_all.append(nb)
+    # Net benefit = TP/n - FP/n * (threshold / (1 - threshold)), for model and treat all
+    nb_model = index.net_benefit(thresholds)
+    nb_all = index.net_benefit_treat_all(thresholds)
 
     # Net benefit for treat none is always 0
     net_benefit_none = [0.0] * len(thresholds)
 
     # Find useful range (where model > treat all and > treat none)
-    useful_range = []
-    for i, t in enumerate(thresholds):
-        if net_benefit_model[i] > max(net_benefit_all[i], 0):
-            useful_range.append(t)
+    useful_range = thresholds[nb_model > np.maximum(nb_all, 0)].tolist()
 
     return {
         "thresholds": thresholds.tolist(),
-        "net_benefit_model": net_benefit_model,
-        "net_benefit_all": net_benefit_all,
+        "net_benefit_model": nb_model.tolist(),
+        "net_benefit_all": nb_all.tolist(),
         "net_benefit_none": net_benefit_none,
         "useful_range": useful_range,
         "useful_range_summary": {
             "min": float(min(useful_range)) if useful_range else None,
             "max": float(max(useful_range)) if useful_range else None,
         },
-        "prevalence": float(prevalence),
+        "prevalence": float(index.prevalence),
     }
 
 
@@ -668,27 +658,34 @@ def compute_subgroup_performance(
     """
     results: dict[str, Any] = {"groups": {}, "reference": reference}
 
-    groups = df[group_col].drop_nulls().unique().sort().to_list()
+    aggregates = {
+        row[group_col]: row
+        for row in compute_group_aggregates(
+            df, group_col, y_true_col=y_true_col, y_prob_col=y_prob_col, threshold=threshold
+        )[group_col].iter_rows(named=True)
+    }
 
     # Determine reference if not specified
     if reference is None:
         # Use largest group
-        group_counts = df.group_by(group_col).len().sort("len", descending=True)
-        reference = group_counts[group_col][0]
+        reference = max(aggregates, key=lambda g: aggregates[g]["n"]) if aggregates else None
         results["reference"] = reference
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    group_rows = group_row_indices(df, group_col)
+    y_true_all = df[y_true_col].to_numpy()
+    y_prob_all = df[y_prob_col].to_numpy()
 
-        if len(y_true) < 10:
+    for group, agg in aggregates.items():
+        if agg["n"] < 10:
             results["groups"][str(group)] = {
-                "n": len(y_true),
+                "n": agg["n"],
                 "error": "Insufficient sample size (n < 10)",
             }
             continue
 
+        y_true = y_true_all[group_rows[group]]
+        y_prob = y_prob_all[group_rows[group]]
+
         # Discrimination
         try:
             auroc = roc_auc_score(y_true, y_prob)
@@ -698,52 +695,41 @@ def compute_subgroup_performance(
             auroc = None
             auprc = None
 
-        # Classification at threshold
-        y_pred = (y_prob >= threshold).astype(int)
-        try:
-            tn, fp, fn, tp = confusion_matrix(y_true, y_pred, labels=[0, 1]).ravel()
-            tpr = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-            fpr = fp / (fp + tn) if (fp + tn) > 0 else 0.0
-            ppv = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-            npv = tn / (tn + fn) if (tn + fn) > 0 else 0.0
-        except ValueError:
-            tpr = fpr = ppv = npv = None
+        # Classification at threshold (from the grouped confusion counts)
+        tp, fp, tn, fn = agg["tp"], agg["fp"], agg["tn"], agg["fn"]
+        tpr = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+        fpr = fp / (fp + tn) if (fp + tn) > 0 else 0.0
+        ppv = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+        npv = tn / (tn + fn) if (tn + fn) > 0 else 0.0
 
         # Calibration
         brier = brier_score_loss(y_true, y_prob) if len(y_true) > 0 else None
 
         results["groups"][str(group)] = {
             "n": len(y_true),
-            "prevalence": float(np.mean(y_true)),
+            "prevalence": float(agg["prevalence"]),
             "auroc": float(auroc) if auroc is not None else None,
             "auprc": float(auprc) if auprc is not None else None,
             "brier_score": float(brier) if brier is not None else None,
-            "tpr": float(tpr) if tpr is not None else None,
-            "fpr": float(fpr) if fpr is not None else None,
-            "ppv": float(ppv) if ppv is not None else None,
-            "npv": float(npv) if npv is not None else None,
+            "tpr": float(tpr),
+            "fpr": float(fpr),
+            "ppv": float(ppv),
+            "npv": float(npv),
             "is_reference": str(group) == str(reference),
         }
 
         # Bootstrap CI for AUROC if requested
         if bootstrap_ci and auroc is not None and len(y_true) >= 20:
-            auroc_samples = []
             seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
-            rng = np.random.default_rng(seed)
-            n = len(y_true)
-
-            for _ in range(n_bootstrap):
-                idx = rng.choice(n, size=n, replace=True)
-                y_true_boot = y_true[idx]
-                y_prob_boot = y_prob[idx]
-
-                if len(np.unique(y_true_boot)) < 2:
-                    continue
-
-                try:
-                    auroc_samples.append(roc_auc_score(y_true_boot, y_prob_boot))
-                except ValueError:
-                    continue
+            ranking_samples, _ = bootstrap_ranking_metrics(
+                y_true,
+                y_prob,
+                n_bootstrap=n_bootstrap,
+                seed=seed,
+                stratified=False,
+                metrics=("auroc",),
+            )
+            auroc_samples = ranking_samples["auroc"]
 
             if len(auroc_samples) > 10:
                 auroc_ci = np.percentile(auroc_samples, [2.5, 97.5])
@@ -15,12 +15,15 @@ import numpy as np
 import polars as pl
 from sklearn.metrics import roc_auc_score
 
-from faircareai.core.constants import DEFAULT_BOOTSTRAP_SEED
-from faircareai.core.metrics import compute_confusion_metrics
+from faircareai.core.calibration import RecalibrationFit, group_recalibration
+from faircareai.core.constants import AUROC_CI_METHODS, DEFAULT_BOOTSTRAP_SEED
+from faircareai.core.metrics import compute_confusion_metrics, compute_group_aggregates
+from faircareai.core.prepared import EncodedAttribute, PreparedAuditData
+from faircareai.core.statistics import AurocDifference, ci_delong_auroc
+from faircareai.core.validation import safe_divide
 from faircareai.metrics.group_utils import (
     determine_reference_group,
-    filter_to_group,
-    get_unique_groups,
+    group_arrays,
 )
 
 
@@ -34,6 +37,10 @@ def compute_subgroup_metrics(
     bootstrap_ci: bool = True,
     n_bootstrap: int = 500,
     random_seed: int | None = DEFAULT_BOOTSTRAP_SEED,
+    group_aggregates: pl.DataFrame | None = None,
+    prepared: PreparedAuditData | None = None,
+    bootstrap_tolerance: float | None = None,
+    ci_method: str = "bootstrap",
 ) -> dict[str, Any]:
     """Compute comprehensive metrics for each subgroup.
 
@@ -47,31 +54,71 @@ def compute_subgroup_metrics(
         bootstrap_ci: Whether to compute bootstrap CI.
         n_bootstrap: Number of bootstrap iterations.
         random_seed: Random seed for bootstrap resampling.
+        group_aggregates: Precomputed per-group counts for ``group_col`` from
+            compute_group_aggregates at the same threshold. Computed here
+            when not supplied.
+        prepared: Encoded audit data shared across stages. When given, group
+            counts, group rows and score/label arrays are read from it.
+        bootstrap_tolerance: Opt-in sequential AUROC bootstrap: stop once the
+            Monte Carlo error of both CI endpoints is within this tolerance.
+            The draws taken are recorded as ``auroc_ci_draws``.
+        ci_method: AUROC CI method, "bootstrap" or "delong". DeLong CIs
+            come from the analytic variance (one sort per group, no
+            resampling) and add ``auroc_se`` per group and a CI and p-value
+            of each group's AUROC difference from the reference.
 
     Returns:
         Dict with per-subgroup performance and fairness metrics.
+
+    Raises:
+        ValueError: If ci_method is not one of AUROC_CI_METHODS.
     """
+    if ci_method not in AUROC_CI_METHODS:
+        raise ValueError(f"ci_method must be one of {AUROC_CI_METHODS}, got {ci_method!r}")
     results: dict[str, Any] = {
         "attribute": group_col,
         "threshold": threshold,
         "groups": {},
     }
 
-    groups = get_unique_groups(df, group_col)
+    if group_aggregates is None and prepared is not None and group_col in prepared.attributes:
+        group_aggregates = prepared.group_aggregates(threshold)[group_col]
+    if group_aggregates is None:
+        group_aggregates = compute_group_aggregates(
+            df, group_col, y_true_col=y_true_col, y_prob_col=y_prob_col, threshold=threshold
+        )[group_col]
+
+    aggregates = {row[group_col]: row for row in group_aggregates.iter_rows(named=True)}
+    groups = list(aggregates)
 
     # Determine reference group
-    reference = determine_reference_group(groups, df, group_col, reference)
+    reference = determine_reference_group(
+        groups,
+        df,
+        group_col,
+        reference,
+        group_sizes={g: row["n"] for g, row in aggregates.items()},
+    )
 
     results["reference"] = reference
 
-    # Compute metrics for each group
-    for group in groups:
-        group_df = filter_to_group(df, group_col, group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
-        y_pred = (y_prob >= threshold).astype(int)
+    # Row positions per group for the rank-based metrics (one grouped pass)
+    y_true_all, y_prob_all, group_rows = group_arrays(
+        df, y_true_col, y_prob_col, group_col, prepared
+    )
 
-        n = len(y_true)
+    # Calibration intercept and slope of every group in one batched fit
+    fitted = [group for group, agg in aggregates.items() if agg["n"] >= 10]
+    recalibration: dict[Any, dict[str, Any]] = {}
+    if fitted:
+        fit = group_recalibration(y_true_all, y_prob_all, [group_rows[group] for group in fitted])
+        recalibration = {
+            group: _recalibration_metrics(fit, (0, i)) for i, group in enumerate(fitted)
+        }
+
+    # Compute metrics for each group
+    for group, agg in aggregates.items():
+        n = agg["n"]
 
         # Basic info
         group_result: dict[str, Any] = {
@@ -86,45 +133,51 @@ def compute_subgroup_metrics(
             continue
 
         # Prevalence
-        prevalence = np.mean(y_true)
-        group_result["prevalence"] = float(prevalence)
-
-        # Classification metrics from confusion matrix
-        try:
-            cm = compute_confusion_metrics(y_true, y_pred, fairness_naming=True)
-        except ValueError:
-            group_result["error"] = "Could not compute metrics"
-            results["groups"][str(group)] = group_result
-            continue
+        group_result["prevalence"] = float(agg["prevalence"])
 
+        # Classification metrics from the grouped confusion counts
+        tp, fp, tn, fn = agg["tp"], agg["fp"], agg["tn"], agg["fn"]
         group_result.update(
             {
-                "tpr": float(cm["tpr"]),
-                "fpr": float(cm["fpr"]),
-                "ppv": float(cm["ppv"]),
-                "npv": float(cm["npv"]),
-                "selection_rate": float(cm["selection_rate"]),
-                "tp": cm["tp"],
-                "fp": cm["fp"],
-                "tn": cm["tn"],
-                "fn": cm["fn"],
+                "tpr": float(safe_divide(tp, tp + fn)),
+                "fpr": float(safe_divide(fp, fp + tn)),
+                "ppv": float(safe_divide(tp, tp + fp)),
+                "npv": float(safe_divide(tn, tn + fn)),
+                "selection_rate": float(safe_divide(tp + fp, n)),
+                "tp": tp,
+                "fp": fp,
+                "tn": tn,
+                "fn": fn,
             }
         )
 
+        y_true = y_true_all[group_rows[group]]
+        y_prob = y_prob_all[group_rows[group]]
+
         # AUROC
         if len(np.unique(y_true)) >= 2:
             auroc = roc_auc_score(y_true, y_prob)
             group_result["auroc"] = float(auroc)
 
+            if bootstrap_ci and n >= 20 and ci_method == "delong":
+                _, auroc_se, auroc_ci_lower, auroc_ci_upper = ci_delong_auroc(y_true, y_prob)
+                group_result["auroc_se"] = auroc_se
+                group_result["auroc_ci_95"] = [auroc_ci_lower, auroc_ci_upper]
             # Bootstrap CI for AUROC
-            if bootstrap_ci and n >= 20:
-                auroc_samples = _bootstrap_auroc(y_true, y_prob, n_bootstrap, random_seed)
+            elif bootstrap_ci and n >= 20:
+                auroc_samples, n_draws = _bootstrap_auroc(
+                    y_true, y_prob, n_bootstrap, random_seed, bootstrap_tolerance
+                )
                 if len(auroc_samples) > 10:
                     auroc_ci = np.percentile(auroc_samples, [2.5, 97.5])
                     group_result["auroc_ci_95"] = [float(auroc_ci[0]), float(auroc_ci[1])]
+                    group_result["auroc_ci_draws"] = n_draws
+
+        # Calibration intercept and slope with Wald CIs
+        group_result.update(recalibration[group])
 
         # Mean prediction
-        group_result["mean_predicted_prob"] = float(np.mean(y_prob))
+        group_result["mean_predicted_prob"] = float(agg["mean_predicted_prob"])
 
         results["groups"][str(group)] = group_result
 
@@ -139,24 +192,48 @@ def _bootstrap_auroc(
     y_prob: np.ndarray,
     n_bootstrap: int,
     random_seed: int | None = None,
-) -> list[float]:
-    """Bootstrap AUROC samples.
+    tolerance: float | None = None,
+) -> tuple[list[float], int]:
+    """Bootstrap AUROC samples and the number of draws taken.
 
-    Note: This is a thin wrapper around faircareai.core.bootstrap.bootstrap_auroc
-    for backward compatibility.
+    Note: This is a thin wrapper around
+    faircareai.core.bootstrap.bootstrap_ranking_metrics for backward compatibility.
     """
-    from faircareai.core.bootstrap import bootstrap_metric
+    from faircareai.core.bootstrap import bootstrap_ranking_metrics
 
     seed = DEFAULT_BOOTSTRAP_SEED if random_seed is None else random_seed
-    samples, _ = bootstrap_metric(
+    samples, n_failed = bootstrap_ranking_metrics(
         y_true,
         y_prob,
-        lambda yt, yp: roc_auc_score(yt, yp),
         n_bootstrap=n_bootstrap,
         seed=seed,
-        min_classes=2,
+        metrics=("auroc",),
+        tolerance=tolerance,
     )
-    return samples
+    return samples["auroc"], len(samples["auroc"]) + n_failed
+
+
+def _recalibration_metrics(fit: RecalibrationFit, index: tuple[int, ...] = ()) -> dict[str, Any]:
+    """Calibration intercept and slope of one fit, with 95% Wald CIs.
+
+    Args:
+        fit: Batch of recalibration fits.
+        index: Position of the fit in the batch's arrays.
+
+    Returns:
+        Dict with calibration_intercept and calibration_slope (None where
+        undefined) and their ``_ci_95`` bounds.
+    """
+    result: dict[str, Any] = {}
+    for name in ("intercept", "slope"):
+        estimate = getattr(fit, name)[index]
+        if np.isnan(estimate):
+            result[f"calibration_{name}"] = None
+            continue
+        lower, upper = fit.wald_ci(name)
+        result[f"calibration_{name}"] = float(estimate)
+        result[f"calibration_{name}_ci_95"] = [float(lower[index]), float(upper[index])]
+    return result
 
 
 def _compute_subgroup_disparities(
@@ -210,6 +287,13 @@ def _compute_subgroup_disparities(
         auroc = group_data.get("auroc")
         if auroc is not None and ref_auroc is not None:
             group_disp["auroc_diff"] = float(auroc - ref_auroc)
+            # DeLong variances of independent groups add
+            if "auroc_se" in group_data and "auroc_se" in ref_data:
+                test = AurocDifference.from_variance(
+                    auroc - ref_auroc, group_data["auroc_se"] ** 2 + ref_data["auroc_se"] ** 2
+                )
+                group_disp["auroc_diff_ci_95"] = [test.ci_lower, test.ci_upper]
+                group_disp["auroc_diff_p_value"] = test.p_value
 
         disparities[str(group_name)] = group_disp
 
@@ -225,6 +309,7 @@ def compute_intersectional(
     min_n: int = 30,
     bootstrap_ci: bool = False,
     n_bootstrap: int = 500,
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute metrics for intersectional subgroups.
 
@@ -237,6 +322,9 @@ def compute_intersectional(
         min_n: Minimum sample size for reporting.
         bootstrap_ci: Whether to compute bootstrap CI.
         n_bootstrap: Number of bootstrap iterations.
+        prepared: Encoded audit data shared across stages. When it encodes
+            every column in ``group_cols``, intersections are built from the
+            attribute codes instead of concatenated strings.
 
     Returns:
         Dict with intersectional analysis results.
@@ -248,34 +336,32 @@ def compute_intersectional(
         "intersections": {},
     }
 
-    # Create intersection column
-    df = df.with_columns(
-        pl.concat_str([pl.col(c).cast(str) for c in group_cols], separator=" x ").alias(
-            "_intersection"
-        )
-    )
+    if prepared is not None and all(col in prepared.attributes for col in group_cols):
+        encoded = prepared.intersection(group_cols)
+        y_true_all, y_prob_all = prepared.y_true, prepared.y_prob
+    else:
+        keys = df.select(
+            pl.concat_str([pl.col(c).cast(str) for c in group_cols], separator=" x ").alias(
+                "_intersection"
+            )
+        )["_intersection"]
+        encoded = EncodedAttribute.from_series(keys)
+        y_true_all = df[y_true_col].to_numpy()
+        y_prob_all = df[y_prob_col].to_numpy()
 
-    # Get unique intersections
-    intersections = (
-        df.group_by("_intersection")
-        .agg(
-            pl.len().alias("n"),
-            pl.col(y_true_col).sum().alias("n_positive"),
-        )
-        .filter(pl.col("n") >= min_n)
-        .sort("n", descending=True)
-    )
+    # Intersections with at least min_n rows, largest first (a null in any
+    # attribute leaves the row out)
+    sizes = encoded.group_sizes()
+    intersections = sorted((g for g, n in sizes.items() if n >= min_n), key=lambda g: -sizes[g])
+    intersection_rows = encoded.group_rows()
 
     # Track overall best and worst
     best_auroc: dict[str, str | float | None] = {"group": None, "value": 0.0}
     worst_auroc: dict[str, str | float | None] = {"group": None, "value": 1.0}
 
-    for row in intersections.iter_rows(named=True):
-        intersection_name = row["_intersection"]
-        intersection_df = df.filter(pl.col("_intersection") == intersection_name)
-
-        y_true = intersection_df[y_true_col].to_numpy()
-        y_prob = intersection_df[y_prob_col].to_numpy()
+    for intersection_name in intersections:
+        y_true = y_true_all[intersection_rows[intersection_name]]
+        y_prob = y_prob_all[intersection_rows[intersection_name]]
         y_pred = (y_prob >= threshold).astype(int)
 
         n = len(y_true)
@@ -314,7 +400,7 @@ def compute_intersectional(
 
                 # Bootstrap CI
                 if bootstrap_ci and n >= 20:
-                    auroc_samples = _bootstrap_auroc(y_true, y_prob, n_bootstrap)
+                    auroc_samples, _ = _bootstrap_auroc(y_true, y_prob, n_bootstrap)
                     if len(auroc_samples) > 10:
                         auroc_ci = np.percentile(auroc_samples, [2.5, 97.5])
                         group_result["auroc_ci_95"] = [
@@ -44,20 +44,26 @@ import numpy as np
 import polars as pl
 from scipy import stats
 from sklearn.calibration import calibration_curve
-from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import brier_score_loss, roc_auc_score
-from statsmodels.api import Logit
 
+from faircareai.core.calibration import (
+    logit_scores,
+    lowess_calibration,
+    recalibration_from_counts,
+)
 from faircareai.core.constants import (
     DEFAULT_BOOTSTRAP_SEED,
     DEFAULT_N_BOOTSTRAP,
+    LOWESS_FRAC,
     MIN_BOOTSTRAP_SAMPLES,
     MIN_SAMPLE_SIZE_CALIBRATION,
     MIN_SAMPLE_SIZE_FLAG,
-    PROB_CLIP_MAX,
-    PROB_CLIP_MIN,
 )
 from faircareai.core.logging import get_logger
+from faircareai.core.parallel import run_tasks
+from faircareai.core.prepared import PreparedAuditData
+from faircareai.core.thresholds import ThresholdIndex
+from faircareai.metrics.group_utils import group_arrays
 
 logger = get_logger(__name__)
 
@@ -78,6 +84,8 @@ def compute_vancalster_metrics(
     n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
     calibration_bins: int = CALIBRATION_BINS_DEFAULT,
     net_benefit_thresholds: np.ndarray | None = None,
+    prepared: PreparedAuditData | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     """Compute all Van Calster recommended metrics overall and by subgroup.
 
@@ -99,6 +107,11 @@ def compute_vancalster_metrics(
         n_bootstrap: Number of bootstrap iterations.
         calibration_bins: Number of bins for calibration curve.
         net_benefit_thresholds: Thresholds for decision curve analysis.
+        prepared: Encoded audit data; arrays and group rows are read from it
+            instead of ``df`` when given.
+        workers: Processes for the overall and per-subgroup computations
+            (see faircareai.core.parallel.run_tasks). Each uses the fixed
+            bootstrap seed, so results do not depend on it.
 
     Returns:
         Dict containing:
@@ -129,51 +142,46 @@ def compute_vancalster_metrics(
         net_benefit_thresholds = NET_BENEFIT_THRESHOLDS_DEFAULT
 
     # Get overall arrays
-    y_true = df[y_true_col].to_numpy()
-    y_prob = df[y_prob_col].to_numpy()
+    if prepared is not None:
+        y_true, y_prob = prepared.y_true, prepared.y_prob
+    else:
+        y_true = df[y_true_col].to_numpy()
+        y_prob = df[y_prob_col].to_numpy()
+
+    settings: dict[str, Any] = {
+        "threshold": threshold,
+        "bootstrap_ci": bootstrap_ci,
+        "n_bootstrap": n_bootstrap,
+        "calibration_bins": calibration_bins,
+        "net_benefit_thresholds": net_benefit_thresholds,
+    }
+
+    # Overall and each subgroup are independent units
+    tasks = [{"y_true": y_true, "y_prob": y_prob, "label": "Overall", **settings}]
+    group_rows: dict[Any, np.ndarray] = {}
+    if group_col is not None:
+        y_true, y_prob, group_rows = group_arrays(df, y_true_col, y_prob_col, group_col, prepared)
+        tasks += [
+            {"y_true": y_true[rows], "y_prob": y_prob[rows], "label": str(group), **settings}
+            for group, rows in group_rows.items()
+        ]
+    outputs = run_tasks(_compute_vancalster_task, tasks, workers=workers)
 
     # === OVERALL METRICS ===
-    results["overall"] = _compute_vancalster_single(
-        y_true=y_true,
-        y_prob=y_prob,
-        threshold=threshold,
-        bootstrap_ci=bootstrap_ci,
-        n_bootstrap=n_bootstrap,
-        calibration_bins=calibration_bins,
-        net_benefit_thresholds=net_benefit_thresholds,
-        label="Overall",
-    )
+    results["overall"] = outputs[0]
 
     # === BY SUBGROUP METRICS ===
     if group_col is not None:
         results["by_subgroup"] = {}
         results["disparities"] = {}
 
-        groups = df[group_col].drop_nulls().unique().sort().to_list()
-
         # Determine reference group (largest by default)
         if reference is None:
-            group_counts = df.group_by(group_col).len().sort("len", descending=True)
-            reference = group_counts[group_col][0]
+            reference = max(group_rows, key=lambda g: len(group_rows[g])) if group_rows else None
 
         results["reference_group"] = reference
 
-        # Compute metrics for each subgroup
-        for group in groups:
-            group_df = df.filter(pl.col(group_col) == group)
-            y_true_g = group_df[y_true_col].to_numpy()
-            y_prob_g = group_df[y_prob_col].to_numpy()
-
-            group_metrics = _compute_vancalster_single(
-                y_true=y_true_g,
-                y_prob=y_prob_g,
-                threshold=threshold,
-                bootstrap_ci=bootstrap_ci,
-                n_bootstrap=n_bootstrap,
-                calibration_bins=calibration_bins,
-                net_benefit_thresholds=net_benefit_thresholds,
-                label=str(group),
-            )
+        for group, group_metrics in zip(group_rows, outputs[1:], strict=True):
             group_metrics["is_reference"] = str(group) == str(reference)
             results["by_subgroup"][str(group)] = group_metrics
 
@@ -188,6 +196,11 @@ def compute_vancalster_metrics(
     return results
 
 
+def _compute_vancalster_task(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Picklable run_tasks entry point for _compute_vancalster_single."""
+    return _compute_vancalster_single(**kwargs)
+
+
 def _compute_vancalster_single(
     y_true: np.ndarray,
     y_prob: np.ndarray,
@@ -334,35 +347,14 @@ def _compute_calibration_metrics(
 
     # Calibration intercept and slope per Van Calster et al. methodology
     # Intercept: fit logistic model with logit(p) as OFFSET (coefficient fixed at 1)
-    # Slope: fit logistic regression with logit(p) as predictor
-    try:
-        y_prob_clipped = np.clip(y_prob, PROB_CLIP_MIN, PROB_CLIP_MAX)
-        logit_p = np.log(y_prob_clipped / (1 - y_prob_clipped))
-
-        # Calibration INTERCEPT using statsmodels Logit with offset
-        # This is the Van Calster method: logit(Y) = α + offset(logit_p)
-        try:
-            int_model = Logit(y_true, np.ones_like(y_true), offset=logit_p).fit(disp=0)
-            result["calibration_intercept"] = float(int_model.params[0])
-        except (ValueError, np.linalg.LinAlgError) as e:
-            # Fallback to sklearn method if statsmodels fails
-            logger.warning(
-                "Statsmodels calibration intercept failed (%s): %s. Falling back to sklearn.",
-                type(e).__name__,
-                str(e),
-            )
-            lr_int = LogisticRegression(solver="lbfgs", max_iter=1000)
-            lr_int.fit(logit_p.reshape(-1, 1), y_true)
-            result["calibration_intercept"] = float(lr_int.intercept_[0])
-
-        # Calibration SLOPE using sklearn LogisticRegression
-        lr_slope = LogisticRegression(solver="lbfgs", max_iter=1000)
-        lr_slope.fit(logit_p.reshape(-1, 1), y_true)
-        result["calibration_slope"] = float(lr_slope.coef_[0, 0])
-    except (ValueError, np.linalg.LinAlgError) as e:
-        logger.warning("Calibration slope computation failed (%s): %s", type(e).__name__, str(e))
-        result["calibration_intercept"] = None
-        result["calibration_slope"] = None
+    # Slope: fit logistic regression with logit(p) as predictor (unpenalized)
+    fit = recalibration_from_counts(logit_scores(y_prob), y_true, np.ones(len(y_true)))
+    if np.isnan(fit.intercept) or np.isnan(fit.slope):
+        logger.warning(
+            "Calibration intercept or slope is undefined (one class, one score or separation)"
+        )
+    result["calibration_intercept"] = None if np.isnan(fit.intercept) else float(fit.intercept)
+    result["calibration_slope"] = None if np.isnan(fit.slope) else float(fit.slope)
 
     # Calibration curve data (for plotting)
     try:
@@ -373,37 +365,32 @@ def _compute_calibration_metrics(
             "n_bins": n_bins,
         }
 
-        # Smoothed calibration curve using LOWESS (Van Calster reference)
-        smoothed_pred = np.array([])
-        smoothed_true = np.array([])
+        # Smoothed calibration curve using LOWESS (Van Calster reference),
+        # evaluated on a fixed grid of predicted risks
+        smoothed = None
         try:
-            from statsmodels.nonparametric.smoothers_lowess import lowess
-
-            order = np.argsort(y_prob)
-            prob_sorted = y_prob[order]
-            y_sorted = y_true[order]
-            lowess_result = lowess(y_sorted, prob_sorted, frac=0.75, it=0, return_sorted=True)
-            smoothed_pred = lowess_result[:, 0]
-            smoothed_true = np.clip(lowess_result[:, 1], 0.0, 1.0)
+            smoothed = lowess_calibration(y_true, y_prob)
         except Exception as e:
             logger.warning("LOWESS calibration smoothing failed (%s): %s", type(e).__name__, str(e))
 
-        result["calibration_curve_smoothed"] = {
-            "prob_true": smoothed_true.tolist() if len(smoothed_true) > 0 else [],
-            "prob_pred": smoothed_pred.tolist() if len(smoothed_pred) > 0 else [],
-            "method": "lowess",
-            "frac": 0.75,
-        }
-
-        # ICI/ECI/E_max using smoothed curve when available
-        error_pred = smoothed_pred if len(smoothed_pred) > 0 else prob_pred
-        error_true = smoothed_true if len(smoothed_true) > 0 else prob_true
-
-        result["ici"] = float(np.mean(np.abs(error_true - error_pred)))
-        eci_numer = np.mean((error_true - error_pred) ** 2)
-        eci_denom = np.mean((prevalence - error_pred) ** 2)
-        result["eci"] = float(eci_numer / eci_denom) if eci_denom > 0 else 0.0
-        result["e_max"] = float(np.max(np.abs(error_true - error_pred)))
+        if smoothed is not None:
+            result["calibration_curve_smoothed"] = smoothed.to_dict()
+            result["ici"] = smoothed.ici
+            result["eci"] = smoothed.eci
+            result["e_max"] = smoothed.e_max
+        else:
+            result["calibration_curve_smoothed"] = {
+                "prob_true": [],
+                "prob_pred": [],
+                "method": "lowess",
+                "frac": LOWESS_FRAC,
+            }
+            # ICI/ECI/E_max from the binned curve
+            result["ici"] = float(np.mean(np.abs(prob_true - prob_pred)))
+            eci_numer = np.mean((prob_true - prob_pred) ** 2)
+            eci_denom = np.mean((prevalence - prob_pred) ** 2)
+            result["eci"] = float(eci_numer / eci_denom) if eci_denom > 0 else 0.0
+            result["e_max"] = float(np.max(np.abs(prob_true - prob_pred)))
     except ValueError as e:
         logger.warning("Calibration curve failed: %s", str(e))
         result["calibration_curve"] = None
@@ -444,18 +431,11 @@ def _compute_net_benefit_metrics(
         Dict with net benefit at threshold and decision curve data.
     """
     result: dict[str, Any] = {}
-    n = len(y_true)
-    prevalence = np.mean(y_true)
+    index = ThresholdIndex(y_true, y_prob)
+    prevalence = index.prevalence
 
     # Net benefit at primary threshold
-    y_pred = (y_prob >= threshold).astype(int)
-    tp = np.sum((y_pred == 1) & (y_true == 1))
-    fp = np.sum((y_pred == 1) & (y_true == 0))
-
-    if threshold < 1:
-        nb = tp / n - fp / n * (threshold / (1 - threshold))
-    else:
-        nb = 0.0
+    nb = index.net_benefit(threshold)[0]
 
     result["net_benefit"] = float(nb)
     result["net_benefit_max"] = float(prevalence)  # Max possible NB
@@ -466,34 +446,20 @@ def _compute_net_benefit_metrics(
     else:
         result["standardized_net_benefit"] = None
 
-    # Decision curve analysis across thresholds
-    nb_model = []
-    nb_all = []
-    nb_none = []
-
-    for t in thresholds:
-        y_pred_t = (y_prob >= t).astype(int)
-        tp_t = np.sum((y_pred_t == 1) & (y_true == 1))
-        fp_t = np.sum((y_pred_t == 1) & (y_true == 0))
-
-        if t < 1:
-            nb_model.append(float(tp_t / n - fp_t / n * (t / (1 - t))))
-            nb_all.append(float(prevalence - (1 - prevalence) * (t / (1 - t))))
-        else:
-            nb_model.append(0.0)
-            nb_all.append(0.0)
-
-        nb_none.append(0.0)
+    # Decision curve analysis across thresholds (one sorted index, no per-threshold scans)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    nb_model = index.net_benefit(thresholds)
+    nb_all = index.net_benefit_treat_all(thresholds)
 
     result["decision_curve"] = {
         "thresholds": thresholds.tolist(),
-        "net_benefit_model": nb_model,
-        "net_benefit_all": nb_all,
-        "net_benefit_none": nb_none,
+        "net_benefit_model": nb_model.tolist(),
+        "net_benefit_all": nb_all.tolist(),
+        "net_benefit_none": [0.0] * len(thresholds),
     }
 
     # Find useful range where model > treat all and > treat none
-    useful_range = [float(t) for i, t in enumerate(thresholds) if nb_model[i] > max(nb_all[i], 0)]
+    useful_range = thresholds[nb_model > np.maximum(nb_all, 0)].tolist()
 
     result["useful_range"] = {
         "min": float(min(useful_range)) if useful_range else None,
@@ -610,10 +576,21 @@ def _bootstrap_metric(
 ) -> list[float]:
     """Bootstrap a metric function.
 
-    Note: This is a thin wrapper around faircareai.core.bootstrap.bootstrap_metric
-    for backward compatibility.
+    AUROC is routed through the vectorized
+    faircareai.core.bootstrap.bootstrap_ranking_metrics engine; other metrics
+    fall back to the generic faircareai.core.bootstrap.bootstrap_metric loop.
     """
-    from faircareai.core.bootstrap import bootstrap_metric
+    from faircareai.core.bootstrap import bootstrap_metric, bootstrap_ranking_metrics
+
+    if metric_fn is roc_auc_score:
+        ranking_samples, _ = bootstrap_ranking_metrics(
+            y_true,
+            y_prob,
+            n_bootstrap=n_bootstrap,
+            seed=DEFAULT_BOOTSTRAP_SEED,
+            metrics=("auroc",),
+        )
+        return ranking_samples["auroc"]
 
     samples, _ = bootstrap_metric(
         y_true,
@@ -885,6 +862,7 @@ def compute_auroc_by_subgroup(
     reference: str | None = None,
     bootstrap_ci: bool = True,
     n_bootstrap: int = DEFAULT_N_BOOTSTRAP,
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute AUROC for each subgroup with bootstrap CIs.
 
@@ -899,6 +877,8 @@ def compute_auroc_by_subgroup(
         reference: Reference group for comparisons.
         bootstrap_ci: Whether to compute 95% CIs.
         n_bootstrap: Number of bootstrap iterations.
+        prepared: Encoded audit data; used instead of ``df`` when it
+            encodes ``group_col``.
 
     Returns:
         Dict with per-subgroup AUROC and comparisons.
@@ -909,19 +889,19 @@ def compute_auroc_by_subgroup(
         "groups": {},
     }
 
-    groups = df[group_col].drop_nulls().unique().sort().to_list()
+    y_true_all, y_prob_all, group_rows = group_arrays(
+        df, y_true_col, y_prob_col, group_col, prepared
+    )
 
     # Determine reference
     if reference is None:
-        group_counts = df.group_by(group_col).len().sort("len", descending=True)
-        reference = group_counts[group_col][0]
+        reference = max(group_rows, key=lambda g: len(group_rows[g])) if group_rows else None
 
     results["reference"] = reference
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         metrics = _compute_auroc_metrics(y_true, y_prob, bootstrap_ci, n_bootstrap)
         metrics["n"] = len(y_true)
@@ -955,6 +935,7 @@ def compute_calibration_by_subgroup(
     y_true_col: str,
     group_col: str,
     n_bins: int = CALIBRATION_BINS_DEFAULT,
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute calibration curves for each subgroup.
 
@@ -967,6 +948,8 @@ def compute_calibration_by_subgroup(
         y_true_col: Column name for true labels.
         group_col: Column name for subgroup variable.
         n_bins: Number of bins for calibration curves.
+        prepared: Encoded audit data; used instead of ``df`` when it
+            encodes ``group_col``.
 
     Returns:
         Dict with per-subgroup calibration metrics and curve data.
@@ -977,12 +960,13 @@ def compute_calibration_by_subgroup(
         "groups": {},
     }
 
-    groups = df[group_col].drop_nulls().unique().sort().to_list()
+    y_true_all, y_prob_all, group_rows = group_arrays(
+        df, y_true_col, y_prob_col, group_col, prepared
+    )
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         metrics = _compute_calibration_metrics(y_true, y_prob, n_bins)
         metrics["n"] = len(y_true)
@@ -999,6 +983,7 @@ def compute_net_benefit_by_subgroup(
     group_col: str,
     threshold: float = 0.5,
     thresholds: np.ndarray | None = None,
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute net benefit (decision curve analysis) for each subgroup.
 
@@ -1013,6 +998,8 @@ def compute_net_benefit_by_subgroup(
         group_col: Column name for subgroup variable.
         threshold: Primary decision threshold.
         thresholds: Array of thresholds for decision curves.
+        prepared: Encoded audit data; used instead of ``df`` when it
+            encodes ``group_col``.
 
     Returns:
         Dict with per-subgroup net benefit and decision curves.
@@ -1027,12 +1014,13 @@ def compute_net_benefit_by_subgroup(
         "groups": {},
     }
 
-    groups = df[group_col].drop_nulls().unique().sort().to_list()
+    y_true_all, y_prob_all, group_rows = group_arrays(
+        df, y_true_col, y_prob_col, group_col, prepared
+    )
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         metrics = _compute_net_benefit_metrics(y_true, y_prob, threshold, thresholds)
         metrics["n"] = len(y_true)
@@ -1048,6 +1036,7 @@ def compute_risk_distribution_by_subgroup(
     y_prob_col: str,
     y_true_col: str,
     group_col: str,
+    prepared: PreparedAuditData | None = None,
 ) -> dict[str, Any]:
     """Compute risk distribution statistics for each subgroup.
 
@@ -1059,6 +1048,8 @@ def compute_risk_distribution_by_subgroup(
         y_prob_col: Column name for predicted probabilities.
         y_true_col: Column name for true labels.
         group_col: Column name for subgroup variable.
+        prepared: Encoded audit data; used instead of ``df`` when it
+            encodes ``group_col``.
 
     Returns:
         Dict with per-subgroup risk distribution statistics.
@@ -1069,12 +1060,13 @@ def compute_risk_distribution_by_subgroup(
         "groups": {},
     }
 
-    groups = df[group_col].drop_nulls().unique().sort().to_list()
+    y_true_all, y_prob_all, group_rows = group_arrays(
+        df, y_true_col, y_prob_col, group_col, prepared
+    )
 
-    for group in groups:
-        group_df = df.filter(pl.col(group_col) == group)
-        y_true = group_df[y_true_col].to_numpy()
-        y_prob = group_df[y_prob_col].to_numpy()
+    for group, rows in group_rows.items():
+        y_true = y_true_all[rows]
+        y_prob = y_prob_all[rows]
 
         metrics = _compute_risk_distribution(y_true, y_prob)
         metrics["n"] = len(y_true)
@@ -6,6 +6,8 @@ import numpy as np
 import polars as pl
 import pytest
 
+from faircareai.core.config import FairnessConfig, FairnessMetric
+
 
 @pytest.fixture
 def sample_binary_data() -> pl.DataFrame:
@@ -123,3 +125,32 @@ def clustered_data() -> pl.DataFrame:
             "y_true": y_true,
         }
     )
+
+
+@pytest.fixture
+def audit_df() -> pl.DataFrame:
+    """Scores on a 0.001 grid with nullable string, categorical and string attributes."""
+    rng = np.random.default_rng(5)
+    n = 3000
+    y_true = rng.binomial(1, 0.25, n)
+    race = rng.choice(["White", "Black", "Asian"], n, p=[0.6, 0.3, 0.1]).tolist()
+    race[:40] = [None] * 40
+    return pl.DataFrame(
+        {
+            "y_prob": np.round(np.clip(0.2 + 0.3 * y_true + rng.normal(0, 0.2, n), 0, 1), 3),
+            "y_true": y_true,
+            "race": race,
+            "sex": pl.Series(rng.choice(["M", "F"], n)).cast(pl.Categorical),
+            "insurance": rng.choice(["Commercial", "Medicaid"], n),
+        }
+    )
+
+
+@pytest.fixture
+def fairness_config() -> FairnessConfig:
+    """Minimal audit configuration."""
+    return FairnessConfig(
+        model_name="Test Model",
+        primary_fairness_metric=FairnessMetric.EQUALIZED_ODDS,
+        fairness_justification="Testing purposes",
+    )
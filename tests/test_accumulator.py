@@ -0,0 +1,185 @@
+"""
+Tests for FairCareAI audit accumulators.
+
+Tests cover:
+- ScoreHistogram merge and aggregate-frame round trip
+- Accumulators over batches matching a single streaming pass
+- Merging accumulators whose batches lack some groups
+- Serialization round trip
+- Incompatible settings and missing columns
+"""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from faircareai.core.accumulator import AuditAccumulator
+from faircareai.core.config import FairnessConfig
+from faircareai.core.exceptions import ConfigurationError, DataValidationError
+from faircareai.core.histogram import ScoreHistogram
+from faircareai.core.prepared import EncodedAttribute
+from faircareai.core.streaming import StreamingAudit
+
+HISTOGRAM_FIELDS = (
+    "counts",
+    "flagged",
+    "prob_sum",
+    "logit_sum",
+    "prob_sq_sum",
+    "prob_min",
+    "prob_max",
+)
+
+
+def _split_calibration(subgroup_performance: dict) -> tuple[dict, list]:
+    """Subgroup results without the calibration fits, and the fitted values."""
+    values: list = []
+    rest: dict = {}
+    for attribute, result in subgroup_performance.items():
+        groups = {}
+        for group, metrics in result["groups"].items():
+            groups[group] = {k: v for k, v in metrics.items() if not k.startswith("calibration_")}
+            for key in sorted(metrics):
+                if key.startswith("calibration_"):
+                    values.extend(np.atleast_1d(metrics[key]).tolist())
+        rest[attribute] = {**result, "groups": groups}
+    return rest, values
+
+
+def _accumulator() -> AuditAccumulator:
+    return AuditAccumulator("y_prob", "y_true", ["race", "sex"], [["race", "sex"]])
+
+
+def _histogram(df: pl.DataFrame) -> ScoreHistogram:
+    attr = EncodedAttribute.from_series(df["race"])
+    return ScoreHistogram.from_arrays(
+        "race", attr.groups, attr.codes, df["y_true"].to_numpy(), df["y_prob"].to_numpy(), 0.5
+    )
+
+
+def _assert_histograms_equal(got: ScoreHistogram, expected: ScoreHistogram) -> None:
+    assert got.groups == expected.groups
+    for field in HISTOGRAM_FIELDS:
+        np.testing.assert_allclose(getattr(got, field), getattr(expected, field), atol=1e-9)
+
+
+class TestHistogramMerge:
+    """Tests for ScoreHistogram.merge and to_aggregates."""
+
+    def test_merge_equals_whole(self, audit_df: pl.DataFrame) -> None:
+        """Merging histograms of disjoint rows equals the histogram of all rows."""
+        is_asian = pl.col("race").eq_missing("Asian")
+        first = audit_df[:1000].filter(~is_asian)
+        second = pl.concat([audit_df[:1000].filter(is_asian), audit_df[1000:]])
+        merged = _histogram(first).merge(_histogram(second))
+        _assert_histograms_equal(merged, _histogram(audit_df))
+
+    def test_aggregates_round_trip(self, audit_df: pl.DataFrame) -> None:
+        """from_aggregates restores a histogram from its aggregate frame."""
+        hist = _histogram(audit_df)
+        restored = ScoreHistogram.from_aggregates(hist.to_aggregates(), "race", 0.5)
+        _assert_histograms_equal(restored, hist)
+        assert restored.dtype == hist.dtype
+
+    def test_merge_rejects_other_threshold(self, audit_df: pl.DataFrame) -> None:
+        """Histograms flagged at different thresholds cannot be merged."""
+        attr = EncodedAttribute.from_series(audit_df["race"])
+        other = ScoreHistogram.from_arrays(
+            "race",
+            attr.groups,
+            attr.codes,
+            audit_df["y_true"].to_numpy(),
+            audit_df["y_prob"].to_numpy(),
+            0.3,
+        )
+        with pytest.raises(ValueError, match="Cannot merge"):
+            _histogram(audit_df).merge(other)
+
+
+class TestAuditAccumulator:
+    """Tests for AuditAccumulator against StreamingAudit."""
+
+    @pytest.fixture
+    def results(self, audit_df: pl.DataFrame, fairness_config: FairnessConfig) -> tuple:
+        site_a = _accumulator().update(audit_df[:1000]).update(audit_df[1000:2000].lazy())
+        # The second site has no Asian patients
+        site_b = _accumulator().update(audit_df[2000:].filter(pl.col("race") != "Asian"))
+        merged = site_a.merge(AuditAccumulator.from_bytes(site_b.to_bytes()))
+        accumulated = merged.finalize(
+            fairness_config, references={"race": "White"}, n_bootstrap=100
+        )
+
+        rows = pl.concat([audit_df[:2000], audit_df[2000:].filter(pl.col("race") != "Asian")])
+        audit = StreamingAudit(rows, "y_prob", "y_true", config=fairness_config)
+        audit.add_sensitive_attribute("race", reference="White")
+        audit.add_sensitive_attribute("sex")
+        audit.add_intersection(["race", "sex"])
+        return accumulated, audit.run(n_bootstrap=100), len(rows)
+
+    def test_matches_single_pass(self, results: tuple) -> None:
+        """Merged accumulators give the single-pass counts, metrics and flags."""
+        accumulated, single, _ = results
+        overall, overall_s = accumulated.overall_performance, single.overall_performance
+        assert overall["confusion_matrix"] == overall_s["confusion_matrix"]
+        assert overall["threshold_analysis"] == overall_s["threshold_analysis"]
+        assert overall["discrimination"]["auroc"] == pytest.approx(
+            overall_s["discrimination"]["auroc"]
+        )
+        assert accumulated.fairness_metrics == single.fairness_metrics
+        # Recalibration fits read per-bin score sums, which merging adds in another order
+        calibrated, calibrated_s = (
+            _split_calibration(accumulated.subgroup_performance),
+            _split_calibration(single.subgroup_performance),
+        )
+        assert calibrated[0] == calibrated_s[0]
+        assert calibrated[1] == pytest.approx(calibrated_s[1], rel=1e-12)
+        assert accumulated.intersectional == single.intersectional
+        assert accumulated.flags == single.flags
+
+    def test_cohort_counts(self, results: tuple) -> None:
+        """Descriptive counts cover every accumulated row."""
+        accumulated, single, n_rows = results
+        assert accumulated.descriptive_stats["cohort_overview"]["n_total"] == n_rows
+        assert (
+            accumulated.descriptive_stats["outcome_by_attribute"]
+            == single.descriptive_stats["outcome_by_attribute"]
+        )
+
+    def test_serialization_round_trip(self, audit_df: pl.DataFrame) -> None:
+        """to_bytes/from_bytes preserves settings, schema and histograms."""
+        acc = _accumulator().update(audit_df)
+        restored = AuditAccumulator.from_bytes(acc.to_bytes())
+        assert restored.n_rows == acc.n_rows == len(audit_df)
+        assert restored.intersections == [["race", "sex"]]
+        assert restored._schema is not None
+        assert restored._schema.schema == acc._schema.schema  # type: ignore[union-attr]
+        for key, hist in acc.histograms.items():
+            _assert_histograms_equal(restored.histograms[key], hist)
+
+
+class TestAccumulatorValidation:
+    """Tests for accumulator settings and batch validation."""
+
+    def test_incompatible_merge(self, audit_df: pl.DataFrame) -> None:
+        """Accumulators with different thresholds or attributes do not merge."""
+        acc = _accumulator().update(audit_df)
+        other = AuditAccumulator("y_prob", "y_true", ["race", "sex"], threshold=0.3)
+        with pytest.raises(ConfigurationError, match="different settings"):
+            acc.merge(other)
+
+    def test_batch_validation(self, audit_df: pl.DataFrame) -> None:
+        """Batches are validated and must carry the attribute columns."""
+        with pytest.raises(DataValidationError, match="probabilities"):
+            _accumulator().update(audit_df.with_columns(pl.col("y_prob") * 2))
+        with pytest.raises(DataValidationError, match="missing attribute"):
+            _accumulator().update(audit_df.drop("sex"))
+
+    def test_empty_accumulator(self, fairness_config: FairnessConfig) -> None:
+        """Finalizing before any rows are accumulated is an error."""
+        with pytest.raises(DataValidationError, match="No rows"):
+            _accumulator().finalize(fairness_config)
+
+    def test_intersection_of_unknown_column(self) -> None:
+        """Intersections may only combine accumulated attributes."""
+        with pytest.raises(ConfigurationError, match="intersections"):
+            AuditAccumulator("y_prob", "y_true", ["race"], [["race", "sex"]])
@@ -163,6 +163,70 @@ class TestDataLoading:
             )
 
 
+class TestLazyFileInput:
+    """Tests for projection and predicate pushdown on file inputs."""
+
+    @pytest.fixture
+    def parquet_path(self, sample_data: pl.DataFrame, tmp_path: Path) -> Path:
+        """Sample data with an admission year and an unaudited notes column."""
+        n = len(sample_data)
+        path = tmp_path / "predictions.parquet"
+        sample_data.with_columns(
+            admit_year=pl.Series([2024, 2025] * (n // 2)),
+            notes=pl.Series(["free text"] * n),
+        ).write_parquet(path, row_group_size=100)
+        return path
+
+    def test_reads_only_required_columns(self, parquet_path: Path) -> None:
+        """audit.df holds the scores, outcomes and attributes, never other columns."""
+        audit = FairCareAudit(parquet_path, "y_prob", "y_true")
+        assert audit.df.columns == ["y_prob", "y_true"]
+        audit.add_sensitive_attribute("race", reference="White")
+        assert audit.df.columns == ["y_prob", "y_true", "race"]
+        assert "notes" in audit.schema
+
+    def test_extra_columns(self, parquet_path: Path) -> None:
+        """extra_columns are loaded too, and must exist."""
+        audit = FairCareAudit(parquet_path, "y_prob", "y_true", extra_columns=["notes"])
+        assert audit.df.columns == ["y_prob", "y_true", "notes"]
+        with pytest.raises(DataValidationError, match="Missing required columns"):
+            FairCareAudit(parquet_path, "y_prob", "y_true", extra_columns=["missing"])
+
+    def test_filter(self, sample_data: pl.DataFrame, parquet_path: Path) -> None:
+        """A cohort filter gives the same audit as filtering the rows first."""
+        cohort = pl.col("admit_year") == 2025
+        config = FairnessConfig(
+            model_name="Test Model",
+            primary_fairness_metric=FairnessMetric.EQUALIZED_ODDS,
+            fairness_justification="Testing purposes",
+        )
+        lazy = FairCareAudit(parquet_path, "y_prob", "y_true", config=config, filter=cohort)
+        eager = FairCareAudit(
+            pl.read_parquet(parquet_path).filter(cohort), "y_prob", "y_true", config=config
+        )
+        assert len(lazy.df) == len(sample_data) // 2
+        for audit in (lazy, eager):
+            audit.add_sensitive_attribute("race", reference="White")
+        results = lazy.run(bootstrap_ci=False)
+        expected = eager.run(bootstrap_ci=False)
+        assert results.descriptive_stats == expected.descriptive_stats
+        assert results.fairness_metrics == expected.fairness_metrics
+
+    def test_filter_in_memory(self, sample_data: pl.DataFrame) -> None:
+        """The filter also applies to in-memory data."""
+        audit = FairCareAudit(sample_data, "y_prob", "y_true", filter=pl.col("sex") == "Female")
+        assert len(audit.df) == (sample_data["sex"] == "Female").sum()
+
+    def test_suggestions_match_in_memory(
+        self, sample_data: pl.DataFrame, parquet_path: Path
+    ) -> None:
+        """Suggestions from the schema and matched columns equal the in-memory ones."""
+        lazy = FairCareAudit(parquet_path, "y_prob", "y_true")
+        eager = FairCareAudit(sample_data, "y_prob", "y_true")
+        assert lazy.suggest_attributes(display=False) == eager.suggest_attributes(display=False)
+        assert lazy._frame is None
+
+
 class TestDataValidation:
     """Tests for data validation."""
 
@@ -246,6 +310,18 @@ class TestSuggestAttributes:
         # Should not raise
         audit.suggest_attributes(display=True)
 
+    def test_profile_reused(self, sample_data: pl.DataFrame) -> None:
+        """Validation profiles the suggested columns; suggestions reuse those counts."""
+        audit = FairCareAudit(sample_data, "y_prob", "y_true")
+        assert audit.profile["n_rows"] == len(sample_data)
+        assert sorted(audit.profile["target_values"]) == [0, 1]
+        counts = audit.profile["attribute_counts"]
+        assert set(counts) == {"race", "sex", "age_group"}
+        assert counts["race"]["len"].sum() == len(sample_data)
+        assert audit._attribute_counts("race") is counts["race"]
+        suggestion = audit.suggest_attributes(display=False)[0]
+        assert suggestion["n_unique"] == counts["race"]["race"].n_unique()
+
 
 class TestAcceptSuggestedAttributes:
     """Tests for accept_suggested_attributes method."""
@@ -390,6 +466,21 @@ class TestRun:
         results = configured_audit.run(bootstrap_ci=True, n_bootstrap=100)
         assert results is not None
 
+    def test_run_stratified_bootstrap(self, configured_audit: FairCareAudit) -> None:
+        """Test that stratified disparity resampling is passed through and recorded."""
+        results = configured_audit.run(n_bootstrap=100, stratified_bootstrap=True)
+        assert "disparity_ci" in results.fairness_metrics["race"]
+        assert results.reproducibility["stratified_bootstrap"] is True
+
+    def test_run_delong_auroc_ci(self, configured_audit: FairCareAudit) -> None:
+        """Test that DeLong subgroup AUROC CIs are passed through and recorded."""
+        results = configured_audit.run(n_bootstrap=100, auroc_ci_method="delong")
+        groups = results.subgroup_performance["race"]["groups"]
+        assert any("auroc_se" in group for group in groups.values())
+        assert results.reproducibility["auroc_ci_method"] == "delong"
+        with pytest.raises(ValueError, match="auroc_ci_method"):
+            configured_audit.run(auroc_ci_method="wald")
+
     def test_run_without_attributes(self, sample_data: pl.DataFrame) -> None:
         """Test error when running without sensitive attributes."""
         config = FairnessConfig(
@@ -436,6 +527,53 @@ class TestRun:
         results = audit.run(bootstrap_ci=False)
         assert "race x sex" in results.intersectional
 
+    def test_results_independent_of_workers(self, sample_data: pl.DataFrame) -> None:
+        """Bootstrap results are identical for serial and process-pool runs."""
+        config = FairnessConfig(
+            model_name="Test",
+            primary_fairness_metric=FairnessMetric.EQUALIZED_ODDS,
+            fairness_justification="Test",
+        )
+        audit = FairCareAudit(
+            data=sample_data, pred_col="y_prob", target_col="y_true", config=config
+        )
+        audit.add_sensitive_attribute(name="race", column="race", reference="White")
+        audit.add_sensitive_attribute(name="sex", column="sex", reference="Male")
+        audit.add_intersection(["race", "sex"])
+
+        serial = audit.run(n_bootstrap=300, random_seed=7)
+        parallel = audit.run(n_bootstrap=300, random_seed=7, workers=3)
+        for section in (
+            "overall_performance",
+            "subgroup_performance",
+            "fairness_metrics",
+            "intersectional",
+        ):
+            assert repr(getattr(parallel, section)) == repr(getattr(serial, section))
+        assert "auroc_ci_95" in serial.overall_performance["discrimination"]
+        assert parallel.reproducibility["workers"] == 3
+
+    def test_unit_seeds_keyed_by_identity(self, sample_data: pl.DataFrame) -> None:
+        """Adding an attribute leaves the other attributes' results unchanged."""
+        config = FairnessConfig(
+            model_name="Test",
+            primary_fairness_metric=FairnessMetric.EQUALIZED_ODDS,
+            fairness_justification="Test",
+        )
+        audit = FairCareAudit(
+            data=sample_data, pred_col="y_prob", target_col="y_true", config=config
+        )
+        audit.add_sensitive_attribute(name="sex", column="sex", reference="Male")
+        before = audit.run(n_bootstrap=50, random_seed=7)
+        audit.add_sensitive_attribute(name="race", column="race", reference="White")
+        after = audit.run(n_bootstrap=50, random_seed=7)
+        assert repr(after.subgroup_performance["sex"]) == repr(before.subgroup_performance["sex"])
+
+    def test_invalid_workers(self, configured_audit: FairCareAudit) -> None:
+        """A worker count of 0 is rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            configured_audit.run(bootstrap_ci=False, workers=0)
+
 
 class TestGetAttrColumn:
     """Tests for _get_attr_column method."""
@@ -7,18 +7,28 @@ Tests cover:
 - compute_percentile_ci function
 - compute_ci_from_samples function
 - bootstrap_auroc convenience function
+- vectorized ranking-metric engine (draw_bootstrap_counts, bootstrap_ranking_metrics)
+- sequential stopping (percentile_mc_error, ci_converged)
 """
 
 import numpy as np
 import pytest
-from sklearn.metrics import roc_auc_score
+from sklearn.metrics import auc, precision_recall_curve, roc_auc_score
 
 from faircareai.core.bootstrap import (
+    auprc_from_counts,
+    auroc_from_counts,
     bootstrap_auroc,
     bootstrap_confusion_metrics,
+    bootstrap_confusion_tables,
     bootstrap_metric,
+    bootstrap_ranking_metrics,
+    ci_converged,
     compute_ci_from_samples,
     compute_percentile_ci,
+    compute_percentile_ci_array,
+    draw_bootstrap_counts,
+    percentile_mc_error,
 )
 
 
@@ -170,6 +180,58 @@ class TestBootstrapConfusionMetrics:
         assert np.mean(results_low["sensitivity"]) != np.mean(results_high["sensitivity"])
 
 
+class TestBootstrapConfusionTables:
+    """Tests for count-level resampling of confusion tables."""
+
+    def test_preserves_group_sizes(self) -> None:
+        """Each resampled table keeps its group's total count."""
+        tables = np.array([[30, 10, 50, 10], [5, 2, 20, 3]])
+        boot = bootstrap_confusion_tables(tables, n_bootstrap=200, stratified=False)
+        assert boot.shape == (200, 2, 4)
+        assert np.all(boot.sum(axis=-1) == tables.sum(axis=-1))
+
+    def test_stratified_preserves_outcome_counts(self) -> None:
+        """Stratified draws keep positives (tp+fn) and negatives (fp+tn) fixed."""
+        table = np.array([30, 10, 50, 10])
+        boot = bootstrap_confusion_tables(table, n_bootstrap=200, stratified=True)
+        assert boot.shape == (200, 4)
+        assert np.all(boot[:, 0] + boot[:, 3] == 40)
+        assert np.all(boot[:, 1] + boot[:, 2] == 60)
+
+    def test_cell_means_match_observed(self) -> None:
+        """Resampled cells are unbiased for the observed counts."""
+        table = np.array([120, 40, 700, 140])
+        boot = bootstrap_confusion_tables(table, n_bootstrap=4000, stratified=False)
+        np.testing.assert_allclose(boot.mean(axis=0), table, rtol=0.05)
+
+    def test_empty_group(self) -> None:
+        """Groups with no rows resample to all-zero tables."""
+        boot = bootstrap_confusion_tables(np.array([[0, 0, 0, 0], [1, 1, 1, 1]]), n_bootstrap=5)
+        assert np.all(boot[:, 0, :] == 0)
+
+
+class TestComputePercentileCIArray:
+    """Tests for column-wise percentile CIs."""
+
+    def test_matches_scalar_version(self) -> None:
+        """Column CIs match compute_percentile_ci on each column."""
+        samples = np.random.default_rng(0).normal(size=(500, 3))
+        lower, upper = compute_percentile_ci_array(samples)
+        for j in range(3):
+            expected = compute_percentile_ci(list(samples[:, j]))
+            assert lower[j] == pytest.approx(expected[0])
+            assert upper[j] == pytest.approx(expected[1])
+
+    def test_nan_replicates_ignored(self) -> None:
+        """NaN replicates are dropped; too few valid values gives NaN bounds."""
+        samples = np.column_stack(
+            [np.r_[np.full(5, np.nan), np.arange(100.0)], np.full(105, np.nan)]
+        )
+        lower, upper = compute_percentile_ci_array(samples)
+        assert lower[0] == pytest.approx(np.percentile(np.arange(100.0), 2.5))
+        assert np.isnan(lower[1]) and np.isnan(upper[1])
+
+
 class TestComputePercentileCI:
     """Tests for compute_percentile_ci function."""
 
@@ -307,3 +369,156 @@ class TestBootstrapAUROC:
         assert result1[0] == result2[0]  # Same samples
         assert result1[1] == result2[1]  # Same CI lower
         assert result1[2] == result2[2]  # Same CI upper
+
+
+class TestVectorizedRankingBootstrap:
+    """Tests for the count-based AUROC/AUPRC bootstrap engine."""
+
+    @pytest.fixture
+    def tied_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """Create data with rounded scores so ties are common."""
+        rng = np.random.default_rng(7)
+        n = 400
+        y_true = rng.binomial(1, 0.25, n)
+        y_prob = np.round(np.clip(rng.normal(0.35 + 0.25 * y_true, 0.2), 0, 1), 2)
+        return y_true, y_prob
+
+    @staticmethod
+    def _level_counts(
+        y_true: np.ndarray, y_prob: np.ndarray, counts: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(y_prob, kind="mergesort")
+        prob_sorted = y_prob[order]
+        starts = np.flatnonzero(np.r_[True, prob_sorted[1:] != prob_sorted[:-1]])
+        pos = np.add.reduceat(np.where(y_true[order] == 1, counts[order], 0), starts)
+        neg = np.add.reduceat(np.where(y_true[order] == 0, counts[order], 0), starts)
+        return pos, neg
+
+    def test_kernels_match_sklearn_on_resample(
+        self, tied_data: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """Count-weighted AUROC/AUPRC equal sklearn on the index-resampled arrays."""
+        y_true, y_prob = tied_data
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            idx = rng.integers(0, len(y_true), len(y_true))
+            counts = np.bincount(idx, minlength=len(y_true))
+            pos, neg = self._level_counts(y_true, y_prob, counts)
+
+            precision, recall, _ = precision_recall_curve(y_true[idx], y_prob[idx])
+            assert auroc_from_counts(pos, neg) == pytest.approx(
+                roc_auc_score(y_true[idx], y_prob[idx]), abs=1e-12
+            )
+            assert auprc_from_counts(pos, neg) == pytest.approx(auc(recall, precision), abs=1e-12)
+
+    def test_counts_preserve_sample_size(self) -> None:
+        """Multinomial replicates draw exactly n rows, per stratum when stratified."""
+        rng = np.random.default_rng(1)
+        strata = [np.arange(0, 30), np.arange(30, 100)]
+        counts = draw_bootstrap_counts(rng, 100, 25, strata=strata)
+        assert counts.shape == (25, 100)
+        assert np.all(counts[:, :30].sum(axis=1) == 30)
+        assert np.all(counts[:, 30:].sum(axis=1) == 70)
+
+    def test_binned_counts(self) -> None:
+        """Counts aggregated into cells sum to the per-row counts."""
+        bins = np.array([0, 0, 1, 2, 2, 2])
+        counts = draw_bootstrap_counts(np.random.default_rng(2), 6, 10, bins=bins, n_bins=3)
+        assert counts.shape == (10, 3)
+        assert np.all(counts.sum(axis=1) == 6)
+
+    def test_unknown_scheme_raises(self) -> None:
+        """Test that an unknown weight scheme is rejected."""
+        with pytest.raises(ValueError, match="Unknown bootstrap scheme"):
+            draw_bootstrap_counts(np.random.default_rng(0), 10, 2, scheme="bayesian")
+
+    def test_ci_matches_loop_bootstrap(self, tied_data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Percentile CIs agree with the loop-based bootstrap up to Monte Carlo error."""
+        y_true, y_prob = tied_data
+        loop_samples, _ = bootstrap_metric(
+            y_true, y_prob, roc_auc_score, n_bootstrap=500, stratified=False
+        )
+        vec_samples, n_failed = bootstrap_ranking_metrics(
+            y_true, y_prob, n_bootstrap=500, stratified=False
+        )
+        assert n_failed == 0
+        assert len(vec_samples["auroc"]) == 500
+        loop_ci = compute_percentile_ci(loop_samples)
+        vec_ci = compute_percentile_ci(vec_samples["auroc"])
+        assert vec_ci[0] == pytest.approx(loop_ci[0], abs=0.02)
+        assert vec_ci[1] == pytest.approx(loop_ci[1], abs=0.02)
+
+    def test_poisson_scheme(self, tied_data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Poisson weights give samples centred on the point estimate."""
+        y_true, y_prob = tied_data
+        samples, _ = bootstrap_ranking_metrics(
+            y_true, y_prob, n_bootstrap=300, scheme="poisson", metrics=("auroc",)
+        )
+        assert set(samples) == {"auroc"}
+        assert np.mean(samples["auroc"]) == pytest.approx(roc_auc_score(y_true, y_prob), abs=0.01)
+
+    def test_single_class_fails_every_resample(self) -> None:
+        """Single-class inputs produce no samples and count every failure."""
+        samples, n_failed = bootstrap_ranking_metrics(np.ones(50), np.linspace(0, 1, 50), 40)
+        assert samples["auroc"] == []
+        assert n_failed == 40
+
+    def test_reproducibility_with_seed(self, tied_data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Test that same seed produces same samples."""
+        y_true, y_prob = tied_data
+        first, _ = bootstrap_ranking_metrics(y_true, y_prob, n_bootstrap=60, seed=5)
+        again, _ = bootstrap_ranking_metrics(y_true, y_prob, n_bootstrap=60, seed=5)
+        assert first == again
+
+
+class TestSequentialStopping:
+    """Tests for Monte Carlo error based early stopping."""
+
+    def test_mc_error_shrinks_with_draws(self) -> None:
+        """Endpoint error falls with the number of replicates."""
+        rng = np.random.default_rng(0)
+        small = percentile_mc_error(rng.normal(size=400), 0.025)
+        large = percentile_mc_error(rng.normal(size=6400), 0.025)
+        assert large < small / 2
+
+    def test_mc_error_degenerate(self) -> None:
+        """Fewer than two samples have unbounded error."""
+        assert percentile_mc_error([0.5], 0.025) == float("inf")
+
+    def test_ci_converged_requires_minimum_draws(self) -> None:
+        """Convergence needs both a tolerance and the minimum draw count."""
+        samples = np.full(50, 0.7)
+        assert not ci_converged(samples, tolerance=1.0)
+        assert not ci_converged(np.full(1000, 0.7), tolerance=None)
+        assert ci_converged(np.full(1000, 0.7), tolerance=1e-9)
+
+    def test_ranking_bootstrap_stops_early(self) -> None:
+        """A loose tolerance stops well short of n_bootstrap; None runs them all."""
+        rng = np.random.default_rng(5)
+        y_true = rng.binomial(1, 0.3, 2000)
+        y_prob = np.clip(rng.normal(0.4 + 0.2 * y_true, 0.2), 0, 1)
+
+        full, _ = bootstrap_ranking_metrics(y_true, y_prob, n_bootstrap=2000, seed=1)
+        early, _ = bootstrap_ranking_metrics(
+            y_true, y_prob, n_bootstrap=2000, seed=1, tolerance=0.01
+        )
+        assert len(full["auroc"]) == 2000
+        assert len(early["auroc"]) < 2000
+        full_ci = compute_percentile_ci(full["auroc"])
+        early_ci = compute_percentile_ci(early["auroc"])
+        assert early_ci[0] == pytest.approx(full_ci[0], abs=0.02)
+        assert early_ci[1] == pytest.approx(full_ci[1], abs=0.02)
+
+    def test_metric_bootstrap_stops_early(self) -> None:
+        """The loop bootstrap checks convergence between draws."""
+        rng = np.random.default_rng(6)
+        y_true = rng.binomial(1, 0.5, 500)
+        y_pred = rng.random(500)
+        samples, _ = bootstrap_metric(
+            y_true,
+            y_pred,
+            lambda t, p: float(np.mean(p)),
+            n_bootstrap=1000,
+            tolerance=0.01,
+        )
+        assert 0 < len(samples) < 1000
@@ -0,0 +1,211 @@
+"""
+Tests for FairCareAI stage result caching.
+
+Tests cover:
+- StageCache round trips, unreadable entries and LRU eviction
+- Content digests of prepared data
+- Cached runs matching uncached runs, reusing unchanged stages
+- Resuming an interrupted run
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pytest
+
+from faircareai.core.audit import FairCareAudit, _AuditContext, _AuditUnit
+from faircareai.core.cache import StageCache, stage_key
+from faircareai.core.config import FairnessConfig
+from faircareai.core.prepared import PreparedAuditData
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, tuple]]:
+    """Record every audit unit computed in this process."""
+    recorded: list[tuple[str, tuple]] = []
+    compute = _AuditContext.compute
+
+    def recording(self: _AuditContext, unit: _AuditUnit) -> Any:
+        recorded.append((unit.stage, unit.target))
+        return compute(self, unit)
+
+    monkeypatch.setattr(_AuditContext, "compute", recording)
+    return recorded
+
+
+def _audit(df: pl.DataFrame, config: FairnessConfig, *attributes: str) -> FairCareAudit:
+    audit = FairCareAudit(df, "y_prob", "y_true", config=config)
+    for name in attributes:
+        audit.add_sensitive_attribute(name)
+    return audit
+
+
+class TestStageCache:
+    """Tests for the cache directory."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored values are returned; unknown keys miss."""
+        cache = StageCache(tmp_path / "cache")
+        cache.put("a", {"auroc": 0.8, "groups": ["x"]})
+        assert cache.get("a") == {"auroc": 0.8, "groups": ["x"]}
+        assert cache.get("b") is None
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_unreadable_entry(self, tmp_path: Path) -> None:
+        """A truncated entry is discarded as a miss."""
+        cache = StageCache(tmp_path)
+        cache.put("a", list(range(100)))
+        path = tmp_path / "a.pkl"
+        path.write_bytes(path.read_bytes()[:10])
+        assert cache.get("a") is None
+        assert not path.exists()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Writes evict the least recently used entries beyond max_bytes."""
+        cache = StageCache(tmp_path, max_bytes=10_000)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, bytes(3000))
+            os.utime(tmp_path / f"{key}.pkl", ns=(i * 10**9, i * 10**9))
+        cache.get("a")  # now the most recently used
+        cache.put("d", bytes(3000))
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in ["a", "c", "d"])
+        assert cache.size_bytes() <= 10_000
+
+    def test_invalid_size(self, tmp_path: Path) -> None:
+        """The size limit must be positive."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            StageCache(tmp_path, max_bytes=0)
+
+    def test_keys(self) -> None:
+        """Keys depend on every part."""
+        assert stage_key("overall", 1) == stage_key("overall", 1)
+        assert stage_key("overall", 1) != stage_key("overall", 2)
+
+    @pytest.mark.parametrize("package", ["scikit-learn", "statsmodels"])
+    def test_keys_follow_library_versions(
+        self, package: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Upgrading a package the stages compute with changes every key."""
+        from faircareai.core import cache
+
+        key = stage_key("overall", 1)
+        version = cache.metadata.version
+
+        monkeypatch.setattr(
+            cache.metadata,
+            "version",
+            lambda name: "0.0.dev0" if name == package else version(name),
+        )
+        cache._library_versions.cache_clear()
+        try:
+            assert stage_key("overall", 1) != key
+        finally:
+            cache._library_versions.cache_clear()
+
+
+class TestDigest:
+    """Tests for PreparedAuditData.digest."""
+
+    def test_content_addressed(self, audit_df: pl.DataFrame) -> None:
+        """Digests follow the content of the columns, not their identity."""
+        prepared = PreparedAuditData.from_frame(audit_df, "y_prob", "y_true", ["race", "sex"])
+        same = PreparedAuditData.from_frame(audit_df.clone(), "y_prob", "y_true", ["race"])
+        assert prepared.digest() == same.digest()
+        assert prepared.digest("race") == same.digest("race")
+        assert prepared.digest("race") != prepared.digest("sex")
+        changed = audit_df.with_columns(pl.col("y_prob") * 0.5)
+        assert PreparedAuditData.from_frame(changed, "y_prob", "y_true").digest() != (
+            prepared.digest()
+        )
+
+
+class TestCachedRun:
+    """Tests for FairCareAudit.run(cache=...)."""
+
+    def test_matches_uncached(
+        self, audit_df: pl.DataFrame, tmp_path: Path, fairness_config: FairnessConfig
+    ) -> None:
+        """A cold and a warm cached run equal the uncached run."""
+        expected = _audit(audit_df, fairness_config, "race", "sex").run(n_bootstrap=50)
+        for _ in range(2):
+            results = _audit(audit_df, fairness_config, "race", "sex").run(
+                n_bootstrap=50, cache=tmp_path
+            )
+            assert results.descriptive_stats == expected.descriptive_stats
+            assert results.overall_performance == expected.overall_performance
+            assert results.subgroup_performance == expected.subgroup_performance
+            assert results.fairness_metrics == expected.fairness_metrics
+            assert results.flags == expected.flags
+
+    def test_reuses_unchanged_stages(
+        self,
+        audit_df: pl.DataFrame,
+        tmp_path: Path,
+        calls: list[tuple[str, tuple]],
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """A rerun computes nothing; a new attribute computes only its own units."""
+        audit = _audit(audit_df, fairness_config, "race", "sex")
+        audit.run(n_bootstrap=50, cache=tmp_path)
+        assert ("overall", ()) in calls
+
+        calls.clear()
+        audit.run(n_bootstrap=50, cache=tmp_path)
+        assert calls == []
+
+        audit.add_sensitive_attribute("insurance")
+        audit.add_intersection(["race", "insurance"])
+        audit.run(n_bootstrap=50, cache=tmp_path)
+        assert sorted(calls) == [
+            ("fairness", ("insurance",)),
+            ("intersectional", ("race", "insurance")),
+            ("subgroup", ("insurance",)),
+        ]
+
+    def test_settings_and_data_invalidate(
+        self,
+        audit_df: pl.DataFrame,
+        tmp_path: Path,
+        calls: list[tuple[str, tuple]],
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """Another seed or changed scores recompute the affected stages."""
+        _audit(audit_df, fairness_config, "race").run(n_bootstrap=50, cache=tmp_path)
+        calls.clear()
+        _audit(audit_df, fairness_config, "race").run(n_bootstrap=50, random_seed=7, cache=tmp_path)
+        assert ("subgroup", ("race",)) in calls
+
+        calls.clear()
+        changed = audit_df.with_columns(pl.col("y_prob") * 0.9)
+        _audit(changed, fairness_config, "race").run(n_bootstrap=50, cache=tmp_path)
+        assert ("overall", ()) in calls
+
+    def test_resumes_interrupted_run(
+        self,
+        audit_df: pl.DataFrame,
+        tmp_path: Path,
+        calls: list[tuple[str, tuple]],
+        monkeypatch: pytest.MonkeyPatch,
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """Units finished before a failure are not recomputed."""
+        compute = _AuditContext.compute
+
+        def failing(self: _AuditContext, unit: _AuditUnit) -> Any:
+            if unit.stage == "fairness" and unit.target == ("sex",):
+                raise KeyboardInterrupt
+            return compute(self, unit)
+
+        audit = _audit(audit_df, fairness_config, "race", "sex")
+        with monkeypatch.context() as patch:
+            patch.setattr(_AuditContext, "compute", failing)
+            with pytest.raises(KeyboardInterrupt):
+                audit.run(n_bootstrap=50, cache=tmp_path)
+
+        calls.clear()
+        audit.run(n_bootstrap=50, cache=tmp_path)
+        assert calls == [("fairness", ("sex",))]
@@ -6,6 +6,8 @@ These tests verify the accuracy of:
 2. Cluster bootstrap CIs for calibration metrics
 3. Group calibration parity analysis
 4. Calibration gap computation
+5. Grid-evaluated LOWESS calibration curve
+6. Batched logistic recalibration
 
 ACE is preferred over ECE for healthcare data because:
 - Quantile binning ensures high-risk tail contributes equally
@@ -15,15 +17,26 @@ ACE is preferred over ECE for healthcare data because:
 import numpy as np
 import polars as pl
 import pytest
+from scipy import special
 
+from faircareai.core.bootstrap import draw_bootstrap_counts
 from faircareai.core.calibration import (
     CalibrationResult,
     GroupCalibrationResult,
+    ace_from_counts,
+    bootstrap_ace,
     compute_ace,
     compute_ace_with_ci,
     compute_calibration_from_df,
     compute_group_calibration,
+    group_recalibration,
+    logit_scores,
+    lowess_calibration,
+    recalibration_from_counts,
 )
+from faircareai.core.histogram import ScoreHistogram
+from faircareai.metrics.aggregated import histogram_calibration_metrics
+from faircareai.metrics.performance import compute_calibration_metrics
 
 
 class TestACE:
@@ -128,6 +141,260 @@ class TestACE:
         assert not np.isnan(ace) or True  # May be NaN if too few valid
 
 
+class TestBatchedACE:
+    """Tests for the batched ACE kernel used by the bootstrap."""
+
+    @pytest.mark.parametrize("decimals", [None, 1])
+    @pytest.mark.parametrize("n_bins", [3, 10])
+    def test_matches_compute_ace_per_resample(self, decimals: int | None, n_bins: int) -> None:
+        """Each resample equals compute_ace on the index-resampled arrays, ties included."""
+        rng = np.random.default_rng(0)
+        y_prob = rng.random(60)
+        if decimals is not None:
+            y_prob = np.round(y_prob, decimals)
+        y_true = (rng.random(60) < y_prob).astype(float)
+        order = np.argsort(y_prob, kind="mergesort")
+        y_true, y_prob = y_true[order], y_prob[order]
+
+        counts = draw_bootstrap_counts(rng, 60, 25)
+        aces = ace_from_counts(y_true, y_prob, counts, n_bins)
+
+        for b in range(25):
+            idx = np.repeat(np.arange(60), counts[b])
+            expected, _ = compute_ace(y_true[idx], y_prob[idx], n_bins)
+            assert aces[b] == pytest.approx(expected, abs=1e-12)
+
+    def test_constant_and_empty_resamples(self) -> None:
+        """A constant resample is one bin; an empty one is NaN."""
+        y_true = np.array([0.0, 1.0, 1.0])
+        y_prob = np.array([0.2, 0.6, 0.6])
+        counts = np.array([[0, 2, 1], [0, 0, 0]])
+        aces = ace_from_counts(y_true, y_prob, counts)
+        assert aces[0] == pytest.approx(0.4)
+        assert np.isnan(aces[1])
+
+    def test_cluster_bootstrap_reproducible(self) -> None:
+        """Cluster replicates depend only on the generator seed."""
+        rng = np.random.default_rng(1)
+        y_prob = rng.random(300)
+        y_true = (rng.random(300) < y_prob).astype(float)
+        clusters = rng.integers(0, 40, size=300)
+
+        first = bootstrap_ace(y_true, y_prob, 5, 50, np.random.default_rng(3), clusters)
+        second = bootstrap_ace(y_true, y_prob, 5, 50, np.random.default_rng(3), clusters)
+        np.testing.assert_array_equal(first, second)
+        assert len(first) == 50
+
+    def test_sequential_stopping_records_draws(self) -> None:
+        """A tolerance truncates the replicates and the result records the draws."""
+        rng = np.random.default_rng(2)
+        y_prob = rng.random(2000)
+        y_true = (rng.random(2000) < y_prob).astype(float)
+        df = pl.DataFrame({"y_true": y_true, "y_prob": y_prob})
+
+        full = bootstrap_ace(y_true, y_prob, 10, 1000, np.random.default_rng(4))
+        early = bootstrap_ace(y_true, y_prob, 10, 1000, np.random.default_rng(4), tolerance=0.01)
+        assert len(early) < len(full) == 1000
+        np.testing.assert_allclose(early, full[: len(early)], atol=1e-12)
+
+        result = compute_calibration_from_df(
+            df, "y_prob", "y_true", n_bootstrap=1000, random_state=0, tolerance=0.01
+        )
+        assert result.n_bootstrap_draws is not None
+        assert result.n_bootstrap_draws < 1000
+
+
+def _statsmodels_lowess(y_true: np.ndarray, y_prob: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    from statsmodels.nonparametric.smoothers_lowess import lowess
+
+    order = np.argsort(y_prob)
+    fitted = lowess(y_true[order], y_prob[order], frac=0.75, it=0, return_sorted=True)
+    return fitted[:, 0], np.clip(fitted[:, 1], 0.0, 1.0)
+
+
+class TestLowessCalibration:
+    """Tests for the grid-evaluated LOWESS calibration curve."""
+
+    def test_matches_statsmodels_on_few_scores(self) -> None:
+        """With at most n_grid distinct scores the curve is statsmodels' lowess."""
+        rng = np.random.default_rng(5)
+        y_prob = rng.choice(np.arange(1, 100) / 100, 400)
+        y_true = (rng.random(400) < y_prob).astype(float)
+        x, expected = _statsmodels_lowess(y_true, y_prob)
+        levels, first = np.unique(x, return_index=True)
+
+        result = lowess_calibration(y_true, y_prob)
+        assert result is not None
+        np.testing.assert_allclose(result.prob_pred, levels, atol=1e-12)
+        np.testing.assert_allclose(result.prob_true, expected[first], atol=1e-9)
+        assert result.ici == pytest.approx(np.mean(np.abs(expected - x)), abs=1e-12)
+        assert result.max_interpolation_error == 0.0
+
+    def test_bounded_grid(self) -> None:
+        """Many distinct scores give n_grid points and ICI/ECI/E_max near statsmodels."""
+        rng = np.random.default_rng(6)
+        y_prob = rng.beta(2, 5, 5000)
+        y_true = (rng.random(5000) < np.clip(1.2 * y_prob, 0, 1)).astype(float)
+        x, expected = _statsmodels_lowess(y_true, y_prob)
+        error = expected - x
+        eci = np.mean(error**2) / np.mean((y_true.mean() - x) ** 2)
+
+        result = lowess_calibration(y_true, y_prob, n_grid=100)
+        assert result is not None
+        assert len(result.prob_pred) == len(result.prob_true) == 100
+        assert result.ici == pytest.approx(np.mean(np.abs(error)), abs=1e-4)
+        assert result.eci == pytest.approx(eci, rel=1e-3)
+        assert result.e_max == pytest.approx(np.max(np.abs(error)), abs=1e-3)
+        assert 0 < result.max_interpolation_error < 1e-2
+
+    def test_too_few_scores(self) -> None:
+        """Fewer than three distinct scores have no smoothed curve."""
+        assert lowess_calibration(np.array([0, 1, 1, 0]), np.array([0.2, 0.2, 0.7, 0.7])) is None
+        result = compute_calibration_metrics(np.array([0, 1, 1, 0]), np.array([0.2, 0.2, 0.7, 0.7]))
+        assert result["calibration_curve_smoothed"]["prob_true"] == []
+
+    def test_histogram_matches_rows(self) -> None:
+        """A histogram with one bin per distinct score gives the row-level curve."""
+        rng = np.random.default_rng(7)
+        y_prob = np.round(rng.random(2000), 2)
+        y_true = (rng.random(2000) < y_prob).astype(int)
+        hist = ScoreHistogram.from_arrays(
+            "all", [], np.full(2000, -1), y_true, y_prob, 0.5, levels=np.unique(y_prob)
+        )
+
+        expected = compute_calibration_metrics(y_true, y_prob)
+        result = histogram_calibration_metrics(hist)
+        for key in ("ici", "eci", "e_max"):
+            assert result[key] == pytest.approx(expected[key], abs=1e-12)
+        np.testing.assert_allclose(
+            result["calibration_curve_smoothed"]["prob_true"],
+            expected["calibration_curve_smoothed"]["prob_true"],
+            atol=1e-12,
+        )
+
+
+class TestRecalibration:
+    """Tests for the batched calibration intercept and slope solver."""
+
+    @pytest.fixture
+    def data(self) -> tuple[np.ndarray, np.ndarray]:
+        """Overconfident scores on a 0.01 grid (ties) and their outcomes."""
+        rng = np.random.default_rng(8)
+        y_prob = np.round(rng.beta(2, 4, 800), 2)
+        y_true = (rng.random(800) < 0.15 + 0.6 * y_prob).astype(float)
+        return y_true, y_prob
+
+    def test_matches_statsmodels(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Estimates and standard errors equal statsmodels Logit."""
+        from statsmodels.api import Logit
+
+        y_true, y_prob = data
+        x = logit_scores(y_prob)
+        offset = Logit(y_true, np.ones_like(x), offset=x).fit(disp=0)
+        full = Logit(y_true, np.column_stack([np.ones_like(x), x])).fit(disp=0)
+
+        fit = recalibration_from_counts(x, y_true, np.ones(len(x)))
+        assert fit.intercept == pytest.approx(offset.params[0], abs=1e-9)
+        assert fit.intercept_se == pytest.approx(offset.bse[0], rel=1e-6)
+        assert fit.slope == pytest.approx(full.params[1], abs=1e-9)
+        assert fit.slope_se == pytest.approx(full.bse[1], rel=1e-6)
+
+    def test_frequency_weights_and_segments(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Weighted segments fitted together equal each expanded fit alone."""
+        y_true, y_prob = data
+        x = logit_scores(y_prob)
+        weights = np.random.default_rng(9).integers(0, 3, (4, 800))
+
+        batched = recalibration_from_counts(x, y_true, weights, segments=np.array([0, 300, 300]))
+        for b in range(4):
+            for i, (lo, hi) in enumerate([(0, 300), (300, 300), (300, 800)]):
+                rows = np.repeat(np.arange(lo, hi), weights[b, lo:hi])
+                alone = recalibration_from_counts(x[rows], y_true[rows], np.ones(len(rows)))
+                np.testing.assert_allclose(
+                    [batched.intercept[b, i], batched.slope[b, i]],
+                    [alone.intercept, alone.slope],
+                    atol=1e-9,
+                )
+        assert np.isnan(batched.slope[:, 1]).all()  # empty segment
+
+    def test_undefined_fits(self) -> None:
+        """One class, one score or separated classes give NaN."""
+        x = logit_scores(np.array([0.2, 0.4, 0.6, 0.8]))
+        no_events = recalibration_from_counts(x, np.zeros(4), np.ones(4))
+        assert np.isnan(no_events.intercept) and np.isnan(no_events.slope)
+
+        one_score = recalibration_from_counts(np.zeros(4), np.array([0, 1, 0, 1]), np.ones(4))
+        assert one_score.intercept == pytest.approx(0.0)
+        assert np.isnan(one_score.slope)
+
+        separated = recalibration_from_counts(x, np.array([0, 0, 1, 1]), np.ones(4))
+        assert np.isnan(separated.slope)
+
+    @pytest.fixture
+    def overfit(self) -> tuple[np.ndarray, np.ndarray]:
+        """A severely overfit model: logits spread ~2.8 around a true slope near 0.24."""
+        rng = np.random.default_rng(0)
+        true_logit = 0.8 * rng.normal(-1, 1, 5000)
+        y_true = rng.binomial(1, special.expit(true_logit)).astype(float)
+        y_prob = special.expit(-1 + 3 * (true_logit + 1) + rng.normal(0, 1.5, 5000))
+        return y_true, y_prob
+
+    def test_severely_overfit_model(self, overfit: tuple[np.ndarray, np.ndarray]) -> None:
+        """Step-halving converges from (0, 1) to the far-away slope of an overfit model."""
+        from statsmodels.api import Logit
+
+        y_true, y_prob = overfit
+        x = logit_scores(y_prob)
+        full = Logit(y_true, np.column_stack([np.ones_like(x), x])).fit(disp=0)
+
+        fit = recalibration_from_counts(x, y_true, np.ones(len(x)))
+        assert full.params[1] < 0.4
+        assert fit.slope == pytest.approx(full.params[1], abs=1e-8)
+        assert fit.slope_se == pytest.approx(full.bse[1], rel=1e-6)
+
+        metrics = compute_calibration_metrics(y_true, y_prob)
+        assert metrics["calibration_slope"] == pytest.approx(full.params[1], abs=1e-8)
+
+    def test_statsmodels_fallback(
+        self, overfit: tuple[np.ndarray, np.ndarray], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fits Newton does not converge on are refitted with statsmodels, separation stays NaN."""
+        from faircareai.core import calibration
+
+        y_true, y_prob = overfit
+        x = logit_scores(y_prob)
+        expected = recalibration_from_counts(x, y_true, np.ones(len(x)))
+        monkeypatch.setattr(calibration, "_NEWTON_MAX_ITER", 1)
+
+        fallback = recalibration_from_counts(
+            x, y_true, np.ones((2, len(x))), segments=np.array([0, 2500])
+        )
+        whole = recalibration_from_counts(x, y_true, np.ones(len(x)))
+        assert whole.slope == pytest.approx(expected.slope, abs=1e-6)
+        assert whole.intercept_se == pytest.approx(expected.intercept_se, rel=1e-4)
+        assert np.isfinite(fallback.slope).all()
+
+        separated = recalibration_from_counts(
+            logit_scores(np.array([0.2, 0.4, 0.6, 0.8])), np.array([0, 0, 1, 1]), np.ones(4)
+        )
+        assert np.isnan(separated.slope)
+
+    def test_group_bootstrap(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Replicates resample within groups; the first row fits the data."""
+        y_true, y_prob = data
+        groups = [np.arange(0, 800, 2), np.arange(1, 800, 2)]
+        fit = group_recalibration(y_true, y_prob, groups, 30, np.random.default_rng(10))
+        assert fit.slope.shape == (31, 2)
+        for i, rows in enumerate(groups):
+            alone = recalibration_from_counts(
+                logit_scores(y_prob[rows]), y_true[rows], np.ones(len(rows))
+            )
+            assert fit.slope[0, i] == pytest.approx(alone.slope, abs=1e-9)
+        lower, upper = fit.wald_ci("slope")
+        assert (lower[0] < fit.slope[0]).all() and (fit.slope[0] < upper[0]).all()
+        assert np.std(fit.slope[1:, 0]) == pytest.approx(fit.slope_se[0, 0], rel=0.5)
+
+
 class TestACEWithCI:
     """Tests for ACE with cluster-aware bootstrap confidence intervals."""
 
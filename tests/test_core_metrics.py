@@ -8,14 +8,17 @@ Tests cover:
 - compute_metrics_for_group function
 - compute_metric_ci function
 - compute_group_metrics function
+- compute_group_aggregates function
 """
 
+import numpy as np
 import polars as pl
 import pytest
 
 from faircareai.core.metrics import (
     GroupMetrics,
     _compute_confusion_matrix,
+    compute_group_aggregates,
     compute_group_metrics,
     compute_metric_ci,
     compute_metrics_for_group,
@@ -507,3 +510,57 @@ class TestComputeGroupMetrics:
         result = compute_group_metrics(df, "group")
         # Should have 10 groups + 1 overall
         assert len(result) == 11
+
+
+class TestComputeGroupAggregates:
+    """Tests for the single-pass grouped confusion engine."""
+
+    @pytest.fixture
+    def df(self) -> pl.DataFrame:
+        """Create DataFrame with two attributes, including a null group."""
+        rng = np.random.default_rng(0)
+        n = 500
+        return pl.DataFrame(
+            {
+                "race": rng.choice(["A", "B", "C"], n).tolist(),
+                "sex": rng.choice(["F", "M", None], n).tolist(),
+                "y_true": rng.integers(0, 2, n),
+                "y_prob": rng.random(n),
+            }
+        )
+
+    def test_matches_per_group_filter(self, df: pl.DataFrame) -> None:
+        """Counts match filtering each group and counting directly."""
+        result = compute_group_aggregates(df, ["race", "sex"], y_prob_col="y_prob", threshold=0.4)
+        for col in ("race", "sex"):
+            for row in result[col].iter_rows(named=True):
+                sub = df.filter(pl.col(col) == row[col])
+                y = sub["y_true"].to_numpy()
+                pred = sub["y_prob"].to_numpy() >= 0.4
+                assert row["n"] == len(sub)
+                assert row["tp"] == int(np.sum((y == 1) & pred))
+                assert row["fp"] == int(np.sum((y == 0) & pred))
+                assert row["tn"] == int(np.sum((y == 0) & ~pred))
+                assert row["fn"] == int(np.sum((y == 1) & ~pred))
+                assert row["prevalence"] == pytest.approx(y.mean())
+                assert row["selection_rate"] == pytest.approx(pred.mean())
+                assert row["mean_predicted_prob"] == pytest.approx(sub["y_prob"].mean())
+
+    def test_sorted_and_nulls_dropped(self, df: pl.DataFrame) -> None:
+        """Groups are sorted and the null group is excluded."""
+        result = compute_group_aggregates(df, "sex", y_prob_col="y_prob")
+        assert result["sex"]["sex"].to_list() == ["F", "M"]
+
+    def test_prediction_column(self) -> None:
+        """Binary predictions can be supplied directly."""
+        df = pl.DataFrame({"g": ["A", "A", "B"], "y_true": [1, 0, 1], "y_pred": [1, 1, 0]})
+        result = compute_group_aggregates(df, "g", y_pred_col="y_pred")["g"]
+        assert result["tp"].to_list() == [1, 0]
+        assert result["fp"].to_list() == [1, 0]
+        assert result["fn"].to_list() == [0, 1]
+        assert "mean_predicted_prob" not in result.columns
+
+    def test_requires_predictions(self, df: pl.DataFrame) -> None:
+        """Missing both prediction sources raises ValueError."""
+        with pytest.raises(ValueError, match="y_prob_col or y_pred_col"):
+            compute_group_aggregates(df, "race")
@@ -141,6 +141,25 @@ class TestComputeCohortSummary:
         # Should not raise and return valid result
         assert "attribute_distributions" in result
 
+    def test_categorical_groups_with_nulls(self) -> None:
+        """Categorical attributes are counted per group, nulls as Unknown."""
+        df = pl.DataFrame(
+            {
+                "y_true": [1, 0, 1, 0, 0],
+                "y_prob": [0.8, 0.2, 0.6, None, 0.4],
+                "sex": pl.Series(["F", "F", "M", None, "M"]).cast(pl.Categorical),
+            }
+        )
+        result = compute_cohort_summary(df, "y_true", "y_prob", {"sex": {"column": "sex"}})
+        groups = result["attribute_distributions"]["sex"]["groups"]
+        assert {name: g["n"] for name, g in groups.items()} == {"Unknown": 1, "F": 2, "M": 2}
+        outcome = result["outcome_by_attribute"]["sex"]["groups"]
+        assert outcome["F"]["n_positive"] == 1
+        pred = result["prediction_by_attribute"]["sex"]["groups"]
+        assert pred["M"]["mean_prob"] == pytest.approx(0.5)
+        assert pred["M"]["std_prob"] == pytest.approx(np.std([0.6, 0.4], ddof=1))
+        assert pred["Unknown"]["mean_prob"] is None
+
     def test_empty_dataframe(self) -> None:
         """Test handling of empty DataFrame raises error due to null type."""
         df = pl.DataFrame(
@@ -8,6 +8,7 @@ Tests cover:
 - _interpret_disparity_index function
 - compute_calibration_by_group function
 - compute_threshold_fairness function
+- optimize_fairness_thresholds function
 - compute_group_auroc_comparison function
 - _interpret_auroc_diff function
 """
@@ -15,6 +16,7 @@ Tests cover:
 import numpy as np
 import polars as pl
 import pytest
+from sklearn.metrics import roc_auc_score
 
 from faircareai.metrics.fairness import (
     _compute_fairness_summary,
@@ -24,7 +26,9 @@ from faircareai.metrics.fairness import (
     compute_disparity_index,
     compute_fairness_metrics,
     compute_group_auroc_comparison,
+    compute_paired_auroc_comparison,
     compute_threshold_fairness,
+    optimize_fairness_thresholds,
 )
 
 
@@ -156,6 +160,53 @@ class TestComputeFairnessMetrics:
         result = compute_fairness_metrics(df, "y_prob", "y_true", "group", reference="Small")
         assert "error" in result
 
+    def test_no_disparity_ci_by_default(self, sample_df: pl.DataFrame) -> None:
+        """Test that disparity CIs are opt-in."""
+        result = compute_fairness_metrics(sample_df, "y_prob", "y_true", "group")
+        assert "disparity_ci" not in result
+
+    def test_disparity_ci_for_every_disparity(self, sample_df: pl.DataFrame) -> None:
+        """Test that bootstrap CIs cover every disparity and contain the point estimate."""
+        result = compute_fairness_metrics(
+            sample_df, "y_prob", "y_true", "group", bootstrap_ci=True, n_bootstrap=400
+        )
+        cis = result["disparity_ci"]
+        for metric in (
+            "demographic_parity_ratio",
+            "demographic_parity_diff",
+            "tpr_diff",
+            "fpr_diff",
+            "equalized_odds_diff",
+            "ppv_ratio",
+            "ppv_diff",
+        ):
+            assert set(cis[metric]) == set(result[metric])
+            for group, ci in cis[metric].items():
+                assert ci is not None
+                assert ci[0] <= ci[1]
+                if metric != "equalized_odds_diff":
+                    # Absolute-value maxima are biased upward; others bracket the estimate
+                    assert ci[0] <= result[metric][group] <= ci[1]
+
+    def test_disparity_ci_reproducible(self, sample_df: pl.DataFrame) -> None:
+        """Test that the same seed gives the same CIs."""
+        kwargs = {"bootstrap_ci": True, "n_bootstrap": 200, "random_seed": 7}
+        first = compute_fairness_metrics(sample_df, "y_prob", "y_true", "group", **kwargs)
+        second = compute_fairness_metrics(sample_df, "y_prob", "y_true", "group", **kwargs)
+        assert first["disparity_ci"] == second["disparity_ci"]
+
+    def test_stratified_disparity_ci(self, sample_df: pl.DataFrame) -> None:
+        """Test that outcome-stratified resampling is selectable and still brackets estimates."""
+        kwargs = {"bootstrap_ci": True, "n_bootstrap": 400, "random_seed": 7}
+        plain = compute_fairness_metrics(sample_df, "y_prob", "y_true", "group", **kwargs)
+        strat = compute_fairness_metrics(
+            sample_df, "y_prob", "y_true", "group", stratified=True, **kwargs
+        )
+        assert strat["disparity_ci"] != plain["disparity_ci"]
+        for group, ci in strat["disparity_ci"]["tpr_diff"].items():
+            assert ci is not None
+            assert ci[0] <= strat["tpr_diff"][group] <= ci[1]
+
 
 class TestComputeFairnessSummary:
     """Tests for _compute_fairness_summary function."""
@@ -419,6 +470,91 @@ class TestComputeThresholdFairness:
         assert "threshold" in result["recommended_threshold"]
         assert "note" in result["recommended_threshold"]
 
+    def test_matches_full_recomputation(self, sample_df: pl.DataFrame) -> None:
+        """Test that sweep rows equal compute_fairness_metrics at each threshold."""
+        result = compute_threshold_fairness(sample_df, "y_prob", "y_true", "group")
+        for row in result["metrics_by_threshold"]:
+            summary = compute_fairness_metrics(
+                sample_df, "y_prob", "y_true", "group", row["threshold"]
+            )["summary"]
+            assert row["equalized_odds_worst"] == pytest.approx(
+                summary["equalized_odds"]["worst_diff"]
+            )
+            assert row["demographic_parity_worst"] == pytest.approx(
+                summary["demographic_parity"]["worst_diff"]
+            )
+
+    def test_recommended_from_fine_grid(self, sample_df: pl.DataFrame) -> None:
+        """Test that the recommendation is searched on the fine grid."""
+        result = compute_threshold_fairness(sample_df, "y_prob", "y_true", "group", n_grid=200)
+        threshold = result["recommended_threshold"]["threshold"]
+        assert 0 < threshold < 1
+        assert round(threshold * 200) == pytest.approx(threshold * 200)
+
+
+class TestOptimizeFairnessThresholds:
+    """Tests for optimize_fairness_thresholds function."""
+
+    @pytest.fixture
+    def shifted_df(self) -> pl.DataFrame:
+        """Create data where group B's scores are shifted upward."""
+        rng = np.random.default_rng(42)
+        n = 1200
+        groups = rng.choice(["A", "B", "C"], size=n, p=[0.5, 0.3, 0.2])
+        y_true = rng.binomial(1, 0.3, n)
+        y_prob = np.where(y_true == 1, rng.normal(0.65, 0.15, n), rng.normal(0.35, 0.15, n))
+        y_prob = np.clip(y_prob + np.where(groups == "B", 0.1, 0.0), 0.01, 0.99)
+        return pl.DataFrame({"y_true": y_true, "y_prob": y_prob, "group": groups})
+
+    def test_global_threshold_shared(self, shifted_df: pl.DataFrame) -> None:
+        """Test that the global search returns one threshold for all groups."""
+        result = optimize_fairness_thresholds(shifted_df, "y_prob", "y_true", "group")
+        assert result["feasible"]
+        assert result["reference"] == "A"
+        assert set(result["thresholds"].values()) == {result["threshold"]}
+        assert result["gap"] == max(result["group_gaps"].values())
+
+    def test_group_specific_reduces_gap(self, shifted_df: pl.DataFrame) -> None:
+        """Test that per-group thresholds close the gap and raise B's threshold."""
+        kwargs = {"min_sensitivity": 0.6, "min_specificity": 0.5}
+        global_result = optimize_fairness_thresholds(
+            shifted_df, "y_prob", "y_true", "group", **kwargs
+        )
+        specific = optimize_fairness_thresholds(
+            shifted_df, "y_prob", "y_true", "group", group_specific=True, **kwargs
+        )
+        assert specific["gap"] <= global_result["gap"]
+        assert specific["thresholds"]["B"] > specific["thresholds"]["A"]
+
+    def test_sensitivity_floor_respected(self, shifted_df: pl.DataFrame) -> None:
+        """Test that every group meets the sensitivity floor."""
+        result = optimize_fairness_thresholds(
+            shifted_df,
+            "y_prob",
+            "y_true",
+            "group",
+            criterion="demographic_parity",
+            min_sensitivity=0.8,
+            group_specific=True,
+        )
+        assert all(tpr >= 0.8 for tpr in result["group_sensitivity"].values())
+
+    def test_infeasible_floor(self, shifted_df: pl.DataFrame) -> None:
+        """Test that an unreachable floor is reported, not guessed."""
+        result = optimize_fairness_thresholds(
+            shifted_df, "y_prob", "y_true", "group", min_sensitivity=1.0, min_specificity=1.0
+        )
+        assert result["feasible"] is False
+        assert result["threshold"] is None
+        assert "note" in result
+
+    def test_unknown_criterion(self, shifted_df: pl.DataFrame) -> None:
+        """Test that unknown criteria raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown criterion"):
+            optimize_fairness_thresholds(
+                shifted_df, "y_prob", "y_true", "group", criterion="calibration"
+            )
+
 
 class TestComputeGroupAurocComparison:
     """Tests for compute_group_auroc_comparison function."""
@@ -492,6 +628,85 @@ class TestComputeGroupAurocComparison:
             if "error" not in result["groups"][group]:
                 assert "auroc_ci_95" in result["groups"][group]
 
+    def test_delong_ci(self, sample_df: pl.DataFrame) -> None:
+        """DeLong CIs agree with the bootstrap and test each difference."""
+        bootstrap = compute_group_auroc_comparison(
+            sample_df, "y_prob", "y_true", "group", n_bootstrap=1000
+        )
+        delong = compute_group_auroc_comparison(
+            sample_df, "y_prob", "y_true", "group", ci_method="delong"
+        )
+        assert delong["ci_method"] == "delong"
+        for group, data in delong["groups"].items():
+            assert data["auroc"] == bootstrap["groups"][group]["auroc"]
+            assert data["auroc_ci_95"] == pytest.approx(
+                bootstrap["groups"][group]["auroc_ci_95"], abs=0.02
+            )
+
+        reference = delong["groups"][delong["reference"]]
+        for group, comp in delong["comparisons"].items():
+            lower, upper = comp["auroc_diff_ci_95"]
+            assert lower < comp["auroc_diff"] < upper
+            se = np.hypot(delong["groups"][group]["auroc_se"], reference["auroc_se"])
+            assert upper - lower == pytest.approx(2 * 1.959964 * se)
+            assert 0 <= comp["p_value"] <= 1
+
+    def test_invalid_ci_method(self, sample_df: pl.DataFrame) -> None:
+        """Unknown CI methods are rejected."""
+        with pytest.raises(ValueError, match="ci_method"):
+            compute_group_auroc_comparison(sample_df, "y_prob", "y_true", "group", ci_method="wald")
+
+
+class TestComputePairedAurocComparison:
+    """Tests for compute_paired_auroc_comparison function."""
+
+    @pytest.fixture
+    def paired_df(self) -> pl.DataFrame:
+        """Two correlated score columns on the same patients."""
+        rng = np.random.default_rng(7)
+        n = 800
+        y_true = rng.binomial(1, 0.3, n)
+        shared = rng.normal(0, 1, n)
+        return pl.DataFrame(
+            {
+                "y_true": y_true,
+                "model_a": y_true + shared + rng.normal(0, 0.5, n),
+                "model_b": 0.5 * y_true + shared + rng.normal(0, 0.5, n),
+                "group": rng.choice(["A", "B", "C"], n),
+            }
+        )
+
+    def test_overall_and_groups(self, paired_df: pl.DataFrame) -> None:
+        """Overall and per-group paired comparisons of the two columns."""
+        result = compute_paired_auroc_comparison(
+            paired_df, "model_a", "model_b", "y_true", group_col="group"
+        )
+        overall = result["overall"]
+        assert overall["n"] == 800
+        assert overall["auroc_diff"] == pytest.approx(overall["auroc"] - overall["other_auroc"])
+        assert overall["auroc_diff_ci_95"][0] > 0
+        assert overall["p_value"] < 0.05
+        assert set(result["groups"]) == {"A", "B", "C"}
+
+        rows = paired_df.filter(pl.col("group") == "B")
+        assert result["groups"]["B"]["n"] == len(rows)
+        assert result["groups"]["B"]["other_auroc"] == pytest.approx(
+            roc_auc_score(rows["y_true"], rows["model_b"])
+        )
+
+    def test_insufficient_group(self, paired_df: pl.DataFrame) -> None:
+        """Groups too small for an AUROC carry an error."""
+        small = paired_df.with_columns(
+            pl.when(pl.int_range(pl.len()) < 5).then(pl.lit("D")).otherwise("group").alias("group")
+        )
+        result = compute_paired_auroc_comparison(
+            small, "model_a", "model_b", "y_true", group_col="group"
+        )
+        assert "error" in result["groups"]["D"]
+        assert "groups" not in compute_paired_auroc_comparison(
+            paired_df, "model_a", "model_b", "y_true"
+        )
+
 
 class TestInterpretAurocDiff:
     """Tests for _interpret_auroc_diff function."""
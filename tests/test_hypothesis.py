@@ -16,9 +16,12 @@ import warnings
 
 import numpy as np
 import polars as pl
+import pytest
 
 from faircareai.core.hypothesis import (
+    PermutationIndex,
     compute_metric_by_type,
+    group_rate_gap,
     stratified_cluster_permutation_test,
     stratified_permutation_test,
 )
@@ -367,6 +370,127 @@ class TestReproducibility:
         assert np.allclose(result1["null_distribution"], result2["null_distribution"])
 
 
+def _clustered_sites(seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    n = 600
+    df = pl.DataFrame(
+        {
+            "patient_id": rng.integers(0, 150, n),
+            "site": rng.choice(["north", "south", "east"], n),
+            "y_true": rng.integers(0, 2, n),
+            "y_pred": rng.integers(0, 2, n),
+        }
+    )
+    patients = pl.DataFrame(
+        {"patient_id": np.arange(150), "group": rng.choice(["A", "B", "C"], 150)}
+    )
+    return df.join(patients, on="patient_id")
+
+
+def _rate_gap(d: pl.DataFrame) -> float:
+    rates = d.group_by("group").agg(pl.col("y_pred").mean())["y_pred"]
+    return float(rates.max() - rates.min())
+
+
+class TestBatchedPermutation:
+    """Tests for the array-native permutation engine (count statistics)."""
+
+    @pytest.mark.parametrize("confound_cols", [None, ["site"]])
+    def test_cluster_counts_match_dataframe_fallback(self, confound_cols: list[str] | None) -> None:
+        """Count statistics reproduce the DataFrame callback permutation by permutation."""
+        df = _clustered_sites()
+        kwargs = {
+            "metric_type": "TPR",
+            "group_col": "group",
+            "y_true_col": "y_true",
+            "cluster_col": "patient_id",
+            "confound_cols": confound_cols,
+            "n_perms": 60,
+            "random_state": 7,
+        }
+        fallback = stratified_cluster_permutation_test(df, _rate_gap, **kwargs)
+        batched = stratified_cluster_permutation_test(
+            df, None, count_statistic=group_rate_gap, value_col="y_pred", **kwargs
+        )
+
+        assert batched["observed_stat"] == pytest.approx(fallback["observed_stat"])
+        np.testing.assert_allclose(batched["null_distribution"], fallback["null_distribution"])
+        assert batched["p_value"] == fallback["p_value"]
+
+    def test_row_level_hypergeometric_null(self) -> None:
+        """Row-level binary counts give the same null distribution as shuffling rows."""
+        df = _clustered_sites(1)
+        kwargs = {
+            "metric_type": "Independence",
+            "group_col": "group",
+            "y_true_col": "y_true",
+            "confound_cols": ["site"],
+            "n_perms": 2000,
+            "random_state": 3,
+        }
+        fallback = stratified_cluster_permutation_test(df, _rate_gap, **kwargs)
+        batched = stratified_cluster_permutation_test(
+            df, None, count_statistic=group_rate_gap, value_col="y_pred", **kwargs
+        )
+
+        assert batched["observed_stat"] == pytest.approx(fallback["observed_stat"])
+        assert batched["p_value"] == pytest.approx(fallback["p_value"], abs=0.05)
+        assert np.mean(batched["null_distribution"]) == pytest.approx(
+            np.mean(fallback["null_distribution"]), rel=0.1
+        )
+
+    def test_permutations_stay_within_strata(self) -> None:
+        """Units only exchange groups with units of the same stratum."""
+        df = _clustered_sites()
+        index = PermutationIndex.from_frame(df, "group", "patient_id", ["site"])
+        sources = index.permute(np.random.default_rng(0), 20)
+
+        site_codes = df["site"].rank("dense").to_numpy()[index.unit_rows]
+        assert (site_codes[sources] == site_codes).all()
+        assert sorted(np.concatenate(index.strata).tolist()) == list(range(index.n_units))
+
+    def test_group_rate_gap(self) -> None:
+        """Gap over non-empty groups; NaN with a single non-empty group."""
+        n = np.array([[10, 20, 0], [10, 0, 0]])
+        successes = np.array([[5, 4, 0], [5, 0, 0]])
+        gap = group_rate_gap(n, successes)
+        assert gap[0] == pytest.approx(0.3)
+        assert np.isnan(gap[1])
+
+    def test_statistic_required(self) -> None:
+        """A statistic must be given, and count statistics need value_col."""
+        df = _clustered_sites()
+        with pytest.raises(ValueError, match="statistic"):
+            stratified_cluster_permutation_test(df, None, "TPR", "group", "y_true")
+        with pytest.raises(ValueError, match="value_col"):
+            stratified_cluster_permutation_test(
+                df, None, "TPR", "group", "y_true", count_statistic=group_rate_gap
+            )
+
+    def test_sequential_stops_after_exceedances(self) -> None:
+        """A null effect stops at the h-th exceedance with p = h / draws."""
+        df = _clustered_sites(2)
+        kwargs = {
+            "metric_type": "Independence",
+            "group_col": "group",
+            "y_true_col": "y_true",
+            "cluster_col": "patient_id",
+            "n_perms": 5000,
+            "random_state": 0,
+            "count_statistic": group_rate_gap,
+            "value_col": "y_pred",
+        }
+        full = stratified_cluster_permutation_test(df, None, **kwargs)
+        early = stratified_cluster_permutation_test(df, None, sequential=True, **kwargs)
+
+        assert full["n_perms"] == 5000
+        assert early["n_perms"] < 5000
+        assert early["p_value"] == pytest.approx(10 / early["n_perms"])
+        np.testing.assert_array_equal(
+            early["null_distribution"], full["null_distribution"][: early["n_perms"]]
+        )
+
+
 class TestEdgeCases:
     """Tests for edge cases and empty data handling."""
 
@@ -4,8 +4,11 @@ Ensures FairCareAI works with ANY binary ML healthcare model producing
 probability scores in [0, 1].
 """
 
+from pathlib import Path
+
 import numpy as np
 import polars as pl
+import pyarrow as pa
 import pytest
 
 from faircareai import FairCareAudit
@@ -56,6 +59,71 @@ class TestPandasInput:
             FairCareAudit(pdf, "risk", "outcome")
 
 
+class TestArrowInput:
+    """Test zero-copy ingestion of Arrow data, NumPy arrays and IPC files."""
+
+    @pytest.fixture
+    def arrays(self) -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(42)
+        return {
+            "risk": rng.uniform(0, 1, 200),
+            "outcome": rng.binomial(1, 0.3, 200),
+            "group": rng.choice(["A", "B"], 200),
+        }
+
+    def test_arrow_table_shares_buffers(self, arrays):
+        """Numeric columns of a pyarrow Table are not copied."""
+        audit = FairCareAudit(pa.table(arrays), "risk", "outcome")
+        assert np.shares_memory(audit.df["risk"].to_numpy(), arrays["risk"])
+
+    def test_record_batch_reader(self, arrays):
+        """A RecordBatchReader is read into one frame without copying its batches."""
+        table = pa.table(arrays)
+        batches = table.to_batches(max_chunksize=50)
+        reader = pa.RecordBatchReader.from_batches(table.schema, batches)
+        audit = FairCareAudit(reader, "risk", "outcome")
+        assert audit.df.shape == (200, 3)
+        chunks = audit.df["risk"].get_chunks()
+        columns = [batch.column("risk") for batch in batches]
+        assert [chunk._get_buffer_info()[0] for chunk in chunks] == [
+            column.buffers()[1].address + 8 * column.offset for column in columns
+        ]
+
+    def test_pandas_mixed_object_column(self, arrays):
+        """Object columns Arrow cannot convert fall back to pl.from_pandas."""
+        pd = pytest.importorskip("pandas")
+        pdf = pd.DataFrame(arrays)
+        pdf["note"] = ["x", 1, 2.0, *[None] * 197]
+        audit = FairCareAudit(pdf, "risk", "outcome")
+        assert audit.df.shape == (200, 4)
+
+    def test_pandas_shares_buffers(self, arrays):
+        """pandas numeric columns go through Arrow without a copy."""
+        pd = pytest.importorskip("pandas")
+        pdf = pd.DataFrame(arrays)
+        audit = FairCareAudit(pdf, "risk", "outcome")
+        assert np.shares_memory(audit.df["risk"].to_numpy(), pdf["risk"].to_numpy())
+
+    def test_from_arrays(self, arrays):
+        """NumPy arrays are audited directly and wrapped without a copy."""
+        audit = FairCareAudit.from_arrays(
+            arrays["risk"], arrays["outcome"], {"group": arrays["group"]}
+        )
+        assert audit.df.columns == ["y_prob", "y_true", "group"]
+        assert np.shares_memory(audit.df["y_prob"].to_numpy(), arrays["risk"])
+        with pytest.raises(DataValidationError, match="same length"):
+            FairCareAudit.from_arrays(arrays["risk"], arrays["outcome"][:10])
+
+    def test_ipc_file_memory_mapped(self, arrays, tmp_path: Path):
+        """Arrow IPC files are read by memory mapping."""
+        path = tmp_path / "predictions.feather"
+        pl.DataFrame(arrays).write_ipc(path)
+        audit = FairCareAudit(path, "risk", "outcome")
+        audit.add_sensitive_attribute("group")
+        assert audit.df.shape == (200, 3)
+        assert not audit.df["risk"].to_numpy().flags.owndata
+
+
 class TestPolarsInput:
     """Test Polars DataFrame handling."""
 
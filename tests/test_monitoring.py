@@ -0,0 +1,152 @@
+"""
+Tests for FairCareAI fairness monitoring.
+
+Tests cover:
+- Period counts accumulated over batches
+- Rolling-window disparities matching compute_fairness_metrics
+- Exponentially decayed counts
+- Flags from the audit fairness thresholds
+- Incremental reads of new Parquet files and appended CSV rows
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from faircareai.core.config import FairnessConfig
+from faircareai.core.exceptions import DataValidationError
+from faircareai.core.monitoring import FairnessMonitor
+from faircareai.metrics.fairness import compute_fairness_metrics
+
+
+@pytest.fixture
+def df() -> pl.DataFrame:
+    """Thirty days of predictions; group B is scored higher than A and C."""
+    rng = np.random.default_rng(0)
+    n = 12000
+    minutes = np.sort(rng.integers(0, 60 * 24 * 30, n))
+    y_true = rng.binomial(1, 0.3, n)
+    race = rng.choice(["A", "B", "C"], n, p=[0.6, 0.3, 0.1])
+    shift = np.where(race == "B", 0.1, 0.0)
+    return pl.DataFrame(
+        {
+            "y_prob": np.clip(0.2 + 0.3 * y_true + shift + rng.normal(0, 0.2, n), 0, 1),
+            "y_true": y_true,
+            "race": race,
+            "scored_at": [datetime(2024, 1, 1) + timedelta(minutes=int(m)) for m in minutes],
+        }
+    )
+
+
+def _monitor() -> FairnessMonitor:
+    return FairnessMonitor("y_prob", "y_true", "scored_at", {"race": "A"})
+
+
+class TestFairnessMonitor:
+    """Tests for FairnessMonitor counts and window metrics."""
+
+    def test_batches_add_up(self, df: pl.DataFrame) -> None:
+        """Counts from two batches equal counts from one."""
+        split = _monitor()
+        assert split.update(df[:5000]) + split.update(df[5000:].lazy()) == len(df)
+        whole = _monitor()
+        whole.update(df)
+        counts = ["period", "attribute", "group", "n", "tp", "fp", "tn", "fn"]
+        assert split.counts.select(counts).equals(whole.counts.select(counts))
+        np.testing.assert_allclose(split.counts["prob_sum"], whole.counts["prob_sum"])
+        assert split.counts["n"].sum() == len(df)
+
+    def test_rolling_matches_fairness_metrics(self, df: pl.DataFrame) -> None:
+        """The last 7-day window equals compute_fairness_metrics over its rows."""
+        monitor = _monitor()
+        monitor.update(df)
+        series = monitor.rolling(7)
+        last = series["period"].max()
+        window = df.filter(pl.col("scored_at") >= last - timedelta(days=6))
+        expected = compute_fairness_metrics(window, "y_prob", "y_true", "race", reference="A")
+
+        rows = series.filter(pl.col("period") == last)
+        for group in ("B", "C"):
+            row = rows.filter(pl.col("group") == group).row(0, named=True)
+            assert row["n"] == expected["group_metrics"][group]["n"]
+            assert row["demographic_parity_ratio"] == pytest.approx(
+                expected["demographic_parity_ratio"][group]
+            )
+            assert row["equalized_odds_diff"] == pytest.approx(
+                expected["equalized_odds_diff"][group]
+            )
+        reference = rows.filter("reference")
+        assert reference["group"].to_list() == ["A"]
+        assert reference["equalized_odds_diff"].is_null().all()
+
+    def test_decayed_weights(self, df: pl.DataFrame) -> None:
+        """Decayed group sizes weight each earlier day by 0.5 ** (age / half_life)."""
+        monitor = _monitor()
+        monitor.update(df)
+        daily = monitor.counts.filter(pl.col("group") == "B").sort("period")["n"].to_numpy()
+        series = monitor.decayed(half_life=2.0)
+        last = series.filter(pl.col("group") == "B").sort("period")["n"][-1]
+        weights = 0.5 ** (np.arange(len(daily))[::-1] / 2.0)
+        assert last == pytest.approx(float(np.sum(daily * weights)))
+
+    def test_flags_use_audit_thresholds(self, df: pl.DataFrame) -> None:
+        """Group B's disparity is flagged in every window; a lenient config flags nothing."""
+        monitor = _monitor()
+        monitor.update(df)
+        series = monitor.rolling(7)
+        flags = monitor.flags(series)
+        assert all(f["category"] == "fairness" and "period" in f for f in flags)
+        periods = series["period"].unique()
+        assert {f["period"] for f in flags if f["group"] == "B"} == set(periods.to_list())
+        flagged = series.filter("flagged").select("period", "group").rows()
+        assert {(f["period"], f["group"]) for f in flags} == set(flagged)
+
+        config = FairnessConfig(model_name="Lenient")
+        config.thresholds["demographic_parity_ratio"] = (0.0, 10.0)
+        config.thresholds["equalized_odds_diff"] = 1.0
+        lenient = FairnessMonitor("y_prob", "y_true", "scored_at", ["race"], config=config)
+        lenient.update(df)
+        assert not lenient.rolling(7)["flagged"].any()
+
+    def test_requires_temporal_column(self, df: pl.DataFrame) -> None:
+        """The time column must be a date or datetime."""
+        with pytest.raises(DataValidationError, match="date or datetime"):
+            _monitor().update(df.with_columns(pl.col("scored_at").dt.to_string("%Y-%m-%d")))
+
+
+class TestIncrementalReads:
+    """Tests for FairnessMonitor.refresh."""
+
+    def test_reads_only_new_parquet_files(self, df: pl.DataFrame, tmp_path: Path) -> None:
+        """Files already read are skipped on the next refresh."""
+        monitor = _monitor()
+        df[:6000].write_parquet(tmp_path / "day-1.parquet")
+        assert monitor.refresh(tmp_path) == 6000
+        df[6000:].write_parquet(tmp_path / "day-2.parquet")
+        assert monitor.refresh(tmp_path) == len(df) - 6000
+        assert monitor.refresh(tmp_path) == 0
+        assert monitor.counts["n"].sum() == len(df)
+
+    def test_reads_appended_csv_tail(self, df: pl.DataFrame, tmp_path: Path) -> None:
+        """Appended CSV lines are read once; a partial last line waits."""
+        path = tmp_path / "log.csv"
+        df[:4000].write_csv(path)
+        monitor = _monitor()
+        assert monitor.refresh(path) == 4000
+
+        tail = df[4000:].write_csv(include_header=False)
+        cut = tail.index("\n", len(tail) // 2) + 5
+        with path.open("a") as fh:
+            fh.write(tail[:cut])
+        added = monitor.refresh(path)
+        with path.open("a") as fh:
+            fh.write(tail[cut:])
+        added += monitor.refresh(path)
+
+        assert 4000 + added == len(df)
+        whole = _monitor()
+        whole.update(df)
+        assert monitor.counts.select("n", "tp", "fp").equals(whole.counts.select("n", "tp", "fp"))
@@ -0,0 +1,74 @@
+"""
+Tests for FairCareAI parallel execution helpers.
+
+Tests cover:
+- Unit seeds derived from SeedSequence by unit identity
+- Worker count normalization
+- Inline and process-pool executors, task ordering
+"""
+
+import os
+
+import pytest
+
+from faircareai.core.parallel import resolve_workers, run_tasks, task_executor, unit_seed
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _fail(x: int) -> int:
+    raise RuntimeError(f"task {x} failed")
+
+
+class TestUnitSeed:
+    """Tests for unit_seed."""
+
+    def test_deterministic_and_distinct(self) -> None:
+        """Same root and key give the same seed; different keys differ."""
+        seeds = [unit_seed(42, "subgroup", name) for name in ("race", "sex", "age")]
+        assert seeds == [unit_seed(42, "subgroup", name) for name in ("race", "sex", "age")]
+        assert len(set(seeds)) == 3
+        assert unit_seed(42, "subgroup", "race") != unit_seed(42, "fairness", "race")
+        assert unit_seed(42, "subgroup", "race") != unit_seed(43, "subgroup", "race")
+
+    def test_integer_keys(self) -> None:
+        """Block numbers address distinct 32-bit seeds."""
+        seeds = {unit_seed(7, "overall_bootstrap", i) for i in range(4)}
+        assert len(seeds) == 4
+        assert all(0 <= s < 2**32 for s in seeds)
+
+
+class TestResolveWorkers:
+    """Tests for resolve_workers."""
+
+    def test_values(self) -> None:
+        """None means serial and -1 means every core."""
+        assert resolve_workers(None) == 1
+        assert resolve_workers(4) == 4
+        assert resolve_workers(-1) == (os.cpu_count() or 1)
+
+    @pytest.mark.parametrize("workers", [0, -2])
+    def test_invalid(self, workers: int) -> None:
+        """Zero and negative counts other than -1 are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            resolve_workers(workers)
+
+
+class TestTaskExecutor:
+    """Tests for task_executor and run_tasks."""
+
+    def test_serial_and_pool_keep_order(self) -> None:
+        """Results come back in task order for any worker count."""
+        tasks = list(range(10))
+        expected = [x * x for x in tasks]
+        assert run_tasks(_square, tasks) == expected
+        assert run_tasks(_square, tasks, workers=2) == expected
+
+    def test_inline_submit(self) -> None:
+        """The serial executor resolves futures on submit, errors included."""
+        with task_executor(1) as executor:
+            assert executor.submit(_square, 3).result() == 9
+            with pytest.raises(RuntimeError, match="task 1"):
+                executor.submit(_fail, 1).result()
@@ -0,0 +1,218 @@
+"""
+Tests for FairCareAI prepared audit data.
+
+Tests cover:
+- EncodedAttribute codes, offsets and group rows
+- Polars group keys for attribute columns
+- PreparedAuditData arrays, cached score order and threshold index
+- Group aggregates, class indices and intersections
+- Stage functions giving identical results with prepared data
+"""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from faircareai.core.metrics import compute_group_aggregates
+from faircareai.core.prepared import EncodedAttribute, PreparedAuditData, group_key
+from faircareai.core.thresholds import ThresholdIndex
+from faircareai.metrics.descriptive import compute_cohort_summary
+from faircareai.metrics.fairness import compute_fairness_metrics
+from faircareai.metrics.group_utils import group_row_indices
+from faircareai.metrics.subgroup import compute_intersectional, compute_subgroup_metrics
+from faircareai.metrics.vancalster import compute_vancalster_metrics
+
+
+@pytest.fixture
+def df() -> pl.DataFrame:
+    """Audit frame with string (nullable), categorical and integer attributes."""
+    rng = np.random.default_rng(11)
+    n = 600
+    y_true = rng.integers(0, 2, n)
+    race = rng.choice(["White", "Black", "Asian"], n).tolist()
+    race[:7] = [None] * 7
+    return pl.DataFrame(
+        {
+            "y_true": y_true,
+            "y_prob": np.round(np.clip(0.3 * y_true + rng.random(n) * 0.7, 0, 1), 2),
+            "race": race,
+            "sex": pl.Series(rng.choice(["M", "F"], n)).cast(pl.Categorical),
+            "age_band": rng.integers(0, 3, n),
+        }
+    )
+
+
+ATTRS = ["race", "sex", "age_band"]
+
+
+def _assert_close(got: object, expected: object) -> None:
+    """Recursively compare nested results, floats approximately."""
+    if isinstance(expected, dict):
+        assert isinstance(got, dict)
+        assert list(got) == list(expected)
+        for key in expected:
+            _assert_close(got[key], expected[key])
+    elif isinstance(expected, float):
+        assert got == pytest.approx(expected, nan_ok=True)
+    else:
+        assert got == expected
+
+
+class TestEncodedAttribute:
+    """Tests for EncodedAttribute."""
+
+    def test_group_rows_match_group_row_indices(self, df: pl.DataFrame) -> None:
+        """Encoded rows equal group_row_indices, group order included."""
+        for col in ATTRS:
+            attr = EncodedAttribute.from_series(df[col])
+            expected = group_row_indices(df, col)
+            rows = attr.group_rows()
+            assert list(rows) == list(expected)
+            for group in expected:
+                np.testing.assert_array_equal(rows[group], expected[group])
+
+    def test_codes_and_offsets(self, df: pl.DataFrame) -> None:
+        """Null rows get code -1 and sit before the first group offset."""
+        attr = EncodedAttribute.from_series(df["race"])
+        assert attr.groups == ["Asian", "Black", "White"]
+        assert int(np.sum(attr.codes == -1)) == 7
+        assert attr.offsets[0] == 7
+        assert attr.offsets[-1] == len(df)
+        assert attr.group_sizes()["Black"] == len(attr.rows("Black"))
+
+
+class TestGroupKey:
+    """Tests for group_key."""
+
+    def test_categorical_grouped_as_strings(self, df: pl.DataFrame) -> None:
+        """Categorical keys are cast to strings; other dtypes are kept."""
+        keys = df.select(group_key(col, df.schema[col]) for col in ATTRS)
+        assert keys.schema == {"race": pl.Utf8, "sex": pl.Utf8, "age_band": pl.Int64}
+        counts = df.group_by(group_key("sex", df.schema["sex"])).len().sort("sex")
+        assert counts["sex"].to_list() == ["F", "M"]
+        assert counts["len"].sum() == len(df)
+
+
+class TestPreparedAuditData:
+    """Tests for PreparedAuditData."""
+
+    def test_compact_arrays(self, df: pl.DataFrame) -> None:
+        """Scores are contiguous float64 and labels uint8."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        assert prepared.y_prob.dtype == np.float64
+        assert prepared.y_prob.flags["C_CONTIGUOUS"]
+        assert prepared.y_true.dtype == np.uint8
+        assert len(prepared) == len(df)
+
+    def test_threshold_index_uses_cached_order(self, df: pl.DataFrame) -> None:
+        """The shared index agrees with a freshly sorted one."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        fresh = ThresholdIndex(df["y_true"].to_numpy(), df["y_prob"].to_numpy())
+        grid = np.linspace(0, 1, 21)
+        for got, expected in zip(
+            prepared.threshold_index.counts(grid), fresh.counts(grid), strict=True
+        ):
+            np.testing.assert_array_equal(got, expected)
+        assert prepared.threshold_index is prepared.threshold_index
+
+    def test_group_aggregates_match_frame(self, df: pl.DataFrame) -> None:
+        """Cached aggregates equal compute_group_aggregates on the frame."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        got = prepared.group_aggregates(0.4)
+        expected = compute_group_aggregates(df, ATTRS, y_prob_col="y_prob", threshold=0.4)
+        for col in ATTRS:
+            assert got[col].schema == expected[col].schema
+            for name in expected[col].columns:
+                left, right = got[col][name], expected[col][name]
+                if left.dtype == pl.Float64:
+                    np.testing.assert_allclose(left.to_numpy(), right.to_numpy())
+                else:
+                    assert left.to_list() == right.to_list()
+        assert prepared.group_aggregates(0.4) is got
+
+    def test_class_indices(self, df: pl.DataFrame) -> None:
+        """Class indices partition the rows by outcome."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        negatives, positives = prepared.class_indices
+        y_true = df["y_true"].to_numpy()
+        np.testing.assert_array_equal(negatives, np.flatnonzero(y_true == 0))
+        np.testing.assert_array_equal(positives, np.flatnonzero(y_true == 1))
+        assert prepared.class_indices is prepared.class_indices
+
+    def test_intersection_matches_concatenated_labels(self, df: pl.DataFrame) -> None:
+        """Intersection groups equal the string-concatenated keys."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        keys = df.select(
+            pl.concat_str([pl.col(c).cast(str) for c in ATTRS], separator=" x ").alias("key")
+        )["key"]
+        expected = group_row_indices(keys.to_frame(), "key")
+        rows = prepared.intersection(ATTRS).group_rows()
+        assert list(rows) == list(expected)
+        for group in expected:
+            np.testing.assert_array_equal(rows[group], expected[group])
+
+    def test_with_arrays_round_trip(self, df: pl.DataFrame) -> None:
+        """Rebuilding from arrays() gives the same rows and aggregates."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        rebuilt = prepared.with_arrays({k: v.copy() for k, v in prepared.arrays().items()})
+        assert set(prepared.arrays()) == {
+            "y_prob",
+            "y_true",
+            *(f"{col}/{part}" for col in ATTRS for part in ("codes", "order", "offsets")),
+        }
+        for col in ATTRS:
+            assert rebuilt.attribute(col).groups == prepared.attribute(col).groups
+            assert rebuilt.group_aggregates(0.4)[col].equals(prepared.group_aggregates(0.4)[col])
+
+    def test_unprepared_attribute_raises(self, df: pl.DataFrame) -> None:
+        """Requesting an attribute that was not encoded is an error."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ["race"])
+        with pytest.raises(KeyError, match="sex"):
+            prepared.attribute("sex")
+
+
+class TestPreparedStages:
+    """Stage functions give the same results with prepared data."""
+
+    def test_fairness_metrics(self, df: pl.DataFrame) -> None:
+        """compute_fairness_metrics is unchanged by prepared data."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        for col in ATTRS:
+            expected = compute_fairness_metrics(df, "y_prob", "y_true", col, threshold=0.4)
+            got = compute_fairness_metrics(
+                df, "y_prob", "y_true", col, threshold=0.4, prepared=prepared
+            )
+            _assert_close(got, expected)
+
+    def test_subgroup_metrics(self, df: pl.DataFrame) -> None:
+        """compute_subgroup_metrics is unchanged by prepared data."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        kwargs = {"threshold": 0.4, "n_bootstrap": 50, "random_seed": 3}
+        expected = compute_subgroup_metrics(df, "y_prob", "y_true", "race", **kwargs)
+        got = compute_subgroup_metrics(df, "y_prob", "y_true", "race", prepared=prepared, **kwargs)
+        _assert_close(got, expected)
+
+    def test_intersectional(self, df: pl.DataFrame) -> None:
+        """compute_intersectional is unchanged by prepared data."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        expected = compute_intersectional(df, "y_prob", "y_true", ["race", "sex"], min_n=20)
+        got = compute_intersectional(
+            df, "y_prob", "y_true", ["race", "sex"], min_n=20, prepared=prepared
+        )
+        _assert_close(got, expected)
+
+    def test_vancalster_metrics(self, df: pl.DataFrame) -> None:
+        """compute_vancalster_metrics is unchanged by prepared data."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        kwargs = {"group_col": "sex", "threshold": 0.4, "n_bootstrap": 50}
+        expected = compute_vancalster_metrics(df, "y_prob", "y_true", **kwargs)
+        got = compute_vancalster_metrics(df, "y_prob", "y_true", prepared=prepared, **kwargs)
+        _assert_close(got, expected)
+
+    def test_cohort_summary(self, df: pl.DataFrame) -> None:
+        """compute_cohort_summary is unchanged by prepared data."""
+        prepared = PreparedAuditData.from_frame(df, "y_prob", "y_true", ATTRS)
+        attrs = {col: {"column": col, "reference": None} for col in ATTRS}
+        expected = compute_cohort_summary(df, "y_true", "y_prob", attrs)
+        got = compute_cohort_summary(df, "y_true", "y_prob", attrs, prepared=prepared)
+        _assert_close(got, expected)
@@ -16,6 +16,7 @@ from faircareai.data.sensitive_attrs import (
     SUGGESTED_PATTERNS,
     display_suggestions,
     get_reference_group,
+    match_sensitive_columns,
     suggest_sensitive_attributes,
     validate_attribute,
 )
@@ -240,6 +241,15 @@ class TestSuggestSensitiveAttributes:
         assert "race" in names
         assert "sex" in names
 
+    def test_match_columns_by_name(self) -> None:
+        """Columns are matched by name alone, first pattern per attribute."""
+        columns = ["Patient_Race", "race", "GENDER", "payer", "lab_value"]
+        assert match_sensitive_columns(columns) == {
+            "race": "race",
+            "sex": "GENDER",
+            "insurance": "payer",
+        }
+
 
 class TestDisplaySuggestions:
     """Tests for display_suggestions function."""
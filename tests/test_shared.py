@@ -0,0 +1,52 @@
+"""
+Tests for FairCareAI shared-memory array transport.
+
+Tests cover:
+- Publishing and attaching arrays without copies
+- Read-only views and dtype/shape preservation
+- Block cleanup and unsupported dtypes
+"""
+
+import numpy as np
+import pytest
+
+from faircareai.core.shared import publish_arrays
+
+
+class TestPublishArrays:
+    """Tests for publish_arrays and SharedArrays.attach."""
+
+    def test_round_trip(self) -> None:
+        """Attached views equal the published arrays, dtype and shape included."""
+        arrays = {
+            "y_prob": np.linspace(0, 1, 7),
+            "y_true": np.array([0, 1, 1, 0, 1, 0, 0], dtype=np.uint8),
+            "codes": np.arange(6, dtype=np.int32).reshape(2, 3),
+            "empty": np.array([], dtype=np.int64),
+        }
+        with publish_arrays(arrays) as handle:
+            attached = handle.attach()
+            assert list(attached) == list(arrays)
+            for key, array in arrays.items():
+                assert attached[key].dtype == array.dtype
+                np.testing.assert_array_equal(attached[key], array)
+
+    def test_views_are_read_only(self) -> None:
+        """Workers cannot write through to the shared block."""
+        with publish_arrays({"x": np.zeros(4)}) as handle:
+            view = handle.attach()["x"]
+            with pytest.raises(ValueError, match="read-only"):
+                view[0] = 1.0
+
+    def test_block_removed_on_exit(self) -> None:
+        """The block is unlinked when the publishing context exits."""
+        with publish_arrays({"x": np.zeros(4)}) as handle:
+            pass
+        with pytest.raises(FileNotFoundError):
+            handle.attach()
+
+    def test_object_arrays_rejected(self) -> None:
+        """Object arrays have no flat buffer to share."""
+        objects = {"groups": np.array(["a", None], dtype=object)}
+        with pytest.raises(TypeError, match="object"), publish_arrays(objects):
+            pass
@@ -0,0 +1,174 @@
+"""
+Tests for FairCareAI SQL pushdown audits.
+
+Tests cover:
+- SQL score bins matching score_bins at bin edges
+- Histograms from aggregate queries matching histograms from arrays
+- SQLAudit over sqlite3 (and DuckDB when installed) matching StreamingAudit
+- Queries as relations, validation errors
+"""
+
+import sqlite3
+from typing import Any
+
+import numpy as np
+import polars as pl
+import pytest
+
+from faircareai.core.config import FairnessConfig
+from faircareai.core.exceptions import DataValidationError
+from faircareai.core.histogram import ScoreHistogram, score_bins
+from faircareai.core.prepared import EncodedAttribute
+from faircareai.core.sql import SQLAudit, fetch_frame, score_bin_sql, sql_histograms
+from faircareai.core.streaming import StreamingAudit
+
+
+@pytest.fixture
+def connection(audit_df: pl.DataFrame) -> sqlite3.Connection:
+    """In-memory sqlite3 database with the frame as table ``predictions``."""
+    con = sqlite3.connect(":memory:")
+    con.execute(
+        "CREATE TABLE predictions "
+        "(y_prob REAL, y_true INTEGER, race TEXT, sex TEXT, insurance TEXT)"
+    )
+    con.executemany("INSERT INTO predictions VALUES (?, ?, ?, ?, ?)", audit_df.rows())
+    return con
+
+
+def _build(audit: StreamingAudit) -> StreamingAudit:
+    audit.add_sensitive_attribute("race", reference="White")
+    audit.add_sensitive_attribute("sex")
+    audit.add_intersection(["race", "sex"])
+    return audit
+
+
+def _assert_matches_streaming(connection: Any, df: pl.DataFrame, config: FairnessConfig) -> None:
+    pushed = _build(SQLAudit(connection, "predictions", "y_prob", "y_true", config=config))
+    streaming = _build(StreamingAudit(df, "y_prob", "y_true", config=config))
+    results, expected = pushed.run(n_bootstrap=50), streaming.run(n_bootstrap=50)
+
+    overall, overall_s = results.overall_performance, expected.overall_performance
+    assert overall["confusion_matrix"] == overall_s["confusion_matrix"]
+    assert overall["threshold_analysis"] == overall_s["threshold_analysis"]
+    assert overall["discrimination"]["auroc"] == pytest.approx(overall_s["discrimination"]["auroc"])
+    assert results.fairness_metrics == expected.fairness_metrics
+    assert results.intersectional == expected.intersectional
+    assert results.flags == expected.flags
+    assert (
+        results.descriptive_stats["outcome_by_attribute"]
+        == expected.descriptive_stats["outcome_by_attribute"]
+    )
+
+
+class TestSQLHistograms:
+    """Tests for the SQL bin expression and aggregate queries."""
+
+    def test_bins_match_score_bins(self) -> None:
+        """The SQL bin of every edge and its neighbours equals score_bins."""
+        edges = np.arange(1001) / 1000
+        scores = np.unique(np.concatenate([edges, np.nextafter(edges, -1), np.nextafter(edges, 2)]))
+        scores = scores[(scores >= 0) & (scores <= 1)]
+        con = sqlite3.connect(":memory:")
+        con.execute("CREATE TABLE s (p REAL)")
+        con.executemany("INSERT INTO s VALUES (?)", [(float(p),) for p in scores])
+        got = fetch_frame(con, f"SELECT p, {score_bin_sql('p', 1000)} AS b FROM s ORDER BY p")
+        np.testing.assert_array_equal(got["b"].to_numpy(), score_bins(got["p"].to_numpy(), 1000))
+
+    def test_matches_arrays(self, audit_df: pl.DataFrame, connection: sqlite3.Connection) -> None:
+        """Aggregate queries give the histogram built from the rows."""
+        hist = sql_histograms(
+            connection, "predictions", "y_prob", "y_true", {"race": ["race"]}, 0.5
+        )["race"]
+        attr = EncodedAttribute.from_series(audit_df["race"])
+        expected = ScoreHistogram.from_arrays(
+            "race",
+            attr.groups,
+            attr.codes,
+            audit_df["y_true"].to_numpy(),
+            audit_df["y_prob"].to_numpy(),
+            0.5,
+        )
+        assert hist.groups == expected.groups
+        np.testing.assert_array_equal(hist.counts, expected.counts)
+        np.testing.assert_array_equal(hist.flagged, expected.flagged)
+        np.testing.assert_allclose(hist.prob_sum, expected.prob_sum, atol=1e-9)
+        np.testing.assert_allclose(hist.logit_sum, expected.logit_sum, atol=1e-6)
+
+
+class TestSQLAudit:
+    """Tests for SQLAudit against StreamingAudit."""
+
+    def test_sqlite_matches_streaming(
+        self,
+        audit_df: pl.DataFrame,
+        connection: sqlite3.Connection,
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """An audit pushed down to sqlite3 equals the streaming audit of the rows."""
+        _assert_matches_streaming(connection, audit_df, fairness_config)
+
+    def test_duckdb_matches_streaming(
+        self, audit_df: pl.DataFrame, fairness_config: FairnessConfig
+    ) -> None:
+        """The same queries run on DuckDB."""
+        duckdb = pytest.importorskip("duckdb")
+        con = duckdb.connect()
+        con.register("frame", audit_df.to_arrow())
+        con.execute("CREATE TABLE predictions AS SELECT * FROM frame")
+        _assert_matches_streaming(con, audit_df, fairness_config)
+
+    def test_query_relation(
+        self,
+        audit_df: pl.DataFrame,
+        connection: sqlite3.Connection,
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """A SELECT query is audited as a subquery."""
+        query = "SELECT * FROM predictions WHERE sex = 'F'"
+        audit = SQLAudit(connection, query, "y_prob", "y_true", config=fairness_config)
+        audit.add_sensitive_attribute("race", reference="White")
+        results = audit.run(bootstrap_ci=False)
+        n_female = int((audit_df["sex"] == "F").sum())
+        assert results.descriptive_stats["cohort_overview"]["n_total"] == n_female
+
+    def test_heavily_null_attribute(
+        self, audit_df: pl.DataFrame, fairness_config: FairnessConfig
+    ) -> None:
+        """NULL keys returned first, past any inference prefix, keep their column dtypes."""
+        rows = audit_df.with_columns(
+            pl.when(pl.int_range(pl.len()) < 1500)
+            .then(None)
+            .otherwise(pl.col("race"))
+            .alias("race")
+        )
+        con = sqlite3.connect(":memory:")
+        con.execute(
+            "CREATE TABLE predictions "
+            "(y_prob REAL, y_true INTEGER, race TEXT, sex TEXT, insurance TEXT)"
+        )
+        con.executemany("INSERT INTO predictions VALUES (?, ?, ?, ?, ?)", rows.rows())
+
+        audit = SQLAudit(con, "predictions", "y_prob", "y_true", config=fairness_config)
+        assert audit.df.schema["race"] == pl.Utf8
+        _assert_matches_streaming(con, rows, fairness_config)
+
+
+class TestSQLValidation:
+    """Tests for SQLAudit validation."""
+
+    def test_out_of_range_scores(self, connection: sqlite3.Connection) -> None:
+        """Scores outside [0, 1] are rejected by the SQL profile."""
+        connection.execute("UPDATE predictions SET y_prob = 1.5 WHERE rowid = 2000")
+        with pytest.raises(DataValidationError, match="probabilities"):
+            SQLAudit(connection, "predictions", "y_prob", "y_true")
+
+    def test_empty_relation(self, connection: sqlite3.Connection) -> None:
+        """A relation without rows is rejected."""
+        with pytest.raises(DataValidationError, match="no rows"):
+            SQLAudit(connection, "SELECT * FROM predictions WHERE 0 = 1", "y_prob", "y_true")
+
+    def test_missing_attribute_column(self, connection: sqlite3.Connection) -> None:
+        """Attributes must name a column of the relation."""
+        audit = SQLAudit(connection, "predictions", "y_prob", "y_true")
+        with pytest.raises(DataValidationError, match="not found"):
+            audit.add_sensitive_attribute("ethnicity")
@@ -9,23 +9,32 @@ These tests verify the accuracy of:
 5. Sample size adequacy (stratum-specific Rule of 5)
 6. Multiplicity control (Holm-Bonferroni, BH-FDR)
 7. Disparate impact decision logic
+8. DeLong AUROC variance and AUROC difference tests
 """
 
 import numpy as np
 import polars as pl
+import pytest
+from sklearn.metrics import roc_auc_score
 
+from faircareai.core.bootstrap import bootstrap_auroc
 from faircareai.core.statistics import (
     AnalysisContext,
+    AurocDifference,
+    ClusterIndex,
     adjust_pvalues,
     adjust_pvalues_fdr_bh,
     adjust_pvalues_holm,
     assess_sample_adequacy,
     assess_stratum_adequacy,
     bootstrap_ci_simple,
+    ci_delong_auroc,
     ci_newcombe_wilson,
     ci_ratio_katz,
     ci_wilson,
     cluster_bootstrap_ci,
+    delong_auroc_covariance,
+    delong_paired_difference,
     disparate_impact_decision,
     get_effective_sample_size,
 )
@@ -290,6 +299,45 @@ class TestClusterBootstrapCI:
         assert width_cluster > width_naive * 0.8  # Allow some variance
 
 
+class TestClusterIndex:
+    """Tests for the CSR cluster index behind the cluster bootstrap."""
+
+    def test_rows_match_per_cluster_scan(self) -> None:
+        """Gathered rows equal concatenating each sampled cluster's rows."""
+        ids = np.array([3, 1, 3, 2, 1, 3, 7])
+        index = ClusterIndex.from_ids(ids)
+        unique = np.unique(ids)
+        assert index.n_clusters == 4
+        assert index.sizes.tolist() == [2, 1, 3, 1]
+
+        clusters = np.array([2, 0, 2, 3])
+        expected = np.concatenate([np.flatnonzero(ids == unique[c]) for c in clusters])
+        np.testing.assert_array_equal(index.rows(clusters), expected)
+
+    def test_sums_aggregate_resample(self) -> None:
+        """Cluster counts times cluster sums equal the gathered row sum."""
+        rng = np.random.default_rng(0)
+        ids = rng.integers(0, 50, size=400)
+        values = rng.random(400)
+        index = ClusterIndex.from_ids(ids)
+
+        clusters = index.sample(rng)
+        rows = index.rows(clusters)
+        assert index.counts(clusters) @ index.sums(values) == pytest.approx(values[rows].sum())
+        assert index.row_weights(clusters).sum() == len(rows)
+
+    def test_from_series_nulls_form_one_cluster(self) -> None:
+        """Null cluster ids are grouped together instead of dropped."""
+        index = ClusterIndex.from_series(pl.Series("pid", ["b", None, "a", None, "b"]))
+        assert index.n_clusters == 3
+        assert sorted(index.sizes.tolist()) == [1, 2, 2]
+
+    def test_empty(self) -> None:
+        """An empty column has no clusters."""
+        index = ClusterIndex.from_series(pl.Series("pid", [], dtype=pl.Int64))
+        assert index.n_clusters == 0
+
+
 class TestSampleAdequacy:
     """Tests for sample size adequacy assessment (Rule of 5)."""
 
@@ -495,3 +543,95 @@ class TestAnalysisContext:
         assert ctx.n_bootstrap == 5000
         assert ctx.alpha == 0.10
         assert ctx.multiplicity_method == "holm"
+
+
+class TestDeLongAUROC:
+    """
+    Tests for the fast (midrank) DeLong AUROC variance.
+
+    Reference: DeLong et al. (1988) Biometrics 44(3); Sun & Xu (2014) IEEE SPL 21(11)
+    """
+
+    @pytest.fixture
+    def paired_scores(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Labels and two correlated, tied scores on the same patients."""
+        rng = np.random.default_rng(0)
+        y_true = rng.binomial(1, 0.3, 400)
+        shared = rng.normal(0, 1, 400)
+        scores_a = np.round(y_true + shared + rng.normal(0, 0.5, 400), 1)
+        scores_b = np.round(0.5 * y_true + shared + rng.normal(0, 0.5, 400), 1)
+        return y_true, scores_a, scores_b
+
+    @staticmethod
+    def _placements(y_true: np.ndarray, scores: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Structural components from all case x control comparisons, O(m * n)."""
+        cases, controls = scores[y_true == 1], scores[y_true == 0]
+        psi = (cases[:, None] > controls[None, :]) + 0.5 * (cases[:, None] == controls[None, :])
+        return psi.mean(axis=1), psi.mean(axis=0)
+
+    def test_matches_pairwise_definition(
+        self, paired_scores: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> None:
+        """AUROCs and covariance equal the O(m * n) DeLong computation, ties included."""
+        y_true, scores_a, scores_b = paired_scores
+        aurocs, covariance = delong_auroc_covariance(y_true, np.vstack([scores_a, scores_b]))
+
+        v10_a, v01_a = self._placements(y_true, scores_a)
+        v10_b, v01_b = self._placements(y_true, scores_b)
+        expected = np.cov(np.vstack([v10_a, v10_b])) / len(v10_a) + np.cov(
+            np.vstack([v01_a, v01_b])
+        ) / len(v01_a)
+
+        np.testing.assert_allclose(
+            aurocs, [roc_auc_score(y_true, scores_a), roc_auc_score(y_true, scores_b)]
+        )
+        np.testing.assert_allclose(covariance, expected)
+
+    def test_ci_close_to_bootstrap(
+        self, paired_scores: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> None:
+        """The analytic CI agrees with a 2000-draw percentile bootstrap."""
+        y_true, scores, _ = paired_scores
+        auroc, se, lower, upper = ci_delong_auroc(y_true, scores)
+        samples, boot_lower, boot_upper = bootstrap_auroc(y_true, scores, n_bootstrap=2000)
+
+        assert auroc == pytest.approx(roc_auc_score(y_true, scores))
+        assert se == pytest.approx(np.std(samples), rel=0.1)
+        assert lower == pytest.approx(boot_lower, abs=0.01)
+        assert upper == pytest.approx(boot_upper, abs=0.01)
+
+    def test_ci_clipped(self) -> None:
+        """A perfectly separating score has zero variance and a CI at 1."""
+        y_true = np.array([0, 0, 0, 1, 1, 1])
+        auroc, se, lower, upper = ci_delong_auroc(y_true, np.arange(6.0))
+        assert (auroc, se, lower, upper) == (1.0, 0.0, 1.0, 1.0)
+
+    def test_single_class_raises(self) -> None:
+        """Variance is undefined without both classes."""
+        with pytest.raises(ValueError, match="both outcome classes"):
+            delong_auroc_covariance(np.ones(5), np.arange(5.0))
+
+    def test_paired_difference(
+        self, paired_scores: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> None:
+        """Correlated scores give a smaller SE than treating them as independent."""
+        y_true, scores_a, scores_b = paired_scores
+        paired = delong_paired_difference(y_true, scores_a, scores_b)
+        _, se_a, _, _ = ci_delong_auroc(y_true, scores_a)
+        _, se_b, _, _ = ci_delong_auroc(y_true, scores_b)
+
+        assert paired.difference == pytest.approx(
+            roc_auc_score(y_true, scores_a) - roc_auc_score(y_true, scores_b)
+        )
+        assert paired.se < np.hypot(se_a, se_b)
+        assert paired.ci_lower < paired.difference < paired.ci_upper
+        assert paired.p_value < 0.05
+        assert delong_paired_difference(y_true, scores_a, scores_a).p_value == 1.0
+
+    def test_difference_from_variance(self) -> None:
+        """Normal CI and two-sided p-value of a difference."""
+        test = AurocDifference.from_variance(0.1, 0.05**2)
+        assert test.se == pytest.approx(0.05)
+        assert test.ci_lower == pytest.approx(0.1 - 1.959964 * 0.05)
+        assert test.p_value == pytest.approx(0.0455, abs=1e-4)
+        assert np.isnan(AurocDifference.from_variance(0.1, float("nan")).p_value)
@@ -0,0 +1,427 @@
+"""
+Tests for FairCareAI streaming audits.
+
+Tests cover:
+- Score binning (numpy and polars agree at bin edges)
+- ScoreHistogram counts, aggregates, AUROC and AUPRC bounds and quantiles
+- Histograms from a streaming scan matching histograms from arrays
+- StreamingAudit over Parquet shards matching FairCareAudit
+- ScoreHistogram with one bin per distinct score (exact rank metrics)
+- FairCareAudit.run(mode="approximate"/"deduplicated") against the exact run
+- Source handling and validation errors
+"""
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from sklearn.metrics import auc, average_precision_score, precision_recall_curve, roc_auc_score
+
+from faircareai.core.audit import FairCareAudit
+from faircareai.core.config import FairnessConfig
+from faircareai.core.constants import STREAMING_SCORE_BINS
+from faircareai.core.exceptions import DataValidationError
+from faircareai.core.histogram import ScoreHistogram, score_bin_expr, score_bins
+from faircareai.core.metrics import compute_group_aggregates
+from faircareai.core.prepared import EncodedAttribute
+from faircareai.core.streaming import StreamingAudit, scan_audit_source, scan_histograms
+from faircareai.core.thresholds import ThresholdIndex
+from faircareai.metrics.aggregated import histogram_calibration_metrics
+from faircareai.metrics.performance import compute_calibration_metrics
+
+
+@pytest.fixture
+def shards(audit_df: pl.DataFrame, tmp_path: Path) -> Path:
+    """The frame written as three Parquet files."""
+    for i, start in enumerate(range(0, len(audit_df), 1000)):
+        audit_df[start : start + 1000].write_parquet(tmp_path / f"part-{i}.parquet")
+    return tmp_path
+
+
+def _histogram(
+    df: pl.DataFrame, column: str, threshold: float = 0.5, n_bins: int = STREAMING_SCORE_BINS
+) -> ScoreHistogram:
+    attr = EncodedAttribute.from_series(df[column].cast(pl.Utf8))
+    return ScoreHistogram.from_arrays(
+        column,
+        attr.groups,
+        attr.codes,
+        df["y_true"].to_numpy(),
+        df["y_prob"].to_numpy(),
+        threshold,
+        n_bins,
+    )
+
+
+class TestScoreBins:
+    """Tests for score_bins and score_bin_expr."""
+
+    def test_edges_are_exact(self) -> None:
+        """Each score lands in the bin whose edges bracket it, including k / n_bins."""
+        scores = np.r_[np.arange(1001) / 1000, np.linspace(0, 1, 7919)]
+        bins = score_bins(scores, 1000)
+        edges = np.arange(1000) / 1000
+        assert np.all(edges[bins] <= scores)
+        inner = bins < 999
+        assert np.all(scores[inner] < edges[bins[inner] + 1])
+
+    def test_polars_matches_numpy(self) -> None:
+        """The streaming expression bins exactly like score_bins."""
+        scores = np.r_[np.arange(1001) / 1000, np.random.default_rng(0).random(5000)]
+        binned = (
+            pl.LazyFrame({"p": scores})
+            .select(score_bin_expr("p", 1000))
+            .collect(streaming=True)["p"]
+            .to_numpy()
+        )
+        np.testing.assert_array_equal(binned, score_bins(scores, 1000))
+
+
+class TestScoreHistogram:
+    """Tests for ScoreHistogram."""
+
+    def test_aggregates_match_group_aggregates(self, audit_df: pl.DataFrame) -> None:
+        """Per-group confusion counts equal compute_group_aggregates."""
+        expected = compute_group_aggregates(audit_df, "race", "y_true", "y_prob", 0.5)["race"]
+        assert_frame_equal(_histogram(audit_df, "race").aggregates(), expected, check_exact=False)
+
+    def test_threshold_index_exact_on_grid(self, audit_df: pl.DataFrame) -> None:
+        """Scores on the bin grid give the row-level threshold counts."""
+        hist = _histogram(audit_df, "race")
+        thresholds = np.linspace(0.05, 0.95, 19)
+        expected = ThresholdIndex(audit_df["y_true"].to_numpy(), audit_df["y_prob"].to_numpy())
+        for got, want in zip(
+            hist.threshold_index().counts(thresholds), expected.counts(thresholds), strict=True
+        ):
+            np.testing.assert_array_equal(got, want)
+
+    def test_auroc_within_bound(self) -> None:
+        """The exact AUROC lies within max_error of the binned AUROC."""
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 2, 2000)
+        y_prob = np.clip(0.4 * y_true + rng.random(2000) * 0.6, 0, 1)
+        hist = ScoreHistogram.from_arrays(
+            "g", ["a"], np.zeros(2000, dtype=np.int64), y_true, y_prob, 0.5, n_bins=20
+        )
+        auroc, max_error = hist.auroc()
+        assert max_error > 0
+        assert abs(roc_auc_score(y_true, y_prob) - auroc) <= max_error
+
+    def test_auprc_within_bound(self) -> None:
+        """The exact AUPRC lies within max_error of the binned AUPRC."""
+        rng = np.random.default_rng(2)
+        y_true = rng.integers(0, 2, 2000)
+        y_prob = np.clip(0.4 * y_true + rng.random(2000) * 0.6, 0, 1)
+        hist = ScoreHistogram.from_arrays(
+            "g", ["a"], np.zeros(2000, dtype=np.int64), y_true, y_prob, 0.5, n_bins=20
+        )
+        auprc, max_error = hist.auprc()
+        assert max_error > 0
+        assert abs(average_precision_score(y_true, y_prob) - auprc) <= max_error
+
+    def test_auprc_bound_holds_for_any_order(self) -> None:
+        """The trapezoidal AUPRC lies within max_error on small random cases."""
+        rng = np.random.default_rng(3)
+        for case in range(2000):
+            n_rows, n_bins = int(rng.integers(2, 40)), int(rng.integers(1, 8))
+            y_true = rng.integers(0, 2, n_rows)
+            if y_true.sum() == 0:
+                continue
+            # Alternate continuous scores with heavily tied ones
+            y_prob = rng.random(n_rows) if case % 2 else np.round(rng.random(n_rows), 1)
+            hist = ScoreHistogram.from_arrays(
+                "g", ["a"], np.zeros(n_rows, dtype=np.int64), y_true, y_prob, 0.5, n_bins=n_bins
+            )
+            auprc, max_error = hist.auprc()
+            precision, recall, _ = precision_recall_curve(y_true, y_prob)
+            assert abs(auc(recall, precision) - auprc) <= max_error + 1e-12
+
+    def test_calibration_slope_on_clipped_scores(self) -> None:
+        """The binned slope matches the exact fit with many scores at 0 and 1."""
+        rng = np.random.default_rng(4)
+        z = rng.normal(0, 4, 50_000)
+        y_true = (rng.random(50_000) < 1 / (1 + np.exp(-0.8 * z))).astype(np.int64)
+        y_prob = np.clip(1 / (1 + np.exp(-0.8 * z)) + rng.normal(0, 0.1, 50_000), 0, 1)
+        hist = ScoreHistogram.from_arrays(
+            "g", ["a"], np.zeros(50_000, dtype=np.int64), y_true, y_prob, 0.5, n_bins=1000
+        )
+        exact = compute_calibration_metrics(y_true, y_prob)
+        binned = histogram_calibration_metrics(hist)
+        assert binned["calibration_slope"] == pytest.approx(exact["calibration_slope"], abs=2e-3)
+
+    def test_levels_are_exact(self, audit_df: pl.DataFrame) -> None:
+        """With one bin per distinct score, rank metrics and quantiles are exact."""
+        y_true, y_prob = audit_df["y_true"].to_numpy(), audit_df["y_prob"].to_numpy()
+        attr = EncodedAttribute.from_series(audit_df["race"])
+        levels = np.unique(y_prob)
+        hist = ScoreHistogram.from_arrays(
+            "race", attr.groups, attr.codes, y_true, y_prob, 0.5, levels=levels
+        )
+        assert hist.auroc() == (pytest.approx(roc_auc_score(y_true, y_prob)), 0.0)
+        q = np.array([0.0, 0.1, 0.25, 0.5, 0.9, 1.0])
+        np.testing.assert_allclose(hist.quantiles(q), np.quantile(y_prob, q))
+        index = hist.threshold_index()
+        assert index.confusion(0.3337) == ThresholdIndex(y_true, y_prob).confusion(0.3337)
+        with pytest.raises(ValueError, match="Cannot merge"):
+            hist.merge(_histogram(audit_df, "race", n_bins=len(levels)))
+
+    def test_quantiles_within_one_bin(self, audit_df: pl.DataFrame) -> None:
+        """Interpolated quantiles are within one bin width; extremes are exact."""
+        hist = _histogram(audit_df, "race")
+        q = np.array([0.0, 0.25, 0.5, 0.9, 1.0])
+        got = hist.quantiles(q)
+        expected = np.quantile(audit_df["y_prob"].to_numpy(), q)
+        assert np.all(np.abs(got - expected) <= 1 / hist.n_bins)
+        assert got[0] == expected[0]
+        assert got[-1] == expected[-1]
+
+
+class TestScanHistograms:
+    """Tests for scan_histograms."""
+
+    def test_matches_arrays(self, audit_df: pl.DataFrame, shards: Path) -> None:
+        """A streaming scan over shards gives the same histograms as the arrays."""
+        histograms = scan_histograms(
+            scan_audit_source(shards),
+            "y_prob",
+            "y_true",
+            {"race": ["race"], "race x sex": ["race", "sex"]},
+            threshold=0.5,
+        )
+        expected = _histogram(audit_df, "race")
+        hist = histograms["race"]
+        assert hist.groups == expected.groups
+        np.testing.assert_array_equal(hist.counts, expected.counts)
+        np.testing.assert_array_equal(hist.flagged, expected.flagged)
+        np.testing.assert_allclose(hist.prob_sum, expected.prob_sum, atol=1e-9)
+        np.testing.assert_allclose(hist.logit_sum, expected.logit_sum, atol=1e-6)
+
+        intersection = histograms["race x sex"]
+        assert "White x F" in intersection.groups
+        # Rows with a null race are left out of the intersection
+        assert intersection.sizes[0] == 40
+
+
+class TestStreamingAudit:
+    """Tests for StreamingAudit against FairCareAudit."""
+
+    @pytest.fixture
+    def results(
+        self, audit_df: pl.DataFrame, shards: Path, fairness_config: FairnessConfig
+    ) -> tuple:
+        def build(audit: FairCareAudit) -> FairCareAudit:
+            audit.add_sensitive_attribute("race", reference="White")
+            audit.add_sensitive_attribute("sex")
+            audit.add_intersection(["race", "sex"])
+            return audit
+
+        eager = build(FairCareAudit(audit_df, "y_prob", "y_true", config=fairness_config))
+        streaming = build(StreamingAudit(shards, "y_prob", "y_true", config=fairness_config))
+        return eager.run(n_bootstrap=100), streaming.run(n_bootstrap=100)
+
+    def test_counts_and_fairness_match(self, results: tuple) -> None:
+        """Count-based sections match the in-memory audit."""
+        eager, streaming = results
+        overall, overall_s = eager.overall_performance, streaming.overall_performance
+        assert overall["confusion_matrix"] == overall_s["confusion_matrix"]
+        assert overall["threshold_analysis"] == overall_s["threshold_analysis"]
+        assert overall["decision_curve"] == overall_s["decision_curve"]
+        for name in ("race", "sex"):
+            groups = eager.fairness_metrics[name]["group_metrics"]
+            groups_s = streaming.fairness_metrics[name]["group_metrics"]
+            for group, metrics in groups.items():
+                assert metrics == pytest.approx(groups_s[group])
+        assert (
+            eager.descriptive_stats["outcome_by_attribute"]
+            == (streaming.descriptive_stats["outcome_by_attribute"])
+        )
+
+    def test_rank_metrics_within_bound(self, results: tuple) -> None:
+        """Binned AUROC is within its reported bound of the exact value."""
+        eager, streaming = results
+        disc = eager.overall_performance["discrimination"]
+        disc_s = streaming.overall_performance["discrimination"]
+        assert abs(disc["auroc"] - disc_s["auroc"]) <= disc_s["auroc_max_error"]
+        assert disc_s["brier_score"] == pytest.approx(disc["brier_score"])
+        for group, metrics in eager.subgroup_performance["race"]["groups"].items():
+            metrics_s = streaming.subgroup_performance["race"]["groups"][group]
+            assert abs(metrics["auroc"] - metrics_s["auroc"]) <= metrics_s["auroc_max_error"]
+            assert metrics_s["auroc_ci_95"][0] < metrics_s["auroc"] < metrics_s["auroc_ci_95"][1]
+
+    def test_intersections_and_flags(self, results: tuple) -> None:
+        """Intersections are keyed by attribute names and flags are generated."""
+        eager, streaming = results
+        assert list(streaming.intersectional) == ["race x sex"]
+        assert set(streaming.intersectional["race x sex"]["intersections"]) == set(
+            eager.intersectional["race x sex"]["intersections"]
+        )
+        assert streaming.flags == eager.flags
+        assert streaming.reproducibility["streaming"]["n_bins"] == 1000
+
+    def test_accepts_lazy_frame(
+        self, audit_df: pl.DataFrame, fairness_config: FairnessConfig
+    ) -> None:
+        """A LazyFrame is audited without collecting it."""
+        audit = StreamingAudit(audit_df.lazy(), "y_prob", "y_true", config=fairness_config)
+        audit.add_sensitive_attribute("sex")
+        assert audit.sensitive_attributes[0].reference in ("F", "M")
+        assert len(audit.df) == 0
+        assert audit.suggest_attributes(display=False) == []
+
+    def test_filter(self, audit_df: pl.DataFrame, fairness_config: FairnessConfig) -> None:
+        """A cohort filter is pushed into the scan."""
+        cohort = pl.col("sex") == "F"
+        audit = StreamingAudit(
+            audit_df.lazy(), "y_prob", "y_true", config=fairness_config, filter=cohort
+        )
+        audit.add_sensitive_attribute("race", reference="White")
+        results = audit.run(bootstrap_ci=False)
+        n_female = int((audit_df["sex"] == "F").sum())
+        assert results.descriptive_stats["cohort_overview"]["n_total"] == n_female
+
+
+def _audit(df: pl.DataFrame, config: FairnessConfig) -> FairCareAudit:
+    audit = FairCareAudit(df, "y_prob", "y_true", config=config)
+    audit.add_sensitive_attribute("race", reference="White")
+    audit.add_sensitive_attribute("sex")
+    audit.add_intersection(["race", "sex"])
+    return audit
+
+
+class TestHistogramModes:
+    """Tests for FairCareAudit.run(mode="approximate"/"deduplicated")."""
+
+    @pytest.fixture
+    def results(self, audit_df: pl.DataFrame, fairness_config: FairnessConfig) -> tuple:
+        return _audit(audit_df, fairness_config).run(n_bootstrap=100), _audit(
+            audit_df, fairness_config
+        ).run(n_bootstrap=100, mode="approximate")
+
+    def test_counts_and_flags_match(self, results: tuple) -> None:
+        """Counts, threshold curves, fairness and flags equal the exact run."""
+        exact, approximate = results
+        overall, overall_a = exact.overall_performance, approximate.overall_performance
+        assert overall_a["confusion_matrix"] == overall["confusion_matrix"]
+        assert overall_a["threshold_analysis"] == overall["threshold_analysis"]
+        for name, metrics in exact.fairness_metrics.items():
+            for group, values in metrics["group_metrics"].items():
+                assert approximate.fairness_metrics[name]["group_metrics"][group] == (
+                    pytest.approx(values)
+                )
+        assert approximate.flags == exact.flags
+
+    def test_rank_metrics_within_bounds(self, results: tuple) -> None:
+        """AUROC and AUPRC are within the bounds recorded for the run."""
+        exact, approximate = results
+        bounds = approximate.reproducibility["approximate"]
+        assert bounds["n_bins"] == 10_000
+        assert bounds["percentile_max_error"] == pytest.approx(1e-4)
+        disc = exact.overall_performance["discrimination"]
+        disc_a = approximate.overall_performance["discrimination"]
+        assert abs(disc["auroc"] - disc_a["auroc"]) <= bounds["auroc_max_error"]
+        assert abs(disc["auprc"] - disc_a["auprc"]) <= bounds["auprc_max_error"]
+        for group, metrics in exact.subgroup_performance["race"]["groups"].items():
+            metrics_a = approximate.subgroup_performance["race"]["groups"][group]
+            assert abs(metrics["auroc"] - metrics_a["auroc"]) <= bounds["subgroup_auroc_max_error"]
+
+    def test_deduplicated_is_exact(
+        self, audit_df: pl.DataFrame, results: tuple, fairness_config: FairnessConfig
+    ) -> None:
+        """Weighted distinct tuples reproduce the exact rank and calibration metrics."""
+        exact, _ = results
+        deduplicated = _audit(audit_df, fairness_config).run(n_bootstrap=100, mode="deduplicated")
+        bounds = deduplicated.reproducibility["deduplicated"]
+        assert bounds["n_bins"] == audit_df["y_prob"].n_unique()
+        assert bounds["auroc_max_error"] == bounds["percentile_max_error"] == 0.0
+
+        overall, overall_d = exact.overall_performance, deduplicated.overall_performance
+        for key in ("auroc", "auprc", "average_precision", "brier_score"):
+            assert overall_d["discrimination"][key] == pytest.approx(overall["discrimination"][key])
+        for key in ("calibration_slope", "calibration_intercept", "oe_ratio"):
+            assert overall_d["calibration"][key] == pytest.approx(overall["calibration"][key])
+        assert overall_d["calibration"]["calibration_curve"]["prob_true"] == pytest.approx(
+            overall["calibration"]["calibration_curve"]["prob_true"]
+        )
+        for group, metrics in exact.subgroup_performance["race"]["groups"].items():
+            metrics_d = deduplicated.subgroup_performance["race"]["groups"][group]
+            assert metrics_d["auroc"] == pytest.approx(metrics["auroc"])
+        assert deduplicated.descriptive_stats["prediction_distribution"] == pytest.approx(
+            exact.descriptive_stats["prediction_distribution"]
+        )
+        assert deduplicated.flags == exact.flags
+
+    def test_deduplicated_falls_back(
+        self,
+        audit_df: pl.DataFrame,
+        results: tuple,
+        monkeypatch: pytest.MonkeyPatch,
+        fairness_config: FairnessConfig,
+    ) -> None:
+        """Histograms with more cells than rows are not built; the exact audit runs instead."""
+        from faircareai.core import audit
+
+        exact, _ = results
+        monkeypatch.setattr(audit, "DEDUPLICATED_MIN_CELLS", 0)
+        monkeypatch.setattr(
+            audit.FairCareAudit,
+            "_histograms",
+            lambda *args: pytest.fail("deduplicated histograms were built"),
+        )
+        fallback = _audit(audit_df, fairness_config).run(n_bootstrap=100, mode="deduplicated")
+        record = fallback.reproducibility["deduplicated"]
+        assert record["fallback"] == "exact"
+        assert record["histogram_cells"] > record["n_rows"] == len(audit_df)
+        assert fallback.overall_performance == exact.overall_performance
+        assert fallback.subgroup_performance == exact.subgroup_performance
+
+    def test_unknown_mode(self, audit_df: pl.DataFrame, fairness_config: FairnessConfig) -> None:
+        """Only the exact and approximate modes are accepted."""
+        audit = FairCareAudit(audit_df, "y_prob", "y_true", config=fairness_config)
+        audit.add_sensitive_attribute("sex")
+        with pytest.raises(ValueError, match="mode"):
+            audit.run(mode="sketch")
+        streaming = StreamingAudit(audit_df.lazy(), "y_prob", "y_true", config=fairness_config)
+        streaming.add_sensitive_attribute("sex")
+        with pytest.raises(ValueError, match="approximate"):
+            streaming.run(mode="exact")
+
+
+class TestStreamingValidation:
+    """Tests for streaming source handling and validation."""
+
+    def test_out_of_range_scores(self, audit_df: pl.DataFrame) -> None:
+        """Scores outside [0, 1] are rejected by the streaming profile."""
+        lazy = audit_df.lazy().with_columns(pl.col("y_prob") * 2)
+        with pytest.raises(DataValidationError, match="probabilities"):
+            StreamingAudit(lazy, "y_prob", "y_true")
+
+    def test_non_binary_targets(self, audit_df: pl.DataFrame) -> None:
+        """Targets other than 0/1 are rejected."""
+        lazy = audit_df.lazy().with_columns(pl.col("y_true") + 1)
+        with pytest.raises(DataValidationError, match="binary"):
+            StreamingAudit(lazy, "y_prob", "y_true")
+
+    def test_missing_attribute_column(self, audit_df: pl.DataFrame) -> None:
+        """Attributes must name a column of the scan."""
+        audit = StreamingAudit(audit_df.lazy(), "y_prob", "y_true")
+        with pytest.raises(DataValidationError, match="not found"):
+            audit.add_sensitive_attribute("ethnicity")
+
+    def test_unsupported_sources(self, tmp_path: Path) -> None:
+        """Unknown file formats and types are rejected."""
+        with pytest.raises(DataValidationError, match="Unsupported file format"):
+            scan_audit_source(tmp_path / "data.json")
+        with pytest.raises(TypeError):
+            scan_audit_source(42)  # type: ignore[arg-type]
+
+    def test_ipc_source(self, audit_df: pl.DataFrame, tmp_path: Path) -> None:
+        """Arrow IPC files are scanned like Parquet."""
+        audit_df.write_ipc(tmp_path / "data.arrow")
+        assert_frame_equal(scan_audit_source(tmp_path / "data.arrow").collect(), audit_df)
+
+    def test_eager_audit_rejects_lazy_frame(self, audit_df: pl.DataFrame) -> None:
+        """FairCareAudit points lazy inputs to StreamingAudit."""
+        with pytest.raises(TypeError, match="StreamingAudit"):
+            FairCareAudit(audit_df.lazy(), "y_prob", "y_true")  # type: ignore[arg-type]
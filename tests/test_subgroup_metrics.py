@@ -10,12 +10,15 @@ Tests cover:
 - compute_pairwise_intersectional function
 - identify_vulnerable_subgroups function
 - _summarize_vulnerable function
+- group_row_indices helper
 """
 
 import numpy as np
 import polars as pl
 import pytest
 
+from faircareai.core.metrics import compute_group_aggregates
+from faircareai.metrics.group_utils import group_row_indices
 from faircareai.metrics.subgroup import (
     _compute_subgroup_disparities,
     _interpret_auroc_range,
@@ -160,6 +163,82 @@ class TestComputeSubgroupMetrics:
         has_ci = any("auroc_ci_95" in g for g in result["groups"].values() if "error" not in g)
         assert has_ci
 
+    def test_precomputed_aggregates(self, sample_df: pl.DataFrame) -> None:
+        """Test that shared group aggregates give identical results."""
+        aggregates = compute_group_aggregates(sample_df, "group", y_prob_col="y_prob")
+        direct = compute_subgroup_metrics(
+            sample_df, "y_prob", "y_true", "group", bootstrap_ci=False
+        )
+        shared = compute_subgroup_metrics(
+            sample_df,
+            "y_prob",
+            "y_true",
+            "group",
+            bootstrap_ci=False,
+            group_aggregates=aggregates["group"],
+        )
+        assert direct == shared
+        assert direct["reference"] == "White"
+
+    def test_group_calibration(self, sample_df: pl.DataFrame) -> None:
+        """Each group carries its calibration slope and intercept with Wald CIs."""
+        from statsmodels.api import Logit
+
+        result = compute_subgroup_metrics(
+            sample_df, "y_prob", "y_true", "group", bootstrap_ci=False
+        )
+        rows = sample_df.filter(pl.col("group") == "Black")
+        y_true = rows["y_true"].to_numpy()
+        logit_p = np.log(rows["y_prob"] / (1 - rows["y_prob"])).to_numpy()
+        model = Logit(y_true, np.column_stack([np.ones_like(logit_p), logit_p])).fit(disp=0)
+
+        group = result["groups"]["Black"]
+        assert group["calibration_slope"] == pytest.approx(model.params[1], rel=1e-8)
+        assert group["calibration_slope_ci_95"] == pytest.approx(
+            model.conf_int()[1].tolist(), rel=1e-6
+        )
+        assert "calibration_intercept_ci_95" in group
+
+    def test_delong_ci(self, sample_df: pl.DataFrame) -> None:
+        """DeLong CIs replace the bootstrap and add difference tests vs the reference."""
+        result = compute_subgroup_metrics(
+            sample_df, "y_prob", "y_true", "group", reference="White", ci_method="delong"
+        )
+        group = result["groups"]["Black"]
+        assert "auroc_ci_draws" not in group
+        assert group["auroc_se"] > 0
+        assert group["auroc_ci_95"][0] < group["auroc"] < group["auroc_ci_95"][1]
+
+        disparity = result["disparities"]["Black"]
+        lower, upper = disparity["auroc_diff_ci_95"]
+        assert lower < disparity["auroc_diff"] < upper
+        assert 0 <= disparity["auroc_diff_p_value"] <= 1
+
+        with pytest.raises(ValueError, match="ci_method"):
+            compute_subgroup_metrics(sample_df, "y_prob", "y_true", "group", ci_method="wald")
+
+
+class TestGroupRowIndices:
+    """Tests for group_row_indices helper."""
+
+    def test_positions_per_group(self) -> None:
+        """Each group maps to its row positions in original order."""
+        df = pl.DataFrame({"g": ["b", "a", None, "b", "a"]})
+        rows = group_row_indices(df, "g")
+        assert list(rows) == ["a", "b"]
+        np.testing.assert_array_equal(rows["a"], [1, 4])
+        np.testing.assert_array_equal(rows["b"], [0, 3])
+
+    def test_categorical_column(self) -> None:
+        """Categorical columns map the same way as strings."""
+        df = pl.DataFrame({"g": ["b", "a", None, "b", "a"]}).with_columns(
+            pl.col("g").cast(pl.Categorical)
+        )
+        rows = group_row_indices(df, "g")
+        assert sorted(rows) == ["a", "b"]
+        np.testing.assert_array_equal(rows["a"], [1, 4])
+        np.testing.assert_array_equal(rows["b"], [0, 3])
+
 
 class TestComputeSubgroupDisparities:
     """Tests for _compute_subgroup_disparities function."""
@@ -343,6 +422,17 @@ class TestComputeIntersectional:
             assert "worst_performing" in summary
             assert "auroc_range" in summary
 
+    def test_null_attribute_values_skipped(self, intersectional_df: pl.DataFrame) -> None:
+        """Rows with a null in any attribute belong to no intersection."""
+        df = intersectional_df.with_columns(
+            pl.when(pl.int_range(pl.len()) < 50).then(None).otherwise(pl.col("sex")).alias("sex")
+        )
+        result = compute_intersectional(
+            df, "y_prob", "y_true", ["race", "sex"], min_n=10, bootstrap_ci=False
+        )
+        assert None not in result["intersections"]
+        assert sum(g["n"] for g in result["intersections"].values()) == 350
+
 
 class TestComputePairwiseIntersectional:
     """Tests for compute_pairwise_intersectional function."""
@@ -0,0 +1,174 @@
+"""
+Tests for FairCareAI threshold sweep index.
+
+Tests cover:
+- ThresholdIndex confusion counts (ties, NaN scores, boundaries)
+- ThresholdIndex metrics and net benefit
+- Consistency with threshold analysis and decision curve outputs
+- GroupedThresholdIndex per-group count and rate matrices
+"""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from faircareai.core.thresholds import GroupedThresholdIndex, ThresholdIndex
+from faircareai.metrics.performance import (
+    compute_classification_at_threshold,
+    compute_decision_curve_analysis,
+    compute_threshold_analysis,
+)
+
+
+def _brute_counts(y_true: np.ndarray, y_prob: np.ndarray, t: float) -> tuple[int, int, int, int]:
+    pred = y_prob >= t
+    pos = y_true == 1
+    return (
+        int(np.sum(pos & pred)),
+        int(np.sum(~pos & pred)),
+        int(np.sum(~pos & ~pred)),
+        int(np.sum(pos & ~pred)),
+    )
+
+
+@pytest.fixture
+def data() -> tuple[np.ndarray, np.ndarray]:
+    """Scores rounded to create ties."""
+    rng = np.random.default_rng(3)
+    y_true = rng.integers(0, 2, 400)
+    y_prob = np.round(np.clip(0.3 * y_true + rng.random(400) * 0.7, 0, 1), 2)
+    return y_true, y_prob
+
+
+class TestThresholdIndexCounts:
+    """Tests for ThresholdIndex.counts and confusion."""
+
+    def test_matches_brute_force(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Counts match direct thresholding, including tied and boundary scores."""
+        y_true, y_prob = data
+        index = ThresholdIndex(y_true, y_prob)
+        thresholds = np.r_[0.0, np.unique(y_prob), 0.333, 1.0, 1.5]
+        tp, fp, tn, fn = index.counts(thresholds)
+        for i, t in enumerate(thresholds):
+            assert (tp[i], fp[i], tn[i], fn[i]) == _brute_counts(y_true, y_prob, t)
+
+    def test_nan_scores_never_flagged(self) -> None:
+        """NaN scores count as predicted negatives."""
+        y_true = np.array([1, 0, 1, 0])
+        y_prob = np.array([0.9, np.nan, np.nan, 0.2])
+        index = ThresholdIndex(y_true, y_prob)
+        assert index.confusion(0.0) == (1, 1, 1, 1)
+        assert index.confusion(0.5) == (1, 0, 2, 1)
+
+    def test_attributes(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Summary attributes describe the indexed cohort."""
+        y_true, y_prob = data
+        index = ThresholdIndex(y_true, y_prob)
+        assert len(index) == 400
+        assert index.n_positive + index.n_negative == 400
+        assert index.prevalence == pytest.approx(y_true.mean())
+
+    def test_length_mismatch_raises(self) -> None:
+        """Arrays of different length are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            ThresholdIndex(np.array([0, 1]), np.array([0.5]))
+
+    def test_from_counts_matches_rows(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """An index built from per-level class counts equals the row-level index."""
+        y_true, y_prob = data
+        levels, inverse = np.unique(y_prob, return_inverse=True)
+        n_positive = np.bincount(inverse, weights=y_true, minlength=len(levels))
+        n_negative = np.bincount(inverse, weights=1 - y_true, minlength=len(levels))
+        index = ThresholdIndex.from_counts(levels, n_positive, n_negative)
+        expected = ThresholdIndex(y_true, y_prob)
+        thresholds = np.r_[0.0, levels, 0.333, 1.5]
+        for got, want in zip(index.counts(thresholds), expected.counts(thresholds), strict=True):
+            np.testing.assert_array_equal(got, want)
+        assert len(index) == 400
+        assert index.prevalence == pytest.approx(y_true.mean())
+
+
+class TestThresholdIndexMetrics:
+    """Tests for ThresholdIndex.metrics and net benefit."""
+
+    def test_metrics_match_classification(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Vectorized metrics match compute_classification_at_threshold."""
+        y_true, y_prob = data
+        thresholds = [0.2, 0.5, 0.8]
+        metrics = ThresholdIndex(y_true, y_prob).metrics(thresholds)
+        for i, t in enumerate(thresholds):
+            expected = compute_classification_at_threshold(y_true, y_prob, t, bootstrap_ci=False)
+            for key in ("sensitivity", "specificity", "ppv", "npv", "f1_score", "accuracy"):
+                assert metrics[key][i] == pytest.approx(expected[key])
+
+    def test_net_benefit_formula(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Net benefit equals TP/n - FP/n * t/(1-t), and 0 at t >= 1."""
+        y_true, y_prob = data
+        index = ThresholdIndex(y_true, y_prob)
+        nb = index.net_benefit([0.25, 1.0])
+        tp, fp, _, _ = _brute_counts(y_true, y_prob, 0.25)
+        assert nb[0] == pytest.approx(tp / 400 - fp / 400 * (0.25 / 0.75))
+        assert nb[1] == 0.0
+
+    def test_treat_all(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """Treat-all net benefit at threshold 0 equals prevalence."""
+        y_true, y_prob = data
+        index = ThresholdIndex(y_true, y_prob)
+        assert index.net_benefit_treat_all(0.0)[0] == pytest.approx(y_true.mean())
+
+
+class TestThresholdDerivedOutputs:
+    """Threshold table and DCA derived from the index."""
+
+    def test_threshold_analysis_matches_single_threshold(
+        self, data: tuple[np.ndarray, np.ndarray]
+    ) -> None:
+        """Each threshold row equals the single-threshold computation."""
+        y_true, y_prob = data
+        result = compute_threshold_analysis(y_true, y_prob, [0.3, 0.6])
+        for row, t in zip(result["metrics"], [0.3, 0.6], strict=True):
+            expected = compute_classification_at_threshold(y_true, y_prob, t, bootstrap_ci=False)
+            assert row == pytest.approx(expected)
+
+    def test_shared_index(self, data: tuple[np.ndarray, np.ndarray]) -> None:
+        """A prebuilt index gives the same decision curve."""
+        y_true, y_prob = data
+        index = ThresholdIndex(y_true, y_prob)
+        assert compute_decision_curve_analysis(
+            y_true, y_prob, index=index
+        ) == compute_decision_curve_analysis(y_true, y_prob)
+
+
+class TestGroupedThresholdIndex:
+    """Tests for GroupedThresholdIndex."""
+
+    @pytest.fixture
+    def frame(self, data: tuple[np.ndarray, np.ndarray]) -> pl.DataFrame:
+        """Attach a group column (with nulls) to the shared data."""
+        y_true, y_prob = data
+        groups = np.random.default_rng(1).choice(["X", "Y", "Z"], len(y_true)).tolist()
+        groups[:5] = [None] * 5
+        return pl.DataFrame({"y_true": y_true, "y_prob": y_prob, "group": groups})
+
+    def test_counts_match_per_group(self, frame: pl.DataFrame) -> None:
+        """Matrix rows match brute-force counts within each group."""
+        index = GroupedThresholdIndex.from_frame(frame, "y_prob", "y_true", "group")
+        assert index.groups == ["X", "Y", "Z"]
+        thresholds = [0.1, 0.45, 0.9]
+        tp, fp, tn, fn = index.counts(thresholds)
+        assert tp.shape == (3, 3)
+        for i, group in enumerate(index.groups):
+            sub = frame.filter(pl.col("group") == group)
+            for k, t in enumerate(thresholds):
+                expected = _brute_counts(sub["y_true"].to_numpy(), sub["y_prob"].to_numpy(), t)
+                assert (tp[i, k], fp[i, k], tn[i, k], fn[i, k]) == expected
+
+    def test_rates(self, frame: pl.DataFrame) -> None:
+        """Rates agree with each group's own ThresholdIndex."""
+        index = GroupedThresholdIndex.from_frame(frame, "y_prob", "y_true", "group")
+        grid = np.linspace(0.01, 0.99, 99)
+        rates = index.rates(grid)
+        own = index["Y"].metrics(grid)
+        row = index.groups.index("Y")
+        np.testing.assert_allclose(rates["tpr"][row], own["sensitivity"])
+        np.testing.assert_allclose(rates["selection_rate"][row], own["pct_flagged"] / 100)
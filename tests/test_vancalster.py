@@ -272,6 +272,18 @@ class TestComputeVancalsterMetrics:
         assert "by_subgroup" not in result
         assert "disparities" not in result
 
+    def test_results_independent_of_workers(self, binary_classification_data: pl.DataFrame) -> None:
+        """Subgroups scheduled in a process pool give the serial results."""
+        kwargs = {
+            "y_prob_col": "risk_score",
+            "y_true_col": "outcome",
+            "group_col": "race",
+            "n_bootstrap": 50,
+        }
+        serial = compute_vancalster_metrics(binary_classification_data, **kwargs)
+        parallel = compute_vancalster_metrics(binary_classification_data, workers=2, **kwargs)
+        assert repr(parallel) == repr(serial)
+
 
 # =============================================================================
 # TEST: AUROC BY SUBGROUP